@@ -22,6 +22,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from common.warm_start import process_value, register
+
 logger = logging.getLogger(__name__)
 
 
@@ -241,33 +243,9 @@ class NLPQueryTool:
     
     @property
     def gazetteer(self) -> dict:
-        """Carrega gazetteer de entidades bíblicas sob demanda."""
+        """Gazetteer de entidades bíblicas, carregado uma vez por processo (ou do snapshot de warm start)."""
         if self._gazetteer is None and self.use_gazetteer:
-            try:
-                import json
-                from pathlib import Path
-                
-                # Tentar múltiplos caminhos
-                possible_paths = [
-                    Path(self.GAZETTEER_PATH),
-                    Path(__file__).parent.parent.parent.parent.parent / "data/NLP/nlp_gazetteer/canonical_entities_v4_unified.json",
-                    Path("/app/data/NLP/nlp_gazetteer/canonical_entities_v4_unified.json"),
-                ]
-                
-                for path in possible_paths:
-                    if path.exists():
-                        with open(path, encoding="utf-8") as f:
-                            self._gazetteer = json.load(f)
-                        logger.info(f"Gazetteer loaded: {path}")
-                        break
-                
-                if self._gazetteer is None:
-                    logger.warning("Gazetteer not found, entity detection disabled")
-                    self._gazetteer = {}
-                    
-            except Exception as e:
-                logger.warning(f"Failed to load gazetteer: {e}")
-                self._gazetteer = {}
+            self._gazetteer = process_value("nlp_gazetteer")
         
         return self._gazetteer or {}
     
@@ -322,11 +300,10 @@ class NLPQueryTool:
     def _get_from_cache(self, query_normalized: str) -> NLPAnalysis | None:
         """Tenta obter análise do cache."""
         try:
+            from bible.ai.usage_counters import cached_row
             from bible.models import QueryNLPCache
             
-            cached = QueryNLPCache.objects.filter(
-                query_normalized=query_normalized
-            ).first()
+            cached = cached_row(QueryNLPCache, query_normalized)
             
             if cached:
                 cached.increment_usage()
@@ -693,6 +670,37 @@ class NLPQueryTool:
         return strategy
 
 
+def _load_gazetteer() -> dict:
+    """Lê o gazetteer do disco; ``{}`` desativa a detecção de entidades."""
+    import json
+    from pathlib import Path
+    
+    # Tentar múltiplos caminhos
+    possible_paths = [
+        Path(NLPQueryTool.GAZETTEER_PATH),
+        Path(__file__).parent.parent.parent.parent.parent / "data/NLP/nlp_gazetteer/canonical_entities_v4_unified.json",
+        Path("/app/data/NLP/nlp_gazetteer/canonical_entities_v4_unified.json"),
+    ]
+    
+    try:
+        for path in possible_paths:
+            if path.exists():
+                with open(path, encoding="utf-8") as f:
+                    gazetteer = json.load(f)
+                logger.info(f"Gazetteer loaded: {path}")
+                return gazetteer
+    except Exception as e:
+        logger.warning(f"Failed to load gazetteer: {e}")
+        return {}
+    
+    logger.warning("Gazetteer not found, entity detection disabled")
+    return {}
+
+
+# Arquivo estático do deploy: compartilhado por todas as instâncias do processo
+register("nlp_gazetteer", _load_gazetteer)
+
+
 # Função de conveniência
 def analyze_query(query: str, **kwargs) -> NLPAnalysis:
     """
@@ -0,0 +1,96 @@
+"""
+Async database access for the ASGI RAG endpoints.
+
+Vector searches issued by the async views run on an ``asyncpg`` pool, so a
+request waiting on Postgres holds neither a thread nor a Django connection.
+asyncpg is used rather than psycopg 3 because installing psycopg 3 switches
+Django's own PostgreSQL backend away from psycopg2 (``common.bulk_copy``
+depends on ``copy_expert``).
+
+Queries are written in the ``%s`` style shared with the sync code paths and
+translated to asyncpg's ``$n`` placeholders. Pools open lazily, one per alias
+(search alias or read replica) and event loop, with the search connections'
+session settings (``hnsw.ef_search``, ``ivfflat.probes``, ``statement_timeout``);
+asyncpg caches prepared statements per connection. Without asyncpg, or with ``RAG_ASYNC_DB=False``, queries run
+on the search route's Django connection through ``sync_to_async``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from collections.abc import Sequence
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from common.db import ROUTE_SEARCH, route_alias, route_cursor, to_numbered_placeholders
+from common.db.replicas import replica_aliases
+from common.db.routing import route_timeout_ms
+
+try:
+    import asyncpg
+except ImportError:  # optional: queries fall back to Django's connection
+    asyncpg = None
+
+_pools: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Task]] = {}
+
+
+def async_db_enabled() -> bool:
+    return asyncpg is not None and getattr(settings, "RAG_ASYNC_DB", True)
+
+
+def _server_settings(alias: str) -> dict[str, str]:
+    options = settings.DATABASES[alias].get("OPTIONS", {}).get("options", "")
+    server_settings = dict(re.findall(r"-c\s*([\w.]+)=(\S+)", str(options)))
+    # The pool only serves requests, so the search route's timeout applies to every query
+    server_settings["statement_timeout"] = str(route_timeout_ms(ROUTE_SEARCH))
+    return server_settings
+
+
+async def _create_pool(alias: str):
+    db = settings.DATABASES[alias]
+    return await asyncpg.create_pool(
+        host=db.get("HOST") or None,
+        port=int(db["PORT"]) if db.get("PORT") else None,
+        user=db.get("USER") or None,
+        password=db.get("PASSWORD") or None,
+        database=db.get("NAME"),
+        min_size=1,
+        max_size=getattr(settings, "RAG_ASYNC_DB_POOL_SIZE", 10),
+        server_settings=_server_settings(alias),
+    )
+
+
+async def get_pool(alias: str):
+    """asyncpg pool of ``alias`` for the running event loop, opened on first use."""
+    loop = asyncio.get_running_loop()
+    entry = _pools.get(alias)
+    if entry is None or entry[0] is not loop:
+        entry = _pools[alias] = (loop, loop.create_task(_create_pool(alias)))
+    task = entry[1]
+    try:
+        return await asyncio.shield(task)
+    except Exception:
+        # Let the next request retry instead of re-raising a stale connection error forever
+        if _pools.get(alias, (None, None))[1] is task:
+            del _pools[alias]
+        raise
+
+
+def _fetchall_sync(sql: str, params: Sequence[Any]) -> list[tuple]:
+    with route_cursor() as cur:
+        cur.execute(sql, params)
+        return cur.fetchall()
+
+
+async def fetchall(sql: str, params: Sequence[Any] = ()) -> list[Sequence[Any]]:
+    """Rows of a ``%s``-style query; records are indexable and iterable like cursor tuples."""
+    if not async_db_enabled():
+        return await sync_to_async(_fetchall_sync)(sql, list(params))
+    # Choosing a replica may probe its lag through Django's (sync) connection
+    alias = await sync_to_async(route_alias)(ROUTE_SEARCH) if replica_aliases() else route_alias(ROUTE_SEARCH)
+    pool = await get_pool(alias)
+    async with pool.acquire() as conn:
+        return await conn.fetch(to_numbered_placeholders(sql), *params)
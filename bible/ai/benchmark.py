@@ -0,0 +1,384 @@
+"""
+Offline, reproducible benchmark for the hybrid search pipeline.
+
+Seeds a synthetic multi-version corpus (Portuguese theological vocabulary,
+fixed RNG seed) with embeddings from a deterministic local stub — feature
+hashing of normalized tokens, so queries and verses sharing words are close
+in vector space — and times each pipeline stage in-process:
+
+    bm25      bm25_search
+    vector    _vector_search
+    fusion    reciprocal_rank_fusion
+    rerank    _stage_reranking (query embedding from the stub, no API call)
+    mmr       _stage_mmr
+    hybrid    hybrid_search end to end (BM25 + vector + RRF)
+    hybrid_full  hybrid_search with reranking and MMR
+
+Results are plain JSON (see ``run_benchmark``) and can be compared with a
+stored baseline through ``compare_to_baseline``. Run it with
+``python manage.py search_benchmark``, which uses a throwaway database.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import platform
+import random
+import re
+import time
+import unicodedata
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any
+from unittest import mock
+
+import numpy as np
+from django.db import connection
+
+from bible.models import CanonicalBook, Language, Testament, Verse, VerseEmbedding, Version
+
+from . import reranking
+from .hybrid import (
+    _format_hits,
+    _stage_mmr,
+    _stage_reranking,
+    _vector_search,
+    bm25_search,
+    hybrid_search,
+    reciprocal_rank_fusion,
+)
+
+logger = logging.getLogger(__name__)
+
+STUB_MODEL = "local-hash-stub"
+STAGES = ("bm25", "vector", "fusion", "rerank", "mmr", "hybrid", "hybrid_full")
+
+_WORDS = (
+    "amor deus senhor graça fé esperança perdão pecado salvação justiça misericórdia paz "
+    "espírito santo reino céu terra luz trevas vida morte ressurreição cordeiro pastor "
+    "ovelhas caminho verdade palavra profeta rei templo aliança povo nações coração alma "
+    "oração louvor glória poder servo filho pai mãe irmão pão água vinho fogo monte "
+    "deserto mar rio cidade casa porta pedra rocha árvore fruto semente colheita vinha "
+    "sabedoria conhecimento temor obediência arrependimento batismo igreja discípulos "
+    "apóstolos evangelho cruz sangue sacrifício altar sacerdote lei mandamento promessa "
+    "bênção maldição juízo ira fidelidade bondade alegria tristeza lágrimas consolo "
+    "força fraqueza humildade orgulho riqueza pobreza viúva órfão estrangeiro inimigo"
+).split()
+_GLUE = "e o a de do da que em para com pelo pela seu sua os as".split()
+_SYNONYMS = {
+    "amor": "caridade",
+    "senhor": "eterno",
+    "graça": "favor",
+    "paz": "descanso",
+    "caminho": "vereda",
+    "coração": "íntimo",
+    "glória": "honra",
+    "força": "vigor",
+    "alegria": "júbilo",
+    "povo": "gente",
+}
+QUERIES = (
+    "amor de deus",
+    "perdão dos pecados",
+    "fé e esperança",
+    "paz no coração",
+    "o senhor é meu pastor",
+    "caminho verdade e vida",
+    "misericórdia e justiça",
+    "ressurreição dos mortos",
+    "sabedoria e temor",
+    "pão da vida",
+    "luz nas trevas",
+    "aliança com o povo",
+)
+_BOOKS = (
+    ("Gen", "Old Testament"),
+    ("Exod", "Old Testament"),
+    ("Ps", "Old Testament"),
+    ("Prov", "Old Testament"),
+    ("Isa", "Old Testament"),
+    ("Matt", "New Testament"),
+    ("John", "New Testament"),
+    ("Rom", "New Testament"),
+    ("Heb", "New Testament"),
+    ("Rev", "New Testament"),
+)
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    verses: int = 2000  # canonical verses; each exists once per version
+    versions: tuple[str, ...] = ("PT_BENCH_A", "PT_BENCH_B", "PT_BENCH_C")
+    dim: int = 64
+    seed: int = 42
+
+
+# ---------------------------------------------------------------------------
+# Deterministic local embeddings
+# ---------------------------------------------------------------------------
+
+
+def _tokens(text: str) -> list[str]:
+    folded = "".join(c for c in unicodedata.normalize("NFKD", text.lower()) if not unicodedata.combining(c))
+    return re.findall(r"[a-z]+", folded)
+
+
+def stub_embedding(text: str, dim: int = 64, salt: str = "") -> list[float]:
+    """L2-normalized signed feature hashing of ``text``'s tokens; identical across runs and processes."""
+    vec = np.zeros(dim)
+    for token in _tokens(text):
+        if token in _GLUE:
+            continue
+        digest = hashlib.blake2b(f"{salt}{token}".encode(), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        vec[value % dim] += 1.0 if value >> 63 else -1.0
+    norm = np.linalg.norm(vec)
+    if norm == 0:
+        vec[0] = 1.0
+        norm = 1.0
+    return (vec / norm).round(6).tolist()
+
+
+def stub_embedding_large(text: str, dim: int = 64) -> list[float]:
+    """Stand-in for the large model used by reranking: a differently-salted, wider stub."""
+    return stub_embedding(text, dim * 2, salt="large:")
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+
+
+def _render(words: list[str], variant: int, rng: random.Random) -> str:
+    out = []
+    for word in words:
+        if variant and word in _SYNONYMS and rng.random() < 0.5:
+            word = _SYNONYMS[word]
+        out.append(word)
+    if variant == 2 and len(out) > 6:
+        del out[rng.randrange(len(out))]
+    text = " ".join(out)
+    return text[0].upper() + text[1:] + "."
+
+
+def seed_corpus(spec: CorpusSpec | None = None) -> dict[str, int]:
+    """Create the synthetic books, versions, verses and stub embeddings in the current database."""
+    spec = spec or CorpusSpec()
+    rng = random.Random(spec.seed)
+    language, _ = Language.objects.get_or_create(code="pt-BR", defaults={"name": "Português"})
+    testaments = {name: Testament.objects.get_or_create(name=name)[0] for _, name in _BOOKS}
+    books = []
+    for order, (osis, testament) in enumerate(_BOOKS, start=1):
+        book, _ = CanonicalBook.objects.get_or_create(
+            osis_code=osis,
+            defaults={"canonical_order": order, "testament": testaments[testament], "chapter_count": 150},
+        )
+        books.append(book)
+    versions = [
+        Version.objects.get_or_create(code=code, defaults={"name": f"Benchmark {code}", "language": language})[0]
+        for code in spec.versions
+    ]
+
+    per_book = -(-spec.verses // len(books))
+    canonical = []
+    for i in range(spec.verses):
+        book = books[i // per_book]
+        position = i % per_book
+        length = rng.randint(8, 20)
+        words = []
+        for _ in range(length):
+            words.append(rng.choice(_GLUE) if rng.random() < 0.3 else rng.choice(_WORDS))
+        canonical.append((book, position // 30 + 1, position % 30 + 1, words))
+
+    verses = []
+    for variant, version in enumerate(versions):
+        for book, chapter, number, words in canonical:
+            verses.append(
+                Verse(
+                    book=book,
+                    version=version,
+                    chapter=chapter,
+                    number=number,
+                    text=_render(words, variant % 3, rng),
+                )
+            )
+    Verse.objects.bulk_create(verses, batch_size=2000)
+
+    VerseEmbedding.objects.bulk_create(
+        (
+            VerseEmbedding(
+                verse=verse,
+                version_code=verse.version.code,
+                model_name_small=STUB_MODEL,
+                dim_small=spec.dim,
+                embedding_small=stub_embedding(verse.text, spec.dim),
+                model_name_large=STUB_MODEL,
+                dim_large=spec.dim * 2,
+                embedding_large=stub_embedding_large(verse.text, spec.dim),
+            )
+            for verse in verses
+        ),
+        batch_size=2000,
+    )
+    _use_vector_column(spec.dim)
+    return {"verses": len(verses), "versions": len(versions), "books": len(books)}
+
+
+def _use_vector_column(dim: int) -> None:
+    """Give ``embedding_small`` the pgvector type production uses (the ORM declares it as JSON)."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT data_type FROM information_schema.columns WHERE table_name = %s AND column_name = %s",
+            [VerseEmbedding._meta.db_table, "embedding_small"],
+        )
+        if cursor.fetchone()[0] == "jsonb":
+            # Deferred FK checks from the seeding inserts would block the ALTER inside a transaction
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+            cursor.execute(
+                f"ALTER TABLE {VerseEmbedding._meta.db_table} "
+                f"ALTER COLUMN embedding_small TYPE vector({dim}) USING embedding_small::text::vector"
+            )
+        cursor.execute(f"ANALYZE {VerseEmbedding._meta.db_table}")
+        cursor.execute(f"ANALYZE {Verse._meta.db_table}")
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    arr = np.array(samples) * 1000
+    return {
+        "n": len(samples),
+        "mean_ms": round(float(arr.mean()), 3),
+        "p50_ms": round(float(np.percentile(arr, 50)), 3),
+        "p95_ms": round(float(np.percentile(arr, 95)), 3),
+        "p99_ms": round(float(np.percentile(arr, 99)), 3),
+        "ops_per_sec": round(len(samples) / float(sum(samples)), 1) if sum(samples) else 0.0,
+    }
+
+
+@contextmanager
+def _quiet_pipeline():
+    """Silence the pipeline's per-call INFO logs for the duration of the run."""
+    loggers = [logging.getLogger(name) for name in ("bible.ai.hybrid", "bible.ai.reranking", "bible.ai.mmr")]
+    levels = [lg.level for lg in loggers]
+    for lg in loggers:
+        lg.setLevel(logging.WARNING)
+    try:
+        yield
+    finally:
+        for lg, level in zip(loggers, levels, strict=True):
+            lg.setLevel(level)
+
+
+def run_benchmark(
+    spec: CorpusSpec | None = None,
+    *,
+    iterations: int = 5,
+    warmup: int = 1,
+    top_k: int = 10,
+    pool_size: int = 100,
+    queries: tuple[str, ...] = QUERIES,
+) -> dict[str, Any]:
+    """Time every stage over ``queries`` × ``iterations`` against the corpus seeded from ``spec``."""
+    spec = spec or CorpusSpec()
+    samples: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    embeddings = {q: stub_embedding(q, spec.dim) for q in queries}
+
+    def query_embedding_large(query):
+        return np.array(stub_embedding_large(query, spec.dim)), 0.0
+
+    def timed(stage, fn, *args, **kwargs):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        if recording:
+            samples[stage].append(time.perf_counter() - start)
+        return result
+
+    hits_seen = 0
+    with _quiet_pipeline(), mock.patch.object(reranking, "get_query_embedding_large", query_embedding_large):
+        for round_no in range(warmup + iterations):
+            recording = round_no >= warmup
+            for q in queries:
+                bm25 = timed("bm25", bm25_search, q, top_k=pool_size)
+                vector = timed("vector", _vector_search, embeddings[q], top_k=pool_size)
+                fused = timed("fusion", reciprocal_rank_fusion, bm25, vector, k=60, alpha=0.7)
+                hits = _format_hits(fused[:pool_size], q)
+                reranked, _, _ = timed("rerank", _stage_reranking, hits, q, pool_size, True, 0.5)
+                timed("mmr", _stage_mmr, reranked, top_k, 0.5, True)
+                result = timed(
+                    "hybrid", hybrid_search, q, embeddings[q], top_k=top_k, pool_size=pool_size, embedding_model="small"
+                )
+                timed(
+                    "hybrid_full",
+                    hybrid_search,
+                    q,
+                    embeddings[q],
+                    top_k=top_k,
+                    pool_size=pool_size,
+                    embedding_model="small",
+                    rerank_with_large=True,
+                    mmr_lambda=0.5,
+                    deduplicate_versions=True,
+                )
+                if recording:
+                    hits_seen += result["total"]
+
+    with connection.cursor() as cursor:
+        cursor.execute("SHOW server_version")
+        server_version = cursor.fetchone()[0]
+
+    return {
+        "meta": {
+            "corpus": {**asdict(spec), "versions": list(spec.versions)},
+            "iterations": iterations,
+            "warmup": warmup,
+            "queries": len(queries),
+            "top_k": top_k,
+            "pool_size": pool_size,
+            "avg_hits": round(hits_seen / max(1, iterations * len(queries)), 2),
+            "python": platform.python_version(),
+            "postgres": server_version,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "stages": {stage: _summary(values) for stage, values in samples.items()},
+    }
+
+
+def compare_to_baseline(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    tolerance: float = 0.5,
+    metric: str = "p50_ms",
+    min_delta_ms: float = 1.0,
+) -> list[dict[str, Any]]:
+    """Stages whose ``metric`` exceeds the baseline by more than ``tolerance`` (and ``min_delta_ms``).
+
+    Raises ``ValueError`` when the baseline was recorded on a different corpus, since
+    latencies from different corpus sizes are not comparable.
+    """
+    if results["meta"]["corpus"] != baseline["meta"]["corpus"]:
+        raise ValueError(
+            f"Baseline corpus {baseline['meta']['corpus']} differs from this run's {results['meta']['corpus']}"
+        )
+    regressions = []
+    for stage, current in results["stages"].items():
+        reference = baseline["stages"].get(stage)
+        if not reference or not reference.get(metric):
+            continue
+        ratio = current[metric] / reference[metric]
+        if ratio > 1 + tolerance and current[metric] - reference[metric] > min_delta_ms:
+            regressions.append(
+                {
+                    "stage": stage,
+                    "metric": metric,
+                    "baseline": reference[metric],
+                    "current": current[metric],
+                    "ratio": round(ratio, 2),
+                }
+            )
+    return regressions
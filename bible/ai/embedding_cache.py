@@ -12,8 +12,10 @@ Data: 2025-09-21
 Baseline Evidence: docs/research/BASELINE_EVIDENCE_REPORT.md
 """
 
+import asyncio
 import hashlib
 import logging
+import os
 import time
 from dataclasses import dataclass
 from typing import Any
@@ -21,6 +23,8 @@ from typing import Any
 import openai
 from django.core.cache import cache
 
+from common.warm_start import register
+
 logger = logging.getLogger(__name__)
 
 
@@ -102,6 +106,9 @@ class EmbeddingCache:
         "thanksgiving",
     ]
 
+    # Modelos usados pelo RAG, aquecidos com as queries acima
+    WARMUP_MODELS = ["text-embedding-3-small", "text-embedding-3-large"]
+
     def __init__(
         self, cache_timeout: int = 86400 * 7, enable_precomputing: bool = True, track_metrics: bool = True  # 1 semana
     ):
@@ -111,8 +118,6 @@ class EmbeddingCache:
         self.metrics = EmbeddingCacheMetrics()
 
         # Configure OpenAI client
-        import os
-
         openai.api_key = os.getenv("OPENAI_API_KEY")
 
         if enable_precomputing:
@@ -135,18 +140,7 @@ class EmbeddingCache:
         cached_embedding = cache.get(cache_key)
 
         if cached_embedding is not None:
-            cache_latency = (time.time() - start_time) * 1000
-
-            if self.track_metrics:
-                self.metrics.cache_hits += 1
-                self.metrics.total_requests += 1
-                self.metrics.avg_cache_latency_ms = self._update_avg(
-                    self.metrics.avg_cache_latency_ms, cache_latency, self.metrics.cache_hits
-                )
-
-            logger.info(f"Cache HIT para query: {query[:50]}... (latência: {cache_latency:.1f}ms)")
-
-            return cached_embedding, {"source": "cache", "latency_ms": cache_latency, "cache_key": cache_key}
+            return cached_embedding, self._record_hit(query, cache_key, start_time)
 
         # Cache miss - chamar API OpenAI
         api_start = time.time()
@@ -155,37 +149,87 @@ class EmbeddingCache:
             response = openai.embeddings.create(input=[normalized_query], model=model)
 
             embedding = response.data[0].embedding
-            api_latency = (time.time() - api_start) * 1000
-            total_latency = (time.time() - start_time) * 1000
 
             # Armazenar no cache
             cache.set(cache_key, embedding, self.cache_timeout)
 
-            if self.track_metrics:
-                self.metrics.cache_misses += 1
-                self.metrics.total_requests += 1
-                self.metrics.avg_api_latency_ms = self._update_avg(
-                    self.metrics.avg_api_latency_ms, api_latency, self.metrics.cache_misses
-                )
+            return embedding, self._record_miss(query, cache_key, model, start_time, api_start)
 
-                # Calcular custo poupado (estimativa)
-                self.metrics.total_api_cost_saved += self._estimate_api_cost(model)
+        except Exception as e:
+            logger.error(f"Erro ao obter embedding da API OpenAI: {e}")
+            raise
 
-            logger.info(
-                f"Cache MISS para query: {query[:50]}... (API: {api_latency:.1f}ms, Total: {total_latency:.1f}ms)"
-            )
+    async def aget_embedding(
+        self, query: str, model: str = "text-embedding-3-small"
+    ) -> tuple[list[float], dict[str, Any]]:
+        """
+        Versão assíncrona de ``get_embedding`` para as views ASGI.
+
+        Aguarda o cache e a API OpenAI (``AsyncOpenAI``) sem bloquear o worker.
+        """
+        start_time = time.time()
+
+        normalized_query = self._normalize_query(query)
+        cache_key = self._get_cache_key(normalized_query, model)
+
+        cached_embedding = await cache.aget(cache_key)
+        if cached_embedding is not None:
+            return cached_embedding, self._record_hit(query, cache_key, start_time)
 
-            return embedding, {
-                "source": "openai_api",
-                "latency_ms": total_latency,
-                "api_latency_ms": api_latency,
-                "cache_key": cache_key,
-            }
+        api_start = time.time()
 
+        try:
+            response = await _get_async_client().embeddings.create(input=[normalized_query], model=model)
         except Exception as e:
             logger.error(f"Erro ao obter embedding da API OpenAI: {e}")
             raise
 
+        embedding = response.data[0].embedding
+        await cache.aset(cache_key, embedding, self.cache_timeout)
+
+        return embedding, self._record_miss(query, cache_key, model, start_time, api_start)
+
+    def _record_hit(self, query: str, cache_key: str, start_time: float) -> dict[str, Any]:
+        """Registrar métricas de um cache hit e retornar o info do embedding."""
+        cache_latency = (time.time() - start_time) * 1000
+
+        if self.track_metrics:
+            self.metrics.cache_hits += 1
+            self.metrics.total_requests += 1
+            self.metrics.avg_cache_latency_ms = self._update_avg(
+                self.metrics.avg_cache_latency_ms, cache_latency, self.metrics.cache_hits
+            )
+
+        logger.info(f"Cache HIT para query: {query[:50]}... (latência: {cache_latency:.1f}ms)")
+
+        return {"source": "cache", "latency_ms": cache_latency, "cache_key": cache_key}
+
+    def _record_miss(
+        self, query: str, cache_key: str, model: str, start_time: float, api_start: float
+    ) -> dict[str, Any]:
+        """Registrar métricas de uma chamada à API e retornar o info do embedding."""
+        api_latency = (time.time() - api_start) * 1000
+        total_latency = (time.time() - start_time) * 1000
+
+        if self.track_metrics:
+            self.metrics.cache_misses += 1
+            self.metrics.total_requests += 1
+            self.metrics.avg_api_latency_ms = self._update_avg(
+                self.metrics.avg_api_latency_ms, api_latency, self.metrics.cache_misses
+            )
+
+            # Calcular custo poupado (estimativa)
+            self.metrics.total_api_cost_saved += self._estimate_api_cost(model)
+
+        logger.info(f"Cache MISS para query: {query[:50]}... (API: {api_latency:.1f}ms, Total: {total_latency:.1f}ms)")
+
+        return {
+            "source": "openai_api",
+            "latency_ms": total_latency,
+            "api_latency_ms": api_latency,
+            "cache_key": cache_key,
+        }
+
     def precompute_embeddings(self, queries: list[str], model: str = "text-embedding-3-small") -> dict[str, Any]:
         """
         Precomputar embeddings para queries específicas.
@@ -281,9 +325,7 @@ class EmbeddingCache:
         # Precompute em background (não bloquear inicialização)
         try:
             # Warm-up para ambos os modelos usados pelo RAG
-            models_to_warmup = ["text-embedding-3-small", "text-embedding-3-large"]
-
-            for model in models_to_warmup:
+            for model in self.WARMUP_MODELS:
                 logger.info(f"Warm-up iniciado para modelo: {model}")
                 result = self.precompute_embeddings(self.COMMON_THEOLOGICAL_QUERIES, model=model)
                 logger.info(f"Warm-up {model}: {result['precomputed']} precomputed, {result['already_cached']} cached")
@@ -333,10 +375,45 @@ class EmbeddingCache:
         }
 
 
+_async_client: tuple[asyncio.AbstractEventLoop, openai.AsyncOpenAI] | None = None
+
+
+def _get_async_client() -> openai.AsyncOpenAI:
+    """``AsyncOpenAI`` do event loop atual (suas conexões HTTP ficam presas ao loop que as abriu)."""
+    global _async_client
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client[0] is not loop:
+        _async_client = (loop, openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY")))
+    return _async_client[1]
+
+
 # Cache global instance
 # Do NOT perform warm-up at import time (can be expensive and requires OPENAI_API_KEY).
 # Default to disable precomputing on import; callers can trigger warm-up explicitly
 # by calling `embedding_cache._warmup_common_embeddings()` or by creating a
 # background task. This avoids side-effects during imports (tests, management
 # commands, CI).
+# Worker boots restore them from the warm-start snapshot instead (common.warm_start).
 embedding_cache = EmbeddingCache(enable_precomputing=False)
+
+
+def _cached_common_embeddings() -> dict[str, list[float]]:
+    """Embeddings das queries comuns já presentes no cache (sem chamar a API)."""
+    keys = [
+        embedding_cache._get_cache_key(embedding_cache._normalize_query(query), model)
+        for model in EmbeddingCache.WARMUP_MODELS
+        for query in EmbeddingCache.COMMON_THEOLOGICAL_QUERIES
+    ]
+    return cache.get_many(keys)
+
+
+def _restore_common_embeddings(embeddings: dict[str, list[float]]) -> None:
+    """Devolve ao cache os embeddings do snapshot que faltam, no lugar do warm-up via API."""
+    present = cache.get_many(list(embeddings))
+    missing = {key: vector for key, vector in embeddings.items() if key not in present}
+    if missing:
+        cache.set_many(missing, embedding_cache.cache_timeout)
+        logger.info(f"Warm start: {len(missing)} embeddings comuns restaurados no cache")
+
+
+register("common_embeddings", _cached_common_embeddings, install=_restore_common_embeddings)
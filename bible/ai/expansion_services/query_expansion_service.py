@@ -238,14 +238,13 @@ class QueryExpansionService:
         return "".join(c for c in nfkd if not unicodedata.combining(c))
 
     def _get_from_cache(self, query_normalized: str) -> "QueryExpansionCache | None":
-        """Busca expansão no cache do banco."""
+        """Busca expansão no cache (Redis, com fallback para o banco)."""
+        from bible.ai.usage_counters import cached_row
         from bible.models import QueryExpansionCache
 
         try:
             # Busca direta com query normalizada (já sem acentos)
-            cached = QueryExpansionCache.objects.filter(
-                query_normalized=query_normalized
-            ).first()
+            cached = cached_row(QueryExpansionCache, query_normalized)
 
             if cached:
                 # Incrementa contador de uso
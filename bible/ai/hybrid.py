@@ -17,13 +17,23 @@ Data: Nov 2025
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 import time
 from dataclasses import dataclass
 from typing import Any, Literal, TYPE_CHECKING
 
-from django.db import connection
+from common.db import execute_prepared, route_cursor
+from common.observability.metrics import (
+    HYBRID_CACHE_TOTAL,
+    HYBRID_MATCH_SOURCE,
+    HYBRID_POOL_SIZE,
+    HYBRID_STAGE_DB_QUERIES,
+    HYBRID_STAGE_DB_TIME,
+    HYBRID_STAGE_LATENCY,
+)
+from common.observability.queries import QueryProbe, probe_queries
 
 from .query_expansion import expand_query, expand_query_for_bm25, ExpandedQuery
 
@@ -213,8 +223,8 @@ def bm25_search(
     
     results = []
     try:
-        with connection.cursor() as cur:
-            cur.execute(sql, params)
+        with route_cursor() as cur:
+            execute_prepared(cur, sql, params)
             rows = cur.fetchall()
             
             for i, row in enumerate(rows):
@@ -278,7 +288,7 @@ def _fallback_like_search(
     sql = "\n".join(sql_parts)
     
     results = []
-    with connection.cursor() as cur:
+    with route_cursor() as cur:
         cur.execute(sql, params)
         rows = cur.fetchall()
         
@@ -671,17 +681,22 @@ def _stage_vector_search(
             query_embedding, top_k=pool_size, versions=versions, book_id=book_id,
             embedding_column=embedding_col,
         )
-        embedding_info.update({
-            "table": "verse_embeddings",
-            "records": "529K (por versão)",
-            "languages": ["pt", "en"],
-            "versions_filter": versions,
-        })
+        embedding_info = _verse_embedding_info(versions)
 
     elapsed = (time.time() - t0) * 1000
     return vector_results, embedding_info, elapsed
 
 
+def _verse_embedding_info(versions: list[str] | None) -> dict[str, Any]:
+    return {
+        "source": "verse",
+        "table": "verse_embeddings",
+        "records": "529K (por versão)",
+        "languages": ["pt", "en"],
+        "versions_filter": versions,
+    }
+
+
 def _format_hits(
     candidates: list[dict[str, Any]],
     query: str,
@@ -950,40 +965,193 @@ def hybrid_search(
     """
     start_time = time.time()
     timings: dict[str, float] = {}
+    probes: dict[str, QueryProbe] = {}
 
-    # Stage 0: NLP Analysis
-    alpha, expand_query_flag, entity_boost, optimized_tsquery, nlp_info, nlp_ms = (
-        _stage_nlp_analysis(query, use_nlp_analysis, alpha, expand_query_flag, alpha_user_provided)
-    )
-    if nlp_ms:
-        timings["nlp_ms"] = nlp_ms
-
-    # Stage 0b: Query Expansion
-    search_query, expansion_info, expansion_ms = (
-        _stage_query_expansion(query, expand_query_flag, expand_mode, max_synonyms)
-    )
-    if expansion_ms:
-        timings["expansion_ms"] = expansion_ms
-
-    # Stage 1: BM25 Search
-    bm25_results, timings["bm25_ms"] = _stage_bm25(
-        query, search_query, optimized_tsquery, expand_query_flag, expansion_info,
-        entity_boost, bm25_original_boost, pool_size, versions, book_id,
+    alpha, expand_query_flag, nlp_info, expansion_info, bm25_results = _lexical_stages(
+        query, use_nlp_analysis, alpha, expand_query_flag, alpha_user_provided, expand_mode, max_synonyms,
+        bm25_original_boost, pool_size, versions, book_id, timings, probes,
     )
 
     # Stage 1b: Re-embed with expanded terms (Opção D)
+    embedding_cache_hit = None
     if reembed_after_expansion and expansion_info.get("expanded_terms"):
         from .embedding_cache import EmbeddingCache
         expanded_text = query + " " + " ".join(expansion_info["expanded_terms"])
         _cache = EmbeddingCache()
-        query_embedding, _ = _cache.get_embedding(expanded_text, model=embed_model_name)
+        query_embedding, embed_info = _cache.get_embedding(expanded_text, model=embed_model_name)
+        embedding_cache_hit = embed_info.get("source") == "cache"
         timings["reembed_ms"] = 0.0  # timing included in vector_ms
 
     # Stage 2: Vector Search
-    vector_results, embedding_info, timings["vector_ms"] = _stage_vector_search(
-        query_embedding, pool_size, versions, book_id, embedding_source, embedding_model,
+    with probe_queries() as probes["vector"]:
+        vector_results, embedding_info, timings["vector_ms"] = _stage_vector_search(
+            query_embedding, pool_size, versions, book_id, embedding_source, embedding_model,
+        )
+
+    return _fuse_and_rank(
+        query, bm25_results, vector_results, embedding_info, start_time, timings, probes,
+        alpha=alpha, expand_query_flag=expand_query_flag, nlp_info=nlp_info, expansion_info=expansion_info,
+        embedding_cache_hit=embedding_cache_hit, top_k=top_k, pool_size=pool_size, rrf_k=rrf_k,
+        rerank_with_large=rerank_with_large, mmr_lambda=mmr_lambda, deduplicate_versions=deduplicate_versions,
+        embedding_source=embedding_source, use_nlp_analysis=use_nlp_analysis,
+    )
+
+
+async def ahybrid_search(
+    query: str,
+    *,
+    embed_model_name: str = "text-embedding-3-small",
+    top_k: int = 20,
+    pool_size: int = 100,
+    versions: list[str] | None = None,
+    book_id: int | None = None,
+    alpha: float = 0.7,
+    alpha_user_provided: bool = False,
+    rrf_k: int = 60,
+    expand_query_flag: bool = False,
+    expand_mode: Literal["static", "dynamic", "auto"] = "auto",
+    max_synonyms: int = 3,
+    rerank_with_large: bool = False,
+    mmr_lambda: float | None = None,
+    deduplicate_versions: bool = False,
+    embedding_source: Literal["verse", "unified"] = "verse",
+    embedding_model: str = "large",
+    reembed_after_expansion: bool = False,
+    use_nlp_analysis: bool = False,
+    bm25_original_boost: float = 1.5,
+) -> dict[str, Any]:
+    """
+    Versão assíncrona de ``hybrid_search`` para as views ASGI.
+
+    O embedding da query (``AsyncOpenAI``) é obtido enquanto as etapas léxicas
+    (NLP, expansão, BM25) rodam numa thread; a busca vetorial em
+    ``verse_embeddings`` usa o driver assíncrono de ``bible.ai.aio``. Busca
+    ``unified`` e reranking com embeddings large continuam síncronos, numa thread.
+    """
+    from asgiref.sync import sync_to_async
+
+    from .aio import fetchall
+    from .embedding_cache import embedding_cache
+
+    start_time = time.time()
+    timings: dict[str, float] = {}
+    probes: dict[str, QueryProbe] = {}
+
+    lexical, (query_embedding, embed_info) = await asyncio.gather(
+        sync_to_async(_lexical_stages)(
+            query, use_nlp_analysis, alpha, expand_query_flag, alpha_user_provided, expand_mode, max_synonyms,
+            bm25_original_boost, pool_size, versions, book_id, timings, probes,
+        ),
+        embedding_cache.aget_embedding(query, model=embed_model_name),
+    )
+    alpha, expand_query_flag, nlp_info, expansion_info, bm25_results = lexical
+    record_cache_lookup("embedding", embed_info.get("source") == "cache")
+
+    # Stage 1b: Re-embed with expanded terms
+    embedding_cache_hit = None
+    if reembed_after_expansion and expansion_info.get("expanded_terms"):
+        expanded_text = query + " " + " ".join(expansion_info["expanded_terms"])
+        query_embedding, embed_info = await embedding_cache.aget_embedding(expanded_text, model=embed_model_name)
+        embedding_cache_hit = embed_info.get("source") == "cache"
+        timings["reembed_ms"] = 0.0
+
+    # Stage 2: Vector Search
+    if embedding_source == "verse":
+        t0 = time.time()
+        embedding_col = "embedding_large" if embedding_model == "large" else "embedding_small"
+        rows = await fetchall(
+            *_vector_search_sql(
+                query_embedding, top_k=pool_size, versions=versions, book_id=book_id, embedding_column=embedding_col,
+            )
+        )
+        vector_results = _vector_rows(rows)
+        embedding_info = _verse_embedding_info(versions)
+        timings["vector_ms"] = (time.time() - t0) * 1000
+    else:
+        vector_results, embedding_info, timings["vector_ms"] = await sync_to_async(_stage_vector_search)(
+            query_embedding, pool_size, versions, book_id, embedding_source, embedding_model,
+        )
+
+    finish = sync_to_async(_fuse_and_rank) if rerank_with_large else _fuse_and_rank
+    result = finish(
+        query, bm25_results, vector_results, embedding_info, start_time, timings, probes,
+        alpha=alpha, expand_query_flag=expand_query_flag, nlp_info=nlp_info, expansion_info=expansion_info,
+        embedding_cache_hit=embedding_cache_hit, top_k=top_k, pool_size=pool_size, rrf_k=rrf_k,
+        rerank_with_large=rerank_with_large, mmr_lambda=mmr_lambda, deduplicate_versions=deduplicate_versions,
+        embedding_source=embedding_source, use_nlp_analysis=use_nlp_analysis,
     )
+    return await result if rerank_with_large else result
+
+
+def _lexical_stages(
+    query: str,
+    use_nlp_analysis: bool,
+    alpha: float,
+    expand_query_flag: bool,
+    alpha_user_provided: bool,
+    expand_mode: Literal["static", "dynamic", "auto"],
+    max_synonyms: int,
+    bm25_original_boost: float,
+    pool_size: int,
+    versions: list[str] | None,
+    book_id: int | None,
+    timings: dict[str, float],
+    probes: dict[str, QueryProbe],
+) -> tuple[float, bool, dict[str, Any], dict[str, Any], list[dict[str, Any]]]:
+    """Stages 0-1 (NLP analysis, query expansion, BM25): everything that doesn't need the query embedding.
+
+    Returns (alpha, expand_query_flag, nlp_info, expansion_info, bm25_results).
+    """
+    # Stage 0: NLP Analysis
+    with probe_queries() as probes["nlp"]:
+        alpha, expand_query_flag, entity_boost, optimized_tsquery, nlp_info, nlp_ms = (
+            _stage_nlp_analysis(query, use_nlp_analysis, alpha, expand_query_flag, alpha_user_provided)
+        )
+    if nlp_ms:
+        timings["nlp_ms"] = nlp_ms
+
+    # Stage 0b: Query Expansion
+    with probe_queries() as probes["expansion"]:
+        search_query, expansion_info, expansion_ms = (
+            _stage_query_expansion(query, expand_query_flag, expand_mode, max_synonyms)
+        )
+    if expansion_ms:
+        timings["expansion_ms"] = expansion_ms
+
+    # Stage 1: BM25 Search
+    with probe_queries() as probes["bm25"]:
+        bm25_results, timings["bm25_ms"] = _stage_bm25(
+            query, search_query, optimized_tsquery, expand_query_flag, expansion_info,
+            entity_boost, bm25_original_boost, pool_size, versions, book_id,
+        )
+
+    return alpha, expand_query_flag, nlp_info, expansion_info, bm25_results
+
 
+def _fuse_and_rank(
+    query: str,
+    bm25_results: list[dict[str, Any]],
+    vector_results: list[dict[str, Any]],
+    embedding_info: dict[str, Any],
+    start_time: float,
+    timings: dict[str, float],
+    probes: dict[str, QueryProbe],
+    *,
+    alpha: float,
+    expand_query_flag: bool,
+    nlp_info: dict[str, Any],
+    expansion_info: dict[str, Any],
+    embedding_cache_hit: bool | None,
+    top_k: int,
+    pool_size: int,
+    rrf_k: int,
+    rerank_with_large: bool,
+    mmr_lambda: float | None,
+    deduplicate_versions: bool,
+    embedding_source: str,
+    use_nlp_analysis: bool,
+) -> dict[str, Any]:
+    """Stages 3-6 (RRF fusion, formatting, reranking, MMR), metrics and the final result."""
     # Stage 3: RRF Fusion
     t0 = time.time()
     fused_results = reciprocal_rank_fusion(
@@ -996,9 +1164,10 @@ def hybrid_search(
     hits = _format_hits(fused_results[:candidate_limit], query)
 
     # Stage 5: Reranking
-    hits, reranking_info, rerank_ms = _stage_reranking(
-        hits, query, top_k, rerank_with_large, mmr_lambda,
-    )
+    with probe_queries() as probes["rerank"]:
+        hits, reranking_info, rerank_ms = _stage_reranking(
+            hits, query, top_k, rerank_with_large, mmr_lambda,
+        )
     if rerank_ms:
         timings["rerank_ms"] = rerank_ms
 
@@ -1009,6 +1178,16 @@ def hybrid_search(
 
     # Assemble result
     total_time = (time.time() - start_time) * 1000
+    _record_stage_metrics(
+        timings, probes, total_time, nlp_info, expansion_info, embedding_cache_hit,
+        pools={
+            "bm25": len(bm25_results),
+            "vector": len(vector_results),
+            "fused": len(fused_results),
+            "returned": len(hits),
+        },
+        hits=hits,
+    )
     return _assemble_result(
         hits=hits, timings=timings, alpha=alpha, rrf_k=rrf_k, pool_size=pool_size,
         expand_query_flag=expand_query_flag, rerank_with_large=rerank_with_large,
@@ -1021,6 +1200,56 @@ def hybrid_search(
     )
 
 
+def record_cache_lookup(cache_name: str, hit: bool) -> None:
+    """Count a hybrid search cache lookup (``embedding``, ``expansion`` or ``nlp``)."""
+    try:
+        HYBRID_CACHE_TOTAL.labels(cache=cache_name, result="hit" if hit else "miss").inc()
+    except Exception:
+        logger.debug("Failed to record cache metric", exc_info=True)
+
+
+def _record_stage_metrics(
+    timings: dict[str, float],
+    probes: dict[str, QueryProbe],
+    total_ms: float,
+    nlp_info: dict[str, Any],
+    expansion_info: dict[str, Any],
+    embedding_cache_hit: bool | None,
+    pools: dict[str, int],
+    hits: list[dict[str, Any]],
+) -> None:
+    """Export per-stage latency, DB load, cache sources and pool sizes to Prometheus.
+
+    Only stages that actually ran (present in ``timings``) are observed, so skipped
+    optional stages don't drag their histograms towards zero.
+    """
+    try:
+        for key, elapsed_ms in timings.items():
+            stage = key.removesuffix("_ms")
+            if stage == "reembed":
+                continue
+            HYBRID_STAGE_LATENCY.labels(stage=stage).observe(elapsed_ms / 1000)
+            probe = probes.get(stage)
+            if probe is not None:
+                HYBRID_STAGE_DB_QUERIES.labels(stage=stage).observe(probe.queries)
+                HYBRID_STAGE_DB_TIME.labels(stage=stage).observe(probe.seconds)
+        HYBRID_STAGE_LATENCY.labels(stage="total").observe(total_ms / 1000)
+
+        if nlp_info.get("enabled") and "from_cache" in nlp_info:
+            record_cache_lookup("nlp", bool(nlp_info["from_cache"]))
+        if expansion_info.get("mode") in ("dynamic", "cached"):
+            record_cache_lookup("expansion", bool(expansion_info.get("from_cache")))
+        if embedding_cache_hit is not None:
+            record_cache_lookup("embedding", embedding_cache_hit)
+
+        for pool, size in pools.items():
+            HYBRID_POOL_SIZE.labels(pool=pool).observe(size)
+        for hit in hits:
+            HYBRID_MATCH_SOURCE.labels(match_source=hit.get("match_source", "unknown")).inc()
+    except Exception:
+        logger.debug("Failed to record hybrid search metrics", exc_info=True)
+
+
 def _vector_search(
     embedding: list[float],
     *,
@@ -1030,9 +1259,34 @@ def _vector_search(
     embedding_column: str = "embedding_small",
 ) -> list[dict[str, Any]]:
     """Busca vetorial simples para uso interno."""
+    sql, params = _vector_search_sql(
+        embedding, top_k=top_k, versions=versions, book_id=book_id, embedding_column=embedding_column,
+        vector_param=True,
+    )
+    with route_cursor() as cur:
+        execute_prepared(cur, sql, params)
+        rows = cur.fetchall()
+
+    return _vector_rows(rows)
+
+
+def _vector_search_sql(
+    embedding: list[float],
+    *,
+    top_k: int,
+    versions: list[str] | None,
+    book_id: int | None,
+    embedding_column: str,
+    vector_param: bool = False,
+) -> tuple[str, list[Any]]:
+    """SQL e parâmetros da busca vetorial em ``verse_embeddings``.
+
+    Com ``vector_param`` o embedding vai como parâmetro (texto estável, preparável);
+    sem ele vai literal no SQL, como o caminho asyncpg espera (sem codec de pgvector).
+    """
     dim = len(embedding)
     nums = ",".join(format(float(x), ".8g") for x in embedding)
-    vec_sql = f"ARRAY[{nums}]::vector({dim})"
+    vec_sql = f"%s::vector({dim})" if vector_param else f"ARRAY[{nums}]::vector({dim})"
 
     col = "embedding_small" if embedding_column not in ("embedding_small", "embedding_large") else embedding_column
 
@@ -1052,7 +1306,7 @@ def _vector_search(
         f"WHERE ve.{col} IS NOT NULL",
     ]
     
-    params: list[Any] = []
+    params: list[Any] = [f"[{nums}]"] if vector_param else []
     
     if versions:
         sql_parts.append("AND ve.version_code = ANY(%s)")
@@ -1068,28 +1322,27 @@ def _vector_search(
     ])
     params.append(top_k)
     
-    sql = "\n".join(sql_parts)
-    
+    return "\n".join(sql_parts), params
+
+
+def _vector_rows(rows) -> list[dict[str, Any]]:
+    """Linhas de ``_vector_search_sql`` → resultados com rank e score vetorial."""
     results = []
-    with connection.cursor() as cur:
-        cur.execute(sql, params)
-        rows = cur.fetchall()
-        
-        for i, row in enumerate(rows):
-            dist = float(row[7])
-            results.append({
-                "verse_id": row[0],
-                "book_id": row[1],
-                "book_osis": row[2],
-                "chapter": row[3],
-                "verse": row[4],
-                "text": row[5],
-                "version_code": row[6],
-                "distance": dist,
-                "similarity": 1.0 - dist,
-                "vector_score": 1.0 - dist,
-                "vector_rank": i + 1,
-            })
+    for i, row in enumerate(rows):
+        dist = float(row[7])
+        results.append({
+            "verse_id": row[0],
+            "book_id": row[1],
+            "book_osis": row[2],
+            "chapter": row[3],
+            "verse": row[4],
+            "text": row[5],
+            "version_code": row[6],
+            "distance": dist,
+            "similarity": 1.0 - dist,
+            "vector_score": 1.0 - dist,
+            "vector_rank": i + 1,
+        })
     
     return results
 
@@ -1163,7 +1416,7 @@ def _vector_search_unified(
     sql = "\n".join(sql_parts)
     
     results = []
-    with connection.cursor() as cur:
+    with route_cursor() as cur:
         cur.execute(sql, params)
         rows = cur.fetchall()
         
@@ -1236,7 +1489,7 @@ def _enrich_unified_results(
     """
     
     verse_map = {}
-    with connection.cursor() as cur:
+    with route_cursor() as cur:
         cur.execute(sql, [preferred_version, canonical_ids])
         for row in cur.fetchall():
             verse_map[row[0]] = {
@@ -1249,7 +1502,7 @@ def _enrich_unified_results(
     # Se algum não foi encontrado na versão preferida, tenta NVI
     missing = [cid for cid in canonical_ids if cid not in verse_map]
     if missing and preferred_version != "NVI":
-        with connection.cursor() as cur:
+        with route_cursor() as cur:
             cur.execute(sql, ["NVI", missing])
             for row in cur.fetchall():
                 if row[0] not in verse_map:
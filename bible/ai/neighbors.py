@@ -0,0 +1,183 @@
+"""Precomputed semantic neighbors for every embedded verse.
+
+``build_neighbors`` loads each version's ``embedding_small`` vectors once,
+L2-normalizes them and ranks all pairs with blocked matrix products (one
+``block_size × n`` similarity slab at a time, so memory stays bounded), keeping
+the top-N per verse as compact id/score arrays in ``VerseNeighbors``.
+
+``similar_verses`` serves ``/ai/rag/similar/`` from that table with a single
+indexed lookup that unnests the arrays and joins the verse rows; it returns
+``None`` when the verse has no row (or a shorter list than requested) so the
+caller can fall back to live vector search.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+import numpy as np
+from django.db import connection, transaction
+
+from bible.models import Verse, VerseEmbedding, VerseNeighbors
+
+logger = logging.getLogger(__name__)
+
+# Neighbors kept per verse; RagSimilarView caps top_k at 20
+NEIGHBORS = 20
+# Rows of the similarity matrix computed per product (block_size × n float32)
+BLOCK_SIZE = 512
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+
+def _parse_vector(text: str) -> np.ndarray:
+    """``'[0.1, 0.2]'`` (jsonb or pgvector text form) to a float32 array."""
+    return np.array(text.strip("[]").split(","), dtype=np.float32)
+
+
+def _load_version(version_code: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Verse ids, chapter keys and the normalized embedding matrix of one version."""
+    with connection.cursor() as cursor:
+        # ``::text`` reads the column the same way whether it is jsonb or pgvector
+        cursor.execute(
+            "SELECT ve.verse_id, v.book_id, v.chapter, ve.embedding_small::text "
+            f"FROM {VerseEmbedding._meta.db_table} ve JOIN {Verse._meta.db_table} v ON v.id = ve.verse_id "
+            "WHERE ve.version_code = %s AND ve.embedding_small IS NOT NULL ORDER BY ve.verse_id",
+            [version_code],
+        )
+        rows = cursor.fetchall()
+    if not rows:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty((0, 0), dtype=np.float32)
+
+    ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+    chapter_keys = np.fromiter((r[1] * 1000 + r[2] for r in rows), dtype=np.int64, count=len(rows))
+    matrix = np.vstack([_parse_vector(r[3]) for r in rows])
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix /= np.where(norms == 0, 1, norms)
+    return ids, chapter_keys, matrix
+
+
+def _top_n(sims: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Column indices and scores of the ``k`` largest values per row, best first."""
+    k = min(k, sims.shape[1])
+    part = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+    scores = np.take_along_axis(sims, part, axis=1)
+    order = np.argsort(-scores, axis=1, kind="stable")
+    return np.take_along_axis(part, order, axis=1), np.take_along_axis(scores, order, axis=1)
+
+
+def _ranked(ids: np.ndarray, cols: np.ndarray, scores: np.ndarray) -> tuple[list[int], list[float]]:
+    keep = np.isfinite(scores)
+    return ids[cols[keep]].tolist(), np.round(scores[keep].astype(np.float64), 4).tolist()
+
+
+def neighbor_rows(version_code: str, *, top_n: int = NEIGHBORS, block_size: int = BLOCK_SIZE) -> list[VerseNeighbors]:
+    """Compute (without saving) the neighbor rows of every embedded verse of ``version_code``."""
+    ids, chapter_keys, matrix = _load_version(version_code)
+    n = len(ids)
+    rows: list[VerseNeighbors] = []
+    if n < 2:
+        return rows
+
+    for start in range(0, n, block_size):
+        end = min(start + block_size, n)
+        sims = matrix[start:end] @ matrix.T
+        sims[np.arange(end - start), np.arange(start, end)] = -np.inf
+        any_cols, any_scores = _top_n(sims, top_n)
+        sims[chapter_keys[start:end, None] == chapter_keys[None, :]] = -np.inf
+        ext_cols, ext_scores = _top_n(sims, top_n)
+
+        for i in range(end - start):
+            neighbor_ids, neighbor_scores = _ranked(ids, any_cols[i], any_scores[i])
+            external_ids, external_scores = _ranked(ids, ext_cols[i], ext_scores[i])
+            rows.append(
+                VerseNeighbors(
+                    verse_id=int(ids[start + i]),
+                    version_code=version_code,
+                    model_name=EMBEDDING_MODEL,
+                    top_n=top_n,
+                    neighbor_ids=neighbor_ids,
+                    neighbor_scores=neighbor_scores,
+                    external_ids=external_ids,
+                    external_scores=external_scores,
+                )
+            )
+    return rows
+
+
+def build_neighbors(
+    versions: list[str] | None = None, *, top_n: int = NEIGHBORS, block_size: int = BLOCK_SIZE
+) -> dict[str, Any]:
+    """Rebuild ``VerseNeighbors`` for ``versions`` (default: every embedded version).
+
+    Each version is replaced atomically, so readers see either the old or the new
+    table for that version, never a partial one.
+    """
+    if versions is None:
+        versions = sorted(set(VerseEmbedding.objects.values_list("version_code", flat=True)))
+
+    stats: dict[str, Any] = {"versions": {}, "verses": 0}
+    started = time.perf_counter()
+    for version_code in versions:
+        t0 = time.perf_counter()
+        rows = neighbor_rows(version_code, top_n=top_n, block_size=block_size)
+        with transaction.atomic():
+            VerseNeighbors.objects.filter(version_code=version_code).delete()
+            VerseNeighbors.objects.bulk_create(rows, batch_size=2000)
+        elapsed = time.perf_counter() - t0
+        stats["versions"][version_code] = {"verses": len(rows), "seconds": round(elapsed, 2)}
+        stats["verses"] += len(rows)
+        logger.info("Built %d neighbor rows for %s in %.1fs", len(rows), version_code, elapsed)
+    stats["seconds"] = round(time.perf_counter() - started, 2)
+    return stats
+
+
+_SIMILAR_SQL = f"""
+SELECT v.id, v.book_id, cb.osis_code, COALESCE(bn.name, cb.osis_code), v.chapter, v.number, v.text,
+       ver.code, ver.name, n.score
+FROM {VerseNeighbors._meta.db_table} vn
+CROSS JOIN LATERAL unnest(
+    CASE WHEN %(external)s THEN vn.external_ids ELSE vn.neighbor_ids END,
+    CASE WHEN %(external)s THEN vn.external_scores ELSE vn.neighbor_scores END
+) WITH ORDINALITY AS n(verse_id, score, rank)
+JOIN verses v ON v.id = n.verse_id
+JOIN canonical_books cb ON cb.id = v.book_id
+JOIN versions ver ON ver.id = v.version_id
+LEFT JOIN LATERAL (
+    SELECT name FROM book_names
+    WHERE canonical_book_id = cb.id AND language_id = ver.language_id
+      AND (version_id = ver.id OR version_id IS NULL)
+    ORDER BY version_id IS NULL
+    LIMIT 1
+) bn ON TRUE
+WHERE vn.verse_id = %(verse_id)s AND vn.top_n >= %(top_k)s AND n.rank <= %(top_k)s
+ORDER BY n.rank
+"""
+
+
+def similar_verses(verse_id: int, *, top_k: int = 5, exclude_same_chapter: bool = True) -> list[dict] | None:
+    """Precomputed neighbors of ``verse_id`` as RAG hits, or ``None`` when the table can't supply ``top_k`` of them."""
+    with connection.cursor() as cursor:
+        cursor.execute(_SIMILAR_SQL, {"verse_id": verse_id, "top_k": top_k, "external": exclude_same_chapter})
+        rows = cursor.fetchall()
+    if len(rows) < top_k:
+        return None  # missing, built with a smaller top_n, or too few neighbors outside the chapter
+    return [
+        {
+            "id": vid,
+            "verse_id": vid,
+            "reference": f"{book_name} {chapter}:{number}",
+            "text": text,
+            "book_osis": osis,
+            "book_name": book_name,
+            "book_id": book_id,
+            "chapter": chapter,
+            "verse": number,
+            "version_code": version_code,
+            "version_name": version_name,
+            "score": round(score, 4),
+            "distance": round(1.0 - score, 4),
+        }
+        for vid, book_id, osis, book_name, chapter, number, text, version_code, version_name, score in rows
+    ]
@@ -32,7 +32,8 @@ from dataclasses import dataclass, field
 from typing import Any
 
 import numpy as np
-from django.db import connection
+
+from common.db import route_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -110,7 +111,7 @@ def get_large_embeddings_batch(verse_ids: list[int]) -> dict[int, np.ndarray]:
     """
     
     embeddings = {}
-    with connection.cursor() as cur:
+    with route_cursor() as cur:
         cur.execute(sql, verse_ids)
         for row in cur.fetchall():
             verse_id = row[0]
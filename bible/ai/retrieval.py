@@ -33,7 +33,7 @@ from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
-from django.db import connection
+from common.db import execute_prepared, route_cursor
 
 from .embedding_cache import embedding_cache
 
@@ -55,6 +55,11 @@ class RetrievalMetrics:
 
 def _vector_array_sql(vec: Sequence[float], dim: int) -> str:
     """Converter vetor para SQL array - mantido do v1.0 para compatibilidade."""
+    return f"ARRAY{_vector_literal(vec, dim)}::vector({dim})"
+
+
+def _vector_literal(vec: Sequence[float], dim: int) -> str:
+    """Vetor validado no formato texto do pgvector (``[0.1,0.2,...]``)."""
     if not vec:
         raise ValueError("Vector vazio")
     if len(vec) != dim:
@@ -63,7 +68,7 @@ def _vector_array_sql(vec: Sequence[float], dim: int) -> str:
         else:
             raise ValueError(f"Dimensão incorreta: esperado {dim}, recebido {len(vec)}")
     nums = ",".join(format(float(x), ".8g") for x in vec)
-    return f"ARRAY[{nums}]::vector({dim})"
+    return f"[{nums}]"
 
 
 def _normalize_query(text: str) -> str:
@@ -152,8 +157,78 @@ def retrieve_v1_1(
     # === BUSCA VETORIAL - Mantida do v1.0 ===
     start_search = time.time()
 
+    sql, params = _search_sql(query_vec, top_k, versions, book_id, chapter, chapter_end, vector_param=True)
+
+    # Executar busca vetorial
+    with route_cursor() as cur:
+        execute_prepared(cur, sql, params)
+        rows = cur.fetchall()
+
+    metrics.search_time_ms = (time.time() - start_search) * 1000
+
+    return _build_response(_rows_to_hits(rows), query_vec, top_k, metrics, start_total, enable_metrics)
+
+
+async def aretrieve(
+    *,
+    query: str | None = None,
+    vector: Sequence[float] | None = None,
+    top_k: int = 10,
+    versions: Sequence[str] | None = None,
+    book_id: int | None = None,
+    chapter: int | None = None,
+    chapter_end: int | None = None,
+    enable_metrics: bool = True,
+) -> dict[str, Any]:
+    """
+    Versão assíncrona de ``retrieve`` para as views ASGI.
+
+    Aguarda o embedding da query (``AsyncOpenAI``) e a busca vetorial (driver
+    assíncrono de ``bible.ai.aio``) em vez de bloquear o worker.
+    """
+    from .aio import fetchall
+
+    start_total = time.time()
+
+    if vector is None and (query is None or not query.strip()):
+        raise ValueError("Informe 'query' ou 'vector'.")
+
+    metrics = RetrievalMetrics(
+        query_time_ms=0, embedding_time_ms=0, search_time_ms=0, total_time_ms=0, cache_hit=False, results_count=0
+    )
+
+    if vector is None:
+        start_embedding = time.time()
+        query_vec, embedding_info = await embedding_cache.aget_embedding(query.strip(), model="text-embedding-3-small")
+        metrics.embedding_time_ms = (time.time() - start_embedding) * 1000
+        metrics.cache_hit = embedding_info.get("source") == "cache"
+    else:
+        query_vec = list(map(float, vector))
+        metrics.cache_hit = True
+
+    start_search = time.time()
+    rows = await fetchall(*_search_sql(query_vec, top_k, versions, book_id, chapter, chapter_end))
+    metrics.search_time_ms = (time.time() - start_search) * 1000
+
+    return _build_response(_rows_to_hits(rows), query_vec, top_k, metrics, start_total, enable_metrics)
+
+
+def _search_sql(
+    query_vec: Sequence[float],
+    top_k: int,
+    versions: Sequence[str] | None,
+    book_id: int | None,
+    chapter: int | None,
+    chapter_end: int | None,
+    vector_param: bool = False,
+) -> tuple[str, list[Any]]:
+    """SQL e parâmetros da busca vetorial (embedding small).
+
+    Com ``vector_param`` o vetor vai como parâmetro, deixando o texto da query
+    estável para ``execute_prepared``; o caminho asyncpg usa o literal.
+    """
     dim = 1536  # small
-    vec_sql = _vector_array_sql(query_vec, dim)
+    vec_sql = "%s::vector(1536)" if vector_param else _vector_array_sql(query_vec, dim)
 
     # Aplicar RAG_ALLOWED_VERSIONS se não especificado
     if not versions:
@@ -170,7 +245,7 @@ def retrieve_v1_1(
         "JOIN canonical_books cb ON cb.id = v.book_id",
     ]
     where = ["ve.embedding_small IS NOT NULL"]
-    params: list[Any] = []
+    params: list[Any] = [_vector_literal(query_vec, dim)] if vector_param else []
 
     if versions:
         where.append("ve.version_code = ANY(%s)")
@@ -195,17 +270,11 @@ def retrieve_v1_1(
     sql.append("LIMIT %s")
     params.append(fetch_limit)
 
-    full_sql = "\n".join(sql)
-
-    # Executar busca vetorial
-    with connection.cursor() as cur:
-        cur.execute(full_sql, params)
-        rows = cur.fetchall()
+    return "\n".join(sql), params
 
-    search_time = (time.time() - start_search) * 1000
-    metrics.search_time_ms = search_time
 
-    # === PROCESSAMENTO DE RESULTADOS - Mantido do v1.0 ===
+def _rows_to_hits(rows) -> list[dict[str, Any]]:
+    """Linhas da busca vetorial → hits (distância convertida em similaridade)."""
     raw_hits = []
     for r in rows:
         verse_id, b_id, ch, num, text, ver, osis, dist = r
@@ -225,7 +294,18 @@ def retrieve_v1_1(
                 "distance": dist,
             }
         )
+    return raw_hits
+
 
+def _build_response(
+    raw_hits: list[dict[str, Any]],
+    query_vec: list[float],
+    top_k: int,
+    metrics: RetrievalMetrics,
+    start_total: float,
+    enable_metrics: bool,
+) -> dict[str, Any]:
+    """Reranking opcional, corte em ``top_k``, métricas finais e resposta."""
     # === APLICAR RERANKING (se habilitado) ===
     # Mantida lógica do v1.0 para compatibilidade
     final_hits = raw_hits
@@ -0,0 +1,23 @@
+"""RAG search services (``rag``) and chapter/commentary analysis helpers."""
+
+from .rag import (
+    RagSearchResult,
+    asearch,
+    asearch_hybrid,
+    get_cache_stats,
+    get_similar_verses,
+    health_check,
+    search,
+    search_hybrid,
+)
+
+__all__ = [
+    "RagSearchResult",
+    "search",
+    "search_hybrid",
+    "asearch",
+    "asearch_hybrid",
+    "get_similar_verses",
+    "get_cache_stats",
+    "health_check",
+]
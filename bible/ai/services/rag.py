@@ -15,12 +15,14 @@ import os
 from dataclasses import dataclass
 from typing import Any
 
+from asgiref.sync import sync_to_async
 from django.core.cache import cache
 
 from bible.models import Book, Version
+from common.warm_start import process_value, register
 
-from . import retrieval as rag_core
-from .embedding_cache import embedding_cache
+from .. import retrieval as rag_core
+from ..embedding_cache import embedding_cache
 
 logger = logging.getLogger(__name__)
 
@@ -48,11 +50,17 @@ class RagSearchResult:
 
 def _get_book_data_cached() -> dict[int, dict[str, str]]:
     """
-    Retorna um dicionário com dados dos livros, usando cache.
+    Retorna um dicionário com dados dos livros, da memória do processo
+    (semeada pelo snapshot de warm start) ou do cache.
     
     Returns:
         Dict mapeando book_id para {osis_code, name}
     """
+    return process_value("rag_book_data")
+
+
+def _load_book_data() -> dict[int, dict[str, str]]:
+    """Dados dos livros do Redis ou, na falta, do banco."""
     cache_key = "rag_book_data"
     book_data = cache.get(cache_key)
     
@@ -81,11 +89,17 @@ def _get_book_data_cached() -> dict[int, dict[str, str]]:
 
 def _get_version_data_cached() -> dict[str, dict[str, str]]:
     """
-    Retorna um dicionário com dados das versões, usando cache.
+    Retorna um dicionário com dados das versões, da memória do processo
+    (semeada pelo snapshot de warm start) ou do cache.
     
     Returns:
         Dict mapeando version_code para {code, name, abbreviation}
     """
+    return process_value("rag_version_data")
+
+
+def _load_version_data() -> dict[str, dict[str, str]]:
+    """Dados das versões do Redis ou, na falta, do banco."""
     cache_key = "rag_version_data"
     version_data = cache.get(cache_key)
     
@@ -103,6 +117,11 @@ def _get_version_data_cached() -> dict[str, dict[str, str]]:
     return version_data
 
 
+# Rótulos dos hits, mantidos por processo enquanto os datasets não mudam
+register("rag_book_data", _load_book_data, datasets=("books",))
+register("rag_version_data", _load_version_data, datasets=("verses",))
+
+
 def _format_reference(book_name: str, chapter: int, verse: int) -> str:
     """Formata uma referência bíblica legível."""
     return f"{book_name} {chapter}:{verse}"
@@ -201,29 +220,104 @@ def search(
         logger.error(f"Erro na busca RAG: {e}")
         raise
     
-    # Enriquecer hits
-    raw_hits = result.get("hits", [])
+    enriched_hits = _collect_hits(result.get("hits", []), book_data, version_data, top_k=top_k, min_score=min_score)
+
+    return RagSearchResult(
+        hits=enriched_hits,
+        total=len(enriched_hits),
+        timing=result.get("timing", {}),
+        query=query,
+        top_k=top_k,
+    )
+
+
+async def asearch(
+    query: str,
+    *,
+    top_k: int = 10,
+    versions: list[str] | None = None,
+    book_id: int | None = None,
+    min_score: float | None = None,
+) -> RagSearchResult:
+    """
+    Versão assíncrona de ``search`` para as views ASGI.
+
+    O embedding e a busca vetorial são aguardados (``rag_core.aretrieve``);
+    os dados auxiliares de livros/versões vêm do cache numa thread.
+    """
+    if not query or not query.strip():
+        raise ValueError("Query não pode estar vazia")
+
+    query = query.strip()
+    top_k = max(1, min(top_k, 50))
+
+    book_data = await sync_to_async(_get_book_data_cached)()
+    version_data = await sync_to_async(_get_version_data_cached)()
+
+    try:
+        result = await rag_core.aretrieve(
+            query=query,
+            top_k=top_k * 2 if min_score else top_k,
+            versions=versions,
+            book_id=book_id,
+        )
+    except Exception as e:
+        logger.error(f"Erro na busca RAG: {e}")
+        raise
+
+    enriched_hits = _collect_hits(result.get("hits", []), book_data, version_data, top_k=top_k, min_score=min_score)
+
+    return RagSearchResult(
+        hits=enriched_hits,
+        total=len(enriched_hits),
+        timing=result.get("timing", {}),
+        query=query,
+        top_k=top_k,
+    )
+
+
+def _collect_hits(
+    raw_hits: list[dict[str, Any]],
+    book_data: dict,
+    version_data: dict,
+    *,
+    top_k: int,
+    min_score: float | None,
+    hybrid: bool = False,
+    rerank: bool = False,
+) -> list[dict[str, Any]]:
+    """Enriquece os hits, aplica o score mínimo e corta em ``top_k``."""
     enriched_hits = []
-    
+
     for hit in raw_hits:
         enriched = _enrich_hit(hit, book_data, version_data)
-        
+
+        if hybrid:
+            # Adicionar métricas extras do hybrid
+            enriched["bm25_score"] = hit.get("bm25_score")
+            enriched["vector_score"] = hit.get("vector_score")
+            enriched["rrf_score"] = hit.get("rrf_score")
+
+            # Flags de origem do match
+            enriched["match_source"] = hit.get("match_source")
+            enriched["contains_query"] = hit.get("contains_query")
+
+        # Métricas de reranking (se disponíveis)
+        if rerank:
+            enriched["large_similarity"] = hit.get("large_similarity")
+            enriched["original_rank"] = hit.get("original_rank")
+            enriched["rank_shift"] = hit.get("rank_shift")
+
         # Aplicar filtro de score mínimo
         if min_score is not None and enriched["score"] < min_score:
             continue
-        
+
         enriched_hits.append(enriched)
-        
+
         if len(enriched_hits) >= top_k:
             break
-    
-    return RagSearchResult(
-        hits=enriched_hits,
-        total=len(enriched_hits),
-        timing=result.get("timing", {}),
-        query=query,
-        top_k=top_k,
-    )
+
+    return enriched_hits
 
 
 def search_hybrid(
@@ -282,7 +376,7 @@ def search_hybrid(
     Returns:
         RagSearchResult com hits enriquecidos
     """
-    from .hybrid import hybrid_search
+    from ..hybrid import hybrid_search, record_cache_lookup
     
     if not query or not query.strip():
         raise ValueError("Query não pode estar vazia")
@@ -294,7 +388,8 @@ def search_hybrid(
     
     # Obter embedding da query (model depends on embedding_model param)
     embed_model_name = "text-embedding-3-large" if embedding_model == "large" else "text-embedding-3-small"
-    query_embedding, _ = embedding_cache.get_embedding(query, model=embed_model_name)
+    query_embedding, embed_info = embedding_cache.get_embedding(query, model=embed_model_name)
+    record_cache_lookup("embedding", embed_info.get("source") == "cache")
 
     # Buscar dados auxiliares
     book_data = _get_book_data_cached()
@@ -333,40 +428,101 @@ def search_hybrid(
         logger.exception(f"Erro inesperado na busca híbrida: {e}")
         raise
     
-    # Enriquecer hits
-    raw_hits = result.get("hits", [])
-    enriched_hits = []
-    
-    for hit in raw_hits:
-        enriched = _enrich_hit(hit, book_data, version_data)
-        
-        # Adicionar métricas extras do hybrid
-        enriched["bm25_score"] = hit.get("bm25_score")
-        enriched["vector_score"] = hit.get("vector_score")
-        enriched["rrf_score"] = hit.get("rrf_score")
-        
-        # Flags de origem do match
-        enriched["match_source"] = hit.get("match_source")
-        enriched["contains_query"] = hit.get("contains_query")
-        
-        # Métricas de reranking (se disponíveis)
-        if rerank:
-            enriched["large_similarity"] = hit.get("large_similarity")
-            enriched["original_rank"] = hit.get("original_rank")
-            enriched["rank_shift"] = hit.get("rank_shift")
-        
-        if min_score is not None and enriched["score"] < min_score:
-            continue
-        
-        enriched_hits.append(enriched)
-        
-        if len(enriched_hits) >= top_k:
-            break
-    
+    return _hybrid_result(
+        result, book_data, version_data, query=query, top_k=top_k, alpha=alpha, min_score=min_score, rerank=rerank
+    )
+
+
+async def asearch_hybrid(
+    query: str,
+    *,
+    top_k: int = 10,
+    versions: list[str] | None = None,
+    book_id: int | None = None,
+    alpha: float | None = None,
+    min_score: float | None = None,
+    expand_query: bool = False,
+    expand_mode: str = "auto",
+    max_synonyms: int = 3,
+    rerank: bool = False,
+    mmr_lambda: float | None = None,
+    deduplicate_versions: bool = False,
+    embedding_source: str = "verse",
+    embedding_model: str = "large",
+    reembed_after_expansion: bool = False,
+) -> RagSearchResult:
+    """
+    Versão assíncrona de ``search_hybrid`` para as views ASGI.
+
+    Mesmos parâmetros e resultado; o embedding da query é obtido em paralelo
+    com o BM25 (ver ``hybrid.ahybrid_search``).
+    """
+    from ..hybrid import ahybrid_search
+
+    if not query or not query.strip():
+        raise ValueError("Query não pode estar vazia")
+
+    query = query.strip()
+    top_k = max(1, min(top_k, 50))
+    alpha_user_provided = alpha is not None
+    alpha = alpha if alpha is not None else HYBRID_ALPHA
+    embed_model_name = "text-embedding-3-large" if embedding_model == "large" else "text-embedding-3-small"
+
+    book_data = await sync_to_async(_get_book_data_cached)()
+    version_data = await sync_to_async(_get_version_data_cached)()
+
+    try:
+        result = await ahybrid_search(
+            query,
+            embed_model_name=embed_model_name,
+            top_k=top_k * 2 if min_score else top_k,
+            pool_size=300,
+            versions=versions,
+            book_id=book_id,
+            alpha=alpha,
+            alpha_user_provided=alpha_user_provided,
+            expand_query_flag=expand_query,
+            expand_mode=expand_mode,
+            max_synonyms=max_synonyms,
+            rerank_with_large=rerank,
+            mmr_lambda=mmr_lambda,
+            deduplicate_versions=deduplicate_versions,
+            embedding_source=embedding_source,
+            embedding_model=embedding_model,
+            reembed_after_expansion=reembed_after_expansion,
+        )
+    except (ConnectionError, TimeoutError, OSError) as e:
+        logger.warning(f"Busca híbrida falhou por conexão/timeout, fallback para vetorial: {e}")
+        return await asearch(query, top_k=top_k, versions=versions, book_id=book_id, min_score=min_score)
+    except Exception as e:
+        logger.exception(f"Erro inesperado na busca híbrida: {e}")
+        raise
+
+    return _hybrid_result(
+        result, book_data, version_data, query=query, top_k=top_k, alpha=alpha, min_score=min_score, rerank=rerank
+    )
+
+
+def _hybrid_result(
+    result: dict[str, Any],
+    book_data: dict,
+    version_data: dict,
+    *,
+    query: str,
+    top_k: int,
+    alpha: float,
+    min_score: float | None,
+    rerank: bool,
+) -> RagSearchResult:
+    """``RagSearchResult`` de uma busca híbrida: hits enriquecidos e metadados das etapas opcionais."""
+    enriched_hits = _collect_hits(
+        result.get("hits", []), book_data, version_data, top_k=top_k, min_score=min_score, hybrid=True, rerank=rerank
+    )
+
     timing = result.get("timing", {})
     timing["hybrid"] = True
     timing["alpha"] = alpha
-    
+
     rag_result = RagSearchResult(
         hits=enriched_hits,
         total=len(enriched_hits),
@@ -374,19 +530,19 @@ def search_hybrid(
         query=query,
         top_k=top_k,
     )
-    
+
     # Adicionar info de query expansion se disponível
     if "query_expansion" in result:
         rag_result.query_expansion = result["query_expansion"]
-    
+
     # Adicionar info de reranking se disponível
     if "reranking" in result:
         rag_result.reranking = result["reranking"]
-    
+
     # Adicionar info de MMR se disponível
     if "mmr_diversification" in result:
         rag_result.mmr_diversification = result["mmr_diversification"]
-    
+
     return rag_result
 
 
@@ -450,7 +606,7 @@ def get_similar_verses(
 
 def get_cache_stats() -> dict[str, Any]:
     """Retorna estatísticas do cache de embeddings."""
-    from .embedding_cache import embedding_cache
+    from ..embedding_cache import embedding_cache
     
     return embedding_cache.get_cache_stats()
 
@@ -28,6 +28,9 @@ urlpatterns = [
     path("rag/retrieve/", views.RagRetrieveView.as_view(), name="rag_retrieve"),
     path("rag/search/", views.RagSearchView.as_view(), name="rag_search"),
     path("rag/hybrid/", views.RagHybridSearchView.as_view(), name="rag_hybrid"),
+    # Async variants (same contract) for ASGI workers
+    path("rag/search/async/", views.RagSearchAsyncView.as_view(), name="rag_search_async"),
+    path("rag/hybrid/async/", views.RagHybridSearchAsyncView.as_view(), name="rag_hybrid_async"),
     path("rag/similar/", views.RagSimilarView.as_view(), name="rag_similar"),
     path("rag/health/", views.RagHealthView.as_view(), name="rag_health"),
     path("rag/stats/", views.RagStatsView.as_view(), name="rag_stats"),
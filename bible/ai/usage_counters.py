@@ -0,0 +1,180 @@
+"""
+Contadores de uso adiados e em lote para os caches de expansão e NLP.
+
+Antes, cada hit em ``QueryExpansionCache``/``QueryNLPCache`` fazia um
+``save(update_fields=["usage_count", "last_used_at"])``: toda busca cacheada
+virava uma escrita com lock de linha, e queries populares disputavam a mesma
+linha. Agora:
+
+- ``record_hit`` só acumula em memória (contagem + último uso) por processo;
+- ``flush`` grava tudo com um ``UPDATE ... FROM (VALUES ...)`` por modelo, a
+  cada ``USAGE_FLUSH_INTERVAL`` segundos (thread daemon), quando
+  ``USAGE_FLUSH_MAX_PENDING`` chaves se acumulam e na saída do processo.
+  Contagens de um flush que falhou voltam para a fila;
+- ``cached_row`` serve as linhas do cache do Django (Redis) em vez de um
+  ``filter().first()`` por busca; ``post_save``/``post_delete`` mantêm o cache
+  coerente.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import logging
+import threading
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from bible.models import QueryExpansionCache, QueryNLPCache
+
+logger = logging.getLogger(__name__)
+
+KEY_FIELD = "query_normalized"
+TRACKED_MODELS = (QueryExpansionCache, QueryNLPCache)
+
+# model -> {query_normalized: [hits, last_used_at]}
+_pending: dict[type[Model], dict[str, list]] = {}
+_lock = threading.Lock()
+_wake = threading.Event()
+_flusher: threading.Thread | None = None
+
+
+def _flush_interval() -> float:
+    return getattr(settings, "USAGE_FLUSH_INTERVAL", 30.0)
+
+
+def record_hit(model: type[Model], key: str, when: datetime | None = None) -> None:
+    """Conta um hit em ``key`` sem tocar o banco; gravado no próximo ``flush``."""
+    when = when or timezone.now()
+    with _lock:
+        entries = _pending.setdefault(model, {})
+        entry = entries.get(key)
+        if entry is None:
+            entries[key] = [1, when]
+        else:
+            entry[0] += 1
+            entry[1] = max(entry[1], when)
+        backlog = sum(len(e) for e in _pending.values())
+
+    if backlog >= getattr(settings, "USAGE_FLUSH_MAX_PENDING", 500):
+        if _flush_interval() > 0:
+            _ensure_flusher()
+            _wake.set()
+        else:
+            flush()
+    elif _flush_interval() > 0:
+        _ensure_flusher()
+
+
+def pending_hits() -> dict[str, dict[str, int]]:
+    """Hits ainda não gravados, por tabela (diagnóstico/testes)."""
+    with _lock:
+        return {model._meta.db_table: {k: v[0] for k, v in entries.items()} for model, entries in _pending.items()}
+
+
+def flush() -> int:
+    """Grava os hits acumulados; retorna o número de linhas atualizadas."""
+    global _pending
+    with _lock:
+        batch, _pending = _pending, {}
+
+    updated = 0
+    for model, entries in batch.items():
+        if not entries:
+            continue
+        try:
+            updated += _apply(model, entries)
+        except DatabaseError as e:
+            logger.warning("Usage flush for %s failed, keeping %d keys: %s", model._meta.db_table, len(entries), e)
+            _requeue(model, entries)
+    return updated
+
+
+def _apply(model: type[Model], entries: dict[str, list]) -> int:
+    table = connection.ops.quote_name(model._meta.db_table)
+    rows = sorted(entries.items())  # fixed lock order across concurrent flushes
+    values = ", ".join(["(%s, %s, %s::timestamptz)"] * len(rows))
+    params = [value for key, (hits, seen) in rows for value in (key, hits, seen)]
+    sql = (
+        f"UPDATE {table} AS t SET usage_count = t.usage_count + v.hits, "
+        f"last_used_at = GREATEST(COALESCE(t.last_used_at, v.seen), v.seen) "
+        f"FROM (VALUES {values}) AS v(key, hits, seen) WHERE t.{KEY_FIELD} = v.key"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.rowcount
+
+
+def _requeue(model: type[Model], entries: dict[str, list]) -> None:
+    with _lock:
+        current = _pending.setdefault(model, {})
+        for key, (hits, seen) in entries.items():
+            entry = current.setdefault(key, [0, seen])
+            entry[0] += hits
+            entry[1] = max(entry[1], seen)
+
+
+def _run_flusher() -> None:
+    while True:
+        _wake.wait(_flush_interval())
+        _wake.clear()
+        try:
+            flush()
+        except Exception:
+            logger.exception("Usage flush failed")
+        finally:
+            connection.close()  # back to the pool between flushes
+
+
+def _ensure_flusher() -> None:
+    global _flusher
+    if _flusher is not None and _flusher.is_alive():
+        return
+    with _lock:
+        if _flusher is None or not _flusher.is_alive():
+            _flusher = threading.Thread(target=_run_flusher, name="usage-counter-flush", daemon=True)
+            _flusher.start()
+
+
+atexit.register(flush)
+
+
+# ---------------------------------------------------------------------------
+# Leitura das linhas via cache
+# ---------------------------------------------------------------------------
+
+
+def _row_key(model: type[Model], key: str) -> str:
+    return f"ai-row:{model._meta.db_table}:{hashlib.sha1(key.encode()).hexdigest()}"
+
+
+def cached_row(model: type[Model], key: str):
+    """Linha de ``model`` com ``query_normalized == key``, do cache quando possível (``None`` se não existe)."""
+    cache_key = _row_key(model, key)
+    row = cache.get(cache_key)
+    if row is None:
+        row = model.objects.filter(**{KEY_FIELD: key}).first()
+        if row is not None:
+            cache.set(cache_key, row, getattr(settings, "AI_LOOKUP_CACHE_TIMEOUT", 86400))
+    return row
+
+
+def _store_row(sender, instance, **kwargs) -> None:
+    cache.set(
+        _row_key(sender, getattr(instance, KEY_FIELD)), instance, getattr(settings, "AI_LOOKUP_CACHE_TIMEOUT", 86400)
+    )
+
+
+def _drop_row(sender, instance, **kwargs) -> None:
+    cache.delete(_row_key(sender, getattr(instance, KEY_FIELD)))
+
+
+for _model in TRACKED_MODELS:
+    post_save.connect(_store_row, sender=_model, dispatch_uid=f"usage_counters_store_{_model.__name__}")
+    post_delete.connect(_drop_row, sender=_model, dispatch_uid=f"usage_counters_drop_{_model.__name__}")
@@ -4,6 +4,7 @@ Skeleton implementation with auth and schema annotations.
 """
 
 import json
+import logging
 import time
 
 from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schema
@@ -11,9 +12,11 @@ from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from common.async_views import AsyncAPIView
 from common.observability.metrics import LATENCY, REQUESTS
 from common.openapi import get_error_responses
 
+from . import neighbors as rag_neighbors
 from . import retrieval as rag_svc
 from .serializers import (
     AgentRunApproveRequestSerializer,
@@ -23,6 +26,8 @@ from .serializers import (
     ToolTestResponseSerializer,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class AgentListView(generics.ListAPIView):
     """List available AI agents."""
@@ -435,6 +440,173 @@ from .serializers import (
 )
 
 
+_TRUE_VALUES = ("true", "1", "yes")
+
+
+def _validation_error(detail):
+    return Response({"detail": detail, "code": "validation_error"}, status=400)
+
+
+def _clamped_float(value):
+    """Float em [0, 1], ou ``None`` quando ausente/inválido."""
+    if not value:
+        return None
+    try:
+        return max(0.0, min(float(value), 1.0))
+    except ValueError:
+        return None
+
+
+def _parse_top_k(request):
+    try:
+        return max(1, min(int(request.query_params.get("top_k") or 10), 50))
+    except ValueError:
+        return 10
+
+
+def _parse_search_params(request):
+    """Parâmetros de ``rag_service.search`` a partir da query string, ou a resposta 400."""
+    q = (request.query_params.get("q") or "").strip()
+    if not q:
+        return None, _validation_error("Parâmetro 'q' é obrigatório")
+    if len(q) < 3:
+        return None, _validation_error("Query deve ter no mínimo 3 caracteres")
+
+    version = request.query_params.get("version")
+    return {
+        "query": q,
+        "top_k": _parse_top_k(request),
+        "versions": [version] if version else None,
+        "min_score": _clamped_float(request.query_params.get("min_score")),
+    }, None
+
+
+def _parse_hybrid_params(request):
+    """Parâmetros de ``rag_service.search_hybrid`` a partir da query string, ou a resposta 400."""
+    query_params = request.query_params
+    q = (query_params.get("q") or "").strip()
+    if not q:
+        return None, _validation_error("Parâmetro 'q' é obrigatório")
+    if len(q) < 2:
+        return None, _validation_error("Query deve ter no mínimo 2 caracteres")
+
+    version = query_params.get("version")
+
+    # Query Expansion
+    expand_mode = query_params.get("expand_mode", "auto")
+    if expand_mode not in ("static", "dynamic", "auto"):
+        expand_mode = "auto"
+    try:
+        max_synonyms = max(1, min(int(query_params.get("max_synonyms", "3")), 5))
+    except ValueError:
+        max_synonyms = 3
+
+    # Embedding source: verse (default, all versions) or unified (PT only, faster)
+    embedding_source = query_params.get("embedding_source", "verse")
+    if embedding_source not in ("verse", "unified"):
+        embedding_source = "verse"
+
+    # Embedding model: large (3072d, optimal per TCC Exp6) or small (1536d, faster)
+    embedding_model = query_params.get("embedding_model", "large")
+    if embedding_model not in ("small", "large"):
+        embedding_model = "large"
+
+    return {
+        "query": q,
+        "top_k": _parse_top_k(request),
+        "versions": [version] if version else None,
+        "alpha": _clamped_float(query_params.get("alpha")),
+        "expand_query": query_params.get("expand", "").lower() in _TRUE_VALUES,
+        "expand_mode": expand_mode,
+        "max_synonyms": max_synonyms,
+        # Reranking with large embeddings
+        "rerank": query_params.get("rerank", "").lower() in _TRUE_VALUES,
+        # MMR Diversification
+        "mmr_lambda": _clamped_float(query_params.get("mmr_lambda")),
+        # Deduplicate versions
+        "deduplicate_versions": query_params.get("dedupe", "").lower() in _TRUE_VALUES,
+        "embedding_source": embedding_source,
+        "embedding_model": embedding_model,
+        # Re-embed after expansion: generate new embedding with expanded terms
+        "reembed_after_expansion": query_params.get("reembed", "").lower() in _TRUE_VALUES,
+    }, None
+
+
+def _observe(view_name, lang, params, duration):
+    version = params["versions"][0] if params["versions"] else "-"
+    REQUESTS.labels(method="GET", status="200", view=view_name, lang=lang, version=version).inc()
+    LATENCY.labels(view=view_name, lang=lang, version=version).observe(duration)
+
+
+def _search_response(result, view_name, lang, params, duration):
+    _observe(view_name, lang, params, duration)
+    return Response(
+        {
+            "hits": result.hits,
+            "total": result.total,
+            "timing": result.timing,
+            "query": result.query,
+        },
+        status=200,
+    )
+
+
+def _hybrid_response(result, view_name, lang, params, duration):
+    _observe(view_name, lang, params, duration)
+    response_data = {
+        "hits": result.hits,
+        "total": result.total,
+        "timing": result.timing,
+        "query": result.query,
+        "search_type": "hybrid",
+        "embedding_source": params["embedding_source"],
+    }
+
+    # Info de expansão, reranking e MMR quando as etapas rodaram
+    for key in ("query_expansion", "reranking", "mmr_diversification"):
+        if getattr(result, key, None):
+            response_data[key] = getattr(result, key)
+
+    return Response(response_data, status=200)
+
+
+RAG_SEARCH_PARAMETERS = [
+    OpenApiParameter(
+        name="q",
+        location=OpenApiParameter.QUERY,
+        required=True,
+        description="Texto da consulta semântica (mínimo 3 caracteres)",
+        type=str,
+        examples=[
+            OpenApiExample("amor", value="amor de Deus"),
+            OpenApiExample("salvação", value="salvação pela graça"),
+            OpenApiExample("confiança", value="confiar no Senhor"),
+        ],
+    ),
+    OpenApiParameter(
+        name="top_k",
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="Número máximo de resultados (1-50, default: 10)",
+        type=int,
+    ),
+    OpenApiParameter(
+        name="version",
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="Código da versão bíblica (ex: 'ACF', 'NVI')",
+        type=str,
+    ),
+    OpenApiParameter(
+        name="min_score",
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="Score mínimo de similaridade (0.0-1.0)",
+        type=float,
+    ),
+]
+
+
 class RagSearchView(APIView):
     """
     Busca semântica (RAG) de versículos.
@@ -463,41 +635,7 @@ class RagSearchView(APIView):
         - "promessas de Deus para os fiéis"
         """,
         tags=["rag"],
-        parameters=[
-            OpenApiParameter(
-                name="q",
-                location=OpenApiParameter.QUERY,
-                required=True,
-                description="Texto da consulta semântica (mínimo 3 caracteres)",
-                type=str,
-                examples=[
-                    OpenApiExample("amor", value="amor de Deus"),
-                    OpenApiExample("salvação", value="salvação pela graça"),
-                    OpenApiExample("confiança", value="confiar no Senhor"),
-                ],
-            ),
-            OpenApiParameter(
-                name="top_k",
-                location=OpenApiParameter.QUERY,
-                required=False,
-                description="Número máximo de resultados (1-50, default: 10)",
-                type=int,
-            ),
-            OpenApiParameter(
-                name="version",
-                location=OpenApiParameter.QUERY,
-                required=False,
-                description="Código da versão bíblica (ex: 'ACF', 'NVI')",
-                type=str,
-            ),
-            OpenApiParameter(
-                name="min_score",
-                location=OpenApiParameter.QUERY,
-                required=False,
-                description="Score mínimo de similaridade (0.0-1.0)",
-                type=float,
-            ),
-        ],
+        parameters=RAG_SEARCH_PARAMETERS,
         responses={
             200: RagSearchResponseSerializer,
             400: {"description": "Parâmetros inválidos"},
@@ -507,64 +645,17 @@ class RagSearchView(APIView):
     def get(self, request, *args, **kwargs):
         view_name = self.__class__.__name__
         lang = getattr(request, "lang_code", "-")
-        
-        # Validar parâmetros
-        q = (request.query_params.get("q") or "").strip()
-        if not q:
-            return Response(
-                {"detail": "Parâmetro 'q' é obrigatório", "code": "validation_error"},
-                status=400,
-            )
-        
-        if len(q) < 3:
-            return Response(
-                {"detail": "Query deve ter no mínimo 3 caracteres", "code": "validation_error"},
-                status=400,
-            )
-        
-        # Extrair parâmetros
-        try:
-            top_k = int(request.query_params.get("top_k") or 10)
-            top_k = max(1, min(top_k, 50))
-        except ValueError:
-            top_k = 10
-        
-        version = request.query_params.get("version")
-        versions = [version] if version else None
-        
-        min_score = None
-        if request.query_params.get("min_score"):
-            try:
-                min_score = float(request.query_params.get("min_score"))
-                min_score = max(0.0, min(min_score, 1.0))
-            except ValueError:
-                pass
-        
+
+        params, error = _parse_search_params(request)
+        if error is not None:
+            return error
+
         # Executar busca
         try:
             t0 = time.time()
-            result = rag_service.search(
-                query=q,
-                top_k=top_k,
-                versions=versions,
-                min_score=min_score,
-            )
-            dur = time.time() - t0
-            
-            # Métricas
-            REQUESTS.labels(method="GET", status="200", view=view_name, lang=lang, version=version or "-").inc()
-            LATENCY.labels(view=view_name, lang=lang, version=version or "-").observe(dur)
-            
-            # Resposta
-            response_data = {
-                "hits": result.hits,
-                "total": result.total,
-                "timing": result.timing,
-                "query": result.query,
-            }
-            
-            return Response(response_data, status=200)
-            
+            result = rag_service.search(**params)
+            return _search_response(result, view_name, lang, params, time.time() - t0)
+
         except ValueError as e:
             return Response(
                 {"detail": str(e), "code": "validation_error"},
@@ -657,24 +748,37 @@ class RagSimilarView(APIView):
         
         exclude_same_chapter = request.query_params.get("exclude_same_chapter", "true").lower() != "false"
         
-        # Executar busca
+        # Executar busca: tabela de vizinhos pré-computada, com busca vetorial ao vivo como fallback
         try:
             t0 = time.time()
-            result = rag_service.get_similar_verses(
-                verse_id=verse_id,
+            hits = rag_neighbors.similar_verses(
+                verse_id,
                 top_k=top_k,
                 exclude_same_chapter=exclude_same_chapter,
             )
+            source = "precomputed"
+            if hits is not None:
+                elapsed_ms = round((time.time() - t0) * 1000, 2)
+                timing = {"total_ms": elapsed_ms, "search_ms": elapsed_ms}
+            else:
+                source = "live"
+                result = rag_service.get_similar_verses(
+                    verse_id=verse_id,
+                    top_k=top_k,
+                    exclude_same_chapter=exclude_same_chapter,
+                )
+                hits, timing = result.hits, result.timing
             dur = time.time() - t0
             
             REQUESTS.labels(method="GET", status="200", view=view_name, lang=lang, version="-").inc()
             LATENCY.labels(view=view_name, lang=lang, version="-").observe(dur)
             
             return Response({
-                "hits": result.hits,
-                "total": result.total,
-                "timing": result.timing,
+                "hits": hits,
+                "total": len(hits),
+                "timing": timing,
                 "reference_verse_id": verse_id,
+                "source": source,
             }, status=200)
             
         except ValueError as e:
@@ -758,6 +862,78 @@ class RagStatsView(APIView):
             )
 
 
+RAG_HYBRID_PARAMETERS = [
+    OpenApiParameter(
+        name="q",
+        location=OpenApiParameter.QUERY,
+        required=True,
+        description="Texto da consulta (mínimo 2 caracteres)",
+        type=str,
+        examples=[
+            OpenApiExample("termo_especifico", value="ódio"),
+            OpenApiExample("conceito", value="amor divino"),
+        ],
+    ),
+    OpenApiParameter(
+        name="top_k",
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="Número máximo de resultados (1-50, default: 10)",
+        type=int,
+    ),
+    OpenApiParameter(
+        name="alpha",
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="Peso BM25 vs Vetorial (0.0-1.0, default: 0.5)",
+        type=float,
+    ),
+    OpenApiParameter(
+        name="version",
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="Código da versão bíblica (ex: 'ACF', 'NVI')",
+        type=str,
+    ),
+    OpenApiParameter(
+        name="expand",
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="Expandir query com sinônimos teológicos (default: false)",
+        type=bool,
+    ),
+    OpenApiParameter(
+        name="rerank",
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="Reordenar com embedding large 3072-dim (default: false)",
+        type=bool,
+    ),
+    OpenApiParameter(
+        name="mmr_lambda",
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="MMR lambda: 0=diversidade, 1=relevância (default: não aplicar)",
+        type=float,
+    ),
+    OpenApiParameter(
+        name="dedupe",
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="Deduplica versículos de diferentes versões (default: false)",
+        type=bool,
+    ),
+    OpenApiParameter(
+        name="embedding_source",
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="Fonte de embeddings: 'verse' (529K, PT+EN) ou 'unified' (31K, apenas PT, 11x mais rápido). Default: 'verse'",
+        type=str,
+        enum=["verse", "unified"],
+    ),
+]
+
+
 class RagHybridSearchView(APIView):
     """
     Busca híbrida: combina BM25 (lexical) + Vetorial (semântica).
@@ -822,76 +998,7 @@ class RagHybridSearchView(APIView):
         - "amor de Deus" com mmr_lambda=0.5 → resultados diversificados
         """,
         tags=["rag"],
-        parameters=[
-            OpenApiParameter(
-                name="q",
-                location=OpenApiParameter.QUERY,
-                required=True,
-                description="Texto da consulta (mínimo 2 caracteres)",
-                type=str,
-                examples=[
-                    OpenApiExample("termo_especifico", value="ódio"),
-                    OpenApiExample("conceito", value="amor divino"),
-                ],
-            ),
-            OpenApiParameter(
-                name="top_k",
-                location=OpenApiParameter.QUERY,
-                required=False,
-                description="Número máximo de resultados (1-50, default: 10)",
-                type=int,
-            ),
-            OpenApiParameter(
-                name="alpha",
-                location=OpenApiParameter.QUERY,
-                required=False,
-                description="Peso BM25 vs Vetorial (0.0-1.0, default: 0.5)",
-                type=float,
-            ),
-            OpenApiParameter(
-                name="version",
-                location=OpenApiParameter.QUERY,
-                required=False,
-                description="Código da versão bíblica (ex: 'ACF', 'NVI')",
-                type=str,
-            ),
-            OpenApiParameter(
-                name="expand",
-                location=OpenApiParameter.QUERY,
-                required=False,
-                description="Expandir query com sinônimos teológicos (default: false)",
-                type=bool,
-            ),
-            OpenApiParameter(
-                name="rerank",
-                location=OpenApiParameter.QUERY,
-                required=False,
-                description="Reordenar com embedding large 3072-dim (default: false)",
-                type=bool,
-            ),
-            OpenApiParameter(
-                name="mmr_lambda",
-                location=OpenApiParameter.QUERY,
-                required=False,
-                description="MMR lambda: 0=diversidade, 1=relevância (default: não aplicar)",
-                type=float,
-            ),
-            OpenApiParameter(
-                name="dedupe",
-                location=OpenApiParameter.QUERY,
-                required=False,
-                description="Deduplica versículos de diferentes versões (default: false)",
-                type=bool,
-            ),
-            OpenApiParameter(
-                name="embedding_source",
-                location=OpenApiParameter.QUERY,
-                required=False,
-                description="Fonte de embeddings: 'verse' (529K, PT+EN) ou 'unified' (31K, apenas PT, 11x mais rápido). Default: 'verse'",
-                type=str,
-                enum=["verse", "unified"],
-            ),
-        ],
+        parameters=RAG_HYBRID_PARAMETERS,
         responses={
             200: RagSearchResponseSerializer,
             400: {"description": "Parâmetros inválidos"},
@@ -901,124 +1008,17 @@ class RagHybridSearchView(APIView):
     def get(self, request, *args, **kwargs):
         view_name = self.__class__.__name__
         lang = getattr(request, "lang_code", "-")
-        
-        # Validar parâmetros
-        q = (request.query_params.get("q") or "").strip()
-        if not q:
-            return Response(
-                {"detail": "Parâmetro 'q' é obrigatório", "code": "validation_error"},
-                status=400,
-            )
-        
-        if len(q) < 2:
-            return Response(
-                {"detail": "Query deve ter no mínimo 2 caracteres", "code": "validation_error"},
-                status=400,
-            )
-        
-        # Extrair parâmetros
-        try:
-            top_k = int(request.query_params.get("top_k") or 10)
-            top_k = max(1, min(top_k, 50))
-        except ValueError:
-            top_k = 10
-        
-        alpha = None
-        if request.query_params.get("alpha"):
-            try:
-                alpha = float(request.query_params.get("alpha"))
-                alpha = max(0.0, min(alpha, 1.0))
-            except ValueError:
-                pass
-        
-        version = request.query_params.get("version")
-        versions = [version] if version else None
-        
-        # Query Expansion
-        expand_query = request.query_params.get("expand", "").lower() in ("true", "1", "yes")
-        expand_mode = request.query_params.get("expand_mode", "auto")
-        if expand_mode not in ("static", "dynamic", "auto"):
-            expand_mode = "auto"
-        max_synonyms_raw = request.query_params.get("max_synonyms", "3")
-        try:
-            max_synonyms = max(1, min(int(max_synonyms_raw), 5))
-        except ValueError:
-            max_synonyms = 3
-        
-        # Reranking with large embeddings
-        rerank = request.query_params.get("rerank", "").lower() in ("true", "1", "yes")
-        
-        # MMR Diversification
-        mmr_lambda = None
-        if request.query_params.get("mmr_lambda"):
-            try:
-                mmr_lambda = float(request.query_params.get("mmr_lambda"))
-                mmr_lambda = max(0.0, min(mmr_lambda, 1.0))
-            except ValueError:
-                pass
-        
-        # Deduplicate versions
-        dedupe = request.query_params.get("dedupe", "").lower() in ("true", "1", "yes")
-        
-        # Embedding source: verse (default, all versions) or unified (PT only, faster)
-        embedding_source = request.query_params.get("embedding_source", "verse")
 
-        # Embedding model: large (3072d, optimal per TCC Exp6) or small (1536d, faster)
-        embedding_model = request.query_params.get("embedding_model", "large")
-        if embedding_model not in ("small", "large"):
-            embedding_model = "large"
+        params, error = _parse_hybrid_params(request)
+        if error is not None:
+            return error
 
-        # Re-embed after expansion: generate new embedding with expanded terms
-        reembed = request.query_params.get("reembed", "").lower() in ("true", "1", "yes")
-        if embedding_source not in ("verse", "unified"):
-            embedding_source = "verse"
-        
         # Executar busca híbrida
         try:
             t0 = time.time()
-            result = rag_service.search_hybrid(
-                query=q,
-                top_k=top_k,
-                versions=versions,
-                alpha=alpha,
-                expand_query=expand_query,
-                expand_mode=expand_mode,
-                max_synonyms=max_synonyms,
-                rerank=rerank,
-                mmr_lambda=mmr_lambda,
-                deduplicate_versions=dedupe,
-                embedding_source=embedding_source,
-                embedding_model=embedding_model,
-                reembed_after_expansion=reembed,
-            )
-            dur = time.time() - t0
-            
-            REQUESTS.labels(method="GET", status="200", view=view_name, lang=lang, version=version or "-").inc()
-            LATENCY.labels(view=view_name, lang=lang, version=version or "-").observe(dur)
-            
-            response_data = {
-                "hits": result.hits,
-                "total": result.total,
-                "timing": result.timing,
-                "query": result.query,
-                "search_type": "hybrid",
-                "embedding_source": embedding_source,
-            }
-            
-            # Adicionar info de expansão se disponível
-            if hasattr(result, "query_expansion") and result.query_expansion:
-                response_data["query_expansion"] = result.query_expansion
-            
-            # Adicionar info de reranking se disponível
-            if hasattr(result, "reranking") and result.reranking:
-                response_data["reranking"] = result.reranking
-            
-            # Adicionar info de MMR se disponível
-            if hasattr(result, "mmr_diversification") and result.mmr_diversification:
-                response_data["mmr_diversification"] = result.mmr_diversification
-            
-            return Response(response_data, status=200)
-            
+            result = rag_service.search_hybrid(**params)
+            return _hybrid_response(result, view_name, lang, params, time.time() - t0)
+
         except ValueError as e:
             return Response(
                 {"detail": str(e), "code": "validation_error"},
@@ -1028,7 +1028,97 @@ class RagHybridSearchView(APIView):
             # Log do erro para debug
             import logging
             logging.getLogger(__name__).error(f"Hybrid search error: {e}", exc_info=True)
-            
+
+            REQUESTS.labels(method="GET", status="500", view=view_name, lang=lang, version="-").inc()
+            return Response(
+                {"detail": f"Erro interno: {str(e)}", "code": "internal_error"},
+                status=500,
+            )
+
+
+class RagSearchAsyncView(AsyncAPIView):
+    """
+    Busca semântica (RAG) assíncrona — mesmo contrato de ``RagSearchView``.
+
+    GET /api/v1/ai/rag/search/async/?q=amor+divino&top_k=10
+
+    Sob ASGI, o embedding (OpenAI) e a busca vetorial (Postgres) são aguardados
+    no event loop, então requisições em espera não ocupam um worker.
+    """
+
+    @extend_schema(
+        summary="Busca semântica de versículos (assíncrona)",
+        description="Mesmos parâmetros e resposta de `GET /ai/rag/search/`, servida por uma view assíncrona (ASGI).",
+        tags=["rag"],
+        parameters=RAG_SEARCH_PARAMETERS,
+        responses={
+            200: RagSearchResponseSerializer,
+            400: {"description": "Parâmetros inválidos"},
+            **get_error_responses(),
+        },
+    )
+    async def get(self, request, *args, **kwargs):
+        view_name = self.__class__.__name__
+        lang = getattr(request, "lang_code", "-")
+
+        params, error = _parse_search_params(request)
+        if error is not None:
+            return error
+
+        try:
+            t0 = time.time()
+            result = await rag_service.asearch(**params)
+            return _search_response(result, view_name, lang, params, time.time() - t0)
+
+        except ValueError as e:
+            return _validation_error(str(e))
+        except Exception as e:
+            logger.error(f"Async search error: {e}", exc_info=True)
+            REQUESTS.labels(method="GET", status="500", view=view_name, lang=lang, version="-").inc()
+            return Response(
+                {"detail": f"Erro interno: {str(e)}", "code": "internal_error"},
+                status=500,
+            )
+
+
+class RagHybridSearchAsyncView(AsyncAPIView):
+    """
+    Busca híbrida assíncrona — mesmo contrato de ``RagHybridSearchView``.
+
+    GET /api/v1/ai/rag/hybrid/async/?q=ódio&alpha=0.5
+
+    O embedding da query é obtido em paralelo com o BM25 e a busca vetorial usa
+    o driver assíncrono (``bible.ai.aio``).
+    """
+
+    @extend_schema(
+        summary="Busca híbrida de versículos (assíncrona)",
+        description="Mesmos parâmetros e resposta de `GET /ai/rag/hybrid/`, servida por uma view assíncrona (ASGI).",
+        tags=["rag"],
+        parameters=RAG_HYBRID_PARAMETERS,
+        responses={
+            200: RagSearchResponseSerializer,
+            400: {"description": "Parâmetros inválidos"},
+            **get_error_responses(),
+        },
+    )
+    async def get(self, request, *args, **kwargs):
+        view_name = self.__class__.__name__
+        lang = getattr(request, "lang_code", "-")
+
+        params, error = _parse_hybrid_params(request)
+        if error is not None:
+            return error
+
+        try:
+            t0 = time.time()
+            result = await rag_service.asearch_hybrid(**params)
+            return _hybrid_response(result, view_name, lang, params, time.time() - t0)
+
+        except ValueError as e:
+            return _validation_error(str(e))
+        except Exception as e:
+            logger.error(f"Async hybrid search error: {e}", exc_info=True)
             REQUESTS.labels(method="GET", status="500", view=view_name, lang=lang, version="-").inc()
             return Response(
                 {"detail": f"Erro interno: {str(e)}", "code": "internal_error"},
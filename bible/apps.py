@@ -7,6 +7,20 @@ class BibleConfig(AppConfig):
     name = "bible"
     verbose_name = "Bible"
 
+    def ready(self):
+        # Register cache invalidation receivers
+        from common import content_cache  # noqa: F401
+        from common.warm_start import boot
+
+        from .ai import usage_counters  # noqa: F401
+        from .crossrefs import graph
+        from .themes.services import theme_matrix  # noqa: F401
+        from .versions import services  # noqa: F401
+
+        # Load in-process registries and the cross-reference graph at boot (no-op unless configured)
+        boot()
+        graph.boot()
+
 
 class AuthConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
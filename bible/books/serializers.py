@@ -69,13 +69,18 @@ class BookSerializer(serializers.ModelSerializer):
 
     def get_aliases(self, obj):
         """Todos os aliases do livro no idioma da requisição."""
+        from bible.utils.book_utils import prefetched_book_names
         from bible.utils.i18n import get_language_from_context
 
         lang_code = get_language_from_context(self.context)
 
-        # Otimização: usar values_list para evitar instanciar objetos
+        # Otimização: usar os nomes pré-carregados (names__language) ou values_list
         aliases = set()
-        names_qs = obj.names.filter(language__code=lang_code).values_list("name", "abbreviation")
+        prefetched = prefetched_book_names(obj)
+        if prefetched is not None:
+            names_qs = [(n.name, n.abbreviation) for n in prefetched if n.language.code == lang_code]
+        else:
+            names_qs = obj.names.filter(language__code=lang_code).values_list("name", "abbreviation")
 
         for name, abbr in names_qs:
             if name:
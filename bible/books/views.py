@@ -9,6 +9,7 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from common.content_cache import ContentCacheMixin
 from common.exceptions import build_error_response
 from common.mixins import LanguageSensitiveMixin
 from common.openapi import LANG_PARAMETER, get_error_responses
@@ -82,8 +83,9 @@ class BookListView(LanguageSensitiveMixin, generics.ListAPIView):
         return context
 
 
-class BookInfoView(LanguageSensitiveMixin, APIView):
+class BookInfoView(ContentCacheMixin, LanguageSensitiveMixin, APIView):
     permission_classes = [AllowAny]  # Public endpoint for development
+    content_datasets = ("books",)
 
     @extend_schema(
         summary="Get book info",
@@ -218,7 +220,9 @@ class BooksByTestamentView(LanguageSensitiveMixin, generics.ListAPIView):
         )
 
 
-class BookOutlineView(LanguageSensitiveMixin, APIView):
+class BookOutlineView(ContentCacheMixin, LanguageSensitiveMixin, APIView):
+    content_datasets = ("books",)
+
     @extend_schema(
         summary="Get book outline",
         tags=["books"],
@@ -470,7 +474,9 @@ class BookSearchView(LanguageSensitiveMixin, generics.GenericAPIView):
         # 1. Search by OSIS code first (exact match has highest priority)
         try:
             osis_book = (
-                CanonicalBook.objects.select_related("testament").prefetch_related("names").get(osis_code__iexact=query)
+                CanonicalBook.objects.select_related("testament")
+                .prefetch_related("names__language")
+                .get(osis_code__iexact=query)
             )
             search_results.append(self._format_search_result(osis_book, query, "osis", "canonical"))
         except CanonicalBook.DoesNotExist:
@@ -484,6 +490,7 @@ class BookSearchView(LanguageSensitiveMixin, generics.GenericAPIView):
         book_names = (
             BookName.objects.filter(name_query)
             .select_related("canonical_book__testament", "language", "version")
+            .prefetch_related("canonical_book__names__language")
             .order_by("canonical_book__canonical_order")
         )
 
@@ -1228,6 +1235,7 @@ class BookRestrictedSearchView(LanguageSensitiveMixin, APIView):
             verses_query.filter(text__icontains=query).select_related("version").order_by("chapter", "number")[:limit]
         )
 
+        book_display_name = get_book_display_name(book, request.lang_code)
         results = []
         for verse in verses_query:
             # Create text preview with highlighted search term
@@ -1245,7 +1253,6 @@ class BookRestrictedSearchView(LanguageSensitiveMixin, APIView):
                         text_preview = text_preview + "..."
 
             match_score = 1.0  # Would be calculated based on relevance
-            book_display_name = get_book_display_name(book, request.lang_code)
 
             result = {
                 "chapter": verse.chapter,
@@ -1343,12 +1350,13 @@ class BookChapterVersesView(LanguageSensitiveMixin, APIView):
             )
 
         # Format verse data
+        book_display_name = get_book_display_name(book, request.lang_code)
         verse_list = []
         for verse in verses:
             verse_data = {
                 "number": verse.number,
                 "text": verse.text,
-                "reference": f"{get_book_display_name(book, request.lang_code)} {verse.chapter}:{verse.number}",
+                "reference": f"{book_display_name} {verse.chapter}:{verse.number}",
                 "version": verse.version.code if verse.version else None,
             }
             verse_list.append(verse_data)
@@ -1358,7 +1366,7 @@ class BookChapterVersesView(LanguageSensitiveMixin, APIView):
             "verse_count": len(verse_list),
             "verses": verse_list,
             "chapter_info": {
-                "book": get_book_display_name(book, request.lang_code),
+                "book": book_display_name,
                 "osis_code": book.osis_code,
                 "testament": book.testament.name if book.testament else "Unknown",
                 "canonical_order": book.canonical_order,
@@ -1502,18 +1510,18 @@ class BookRangeView(LanguageSensitiveMixin, APIView):
             )
 
         # Format verse data
+        book_display_name = get_book_display_name(book, request.lang_code)
         verse_list = []
         for verse in verses:
             verse_data = {
                 "chapter": verse.chapter,
                 "verse": verse.number,
                 "text": verse.text,
-                "reference": f"{get_book_display_name(book, request.lang_code)} {verse.chapter}:{verse.number}",
+                "reference": f"{book_display_name} {verse.chapter}:{verse.number}",
                 "version": verse.version.code if verse.version else None,
             }
             verse_list.append(verse_data)
 
-        book_display_name = get_book_display_name(book, request.lang_code)
         start_ref = f"{book_display_name} {start_chapter}:{start_verse}"
         end_ref = f"{book_display_name} {end_chapter}:{end_verse}"
 
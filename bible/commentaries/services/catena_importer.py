@@ -3,68 +3,275 @@ Import authors from validated_authors.json and commentaries from Catena Bible da
 
 Usage:
     python manage.py bible commentaries import-authors
-    python manage.py bible commentaries import-entries [--limit 100]
+    python manage.py bible commentaries import-entries [--limit 100] [--workers 8]
+
+With ``workers > 1`` entry files are parsed by a process pool into plain row
+tuples; the parent process is the only DB writer and streams the rows with
+``COPY`` into a temporary staging table, then merges them into
+``commentaries_entry`` with one ``INSERT ... SELECT ... ON CONFLICT DO NOTHING``.
 """
 
 import json
 import logging
 import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import NamedTuple
 
-from django.db import transaction
+import django
+from django.db import connection, transaction
+from django.db.models import F
 
 from bible.commentaries.models import Author, CommentaryEntry, CommentarySource
 from bible.models import CanonicalBook
+from common.bulk_copy import column_defaults, copy_rows, copy_supported
 
 logger = logging.getLogger(__name__)
 
 # OSIS mapping: Catena Bible uses short codes in folder names
 CATENA_BOOK_TO_OSIS = {
     # OT — full names
-    "genesis": "Gen", "exodus": "Exod", "leviticus": "Lev", "numbers": "Num",
-    "deuteronomy": "Deut", "joshua": "Josh", "judges": "Judg", "ruth": "Ruth",
-    "1samuel": "1Sam", "2samuel": "2Sam", "1kings": "1Kgs", "2kings": "2Kgs",
-    "1chronicles": "1Chr", "2chronicles": "2Chr", "ezra": "Ezra", "nehemiah": "Neh",
-    "esther": "Esth", "job": "Job", "psalms": "Ps", "proverbs": "Prov",
-    "ecclesiastes": "Eccl", "song_of_solomon": "Song", "songofsolomon": "Song",
-    "isaiah": "Isa", "jeremiah": "Jer", "lamentations": "Lam", "ezekiel": "Ezek",
-    "daniel": "Dan", "hosea": "Hos", "joel": "Joel", "amos": "Amos",
-    "obadiah": "Obad", "jonah": "Jonah", "micah": "Mic", "nahum": "Nah",
-    "habakkuk": "Hab", "zephaniah": "Zeph", "haggai": "Hag", "zechariah": "Zech",
+    "genesis": "Gen",
+    "exodus": "Exod",
+    "leviticus": "Lev",
+    "numbers": "Num",
+    "deuteronomy": "Deut",
+    "joshua": "Josh",
+    "judges": "Judg",
+    "ruth": "Ruth",
+    "1samuel": "1Sam",
+    "2samuel": "2Sam",
+    "1kings": "1Kgs",
+    "2kings": "2Kgs",
+    "1chronicles": "1Chr",
+    "2chronicles": "2Chr",
+    "ezra": "Ezra",
+    "nehemiah": "Neh",
+    "esther": "Esth",
+    "job": "Job",
+    "psalms": "Ps",
+    "proverbs": "Prov",
+    "ecclesiastes": "Eccl",
+    "song_of_solomon": "Song",
+    "songofsolomon": "Song",
+    "isaiah": "Isa",
+    "jeremiah": "Jer",
+    "lamentations": "Lam",
+    "ezekiel": "Ezek",
+    "daniel": "Dan",
+    "hosea": "Hos",
+    "joel": "Joel",
+    "amos": "Amos",
+    "obadiah": "Obad",
+    "jonah": "Jonah",
+    "micah": "Mic",
+    "nahum": "Nah",
+    "habakkuk": "Hab",
+    "zephaniah": "Zeph",
+    "haggai": "Hag",
+    "zechariah": "Zech",
     "malachi": "Mal",
     # OT — Catena Bible short folder codes (used in dataset directory names)
-    "gn": "Gen", "ex": "Exod", "lv": "Lev", "nm": "Num", "dt": "Deut",
-    "jo": "Josh", "jgs": "Judg", "ru": "Ruth",
-    "1sm": "1Sam", "2sm": "2Sam", "1kgs": "1Kgs", "2kgs": "2Kgs",
-    "1chr": "1Chr", "2chr": "2Chr", "ezr": "Ezra", "neh": "Neh",
-    "est": "Esth", "jb": "Job", "ps": "Ps", "prv": "Prov",
-    "eccl": "Eccl", "sg": "Song",
-    "is": "Isa", "jer": "Jer", "lam": "Lam", "ez": "Ezek",
-    "dn": "Dan", "hos": "Hos", "jl": "Joel", "am": "Amos",
-    "ob": "Obad", "jon": "Jonah", "mi": "Mic", "na": "Nah",
-    "hb": "Hab", "zep": "Zeph", "hg": "Hag", "zec": "Zech",
+    "gn": "Gen",
+    "ex": "Exod",
+    "lv": "Lev",
+    "nm": "Num",
+    "dt": "Deut",
+    "jo": "Josh",
+    "jgs": "Judg",
+    "ru": "Ruth",
+    "1sm": "1Sam",
+    "2sm": "2Sam",
+    "1kgs": "1Kgs",
+    "2kgs": "2Kgs",
+    "1chr": "1Chr",
+    "2chr": "2Chr",
+    "ezr": "Ezra",
+    "neh": "Neh",
+    "est": "Esth",
+    "jb": "Job",
+    "ps": "Ps",
+    "prv": "Prov",
+    "eccl": "Eccl",
+    "sg": "Song",
+    "is": "Isa",
+    "jer": "Jer",
+    "lam": "Lam",
+    "ez": "Ezek",
+    "dn": "Dan",
+    "hos": "Hos",
+    "jl": "Joel",
+    "am": "Amos",
+    "ob": "Obad",
+    "jon": "Jonah",
+    "mi": "Mic",
+    "na": "Nah",
+    "hb": "Hab",
+    "zep": "Zeph",
+    "hg": "Hag",
+    "zec": "Zech",
     "mal": "Mal",
     # NT — short codes (used in some filenames)
-    "1thes": "1Thess", "2thes": "2Thess",
+    "1thes": "1Thess",
+    "2thes": "2Thess",
     # Deuterocanonical
-    "tobit": "Tob", "judith": "Jdt", "wisdom": "Wis", "sirach": "Sir",
-    "baruch": "Bar", "1maccabees": "1Macc", "2maccabees": "2Macc",
+    "tobit": "Tob",
+    "judith": "Jdt",
+    "wisdom": "Wis",
+    "sirach": "Sir",
+    "baruch": "Bar",
+    "1maccabees": "1Macc",
+    "2maccabees": "2Macc",
     # NT — full names
-    "matthew": "Matt", "mark": "Mark", "luke": "Luke", "john": "John",
-    "acts": "Acts", "romans": "Rom", "1corinthians": "1Cor", "2corinthians": "2Cor",
-    "galatians": "Gal", "ephesians": "Eph", "philippians": "Phil",
-    "colossians": "Col", "1thessalonians": "1Thess", "2thessalonians": "2Thess",
-    "1timothy": "1Tim", "2timothy": "2Tim", "titus": "Titus", "philemon": "Phlm",
-    "hebrews": "Heb", "james": "Jas", "1peter": "1Pet", "2peter": "2Pet",
-    "1john": "1John", "2john": "2John", "3john": "3John", "jude": "Jude",
+    "matthew": "Matt",
+    "mark": "Mark",
+    "luke": "Luke",
+    "john": "John",
+    "acts": "Acts",
+    "romans": "Rom",
+    "1corinthians": "1Cor",
+    "2corinthians": "2Cor",
+    "galatians": "Gal",
+    "ephesians": "Eph",
+    "philippians": "Phil",
+    "colossians": "Col",
+    "1thessalonians": "1Thess",
+    "2thessalonians": "2Thess",
+    "1timothy": "1Tim",
+    "2timothy": "2Tim",
+    "titus": "Titus",
+    "philemon": "Phlm",
+    "hebrews": "Heb",
+    "james": "Jas",
+    "1peter": "1Pet",
+    "2peter": "2Pet",
+    "1john": "1John",
+    "2john": "2John",
+    "3john": "3John",
+    "jude": "Jude",
     "revelation": "Rev",
 }
 
 AUTHORS_JSON = Path("data/authors/validated_authors.json")
 CATENA_BASE = Path("C:/Users/Iury Coelho/Desktop/bible-commentaries-dataset/data/01_cleaned/catena_bible")
 
+# Files handed to a pool worker per task in parallel mode
+PARSE_CHUNK_SIZE = 64
+
+STAGING_TABLE = "catena_entry_staging"
+STAGING_COLUMNS = (
+    "ord",
+    "author_id",
+    "book_id",
+    "chapter",
+    "verse",
+    "original_reference",
+    "body_text",
+    "word_count",
+    "display_order",
+)
+# commentaries_entry column -> staging expression it is merged from
+MERGED_COLUMNS = {
+    "author_id": "s.author_id",
+    "book_id": "s.book_id",
+    "chapter": "s.chapter",
+    "verse_start": "s.verse",
+    "verse_end": "s.verse",
+    "original_reference": "s.original_reference",
+    "body_text": "s.body_text",
+    "word_count": "s.word_count",
+    "display_order": "s.display_order",
+}
+# Constant fields of every Catena entry, in both the serial and the parallel importer
+CATENA_ENTRY_VALUES = {
+    "extraction_method": "beautifulsoup",
+    "content_type": "full",
+    "is_complete": True,
+    "original_language": "en",
+    "confidence_score": 0.9,
+}
+
+
+class ParsedCatenaFile(NamedTuple):
+    """DB-free result of parsing one Catena verse file (picklable across processes)."""
+
+    book_candidates: tuple[str, ...]  # OSIS codes to try, in order
+    chapter: int | None
+    verse: int | None
+    reference: str
+    commentaries: list[tuple[int, str, str, int]]  # (display_order, author_name, body_text, word_count)
+    skipped: int = 0
+    error: str = ""
+
+
+def catena_osis(folder_name: str) -> str | None:
+    """Map a Catena folder or filename prefix to an OSIS code."""
+    key = folder_name.lower().replace(" ", "").replace("-", "").replace("_", "")
+    osis = CATENA_BOOK_TO_OSIS.get(key)
+    if not osis:
+        # Try partial match
+        for catena_key, osis_code in CATENA_BOOK_TO_OSIS.items():
+            if catena_key in key or key in catena_key:
+                return osis_code
+    return osis
+
+
+def parse_verse_filename(filename: str):
+    """Parse 'rom_12_01.json' → ('rom', 12, 1)."""
+    name = filename.replace(".json", "")
+    parts = name.split("_")
+    if len(parts) < 3:
+        return None, None, None
+
+    # Last two parts are chapter and verse
+    try:
+        verse = int(parts[-1])
+        chapter = int(parts[-2])
+        book_part = "_".join(parts[:-2])
+        return book_part, chapter, verse
+    except (ValueError, IndexError):
+        return None, None, None
+
+
+def parse_catena_file(filepath: str) -> ParsedCatenaFile:
+    """Parse a single Catena Bible JSON file without touching the database."""
+    try:
+        with open(filepath, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        return ParsedCatenaFile((), None, None, "", [], error=str(e) or type(e).__name__)
+
+    verse_ref = data.get("verse_reference", "")
+    commentaries = data.get("commentaries", [])
+
+    # Path: .../catena_bible/new_testament/pauline_epistles/romans/verses/rom_12_01.json
+    # or:   .../catena_bible/old_testament/pentateuch/gn/verses/gn_01_01.json
+    book_part, chapter, verse = parse_verse_filename(os.path.basename(filepath))
+    if not commentaries or not chapter or not verse:
+        return ParsedCatenaFile((), None, None, verse_ref, [])
+
+    # Book from the direct parent of "verses/", then the filename prefix, then the category dir
+    verses_dir = os.path.dirname(filepath)
+    folders = (
+        os.path.basename(os.path.dirname(verses_dir)),
+        book_part,
+        os.path.basename(os.path.dirname(os.path.dirname(verses_dir))),
+    )
+    candidates = tuple(dict.fromkeys(osis for osis in map(catena_osis, filter(None, folders)) if osis))
+
+    rows = []
+    skipped = 0
+    for idx, commentary in enumerate(commentaries):
+        content = commentary.get("content", "")
+        if not content or len(content.strip()) < 10:
+            skipped += 1
+            continue
+        rows.append((idx, commentary.get("author", ""), content.strip(), len(content.split())))
+
+    return ParsedCatenaFile(candidates, chapter, verse, verse_ref, rows, skipped)
+
 
 @dataclass
 class ImportResult:
@@ -75,9 +282,19 @@ class ImportResult:
     entries_created: int = 0
     entries_skipped: int = 0
     books_not_found: int = 0
+    files_processed: int = 0
+    rows_staged: int = 0
     errors: list = field(default_factory=list)
     duration_seconds: float = 0.0
 
+    @property
+    def files_per_second(self) -> float:
+        return self.files_processed / self.duration_seconds if self.duration_seconds else 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_staged / self.duration_seconds if self.duration_seconds else 0.0
+
 
 class CatenaImporter:
     """Import validated authors and Catena Bible commentaries."""
@@ -90,45 +307,17 @@ class CatenaImporter:
 
     def _resolve_book(self, folder_name: str) -> CanonicalBook | None:
         """Resolve a Catena folder name to a CanonicalBook."""
-        key = folder_name.lower().replace(" ", "").replace("-", "").replace("_", "")
-        if key in self._book_cache:
-            return self._book_cache[key]
-
-        osis = CATENA_BOOK_TO_OSIS.get(key)
-        if not osis:
-            # Try partial match
-            for catena_key, osis_code in CATENA_BOOK_TO_OSIS.items():
-                if catena_key in key or key in catena_key:
-                    osis = osis_code
-                    break
-
-        if not osis:
-            self._book_cache[key] = None
-            return None
+        osis = catena_osis(folder_name)
+        return self._book_for_osis(osis) if osis else None
 
-        try:
-            book = CanonicalBook.objects.get(osis_code=osis)
-            self._book_cache[key] = book
-            return book
-        except CanonicalBook.DoesNotExist:
-            self._book_cache[key] = None
-            return None
+    def _book_for_osis(self, osis: str) -> CanonicalBook | None:
+        if osis not in self._book_cache:
+            self._book_cache[osis] = CanonicalBook.objects.filter(osis_code=osis).first()
+        return self._book_cache[osis]
 
     def _parse_verse_ref(self, filename: str):
-        """Parse 'rom_12_01.json' → ('romans', 12, 1)."""
-        name = filename.replace(".json", "")
-        parts = name.split("_")
-        if len(parts) < 3:
-            return None, None, None
-
-        # Last two parts are chapter and verse
-        try:
-            verse = int(parts[-1])
-            chapter = int(parts[-2])
-            book_part = "_".join(parts[:-2])
-            return book_part, chapter, verse
-        except (ValueError, IndexError):
-            return None, None, None
+        """Parse 'rom_12_01.json' → ('rom', 12, 1)."""
+        return parse_verse_filename(filename)
 
     # ─── Authors Import ───────────────────────────────────────
 
@@ -266,8 +455,14 @@ class CatenaImporter:
 
     # ─── Entries Import ───────────────────────────────────────
 
-    def import_entries(self, limit: int | None = None, batch_size: int = 500) -> ImportResult:
-        """Import commentary entries from Catena Bible dataset."""
+    def import_entries(self, limit: int | None = None, batch_size: int = 500, workers: int = 1) -> ImportResult:
+        """Import commentary entries from Catena Bible dataset.
+
+        ``workers > 1`` switches to the process-parallel COPY import (PostgreSQL only).
+        """
+        if workers > 1:
+            return self.import_entries_parallel(limit=limit, workers=workers)
+
         result = ImportResult()
         start = time.time()
 
@@ -297,13 +492,13 @@ class CatenaImporter:
                 filepath = os.path.join(root, filename)
                 try:
                     entries = self._parse_commentary_file(filepath, catena_source, result)
+                    result.files_processed += 1
                     entries_batch.extend(entries)
                     total_processed += len(entries)
 
                     # Bulk create in batches
                     if len(entries_batch) >= batch_size:
-                        CommentaryEntry.objects.bulk_create(entries_batch, ignore_conflicts=True)
-                        result.entries_created += len(entries_batch)
+                        self._insert_entries(entries_batch, result)
                         entries_batch = []
                         if total_processed % 5000 == 0:
                             logger.info(f"  Processed {total_processed:,} entries...")
@@ -316,90 +511,188 @@ class CatenaImporter:
 
         # Flush remaining
         if entries_batch:
-            CommentaryEntry.objects.bulk_create(entries_batch, ignore_conflicts=True)
-            result.entries_created += len(entries_batch)
+            self._insert_entries(entries_batch, result)
 
-        # Update source stats
-        catena_source.entry_count = CommentaryEntry.objects.filter(source=catena_source).count()
-        catena_source.save(update_fields=["entry_count"])
+        # Update source stats by what this run inserted, as the parallel path does
+        CommentarySource.objects.filter(pk=catena_source.pk).update(
+            entry_count=F("entry_count") + result.entries_created
+        )
 
         result.duration_seconds = time.time() - start
         return result
 
-    def _parse_commentary_file(
-        self, filepath: str, source: CommentarySource, result: ImportResult
-    ) -> list[CommentaryEntry]:
-        """Parse a single Catena Bible JSON file into CommentaryEntry objects."""
-        with open(filepath, encoding="utf-8") as f:
-            data = json.load(f)
+    @staticmethod
+    def _insert_entries(entries: list[CommentaryEntry], result: ImportResult) -> None:
+        """bulk_create(ignore_conflicts=True), counting the rows the database actually inserted."""
+        inserted = 0
 
-        verse_ref = data.get("verse_reference", "")
-        commentaries = data.get("commentaries", [])
+        def count_inserted(execute, sql, params, many, context):
+            nonlocal inserted
+            returned = execute(sql, params, many, context)
+            inserted += max(context["cursor"].rowcount, 0)
+            return returned
 
-        if not commentaries:
-            return []
+        with connection.execute_wrapper(count_inserted):
+            CommentaryEntry.objects.bulk_create(entries, ignore_conflicts=True)
+        result.entries_created += inserted
+        result.entries_skipped += len(entries) - inserted
 
-        # Resolve book from file path
-        # Path: .../catena_bible/new_testament/pauline_epistles/romans/verses/rom_12_01.json
-        # or:   .../catena_bible/old_testament/pentateuch/gn/verses/gn_01_01.json
-        filename = os.path.basename(filepath)
-        book_part, chapter, verse = self._parse_verse_ref(filename)
+    def import_entries_parallel(self, limit: int | None = None, workers: int | None = None) -> ImportResult:
+        """Parse files in a process pool and load them with COPY + one set-based merge.
 
-        if not chapter or not verse:
-            return []
+        ``entry_count`` is bumped by the number of rows the merge actually inserted.
+        """
+        result = ImportResult()
+        start = time.time()
+
+        if not self.catena_base.exists():
+            result.errors.append(f"Catena base not found: {self.catena_base}")
+            return result
+        if not copy_supported():
+            result.errors.append("Parallel import requires PostgreSQL (COPY FROM STDIN)")
+            return result
 
-        # Try to find book from the direct parent of "verses/" directory
-        # e.g., .../romans/verses/rom_12_01.json → parent of verses/ = "romans"
-        verses_dir = os.path.dirname(filepath)  # .../romans/verses
-        book_dir = os.path.basename(os.path.dirname(verses_dir))  # "romans" or "gn"
-        book = self._resolve_book(book_dir)
+        if not self._author_cache:
+            self._warm_author_cache()
 
-        if not book:
-            # Try book_part from filename (e.g., "gn" from "gn_01_01.json")
-            if book_part:
-                book = self._resolve_book(book_part)
-        if not book:
-            # Try grandparent (category dir like "pentateuch")
-            grandparent = os.path.basename(os.path.dirname(os.path.dirname(verses_dir)))
-            book = self._resolve_book(grandparent)
-        if not book:
-            result.books_not_found += 1
-            return []
+        catena_source = self.ensure_sources()["catena"]
+        book_ids = dict(CanonicalBook.objects.values_list("osis_code", "id"))
+        files = self._catena_files()
 
-        entries = []
-        for idx, commentary in enumerate(commentaries):
-            author_name = commentary.get("author", "")
-            content = commentary.get("content", "")
-            period = commentary.get("period", "")
+        # Workers only parse JSON; django.setup() lets them unpickle this module under "spawn" too
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=django.setup)
+        try:
+            parsed = pool.map(parse_catena_file, files, chunksize=PARSE_CHUNK_SIZE)
+            rows = self._staging_rows(zip(files, parsed, strict=True), book_ids, result, limit, start)
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(
+                    f"CREATE TEMP TABLE {STAGING_TABLE} ("
+                    "ord bigint, author_id bigint, book_id bigint, chapter integer, verse integer, "
+                    "original_reference text, body_text text, word_count integer, display_order integer"
+                    ") ON COMMIT DROP"
+                )
+                result.rows_staged = copy_rows(cursor, STAGING_TABLE, STAGING_COLUMNS, rows)
+                cursor.execute(*self._merge_sql(catena_source.pk))
+                result.entries_created = cursor.rowcount
+                CommentarySource.objects.filter(pk=catena_source.pk).update(
+                    entry_count=F("entry_count") + result.entries_created
+                )
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+        result.entries_skipped += result.rows_staged - result.entries_created
+        result.duration_seconds = time.time() - start
+        logger.info(
+            f"Catena import: {result.files_processed:,} files ({result.files_per_second:,.0f}/s), "
+            f"{result.rows_staged:,} rows ({result.rows_per_second:,.0f}/s), {result.entries_created:,} new"
+        )
+        return result
 
-            if not content or len(content.strip()) < 10:
-                result.entries_skipped += 1
+    def _catena_files(self) -> list[str]:
+        """Every entry file under the dataset root, in the serial importer's walk order."""
+        files = []
+        for root, _dirs, names in os.walk(self.catena_base):
+            files.extend(os.path.join(root, name) for name in sorted(names) if name.endswith(".json"))
+        return files
+
+    def _staging_rows(self, parsed, book_ids: dict[str, int], result: ImportResult, limit: int | None, start: float):
+        """Resolve ``(path, ParsedCatenaFile)`` pairs into staging row tuples; stops after ``limit`` rows."""
+        ordinal = 0
+        for filepath, item in parsed:
+            if item.error:
+                result.errors.append(f"Error processing {os.path.basename(filepath)}: {item.error}")
+                continue
+            result.files_processed += 1
+            if item.chapter is None:
                 continue
 
-            # Resolve author
-            author = self._resolve_author(author_name)
-
-            entries.append(
-                CommentaryEntry(
-                    source=source,
-                    author=author,
-                    book=book,
-                    chapter=chapter,
-                    verse_start=verse,
-                    verse_end=verse,
-                    original_reference=verse_ref,
-                    body_text=content.strip(),
-                    extraction_method="beautifulsoup",
-                    content_type="full",
-                    is_complete=True,
-                    original_language="en",
-                    word_count=len(content.split()),
-                    display_order=idx,
-                    confidence_score=0.9,
+            book_id = next((book_ids[osis] for osis in item.book_candidates if osis in book_ids), None)
+            if book_id is None:
+                result.books_not_found += 1
+                continue
+            result.entries_skipped += item.skipped
+
+            for display_order, author_name, body_text, word_count in item.commentaries:
+                author = self._resolve_author(author_name)
+                yield (
+                    ordinal,
+                    author.pk if author else None,
+                    book_id,
+                    item.chapter,
+                    item.verse,
+                    item.reference,
+                    body_text,
+                    word_count,
+                    display_order,
                 )
-            )
+                ordinal += 1
+                if limit and ordinal >= limit:
+                    return
+
+            if result.files_processed % 5000 == 0:
+                elapsed = time.time() - start
+                logger.info(f"  Parsed {result.files_processed:,} files ({result.files_processed / elapsed:,.0f}/s)...")
+
+    def _merge_sql(self, source_id: int) -> tuple[str, list]:
+        """Staging → commentaries_entry; first row wins per unique reference, like bulk_create(ignore_conflicts).
+
+        Columns the staging table does not carry are filled from ``CATENA_ENTRY_VALUES`` and the model
+        defaults, so the statement follows ``CommentaryEntry`` as fields are added.
+        """
+        table = CommentaryEntry._meta.db_table
+        fixed = {"source_id": source_id}
+        fixed.update(
+            {CommentaryEntry._meta.get_field(name).column: value for name, value in CATENA_ENTRY_VALUES.items()}
+        )
+        default_columns, default_values = column_defaults(CommentaryEntry, exclude=(*MERGED_COLUMNS, *fixed))
+        columns = [*MERGED_COLUMNS, *fixed, *default_columns]
+        placeholders = ", ".join(["%s"] * (len(fixed) + len(default_values)))
+        sql = (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"SELECT {', '.join(MERGED_COLUMNS.values())}, {placeholders} FROM {STAGING_TABLE} s "
+            # The unique constraint treats NULL authors as distinct; skip those already loaded explicitly
+            f"WHERE s.author_id IS NOT NULL OR NOT EXISTS (SELECT 1 FROM {table} e "
+            "WHERE e.source_id = %s AND e.author_id IS NULL AND e.book_id = s.book_id "
+            "AND e.chapter = s.chapter AND e.verse_start = s.verse AND e.verse_end = s.verse "
+            "AND e.display_order = s.display_order) "
+            "ORDER BY ord "
+            "ON CONFLICT DO NOTHING"
+        )
+        return sql, [*fixed.values(), *default_values, source_id]
+
+    def _parse_commentary_file(
+        self, filepath: str, source: CommentarySource, result: ImportResult
+    ) -> list[CommentaryEntry]:
+        """Parse a single Catena Bible JSON file into CommentaryEntry objects."""
+        parsed = parse_catena_file(filepath)
+        if parsed.error:
+            raise ValueError(parsed.error)
+
+        if parsed.chapter is None:
+            return []
 
-        return entries
+        book = next(filter(None, map(self._book_for_osis, parsed.book_candidates)), None)
+        if not book:
+            result.books_not_found += 1
+            return []
+        result.entries_skipped += parsed.skipped
+
+        return [
+            CommentaryEntry(
+                source=source,
+                author=self._resolve_author(author_name),
+                book=book,
+                chapter=parsed.chapter,
+                verse_start=parsed.verse,
+                verse_end=parsed.verse,
+                original_reference=parsed.reference,
+                body_text=body_text,
+                word_count=word_count,
+                display_order=display_order,
+                **CATENA_ENTRY_VALUES,
+            )
+            for display_order, author_name, body_text, word_count in parsed.commentaries
+        ]
 
     def _resolve_author(self, dataset_name: str) -> Author | None:
         """Resolve a dataset author name to an Author record."""
@@ -452,7 +745,5 @@ class CatenaImporter:
                     count=__import__("django.db.models", fromlist=["Count"]).Count("id")
                 )
             ),
-            "sources": list(
-                CommentarySource.objects.values("short_code", "name", "entry_count")
-            ),
+            "sources": list(CommentarySource.objects.values("short_code", "name", "entry_count")),
         }
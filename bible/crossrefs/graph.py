@@ -0,0 +1,450 @@
+"""
+In-memory cross-reference graph.
+
+All ``CrossReference`` rows are packed into a CSR adjacency structure keyed by
+the source verse coordinate: ``nodes`` holds the sorted packed coordinates that
+have outgoing references and ``offsets[i]:offsets[i + 1]`` is the slice of edge
+arrays (target start coordinate, target end verse, confidence, source,
+relation type, row id) belonging to ``nodes[i]``.
+
+Single-verse lookups, summary statistics and multi-hop traversals (k-hop
+neighborhood, shortest path) are answered from memory. Each process loads the
+graph at worker boot (``boot()``, from ``BibleConfig.ready``) or on its first
+lookup, either from a snapshot file (``CROSSREF_GRAPH_SNAPSHOT``) when it still
+matches the table, or with one table scan.
+
+``invalidate_crossref_graph()`` bumps a generation token in the shared cache;
+bulk loaders call it once after their commit. Single-row writes only flag the
+graph as stale, and the flag is folded into one invalidation at most every
+``CROSSREF_GRAPH_REFRESH_INTERVAL`` seconds, so a burst of edits costs one
+rebuild. A process holding an outdated graph keeps answering from it while the
+new one is built in a background thread (inline when the interval is 0);
+content-cached views check ``graph_is_current`` so such answers are never
+stored under the new ``crossrefs`` generation.
+"""
+
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count, Max
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from bible.models import CanonicalBook, CrossReference
+from bible.utils.verse_index import COORDINATE_FIELD_MASK, pack_coordinate, unpack_coordinate
+
+logger = logging.getLogger(__name__)
+
+GRAPH_GENERATION_CACHE_KEY = "crossref_graph:generation:v1"
+GRAPH_STALE_CACHE_KEY = "crossref_graph:stale:v1"
+
+# Widest target range expanded into individual nodes during traversal
+MAX_TARGET_SPAN = 50
+
+
+@dataclass
+class CrossRefGraph:
+    nodes: np.ndarray
+    offsets: np.ndarray
+    edge_ids: np.ndarray
+    edge_to: np.ndarray
+    edge_to_end: np.ndarray
+    edge_confidence: np.ndarray
+    edge_source: np.ndarray
+    edge_relation: np.ndarray
+    sources: list[str]
+    relation_types: list[str]
+    book_codes: dict[int, str]
+    stamp: str = ""
+    generation: str | None = None
+    _index: dict[int, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self._index = {key: i for i, key in enumerate(self.nodes.tolist())}
+        self._sources_by_name: dict[str, list[int]] = {}
+        for i, name in enumerate(self.sources):
+            self._sources_by_name.setdefault(name.lower(), []).append(i)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.edge_ids)
+
+    def degree(self, key: int) -> int:
+        """Number of outgoing references from a verse."""
+        i = self._index.get(key)
+        return 0 if i is None else int(self.offsets[i + 1] - self.offsets[i])
+
+    def edges_from(self, key: int, source: str | None = None, min_confidence: float | None = None) -> np.ndarray:
+        """Edge indices leaving ``key`` (ascending row id), optionally filtered by source and confidence."""
+        i = self._index.get(key)
+        if i is None:
+            return np.empty(0, dtype=np.int64)
+        idx = np.arange(self.offsets[i], self.offsets[i + 1], dtype=np.int64)
+        if source:
+            idx = idx[np.isin(self.edge_source[idx], self._sources_by_name.get(source.lower(), []))]
+        if min_confidence is not None:
+            idx = idx[self.edge_confidence[idx] >= min_confidence]
+        return idx
+
+    def summary(self, idx: np.ndarray) -> dict:
+        """Per-source counts and confidence stats for a set of edges."""
+        if not len(idx):
+            return {"sources": {}, "confidence": None}
+        codes, counts = np.unique(self.edge_source[idx], return_counts=True)
+        sources = {(self.sources[c] or "unknown"): int(n) for c, n in zip(codes.tolist(), counts.tolist(), strict=True)}
+        conf = self.edge_confidence[idx]
+        return {
+            "sources": dict(sorted(sources.items())),
+            "confidence": {
+                "min": round(float(conf.min()), 3),
+                "max": round(float(conf.max()), 3),
+                "avg": round(float(conf.mean()), 3),
+            },
+        }
+
+    def targets(self, i: int) -> list[int]:
+        """Packed coordinates of every verse in the target range of edge ``i``."""
+        start = int(self.edge_to[i])
+        span = min(int(self.edge_to_end[i]) - (start & COORDINATE_FIELD_MASK), MAX_TARGET_SPAN)
+        return [start + offset for offset in range(max(span, 0) + 1)]
+
+    # ------------------------------------------------------------------
+    # Traversals
+    # ------------------------------------------------------------------
+
+    def neighborhood(
+        self,
+        key: int,
+        hops: int = 1,
+        max_nodes: int = 200,
+        source: str | None = None,
+        min_confidence: float | None = None,
+    ) -> dict:
+        """Breadth-first k-hop neighborhood.
+
+        Returns ``{"nodes": {key: hop}, "edges": [(from_key, edge_index)], "truncated": bool}``.
+        Expansion stops once ``max_nodes`` verses have been reached.
+        """
+        hop_of = {key: 0}
+        edges: list[tuple[int, int]] = []
+        frontier = [key]
+        truncated = False
+
+        for depth in range(1, hops + 1):
+            next_frontier = []
+            for node in frontier:
+                for i in self.edges_from(node, source, min_confidence).tolist():
+                    reached = False
+                    for target in self.targets(i):
+                        if target in hop_of:
+                            reached = True
+                        elif len(hop_of) < max_nodes:
+                            hop_of[target] = depth
+                            next_frontier.append(target)
+                            reached = True
+                        else:
+                            truncated = True
+                    if reached:
+                        edges.append((node, i))
+            if truncated or not next_frontier:
+                break
+            frontier = next_frontier
+
+        return {"nodes": hop_of, "edges": edges, "truncated": truncated}
+
+    def shortest_path(
+        self,
+        from_key: int,
+        to_key: int,
+        max_hops: int = 4,
+        source: str | None = None,
+        min_confidence: float | None = None,
+    ) -> list[tuple[int, int]] | None:
+        """Fewest-hop chain of references from one verse to another.
+
+        Returns ``[(from_key, edge_index), ...]`` (empty when both verses are the
+        same) or ``None`` when no path exists within ``max_hops``.
+        """
+        if from_key == to_key:
+            return []
+
+        parent: dict[int, tuple[int, int] | None] = {from_key: None}
+        queue = deque([(from_key, 0)])
+        while queue:
+            node, depth = queue.popleft()
+            if depth >= max_hops:
+                continue
+            for i in self.edges_from(node, source, min_confidence).tolist():
+                for target in self.targets(i):
+                    if target in parent:
+                        continue
+                    parent[target] = (node, i)
+                    if target == to_key:
+                        path = []
+                        step = parent[target]
+                        while step is not None:
+                            path.append(step)
+                            step = parent[step[0]]
+                        return path[::-1]
+                    queue.append((target, depth + 1))
+        return None
+
+    # ------------------------------------------------------------------
+    # Formatting
+    # ------------------------------------------------------------------
+
+    def format_key(self, key: int) -> str:
+        """OSIS-style reference for a packed coordinate (e.g. ``John.3.16``)."""
+        book_id, chapter, verse = unpack_coordinate(key)
+        return f"{self.book_codes.get(book_id, book_id)}.{chapter}.{verse}"
+
+    def edge_payload(self, from_key: int, i: int) -> dict:
+        to_ref = self.format_key(int(self.edge_to[i]))
+        verse_end = int(self.edge_to_end[i])
+        if verse_end > int(self.edge_to[i]) & COORDINATE_FIELD_MASK:
+            to_ref = f"{to_ref}-{verse_end}"
+        return {
+            "id": int(self.edge_ids[i]),
+            "from": self.format_key(from_key),
+            "to": to_ref,
+            "confidence": round(float(self.edge_confidence[i]), 3),
+            "source": self.sources[self.edge_source[i]],
+            "relation_type": self.relation_types[self.edge_relation[i]],
+        }
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def save(self, path: str | Path) -> None:
+        """Write the graph to a compressed ``.npz`` snapshot."""
+        meta = {
+            "sources": self.sources,
+            "relation_types": self.relation_types,
+            "book_codes": {str(k): v for k, v in self.book_codes.items()},
+            "stamp": self.stamp,
+        }
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                nodes=self.nodes,
+                offsets=self.offsets,
+                edge_ids=self.edge_ids,
+                edge_to=self.edge_to,
+                edge_to_end=self.edge_to_end,
+                edge_confidence=self.edge_confidence,
+                edge_source=self.edge_source,
+                edge_relation=self.edge_relation,
+                meta=np.array(json.dumps(meta)),
+            )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "CrossRefGraph":
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            return cls(
+                nodes=data["nodes"],
+                offsets=data["offsets"],
+                edge_ids=data["edge_ids"],
+                edge_to=data["edge_to"],
+                edge_to_end=data["edge_to_end"],
+                edge_confidence=data["edge_confidence"],
+                edge_source=data["edge_source"],
+                edge_relation=data["edge_relation"],
+                sources=meta["sources"],
+                relation_types=meta["relation_types"],
+                book_codes={int(k): v for k, v in meta["book_codes"].items()},
+                stamp=meta["stamp"],
+            )
+
+
+def table_stamp() -> str:
+    """Cheap fingerprint of the cross_references table (row count, max id, last update)."""
+    stamp = CrossReference.objects.aggregate(rows=Count("id"), last_id=Max("id"), last_updated=Max("updated_at"))
+    last_updated = stamp["last_updated"].isoformat() if stamp["last_updated"] else ""
+    return f"{stamp['rows']}:{stamp['last_id']}:{last_updated}"
+
+
+def build_crossref_graph() -> CrossRefGraph:
+    """Build the graph with a single scan over ``cross_references``."""
+    start = time.time()
+    stamp = table_stamp()
+    sources: dict[str, int] = {}
+    relations: dict[str, int] = {}
+    ids, from_keys, to_keys, to_ends, confidences, source_codes, relation_codes = [], [], [], [], [], [], []
+
+    rows = CrossReference.objects.order_by().values_list(
+        "id",
+        "from_book_id",
+        "from_chapter",
+        "from_verse",
+        "to_book_id",
+        "to_chapter",
+        "to_verse_start",
+        "to_verse_end",
+        "confidence",
+        "source",
+        "relation_type",
+    )
+    for pk, fb, fc, fv, tb, tc, tvs, tve, conf, src, rel in rows.iterator(chunk_size=10_000):
+        ids.append(pk)
+        from_keys.append(pack_coordinate(fb, fc, fv))
+        to_keys.append(pack_coordinate(tb, tc, tvs))
+        to_ends.append(tve)
+        confidences.append(conf)
+        source_codes.append(sources.setdefault(src or "", len(sources)))
+        relation_codes.append(relations.setdefault(rel or "", len(relations)))
+
+    ids_arr = np.asarray(ids, dtype=np.int64)
+    from_arr = np.asarray(from_keys, dtype=np.int64)
+    order = np.lexsort((ids_arr, from_arr))
+    nodes, counts = np.unique(from_arr[order], return_counts=True)
+
+    graph = CrossRefGraph(
+        nodes=nodes,
+        offsets=np.concatenate(([0], np.cumsum(counts))).astype(np.int64),
+        edge_ids=ids_arr[order],
+        edge_to=np.asarray(to_keys, dtype=np.int64)[order],
+        edge_to_end=np.asarray(to_ends, dtype=np.int32)[order],
+        edge_confidence=np.asarray(confidences, dtype=np.float64)[order],
+        edge_source=np.asarray(source_codes, dtype=np.int32)[order],
+        edge_relation=np.asarray(relation_codes, dtype=np.int32)[order],
+        sources=list(sources),
+        relation_types=list(relations),
+        book_codes=dict(CanonicalBook.objects.values_list("id", "osis_code")),
+        stamp=stamp,
+    )
+    logger.info(
+        "Cross-reference graph built: %d verses, %d edges in %.2fs",
+        len(graph.nodes),
+        graph.edge_count,
+        time.time() - start,
+    )
+    return graph
+
+
+def _load_or_build() -> CrossRefGraph:
+    snapshot = getattr(settings, "CROSSREF_GRAPH_SNAPSHOT", "")
+    if snapshot and Path(snapshot).exists():
+        try:
+            graph = CrossRefGraph.load(snapshot)
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("Ignoring unreadable cross-reference graph snapshot %s: %s", snapshot, exc)
+        else:
+            if graph.stamp == table_stamp():
+                logger.info("Cross-reference graph loaded from snapshot %s", snapshot)
+                return graph
+            logger.info("Cross-reference graph snapshot %s is stale; rebuilding", snapshot)
+    return build_crossref_graph()
+
+
+_graph: CrossRefGraph | None = None
+_graph_lock = threading.Lock()  # held while (re)building, including by the background refresher
+_stale_checked_at = 0.0
+
+
+def _refresh_interval() -> float:
+    return getattr(settings, "CROSSREF_GRAPH_REFRESH_INTERVAL", 60.0)
+
+
+def _current_generation() -> str:
+    generation = cache.get(GRAPH_GENERATION_CACHE_KEY)
+    if generation is None:
+        cache.add(GRAPH_GENERATION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+        generation = cache.get(GRAPH_GENERATION_CACHE_KEY)
+    return generation
+
+
+def _fold_stale_flag() -> None:
+    """Turn flagged single-row writes into one invalidation, checked at most once per refresh interval."""
+    global _stale_checked_at
+    now = time.monotonic()
+    if now - _stale_checked_at < _refresh_interval():
+        return
+    _stale_checked_at = now
+    # Only the process whose delete wins bumps the generation
+    if cache.get(GRAPH_STALE_CACHE_KEY) is not None and cache.delete(GRAPH_STALE_CACHE_KEY):
+        invalidate_crossref_graph()
+
+
+def _install(generation: str) -> CrossRefGraph:
+    global _graph
+    graph = _load_or_build()
+    graph.generation = generation
+    _graph = graph
+    return graph
+
+
+def _refresh_in_background(generation: str) -> None:
+    if not _graph_lock.acquire(blocking=False):
+        return  # a build is already running
+
+    def run():
+        try:
+            _install(generation)
+        except Exception:
+            logger.exception("Cross-reference graph refresh failed")
+        finally:
+            _graph_lock.release()
+            connection.close()
+
+    threading.Thread(target=run, name="crossref-graph", daemon=True).start()
+
+
+def get_crossref_graph() -> CrossRefGraph:
+    """Return this process's graph; an outdated one is served while its replacement builds."""
+    _fold_stale_flag()
+    generation = _current_generation()
+    graph = _graph
+    if graph is not None and graph.generation == generation:
+        return graph
+    if graph is not None and _refresh_interval() > 0:
+        _refresh_in_background(generation)
+        return graph
+    with _graph_lock:
+        if _graph is None or _graph.generation != generation:
+            _install(generation)
+        return _graph
+
+
+def graph_is_current(graph: CrossRefGraph) -> bool:
+    """Whether ``graph`` includes every committed write: no newer generation and no pending single-row writes."""
+    found = cache.get_many([GRAPH_GENERATION_CACHE_KEY, GRAPH_STALE_CACHE_KEY])
+    return found.get(GRAPH_GENERATION_CACHE_KEY) == graph.generation and GRAPH_STALE_CACHE_KEY not in found
+
+
+def boot() -> None:
+    """Load the graph in the background at worker start when snapshots or warm start are configured."""
+    if not (
+        getattr(settings, "CROSSREF_GRAPH_SNAPSHOT", "")
+        or getattr(settings, "WARM_START_SNAPSHOT", "")
+        or getattr(settings, "WARM_START_REQUIRED", False)
+    ):
+        return  # built on the first lookup
+    _refresh_in_background(_current_generation())
+
+
+def invalidate_crossref_graph() -> None:
+    """Force every process to rebuild its graph; bulk loaders call this once after committing."""
+    cache.set(GRAPH_GENERATION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+
+
+@receiver(post_save, sender=CrossReference)
+@receiver(post_delete, sender=CrossReference)
+def flag_crossref_graph_stale(**kwargs) -> None:
+    """Mark the graph stale once the write commits; repeated writes share the flag."""
+    transaction.on_commit(lambda: cache.add(GRAPH_STALE_CACHE_KEY, True, timeout=None))
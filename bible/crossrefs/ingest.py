@@ -0,0 +1,202 @@
+"""
+Streaming cross-reference ingestion for OpenBible / TSK exports.
+
+Each tab-separated line (``from``, ``to``, ``votes``) is parsed and resolved
+against a preloaded book map, so no line costs a query. Resolved edges are
+streamed with ``COPY`` into a staging table and merged into
+``cross_references`` with one ``INSERT ... SELECT ... ON CONFLICT DO NOTHING``,
+filling the denormalized ``from_book/from_chapter/from_verse`` and
+``to_book/to_chapter/to_verse_start/to_verse_end`` columns directly.
+
+Accepted reference forms:
+    "Gen.1.1"                 OpenBible / OSIS
+    "Prov.8.22-Prov.8.30"     OSIS range (also "Prov.8.22-30")
+    "GEN.1.1"                 3-letter catalog codes
+    "Genesis 1:1-3"           human-readable (TSK-style), via ``parse_ref``
+"""
+
+import logging
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from django.db import connection, transaction
+
+from bible.models import CanonicalBook, CrossReference
+from bible.utils.osis_maps import CATALOG_TO_OSIS
+from bible.utils.ref_parser import parse_ref
+from common.bulk_copy import column_defaults, copy_rows
+
+logger = logging.getLogger(__name__)
+
+STAGING_TABLE = "crossref_ingest_staging"
+STAGED_COLUMNS = (
+    "from_book_id",
+    "from_chapter",
+    "from_verse",
+    "to_book_id",
+    "to_chapter",
+    "to_verse_start",
+    "to_verse_end",
+    "votes",
+)
+
+# (book_id, chapter, verse_start, verse_end, truncated)
+Resolved = tuple[int, int, int, int, bool]
+
+
+@dataclass
+class CrossRefIngestStats:
+    lines: int = 0
+    edges_staged: int = 0
+    created: int = 0
+    unresolved: int = 0
+    below_min_votes: int = 0
+    ranges_truncated: int = 0
+    duration_seconds: float = 0.0
+
+    @property
+    def lines_per_second(self) -> float:
+        return self.lines / self.duration_seconds if self.duration_seconds else 0.0
+
+    @property
+    def edges_per_second(self) -> float:
+        return self.edges_staged / self.duration_seconds if self.duration_seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            **asdict(self),
+            "lines_per_second": round(self.lines_per_second, 1),
+            "edges_per_second": round(self.edges_per_second, 1),
+        }
+
+
+class ReferenceResolver:
+    """Resolve reference strings to book-id coordinates from a preloaded ``osis_code → id`` map."""
+
+    def __init__(self, book_ids: dict[str, int] | None = None):
+        if book_ids is None:
+            book_ids = dict(CanonicalBook.objects.values_list("osis_code", "id"))
+        self.book_ids = book_ids
+        self._folded = {code.lower(): book_id for code, book_id in book_ids.items()}
+        # Exports repeat the same source verse on consecutive lines
+        self._cache: dict[str, Resolved | None] = {}
+
+    def resolve(self, text: str) -> Resolved | None:
+        text = text.strip()
+        if text not in self._cache:
+            self._cache[text] = self._parse(text)
+        return self._cache[text]
+
+    def _book_id(self, code: str) -> int | None:
+        book_id = self.book_ids.get(code) or self._folded.get(code.lower())
+        if book_id is None and code.upper() in CATALOG_TO_OSIS:
+            book_id = self.book_ids.get(CATALOG_TO_OSIS[code.upper()])
+        return book_id
+
+    def _parse(self, text: str) -> Resolved | None:
+        if " " not in text and text.count(".") >= 2:
+            return self._parse_dotted(text)
+        osis, chapter, verse_start, verse_end = parse_ref(text)
+        book_id = self.book_ids.get(osis) if osis else None
+        if book_id is None or not verse_start:
+            return None
+        return book_id, chapter, verse_start, max(verse_end or verse_start, verse_start), False
+
+    def _parse_dotted(self, text: str) -> Resolved | None:
+        start, _, end = text.partition("-")
+        try:
+            code, chapter, verse = start.split(".")
+            chapter, verse = int(chapter), int(verse)
+        except ValueError:
+            return None
+        book_id = self._book_id(code)
+        if book_id is None or chapter < 1 or verse < 1:
+            return None
+        if not end:
+            return book_id, chapter, verse, verse, False
+
+        parts = end.split(".")
+        try:
+            if len(parts) == 3:
+                end_book, end_chapter, end_verse = self._book_id(parts[0]), int(parts[1]), int(parts[2])
+            elif len(parts) == 2:
+                end_book, end_chapter, end_verse = book_id, int(parts[0]), int(parts[1])
+            else:
+                end_book, end_chapter, end_verse = book_id, chapter, int(parts[0])
+        except ValueError:
+            return None
+        # The model stores single-chapter target ranges; cross-chapter spans keep their first verse
+        if end_book != book_id or end_chapter != chapter or end_verse < verse:
+            return book_id, chapter, verse, verse, True
+        return book_id, chapter, verse, end_verse, False
+
+
+def iter_crossref_rows(lines, resolver: ReferenceResolver, stats: CrossRefIngestStats, min_votes: int = 0):
+    """Yield staging tuples (``STAGED_COLUMNS``) for each resolvable line."""
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        parts = line.split("\t")
+        if len(parts) < 2:
+            continue
+        try:
+            votes = int(float(parts[2])) if len(parts) > 2 and parts[2] else 0
+        except ValueError:
+            continue  # header row ("From Verse  To Verse  Votes ...")
+
+        stats.lines += 1
+        if votes < min_votes:
+            stats.below_min_votes += 1
+            continue
+
+        source = resolver.resolve(parts[0])
+        target = resolver.resolve(parts[1])
+        if source is None or target is None:
+            stats.unresolved += 1
+            continue
+        if target[4]:
+            stats.ranges_truncated += 1
+
+        stats.edges_staged += 1
+        yield source[0], source[1], source[2], target[0], target[1], target[2], target[3], max(votes, 0)
+
+
+def ingest_cross_references(
+    path: str | Path, source: str = "openbible", min_votes: int = 0, resolver: ReferenceResolver | None = None
+) -> CrossRefIngestStats:
+    """Stream a cross-reference export into ``cross_references``; existing edges are left untouched."""
+    stats = CrossRefIngestStats()
+    start = time.time()
+    resolver = resolver or ReferenceResolver()
+    table = CrossReference._meta.db_table
+    default_columns, default_values = column_defaults(CrossReference, exclude=(*STAGED_COLUMNS, "source"))
+
+    with open(path, encoding="utf-8") as lines, transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMP TABLE {STAGING_TABLE} ("
+            "from_book_id bigint, from_chapter integer, from_verse integer, to_book_id bigint, "
+            "to_chapter integer, to_verse_start integer, to_verse_end integer, votes integer"
+            ") ON COMMIT DROP"
+        )
+        copy_rows(cursor, STAGING_TABLE, STAGED_COLUMNS, iter_crossref_rows(lines, resolver, stats, min_votes))
+
+        columns = [*STAGED_COLUMNS, "source", *default_columns]
+        placeholders = ", ".join(["%s"] * (1 + len(default_values)))
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"SELECT {', '.join(STAGED_COLUMNS)}, {placeholders} FROM {STAGING_TABLE} "
+            "ON CONFLICT DO NOTHING",
+            [source, *default_values],
+        )
+        stats.created = cursor.rowcount
+        cursor.execute(f"DROP TABLE {STAGING_TABLE}")
+
+    stats.duration_seconds = time.time() - start
+    logger.info(
+        f"Cross-reference ingest: {stats.lines:,} lines ({stats.lines_per_second:,.0f}/s), "
+        f"{stats.edges_staged:,} edges staged ({stats.edges_per_second:,.0f}/s), {stats.created:,} new, "
+        f"{stats.unresolved:,} unresolved"
+    )
+    return stats
@@ -5,6 +5,8 @@ URL configuration for Cross-References domain.
 from django.urls import path
 
 from .views import (
+    CrossReferenceGraphView,
+    CrossReferencePathView,
     CrossReferencesByThemeView,
     CrossReferencesByVerseDeprecatedView,
     CrossReferencesByVerseView,
@@ -18,6 +20,8 @@ urlpatterns = [
     # New: textual reference support via query param ?ref=
     path("for/", CrossReferencesByVerseView.as_view(), name="crossrefs_for"),
     path("for/grouped/", CrossReferencesGroupedView.as_view(), name="crossrefs_for_grouped"),
+    path("graph/", CrossReferenceGraphView.as_view(), name="crossrefs_graph"),
+    path("graph/path/", CrossReferencePathView.as_view(), name="crossrefs_graph_path"),
     path("parallels/", CrossReferencesParallelsView.as_view(), name="crossrefs_parallels"),
     path(
         "verse/<int:verse_id>/",
@@ -1,10 +1,10 @@
 """Views for cross-references domain."""
 
-from django.db.models import Avg, Count, Exists, Max, Min, OuterRef
+from django.db.models import Exists, OuterRef
 from django.http import Http404
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from django.views.decorators.vary import vary_on_headers
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schema
 from rest_framework import generics
 from rest_framework.exceptions import NotFound, ValidationError
@@ -13,10 +13,12 @@ from rest_framework.response import Response
 from bible.references.services import resolve_book_by_alias
 from bible.references.views import _parse_reference_string
 from bible.utils import get_canonical_book_by_name
+from common.content_cache import ContentCacheMixin
 from common.openapi import get_error_responses
 from common.pagination import StandardResultsSetPagination
 
 from ..models import CrossReference, Theme, Verse
+from .graph import get_crossref_graph, graph_is_current, pack_coordinate
 from .serializers import CrossReferenceSerializer
 
 
@@ -41,14 +43,17 @@ class CrossReferencePagination(StandardResultsSetPagination):
 class CrossReferenceFiltersMixin:
     """Helpers to apply common query filters and expose them in responses."""
 
-    def _apply_common_filters(self, queryset):
+    def _parse_common_filters(self) -> tuple[str | None, float | None]:
+        """Validate ``source`` / ``min_confidence`` and record them as applied filters."""
         self._applied_filters = {}
+        source = None
+        min_confidence = None
 
-        source = self.request.query_params.get("source")
-        if source:
-            normalized = source.strip()
+        raw_source = self.request.query_params.get("source")
+        if raw_source:
+            normalized = raw_source.strip()
             if normalized:
-                queryset = queryset.filter(source__iexact=normalized)
+                source = normalized
                 self._applied_filters["source"] = normalized
 
         min_conf = self.request.query_params.get("min_confidence")
@@ -59,9 +64,17 @@ class CrossReferenceFiltersMixin:
                 raise ValidationError({"min_confidence": "Value must be between 0 and 1."}) from exc
             if not 0.0 <= value <= 1.0:
                 raise ValidationError({"min_confidence": "Value must be between 0 and 1."})
-            queryset = queryset.filter(confidence__gte=value)
+            min_confidence = value
             self._applied_filters["min_confidence"] = value
 
+        return source, min_confidence
+
+    def _apply_common_filters(self, queryset):
+        source, min_confidence = self._parse_common_filters()
+        if source:
+            queryset = queryset.filter(source__iexact=source)
+        if min_confidence is not None:
+            queryset = queryset.filter(confidence__gte=min_confidence)
         return queryset
 
     @property
@@ -78,14 +91,19 @@ class ReferenceResolutionMixin:
         if hasattr(self, "_resolved_reference_cache"):
             return self._resolved_reference_cache
 
-        raw_ref = self.request.query_params.get(self.ref_param, "")
+        self._resolved_reference_cache = self._resolve_reference_param(self.ref_param)
+        self._input_ref = self._resolved_reference_cache[0]
+        return self._resolved_reference_cache
+
+    def _resolve_reference_param(self, param: str):
+        raw_ref = self.request.query_params.get(param, "")
         ref_value = raw_ref.strip()
         if not ref_value:
-            raise ValidationError({self.ref_param: "Query parameter 'ref' is required."})
+            raise ValidationError({param: f"Query parameter '{param}' is required."})
 
         parsed = _parse_reference_string(ref_value)
         if not parsed.get("items"):
-            raise ValidationError({self.ref_param: "Could not parse textual reference."})
+            raise ValidationError({param: "Could not parse textual reference."})
 
         entry = parsed["items"][0]
         lang = getattr(self.request, "lang_code", "en")
@@ -96,7 +114,7 @@ class ReferenceResolutionMixin:
             except Http404:
                 book = None
         if book is None:
-            raise ValidationError({self.ref_param: f"Unknown book '{entry.get('book_raw')}'."})
+            raise ValidationError({param: f"Unknown book '{entry.get('book_raw')}'."})
 
         chapter = entry.get("chapter")
         verse = entry.get("verse_start")
@@ -104,28 +122,19 @@ class ReferenceResolutionMixin:
             chapter = int(chapter)
             verse = int(verse)
         except (TypeError, ValueError) as exc:
-            raise ValidationError({self.ref_param: "Reference must include numeric chapter and verse."}) from exc
+            raise ValidationError({param: "Reference must include numeric chapter and verse."}) from exc
 
-        self._input_ref = ref_value
-        self._resolved_reference_cache = (ref_value, book, chapter, verse)
-        return self._resolved_reference_cache
+        return ref_value, book, chapter, verse
 
 
 @method_decorator(vary_on_headers("Accept-Language"), name="get")
-@method_decorator(cache_page(60), name="get")
-class CrossReferencesByVerseView(CrossReferenceFiltersMixin, ReferenceResolutionMixin, generics.ListAPIView):
+class CrossReferencesByVerseView(
+    ContentCacheMixin, CrossReferenceFiltersMixin, ReferenceResolutionMixin, generics.ListAPIView
+):
     serializer_class = CrossReferenceSerializer
     pagination_class = CrossReferencePagination
-
-    def get_queryset(self):
-        _, book, chapter, verse = self._resolve_reference()
-        base = (
-            CrossReference.objects.filter(from_book=book, from_chapter=chapter, from_verse=verse)
-            .select_related("from_book", "to_book")
-            .order_by("from_book", "from_chapter", "from_verse")
-        )
-        self._available_total = base.count()
-        return self._apply_common_filters(base)
+    content_datasets = ("crossrefs", "books")
+    queryset = CrossReference.objects.none()  # rows come from the graph; see list()
 
     @extend_schema(
         summary="List cross-references for a verse (by textual reference)",
@@ -184,31 +193,37 @@ class CrossReferencesByVerseView(CrossReferenceFiltersMixin, ReferenceResolution
         ],
     )
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        available_total = getattr(self, "_available_total", 0)
+        # Counts, filters and summary come from the in-memory graph; only the page rows hit the database
+        _, book, chapter, verse = self._resolve_reference()
+        graph = get_crossref_graph()
+        # An outdated graph may still answer, but not into the cache under the new generation
+        self.content_cache_store = graph_is_current(graph)
+        key = pack_coordinate(book.id, chapter, verse)
+        available_total = graph.degree(key)
         if available_total == 0:
             raise NotFound({"detail": "Cross references not found for reference.", "code": "not_found"})
 
-        filtered_total = queryset.count()
+        source, min_confidence = self._parse_common_filters()
+        edges = graph.edges_from(key, source=source, min_confidence=min_confidence)
 
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            response = self.get_paginated_response(serializer.data)
-        else:
-            serializer = self.get_serializer(queryset, many=True)
-            response = Response(serializer.data)
+        page_ids = self.paginate_queryset(graph.edge_ids[edges].tolist())
+        rows = CrossReference.objects.select_related("from_book", "to_book").in_bulk(page_ids)
+        serializer = self.get_serializer([rows[pk] for pk in page_ids if pk in rows], many=True)
+        response = self.get_paginated_response(serializer.data)
 
-        response.data["summary"] = self._build_summary(queryset, filtered_total, available_total)
+        stats = graph.summary(edges)
+        response.data["summary"] = self._summary_payload(
+            len(edges), available_total, stats["sources"], stats["confidence"]
+        )
         return response
 
-    def _build_summary(self, queryset, filtered_total: int, available_total: int) -> dict:
+    def _summary_payload(self, filtered_total: int, available_total: int, sources: dict, confidence) -> dict:
         summary = {
             "input": getattr(self, "_input_ref", None),
             "available": available_total,
             "total": filtered_total,
-            "sources": {},
-            "confidence": None,
+            "sources": sources,
+            "confidence": confidence if filtered_total else None,
             "filters": dict(self.applied_filters),
         }
 
@@ -219,30 +234,15 @@ class CrossReferencesByVerseView(CrossReferenceFiltersMixin, ReferenceResolution
             except (TypeError, ValueError):
                 summary["filters"]["limit"] = limit_value
 
-        source_rows = queryset.values("source").annotate(items=Count("id")).order_by("source")
-        summary["sources"] = {(row["source"] or "unknown"): row["items"] for row in source_rows}
-
-        if filtered_total:
-            aggregates = queryset.aggregate(
-                min_conf=Min("confidence"),
-                max_conf=Max("confidence"),
-                avg_conf=Avg("confidence"),
-            )
-            summary["confidence"] = {
-                "min": round(float(aggregates["min_conf"]), 3) if aggregates["min_conf"] is not None else None,
-                "max": round(float(aggregates["max_conf"]), 3) if aggregates["max_conf"] is not None else None,
-                "avg": round(float(aggregates["avg_conf"]), 3) if aggregates["avg_conf"] is not None else None,
-            }
-
         return summary
 
 
-@method_decorator(cache_page(60), name="get")
-class CrossReferencesParallelsView(ReferenceResolutionMixin, generics.ListAPIView):
+class CrossReferencesParallelsView(ContentCacheMixin, ReferenceResolutionMixin, generics.ListAPIView):
     """Return parallel passages (Gospels) for a textual reference."""
 
     serializer_class = CrossReferenceSerializer
     pagination_class = CrossReferencePagination
+    content_datasets = ("crossrefs", "books")
 
     GOSPELS = {"Matt", "Mark", "Luke", "John"}
 
@@ -290,8 +290,9 @@ class CrossReferencesParallelsView(ReferenceResolutionMixin, generics.ListAPIVie
         return super().get(request, *args, **kwargs)
 
 
-@method_decorator(cache_page(60), name="get")
-class CrossReferencesGroupedView(CrossReferenceFiltersMixin, ReferenceResolutionMixin, generics.ListAPIView):
+class CrossReferencesGroupedView(
+    ContentCacheMixin, CrossReferenceFiltersMixin, ReferenceResolutionMixin, generics.ListAPIView
+):
     """Group cross-references by strength (confidence) for a textual reference.
 
     Strength buckets (by confidence):
@@ -302,6 +303,7 @@ class CrossReferencesGroupedView(CrossReferenceFiltersMixin, ReferenceResolution
     """
 
     serializer_class = CrossReferenceSerializer
+    content_datasets = ("crossrefs", "books")
 
     BUCKETS = (
         ("very_strong", 0.85),
@@ -419,12 +421,12 @@ class CrossReferencesByVerseDeprecatedView(generics.ListAPIView):
         return response
 
 
-@method_decorator(cache_page(60), name="get")
-class CrossReferencesByThemeView(CrossReferenceFiltersMixin, generics.ListAPIView):
+class CrossReferencesByThemeView(ContentCacheMixin, CrossReferenceFiltersMixin, generics.ListAPIView):
     """GET /api/v1/bible/cross-references/by-theme/<theme_id>/"""
 
     serializer_class = CrossReferenceSerializer
     pagination_class = CrossReferencePagination
+    content_datasets = ("crossrefs", "books", "themes")
 
     @extend_schema(
         summary="List cross-references by theme",
@@ -482,3 +484,136 @@ class CrossReferencesByThemeView(CrossReferenceFiltersMixin, generics.ListAPIVie
         )
         self._available_total = base.count()
         return self._apply_common_filters(base)
+
+
+def _bounded_int_param(request, name: str, default: int, minimum: int, maximum: int) -> int:
+    raw = request.query_params.get(name)
+    if raw in (None, ""):
+        return default
+    try:
+        value = int(raw)
+    except (TypeError, ValueError) as exc:
+        raise ValidationError({name: f"Value must be an integer between {minimum} and {maximum}."}) from exc
+    if not minimum <= value <= maximum:
+        raise ValidationError({name: f"Value must be an integer between {minimum} and {maximum}."})
+    return value
+
+
+class CrossReferenceGraphView(CrossReferenceFiltersMixin, ReferenceResolutionMixin, generics.GenericAPIView):
+    """GET /api/v1/bible/cross-references/graph/?ref=<ref>&hops=<k> — k-hop neighborhood ("refs of refs")."""
+
+    MAX_HOPS = 3
+    MAX_NODES = 1000
+
+    @extend_schema(
+        summary="Cross-reference neighborhood (multi-hop)",
+        description="Breadth-first neighborhood of a verse in the cross-reference graph, answered from memory. "
+        "Each node carries its hop distance from the input verse; expansion stops at `max_nodes`.",
+        tags=["cross-references"],
+        parameters=[
+            OpenApiParameter(name="ref", description="Text reference (e.g., 'Jo 3:16')", required=True),
+            OpenApiParameter(name="hops", type=int, description="Traversal depth (1-3, default 1)", required=False),
+            OpenApiParameter(
+                name="max_nodes", type=int, description="Maximum verses returned (1-1000, default 200)", required=False
+            ),
+            OpenApiParameter(name="source", description="Follow only edges from this source", required=False),
+            OpenApiParameter(
+                name="min_confidence", description="Follow only edges with at least this confidence", required=False
+            ),
+        ],
+        responses={200: OpenApiTypes.OBJECT, **get_error_responses()},
+        examples=[
+            OpenApiExample(
+                "Two hops",
+                value={
+                    "input": "Jo 3:16",
+                    "root": "John.3.16",
+                    "hops": 2,
+                    "truncated": False,
+                    "nodes": [{"ref": "John.3.16", "hop": 0}, {"ref": "Rom.5.8", "hop": 1}],
+                    "edges": [
+                        {
+                            "id": 101,
+                            "from": "John.3.16",
+                            "to": "Rom.5.8",
+                            "confidence": 0.9,
+                            "source": "TSK",
+                            "relation_type": "thematic",
+                        }
+                    ],
+                },
+                response_only=True,
+            )
+        ],
+    )
+    def get(self, request, *args, **kwargs):
+        ref, book, chapter, verse = self._resolve_reference()
+        hops = _bounded_int_param(request, "hops", 1, 1, self.MAX_HOPS)
+        max_nodes = _bounded_int_param(request, "max_nodes", 200, 1, self.MAX_NODES)
+        source, min_confidence = self._parse_common_filters()
+
+        graph = get_crossref_graph()
+        root = pack_coordinate(book.id, chapter, verse)
+        if graph.degree(root) == 0:
+            raise NotFound({"detail": "Cross references not found for reference.", "code": "not_found"})
+
+        result = graph.neighborhood(root, hops, max_nodes, source=source, min_confidence=min_confidence)
+        payload = {
+            "input": ref,
+            "root": graph.format_key(root),
+            "hops": hops,
+            "truncated": result["truncated"],
+            "nodes": [{"ref": graph.format_key(key), "hop": hop} for key, hop in result["nodes"].items()],
+            "edges": [graph.edge_payload(from_key, i) for from_key, i in result["edges"]],
+        }
+        if self.applied_filters:
+            payload["filters"] = self.applied_filters
+        return Response(payload)
+
+
+class CrossReferencePathView(CrossReferenceFiltersMixin, ReferenceResolutionMixin, generics.GenericAPIView):
+    """GET /api/v1/bible/cross-references/graph/path/?from=<ref>&to=<ref> — shortest reference chain."""
+
+    MAX_HOPS = 6
+
+    @extend_schema(
+        summary="Shortest cross-reference path between two verses",
+        description="Fewest-hop chain of cross-references leading from one verse to another, answered from memory.",
+        tags=["cross-references"],
+        parameters=[
+            OpenApiParameter(name="from", description="Start reference (e.g., 'Gn 3:15')", required=True),
+            OpenApiParameter(name="to", description="Target reference (e.g., 'Ap 12:9')", required=True),
+            OpenApiParameter(name="max_hops", type=int, description="Search depth (1-6, default 4)", required=False),
+            OpenApiParameter(name="source", description="Follow only edges from this source", required=False),
+            OpenApiParameter(
+                name="min_confidence", description="Follow only edges with at least this confidence", required=False
+            ),
+        ],
+        responses={200: OpenApiTypes.OBJECT, **get_error_responses()},
+    )
+    def get(self, request, *args, **kwargs):
+        from_ref, from_book, from_chapter, from_verse = self._resolve_reference_param("from")
+        to_ref, to_book, to_chapter, to_verse = self._resolve_reference_param("to")
+        max_hops = _bounded_int_param(request, "max_hops", 4, 1, self.MAX_HOPS)
+        source, min_confidence = self._parse_common_filters()
+
+        graph = get_crossref_graph()
+        start = pack_coordinate(from_book.id, from_chapter, from_verse)
+        path = graph.shortest_path(
+            start,
+            pack_coordinate(to_book.id, to_chapter, to_verse),
+            max_hops,
+            source=source,
+            min_confidence=min_confidence,
+        )
+        if path is None:
+            raise NotFound({"detail": f"No cross-reference path within {max_hops} hops.", "code": "not_found"})
+
+        return Response(
+            {
+                "from": from_ref,
+                "to": to_ref,
+                "hops": len(path),
+                "path": [graph.edge_payload(from_key, i) for from_key, i in path],
+            }
+        )
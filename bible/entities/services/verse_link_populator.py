@@ -16,9 +16,10 @@ from pathlib import Path
 from django.db import transaction
 
 from bible.entities.models import CanonicalEntity, EntityVerseLink
-from bible.models import CanonicalBook, Verse, Version
+from bible.models import Version
 from bible.symbols.models import BiblicalSymbol, SymbolMeaning, SymbolOccurrence
 from bible.utils.ref_parser import parse_ref
+from bible.utils.verse_index import VerseIndex
 
 logger = logging.getLogger(__name__)
 
@@ -52,9 +53,8 @@ class VerseLinkPopulator:
         self.processed_dir = Path(processed_dir)
         self.version_code = version_code
 
-        self._book_cache: dict[str, CanonicalBook] = {}
-        self._verse_cache: dict[str, Verse] = {}
         self._version: Version | None = None
+        self._verse_index: VerseIndex | None = None
 
     def populate_all(self, clear_existing: bool = False) -> PopulateStats:
         start = time.time()
@@ -65,7 +65,7 @@ class VerseLinkPopulator:
             stats.errors.append(f"Version {self.version_code} not found")
             return stats
 
-        self._build_book_cache()
+        self._verse_index = VerseIndex(version=self._version)
 
         if clear_existing:
             e_del = EntityVerseLink.objects.all().delete()[0]
@@ -85,26 +85,10 @@ class VerseLinkPopulator:
         )
         return stats
 
-    def _build_book_cache(self):
-        for book in CanonicalBook.objects.all():
-            self._book_cache[book.osis_code] = book
-
-    def _find_verse(self, osis_code: str, chapter: int, verse_num: int) -> Verse | None:
-        key = f"{osis_code}:{chapter}:{verse_num}"
-        if key in self._verse_cache:
-            return self._verse_cache[key]
-
-        book = self._book_cache.get(osis_code)
-        if not book:
-            return None
-
-        verse = (
-            Verse.objects
-            .filter(book=book, version=self._version, chapter=chapter, number=verse_num)
-            .first()
-        )
-        self._verse_cache[key] = verse
-        return verse
+    def _find_verses(self, osis_code: str, chapter: int, verse_start: int, verse_end: int | None) -> list[int]:
+        """Verse ids for every verse of a range, in order; 0 marks a verse missing from the version."""
+        refs = [(osis_code, chapter, v_num) for v_num in range(verse_start, (verse_end or verse_start) + 1)]
+        return self._verse_index.resolve_many(refs).tolist()
 
     def _populate_entity_links(self, stats: PopulateStats):
         logger.info("Populating EntityVerseLink from key_refs...")
@@ -146,16 +130,15 @@ class VerseLinkPopulator:
                         # Chapter-only ref — skip (too broad)
                         continue
 
-                    for v_num in range(vs, (ve or vs) + 1):
-                        verse = self._find_verse(osis, chapter, v_num)
-                        if not verse:
+                    for verse_id in self._find_verses(osis, chapter, vs, ve):
+                        if not verse_id:
                             stats.verses_not_found += 1
                             continue
 
                         links_batch.append(
                             EntityVerseLink(
                                 entity=entity,
-                                verse=verse,
+                                verse_id=verse_id,
                                 mention_type="explicit",
                                 relevance=1.0,
                                 is_primary_subject=True,
@@ -222,16 +205,15 @@ class VerseLinkPopulator:
                     if vs is None:
                         continue
 
-                    for v_num in range(vs, (ve or vs) + 1):
-                        verse = self._find_verse(osis, chapter, v_num)
-                        if not verse:
+                    for verse_id in self._find_verses(osis, chapter, vs, ve):
+                        if not verse_id:
                             stats.verses_not_found += 1
                             continue
 
                         occ_batch.append(
                             SymbolOccurrence(
                                 symbol=symbol,
-                                verse=verse,
+                                verse_id=verse_id,
                                 meaning=meaning,
                                 usage_type="symbolic",
                                 context_note=context[:500] if context else "",
@@ -188,7 +188,7 @@ class CanonicalEntityViewSet(viewsets.ReadOnlyModelViewSet):
         links = (
             EntityVerseLink.objects
             .filter(verse__book=canonical_book, verse__chapter=int(chapter))
-            .select_related("entity")
+            .select_related("entity", "verse")
         )
 
         entity_verses = defaultdict(dict)
@@ -18,6 +18,7 @@ from django.db.models import Count
 
 from bible.models import CanonicalBook
 from bible.utils.osis_maps import parse_osis_ref
+from bible.utils.verse_index import VerseIndex
 
 from ..models import Artist, BiblicalImage, ImageTag, ImageVerseLink
 
@@ -45,7 +46,7 @@ class ImageImporter:
         self.metadata_path = Path(metadata_path) if metadata_path else METADATA_PATH
         self.tags_path = Path(tags_path) if tags_path else TAGS_PATH
         self._artist_cache: dict[str, Artist] = {}
-        self._book_cache: dict[str, CanonicalBook | None] = {}
+        self._verse_index: VerseIndex | None = None
 
     # ─── Metadata Import ──────────────────────────────────
 
@@ -246,16 +247,9 @@ class ImageImporter:
                 result.verse_links_skipped += 1
 
     def _resolve_book(self, osis_code: str) -> CanonicalBook | None:
-        if osis_code in self._book_cache:
-            return self._book_cache[osis_code]
-
-        try:
-            book = CanonicalBook.objects.get(osis_code=osis_code)
-            self._book_cache[osis_code] = book
-            return book
-        except CanonicalBook.DoesNotExist:
-            self._book_cache[osis_code] = None
-            return None
+        if self._verse_index is None:
+            self._verse_index = VerseIndex()
+        return self._verse_index.book(osis_code)
 
     # ─── Status ───────────────────────────────────────────
 
@@ -51,7 +51,7 @@ class ArtistViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=True, methods=["get"])
     def images(self, request, slug=None):
         artist = self.get_object()
-        images = BiblicalImage.objects.filter(artist=artist).order_by("-completion_year")[:50]
+        images = BiblicalImage.objects.filter(artist=artist).select_related("artist").order_by("-completion_year")[:50]
         serializer = BiblicalImageListSerializer(images, many=True)
         return Response(serializer.data)
 
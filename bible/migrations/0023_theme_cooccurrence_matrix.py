@@ -0,0 +1,95 @@
+# Generated by Django 4.2.7 on 2026-10-19 10:04
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# Fill the matrix from the theme links that already exist; later changes keep it current
+BACKFILL_SQL = [
+    """
+    INSERT INTO theme_cooccurrence (theme_id, related_theme_id, shared_verse_count, updated_at)
+    SELECT a.theme_id, b.theme_id, COUNT(*), NOW()
+    FROM verse_themes a
+    JOIN verse_themes b ON b.verse_id = a.verse_id AND b.theme_id <> a.theme_id
+    GROUP BY a.theme_id, b.theme_id
+    """,
+    """
+    INSERT INTO theme_chapter_distribution (theme_id, book_id, chapter, verse_count, first_verse, updated_at)
+    SELECT vt.theme_id, v.book_id, v.chapter, COUNT(*), MIN(v.number), NOW()
+    FROM verse_themes vt
+    JOIN verses v ON v.id = vt.verse_id
+    GROUP BY vt.theme_id, v.book_id, v.chapter
+    """,
+]
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bible", "0022_initial_models"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ThemeChapterDistribution",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("chapter", models.PositiveIntegerField()),
+                ("verse_count", models.PositiveIntegerField(default=0)),
+                ("first_verse", models.PositiveIntegerField()),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "book",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="bible.canonicalbook"
+                    ),
+                ),
+                (
+                    "theme",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="chapter_distribution",
+                        to="bible.theme",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "theme_chapter_distribution",
+            },
+        ),
+        migrations.CreateModel(
+            name="ThemeCooccurrence",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("shared_verse_count", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "related_theme",
+                    models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="+", to="bible.theme"),
+                ),
+                (
+                    "theme",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="cooccurrences", to="bible.theme"
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "theme_cooccurrence",
+                "indexes": [models.Index(fields=["theme", "-shared_verse_count"], name="tco_theme_count_idx")],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="themecooccurrence",
+            constraint=models.UniqueConstraint(fields=("theme", "related_theme"), name="uniq_theme_cooccurrence_pair"),
+        ),
+        migrations.AddIndex(
+            model_name="themechapterdistribution",
+            index=models.Index(fields=["theme", "book"], name="tcd_theme_book_idx"),
+        ),
+        migrations.AddConstraint(
+            model_name="themechapterdistribution",
+            constraint=models.UniqueConstraint(
+                fields=("theme", "book", "chapter"), name="uniq_theme_chapter_distribution"
+            ),
+        ),
+        migrations.RunSQL(BACKFILL_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:02
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bible", "0023_theme_cooccurrence_matrix"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VerseNeighbors",
+            fields=[
+                (
+                    "verse",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="neighbors",
+                        serialize=False,
+                        to="bible.verse",
+                    ),
+                ),
+                ("version_code", models.CharField(max_length=40)),
+                ("model_name", models.CharField(max_length=80)),
+                ("top_n", models.PositiveSmallIntegerField()),
+                (
+                    "neighbor_ids",
+                    django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), size=None),
+                ),
+                (
+                    "neighbor_scores",
+                    django.contrib.postgres.fields.ArrayField(base_field=models.FloatField(), size=None),
+                ),
+                (
+                    "external_ids",
+                    django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), size=None),
+                ),
+                (
+                    "external_scores",
+                    django.contrib.postgres.fields.ArrayField(base_field=models.FloatField(), size=None),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "verse_semantic_neighbors",
+                "indexes": [models.Index(fields=["version_code"], name="vsn_version_code_idx")],
+            },
+        ),
+    ]
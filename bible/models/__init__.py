@@ -18,8 +18,8 @@ from bible.commentaries import (
 )
 from .nlp_cache import QueryNLPCache
 from .query_expansion import QueryExpansionCache
-from .rag import UnifiedThemeEmbedding, UnifiedVerseEmbedding, VerseEmbedding
-from .themes import Theme, VerseTheme
+from .rag import UnifiedThemeEmbedding, UnifiedVerseEmbedding, VerseEmbedding, VerseNeighbors
+from .themes import Theme, ThemeChapterDistribution, ThemeCooccurrence, VerseTheme
 from .topics import (
     Topic,
     TopicAspect,
@@ -65,8 +65,11 @@ __all__ = [
     "APIKey",
     "Theme",
     "VerseTheme",
+    "ThemeCooccurrence",
+    "ThemeChapterDistribution",
     "CrossReference",
     "VerseEmbedding",
+    "VerseNeighbors",
     "UnifiedVerseEmbedding",
     "UnifiedThemeEmbedding",
     # Query Expansion
@@ -132,9 +132,11 @@ class QueryExpansionCache(models.Model):
         return " | ".join(unique)
 
     def increment_usage(self):
-        """Incrementa contador de uso."""
+        """Incrementa contador de uso (gravado em lote por ``bible.ai.usage_counters``)."""
         from django.utils import timezone
 
+        from bible.ai.usage_counters import record_hit
+
         self.usage_count += 1
         self.last_used_at = timezone.now()
-        self.save(update_fields=["usage_count", "last_used_at"])
+        record_hit(type(self), self.query_normalized, self.last_used_at)
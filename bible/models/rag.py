@@ -1,4 +1,4 @@
-"""RAG-related models: verse embeddings storage."""
+"""RAG-related models: verse embeddings storage and precomputed semantic neighbors."""
 
 import pgvector.django
 from django.contrib.postgres.fields import ArrayField
@@ -36,6 +36,35 @@ class VerseEmbedding(models.Model):
         return f"Embedding({self.verse_id}, {self.version_code})"
 
 
+class VerseNeighbors(models.Model):
+    """Top-N semantic neighbors of a verse, precomputed from ``verse_embeddings``.
+
+    Neighbors are other verses of the same version ranked by cosine similarity of
+    ``embedding_small``, best first. ``external_*`` repeats the ranking without the
+    verse's own chapter, so "similar verses elsewhere" is answered from this row
+    alone. Rebuilt by ``bible.ai.neighbors.build_neighbors``.
+    """
+
+    verse = models.OneToOneField(Verse, on_delete=models.CASCADE, primary_key=True, related_name="neighbors")
+    version_code = models.CharField(max_length=40)
+    model_name = models.CharField(max_length=80)
+    top_n = models.PositiveSmallIntegerField()
+    neighbor_ids = ArrayField(models.BigIntegerField())
+    neighbor_scores = ArrayField(models.FloatField())
+    external_ids = ArrayField(models.BigIntegerField())
+    external_scores = ArrayField(models.FloatField())
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "verse_semantic_neighbors"
+        indexes = [
+            models.Index(fields=["version_code"], name="vsn_version_code_idx"),
+        ]
+
+    def __str__(self):
+        return f"Neighbors({self.verse_id}, {len(self.neighbor_ids)})"
+
+
 class UnifiedVerseEmbedding(models.Model):
     """Unified embeddings for a canonical verse across multiple versions.
 
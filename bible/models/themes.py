@@ -42,3 +42,58 @@ class VerseTheme(models.Model):
 
     def __str__(self):
         return f"{self.verse_id} ~ {self.theme.name}"
+
+
+class ThemeCooccurrence(models.Model):
+    """
+    Sparse theme × theme co-occurrence matrix derived from VerseTheme.
+
+    One row per ordered pair of themes sharing at least one verse, so a
+    single index scan on ``theme`` answers "which themes appear alongside X".
+    Rebuilt by ``bible.themes.services.rebuild_theme_matrix``.
+    """
+
+    theme = models.ForeignKey(Theme, on_delete=models.CASCADE, related_name="cooccurrences")
+    related_theme = models.ForeignKey(Theme, on_delete=models.CASCADE, related_name="+")
+    shared_verse_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "theme_cooccurrence"
+        constraints = [
+            models.UniqueConstraint(fields=["theme", "related_theme"], name="uniq_theme_cooccurrence_pair"),
+        ]
+        indexes = [
+            models.Index(fields=["theme", "-shared_verse_count"], name="tco_theme_count_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.theme_id} ~ {self.related_theme_id} ({self.shared_verse_count})"
+
+
+class ThemeChapterDistribution(models.Model):
+    """
+    Per-theme verse distribution by book and chapter derived from VerseTheme.
+
+    Book-level totals are aggregated from these rows; ``first_verse`` keeps the
+    earliest themed verse of the chapter for "first occurrence" lookups.
+    """
+
+    theme = models.ForeignKey(Theme, on_delete=models.CASCADE, related_name="chapter_distribution")
+    book = models.ForeignKey("CanonicalBook", on_delete=models.CASCADE, related_name="+")
+    chapter = models.PositiveIntegerField()
+    verse_count = models.PositiveIntegerField(default=0)
+    first_verse = models.PositiveIntegerField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "theme_chapter_distribution"
+        constraints = [
+            models.UniqueConstraint(fields=["theme", "book", "chapter"], name="uniq_theme_chapter_distribution"),
+        ]
+        indexes = [
+            models.Index(fields=["theme", "book"], name="tcd_theme_book_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.theme_id} @ {self.book_id}:{self.chapter} ({self.verse_count})"
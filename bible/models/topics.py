@@ -104,6 +104,13 @@ class Topic(models.Model):
 
     def get_display_name(self, language_code: str = "en") -> str:
         """Get localized display name with fallback logic."""
+        # Resolve from prefetched names (prefetch_related("names__language")) without extra queries
+        prefetched = getattr(self, "_prefetched_objects_cache", {}).get("names")
+        if prefetched is not None and all(TopicName.language.is_cached(n) for n in prefetched):
+            by_lang = {n.language.code: n.name for n in prefetched}
+            candidates = [language_code, "pt" if language_code.startswith("pt") else None, "en"]
+            return next((by_lang[code] for code in candidates if code in by_lang), self.canonical_name)
+
         # Try exact match
         name_obj = self.names.filter(language__code=language_code).first()
         if name_obj:
@@ -317,6 +324,13 @@ class TopicAspect(models.Model):
 
     def get_label(self, language_code: str = "en") -> str:
         """Get localized label with fallback logic."""
+        # Resolve from prefetched labels (prefetch_related("labels__language")) without extra queries
+        prefetched = getattr(self, "_prefetched_objects_cache", {}).get("labels")
+        if prefetched is not None and all(TopicAspectLabel.language.is_cached(label) for label in prefetched):
+            by_lang = {label.language.code: label.label for label in prefetched}
+            candidates = [language_code, "pt" if language_code.startswith("pt") else None, "en"]
+            return next((by_lang[code] for code in candidates if code in by_lang), self.canonical_label)
+
         label_obj = self.labels.filter(language__code=language_code).first()
         if label_obj:
             return label_obj.label
@@ -37,6 +37,16 @@ class Verse(models.Model):
     @property
     def reference(self):
         """Human-readable verse reference using version's language."""
+        # Resolve from prefetched names (prefetch_related("book__names__language")) without extra queries
+        prefetched = getattr(self.book, "_prefetched_objects_cache", {}).get("names")
+        if prefetched is not None:
+            names = [n for n in prefetched if n.language_id == self.version.language_id]
+            book_name = next((n for n in names if n.version_id == self.version_id), None) or next(
+                (n for n in names if n.version_id is None), None
+            )
+            display_name = book_name.name if book_name else self.book.osis_code
+            return f"{display_name} {self.chapter}:{self.number}"
+
         book_name = self.book.names.filter(language=self.version.language, version=self.version).first()
 
         if not book_name:
@@ -27,7 +27,8 @@ class PersonViewSet(viewsets.ReadOnlyModelViewSet):
         return PersonListSerializer
 
     def get_queryset(self):
-        return Person.objects.all()
+        # Reverse one-to-ones read by has_author_profile / has_biblical_profile
+        return Person.objects.select_related("author_profile", "biblical_profile")
 
     @extend_schema(
         summary="List people",
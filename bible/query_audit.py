@@ -0,0 +1,515 @@
+"""
+Query-count audit for the Bible read API.
+
+Walks every GET route registered under ``bible/urls.py``, seeds the same
+synthetic fixtures at two sizes (``SIZES``), requests each endpoint once per
+size and records status, query count and DB time. An endpoint whose query
+count grows with the size of its result set has an N+1 pattern
+(``find_scaling``) — e.g. a serializer reading ``verse.book`` per row without
+``select_related``.
+
+Route kwargs and query strings come from ``PARAMS``, formatted with the
+fixture values returned by ``seed_fixtures``; routes with no entry are called
+with kwargs filled from ``DEFAULT_KWARGS``. The report is plain,
+deterministically ordered JSON so that two commits can be diffed::
+
+    python manage.py query_audit --output query_report.json
+
+Known, not-yet-fixed scaling endpoints live in ``KNOWN_SCALING`` with the
+reason; the guard test fails for anything else that scales and for entries
+that no longer need to be listed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any
+from urllib.parse import urlencode
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+from django.urls import URLPattern, URLResolver, reverse
+from rest_framework.test import APIClient
+
+from common.observability.queries import probe_queries
+
+SIZES = {"small": 3, "large": 9}
+
+# Allowed extra queries at the large size before an endpoint counts as scaling
+SCALING_SLACK = 0
+
+# url name -> reason; endpoints whose query count is known to grow with result size
+KNOWN_SCALING: dict[str, str] = {}
+
+# Routes that are not reads even though they answer GET, or need external services
+SKIP: dict[str, str] = {
+    "bible:rag:eval_simple": "calls the embedding API",
+}
+
+# Fallback route kwargs, by kwarg name
+DEFAULT_KWARGS = {
+    "book_name": "{book_name}",
+    "book": "{book_osis}",
+    "chapter": "1",
+    "verse": "1",
+    "slug": "{topic_slug}",
+    "canonical_id": "{entity_id}",
+}
+
+# url name -> {"kwargs": {...}, "query": {...}}; values are str.format templates over the fixtures
+PARAMS: dict[str, dict[str, dict[str, str]]] = {
+    "bible:books:books_by_author": {"kwargs": {"author_name": "Moses"}},
+    "bible:books:books_by_testament": {"kwargs": {"testament_id": "{testament_id}"}},
+    "bible:books:books_search": {"query": {"q": "Ge"}},
+    "bible:books:books_resolve": {"kwargs": {"identifier": "{book_osis}"}},
+    "bible:books:books_canon": {"kwargs": {"tradition": "protestant"}},
+    "bible:books:book_section_detail": {"kwargs": {"section_id": "1"}},
+    "bible:books:book_restricted_search": {"query": {"q": "light"}},
+    "bible:books:book_range": {
+        "query": {"start_chapter": "1", "start_verse": "1", "end_chapter": "2", "end_verse": "2"}
+    },
+    "bible:verses:verses_list": {"query": {"book": "{book_id}", "version": "{version_code}"}},
+    "bible:verses:verses_by_reference": {"query": {"ref": "{book_osis} 1", "version": "{version_code}"}},
+    "bible:verses:verses_range": {"query": {"ref": "{book_osis} 1:1-2:2", "version": "{version_code}"}},
+    "bible:verses:verses_compare": {"query": {"ref": "{book_osis} 1", "versions": "{version_codes}"}},
+    "bible:verses:verses_export": {"query": {"book": "{book_osis}", "version": "{version_code}"}},
+    "bible:verses:verses_by_theme": {"kwargs": {"theme_id": "{theme_id}"}},
+    "bible:verses:verse_detail": {"kwargs": {"pk": "{verse_id}"}},
+    "bible:themes:themes_search": {"query": {"q": "Theme"}},
+    "bible:themes:theme_detail": {"kwargs": {"pk": "{theme_id}"}},
+    "bible:themes:theme_statistics": {"kwargs": {"theme_id": "{legacy_theme_id}"}},
+    "bible:themes:theme_progression": {"kwargs": {"theme_id": "{legacy_theme_id}"}},
+    "bible:themes:concept_map": {"kwargs": {"concept": "Theme"}},
+    "bible:topics:search": {"query": {"q": "Topic"}},
+    "bible:topics:by-letter": {"kwargs": {"letter": "T"}},
+    "bible:topics:by-type": {"kwargs": {"topic_type": "concept"}},
+    "bible:topics:review-detail": {"kwargs": {"topic_key": "{topic_slug}"}},
+    "bible:topics:review-entities": {"kwargs": {"topic_key": "{topic_slug}"}},
+    "bible:topics:review-themes": {"kwargs": {"topic_key": "{topic_slug}"}},
+    "bible:crossrefs:crossrefs_for": {"query": {"ref": "{book_osis} 1:1"}},
+    "bible:crossrefs:crossrefs_for_grouped": {"query": {"ref": "{book_osis} 1:1"}},
+    "bible:crossrefs:crossrefs_graph": {"query": {"ref": "{book_osis} 1:1"}},
+    "bible:crossrefs:crossrefs_graph_path": {"query": {"from": "{book_osis} 1:1", "to": "{last_book_osis} 2:1"}},
+    "bible:crossrefs:crossrefs_parallels": {"query": {"ref": "{book_osis} 1:1"}},
+    "bible:crossrefs:crossrefs_by_verse": {"kwargs": {"verse_id": "{verse_id}"}},
+    "bible:crossrefs:crossrefs_by_theme": {"kwargs": {"theme_id": "{legacy_theme_id}"}},
+    "bible:versions:version_detail": {"kwargs": {"abbreviation": "{version_code}"}},
+    "bible:references:references_parse": {"query": {"q": "{book_osis} 1:1-3"}},
+    "bible:references:references_resolve": {"query": {"q": "{book_osis} 1:1-3"}},
+    "bible:references:references_normalize": {"query": {"q": "{book_osis} 1:1-3"}},
+    "bible:comments:commentary-entry-list": {"query": {"verse": "{book_osis}.1.1"}},
+    "bible:comments:commentary-entry-detail": {"kwargs": {"pk": "{commentary_entry_id}"}},
+    "bible:comments:commentary-author-detail": {"kwargs": {"pk": "{commentary_author_id}"}},
+    "bible:comments:commentary-author-entries": {"kwargs": {"pk": "{commentary_author_id}"}},
+    "bible:comments:commentary-source-detail": {"kwargs": {"pk": "{commentary_source_id}"}},
+    "bible:people:person-detail": {"kwargs": {"slug": "{person_slug}"}},
+    "bible:images:artist-detail": {"kwargs": {"slug": "{artist_slug}"}},
+    "bible:images:artist-images": {"kwargs": {"slug": "{artist_slug}"}},
+    "bible:images:image-search": {"query": {"q": "Image"}},
+    "bible:images:image-detail": {"kwargs": {"pk": "{image_id}"}},
+    "bible:entities:entity-search": {"query": {"q": "Entity"}},
+    "bible:symbols:symbol-by-context": {"kwargs": {"context": "covenant"}},
+    "bible:symbols:symbol-search": {"query": {"q": "Symbol"}},
+    "bible:symbols:symbol-detail": {"kwargs": {"canonical_id": "{symbol_id}"}},
+    "bible:studies:detail": {"kwargs": {"slug": "{study_slug}"}},
+    "bible:studies:rail": {"kwargs": {"slug": "{study_slug}"}},
+}
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    name: str
+    route: str
+    kwargs: tuple[str, ...]
+
+
+@dataclass
+class Measurement:
+    status: int
+    queries: int
+    db_ms: float
+    items: int | None
+
+
+# ---------------------------------------------------------------------------
+# Route discovery
+# ---------------------------------------------------------------------------
+
+
+def _answers_get(pattern: URLPattern) -> bool:
+    callback = pattern.callback
+    actions = getattr(callback, "actions", None)
+    if actions is not None:
+        return "get" in actions
+    view_class = getattr(callback, "view_class", None) or getattr(callback, "cls", None)
+    if view_class is None:
+        return True
+    return hasattr(view_class, "get") and "get" in getattr(view_class, "http_method_names", ["get"])
+
+
+def iter_endpoints(patterns=None, namespace: str = "bible", prefix: str = "") -> list[Endpoint]:
+    """Every GET route under ``bible/urls.py`` as ``bible:<app>:<name>``, without format-suffix duplicates."""
+    if patterns is None:
+        from bible import urls
+
+        patterns = urls.urlpatterns
+    endpoints: dict[str, Endpoint] = {}
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            child_ns = f"{namespace}:{pattern.namespace}" if pattern.namespace else namespace
+            for endpoint in iter_endpoints(pattern.url_patterns, child_ns, prefix + str(pattern.pattern)):
+                endpoints.setdefault(endpoint.name, endpoint)
+            continue
+        if not pattern.name or "format" in pattern.pattern.regex.groupindex or not _answers_get(pattern):
+            continue
+        name = f"{namespace}:{pattern.name}"
+        kwargs = tuple(pattern.pattern.regex.groupindex)
+        endpoints.setdefault(name, Endpoint(name=name, route=prefix + str(pattern.pattern), kwargs=kwargs))
+    return sorted(endpoints.values(), key=lambda e: e.name)
+
+
+def build_url(endpoint: Endpoint, fixtures: dict[str, Any]) -> str:
+    params = PARAMS.get(endpoint.name, {})
+    templates = {**{k: DEFAULT_KWARGS.get(k, "") for k in endpoint.kwargs}, **params.get("kwargs", {})}
+    kwargs = {k: v.format(**fixtures) for k, v in templates.items()}
+    url = reverse(endpoint.name, kwargs=kwargs or None)
+    query = {k: v.format(**fixtures) for k, v in params.get("query", {}).items()}
+    return f"{url}?{urlencode(query)}" if query else url
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+BOOKS = ["Gen", "Exod", "Lev", "Num", "Deut", "Josh", "Judg", "Ruth", "1Sam", "2Sam", "1Kgs", "2Kgs"]
+BOOK_NAMES = [
+    "Genesis",
+    "Exodus",
+    "Leviticus",
+    "Numbers",
+    "Deuteronomy",
+    "Joshua",
+    "Judges",
+    "Ruth",
+    "1 Samuel",
+    "2 Samuel",
+    "1 Kings",
+    "2 Kings",
+]
+
+
+def seed_fixtures(n: int) -> dict[str, Any]:
+    """
+    Create ``n`` rows for every collection an endpoint can list.
+
+    The first book's chapter 1, the first theme, topic, entity, symbol, artist
+    and study each own ``n`` children, so detail endpoints grow with ``n`` as
+    well. Returns the identifiers ``PARAMS`` templates refer to.
+    """
+    from bible.commentaries.models import Author, CommentaryEntry, CommentarySource
+    from bible.entities.models import CanonicalEntity, EntityAlias, EntityRelationship, EntityVerseLink
+    from bible.images.models import Artist, BiblicalImage, ImageTag, ImageVerseLink
+    from bible.models import (
+        APIKey,
+        BookName,
+        CanonicalBook,
+        CrossReference,
+        Language,
+        Testament,
+        ThemeCooccurrence,
+        Topic,
+        TopicAspect,
+        TopicCrossReference,
+        TopicDefinition,
+        TopicName,
+        TopicRelation,
+        TopicThemeLink,
+        TopicVerse,
+        Verse,
+        VerseTheme,
+        Version,
+    )
+    from bible.models import Theme as LegacyTheme
+    from bible.people.models import Person
+    from bible.studies.models import Study, StudyBookmark
+    from bible.symbols.models import BiblicalSymbol, SymbolMeaning, SymbolOccurrence
+    from bible.themes.models import Theme, ThemeProgression, ThemeVerseLink
+    from bible.themes.services.theme_matrix import rebuild_theme_matrix
+
+    if n > len(BOOKS):
+        raise ValueError(f"n={n} exceeds the {len(BOOKS)} seeded book codes")
+
+    english = Language.objects.create(code="en", name="English")
+    old = Testament.objects.create(name="Old Testament", abbreviation="OT", order=1)
+    Testament.objects.create(name="New Testament", abbreviation="NT", order=2)
+    books = [
+        CanonicalBook.objects.create(osis_code=osis, canonical_order=i + 1, testament=old, chapter_count=2)
+        for i, osis in enumerate(BOOKS[:n])
+    ]
+    BookName.objects.bulk_create(
+        BookName(canonical_book=book, language=english, name=name, abbreviation=book.osis_code)
+        for book, name in zip(books, BOOK_NAMES[:n], strict=True)
+    )
+    versions = [
+        Version.objects.create(code=f"EN_AUDIT{i}", name=f"Audit Version {i}", language=english) for i in range(n)
+    ]
+    verses = Verse.objects.bulk_create(
+        Verse(book=book, version=version, chapter=chapter, number=number, text=f"And there was light {number}")
+        for version in versions
+        for book in books
+        for chapter in (1, 2)
+        for number in range(1, n + 1)
+    )
+    chapter_one = [v for v in verses if v.version_id == versions[0].id and v.book_id == books[0].id][:n]
+    # First verse of every book, so theme distributions span n books
+    openers = [v for v in verses if v.version_id == versions[0].id and v.chapter == 1 and v.number == 1]
+
+    legacy_themes = [LegacyTheme.objects.create(name=f"Theme {i}") for i in range(n)]
+    VerseTheme.objects.bulk_create(VerseTheme(verse=v, theme=legacy_themes[0]) for v in chapter_one + openers[1:])
+    rebuild_theme_matrix()  # bulk_create skips the refresh receivers, as in the importers
+    ThemeCooccurrence.objects.bulk_create(
+        ThemeCooccurrence(theme=legacy_themes[0], related_theme=t, shared_verse_count=1) for t in legacy_themes[1:]
+    )
+    themes = [
+        Theme.objects.create(slug=f"theme-{i}", name_en=f"Theme {i}", label_normalized=f"theme {i}") for i in range(n)
+    ]
+    stages = [
+        ThemeProgression.objects.create(
+            theme=themes[0], stage_order=i + 1, stage_name_en=f"Stage {i}", description_en="Stage"
+        )
+        for i in range(n)
+    ]
+    ThemeVerseLink.objects.bulk_create(
+        ThemeVerseLink(theme=themes[0], verse=v, progression_stage=stage)
+        for v, stage in zip(chapter_one, stages, strict=True)
+    )
+
+    crossrefs = CrossReference.objects.bulk_create(
+        CrossReference(
+            from_book=books[0],
+            from_chapter=1,
+            from_verse=1,
+            to_book=book,
+            to_chapter=2,
+            to_verse_start=1,
+            to_verse_end=2,
+            votes=10 + i,
+        )
+        for i, book in enumerate(books)
+    )
+
+    topics = [
+        Topic.objects.create(
+            slug=f"topic-{i}",
+            canonical_id=f"topic-{i}",
+            canonical_name=f"Topic {i}",
+            name_normalized=f"topic {i}",
+            topic_type="concept",
+            primary_source="NAV",
+        )
+        for i in range(n)
+    ]
+    topic = topics[0]
+    TopicName.objects.bulk_create(TopicName(topic=t, language=english, name=t.canonical_name) for t in topics)
+    TopicDefinition.objects.bulk_create(
+        TopicDefinition(topic=topic, source=f"D{i:02d}", text=f"Definition {i}") for i in range(n)
+    )
+    aspects = TopicAspect.objects.bulk_create(
+        TopicAspect(topic=topic, canonical_label=f"Aspect {i}", slug=f"aspect-{i}", order=i) for i in range(n)
+    )
+    TopicVerse.objects.bulk_create(
+        TopicVerse(topic=topic, verse=v, aspect=aspect) for v, aspect in zip(chapter_one, aspects, strict=True)
+    )
+    TopicThemeLink.objects.bulk_create(
+        TopicThemeLink(topic=topic, theme=t, label_original=t.name, label_en=t.name, label_normalized=t.name.lower())
+        for t in legacy_themes
+    )
+    TopicCrossReference.objects.bulk_create(TopicCrossReference(topic=topic, cross_reference=c) for c in crossrefs)
+    TopicRelation.objects.bulk_create(
+        TopicRelation(source=topic, target=t, relation_type="see_also") for t in topics[1:]
+    )
+
+    entities = [
+        CanonicalEntity.objects.create(canonical_id=f"PER:entity-{i}", namespace="PERSON", primary_name=f"Entity {i}")
+        for i in range(n)
+    ]
+    EntityAlias.objects.bulk_create(EntityAlias(entity=e, name=f"{e.primary_name} alias") for e in entities)
+    EntityVerseLink.objects.bulk_create(
+        EntityVerseLink(entity=e, verse=v) for e, v in zip(entities, chapter_one, strict=True)
+    )
+    EntityRelationship.objects.bulk_create(
+        EntityRelationship(source=entities[0], target=e, relationship_type="sibling_of") for e in entities[1:]
+    )
+
+    symbols = [
+        BiblicalSymbol.objects.create(canonical_id=f"SYM:symbol-{i}", namespace="OBJECT", primary_name=f"Symbol {i}")
+        for i in range(n)
+    ]
+    meanings = SymbolMeaning.objects.bulk_create(SymbolMeaning(symbol=s, meaning=f"Meaning of {s}") for s in symbols)
+    SymbolOccurrence.objects.bulk_create(
+        SymbolOccurrence(symbol=s, verse=v, meaning=m) for s, v, m in zip(symbols, chapter_one, meanings, strict=True)
+    )
+
+    authors = [Author.objects.create(name=f"Author {i}", author_type="church_father") for i in range(n)]
+    source = CommentarySource.objects.create(name="Audit Commentary", short_code="AUDIT", primary_author=authors[0])
+    entries = CommentaryEntry.objects.bulk_create(
+        CommentaryEntry(
+            source=source, author=a, book=books[0], chapter=1, verse_start=1, verse_end=1, body_text="Commentary"
+        )
+        for a in authors
+    )
+    people = Person.objects.bulk_create(
+        Person(canonical_name=f"Person {i}", slug=f"person-{i}", person_type="biblical") for i in range(n)
+    )
+
+    artist = Artist.objects.create(name="Audit Artist", slug="audit-artist")
+    images = BiblicalImage.objects.bulk_create(
+        BiblicalImage(key=f"image-{i}", title=f"Image {i}", artist=artist, image_url=f"https://example.com/{i}.jpg")
+        for i in range(n)
+    )
+    ImageTag.objects.bulk_create(ImageTag(image=image) for image in images)
+    ImageVerseLink.objects.bulk_create(
+        ImageVerseLink(image=image, book=books[0], chapter=1, verse_start=1, verse_end=1, relevance_type="primary")
+        for image in images
+    )
+
+    user = User.objects.create_user(username="query-audit")
+    api_key = APIKey.objects.create(name="Query audit", user=user, scopes=["read", "write", "admin", "ai-tools"])
+    studies = [
+        Study.objects.create(slug=f"study-{i}", title=f"Study {i}", author=user, visibility="public", is_published=True)
+        for i in range(n)
+    ]
+    StudyBookmark.objects.bulk_create(StudyBookmark(study=s, user=user) for s in studies)
+
+    return {
+        "n": n,
+        "api_key": api_key.key,
+        "book_id": books[0].id,
+        "book_osis": books[0].osis_code,
+        "book_name": BOOK_NAMES[0],
+        "last_book_osis": books[-1].osis_code,
+        "testament_id": old.id,
+        "version_code": versions[0].code,
+        "version_codes": ",".join(v.code for v in versions[:3]),
+        "verse_id": chapter_one[0].id,
+        "theme_id": themes[0].id,
+        "legacy_theme_id": legacy_themes[0].id,
+        "topic_slug": topic.slug,
+        "entity_id": entities[0].canonical_id,
+        "symbol_id": symbols[0].canonical_id,
+        "commentary_entry_id": entries[0].id,
+        "commentary_author_id": authors[0].id,
+        "commentary_source_id": source.id,
+        "person_slug": people[0].slug,
+        "artist_slug": artist.slug,
+        "image_id": images[0].id,
+        "study_slug": studies[0].slug,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Measuring
+# ---------------------------------------------------------------------------
+
+
+def _count_items(response) -> int | None:
+    data = getattr(response, "data", None)
+    if isinstance(data, list):
+        return len(data)
+    if isinstance(data, dict):
+        for key in ("results", "data", "items", "verses"):
+            if isinstance(data.get(key), list):
+                return len(data[key])
+    return None
+
+
+def measure(client: APIClient, url: str) -> Measurement:
+    cache.clear()
+    # Savepoint outside the probe: a view hitting a DB error must not poison the remaining requests
+    with transaction.atomic():
+        with probe_queries() as probe:
+            response = client.get(url)
+    return Measurement(
+        status=response.status_code,
+        queries=probe.queries,
+        db_ms=round(probe.seconds * 1000, 2),
+        items=_count_items(response),
+    )
+
+
+def audit_endpoints(n: int, endpoints: list[Endpoint] | None = None) -> dict[str, dict[str, Any]]:
+    """Seed fixtures at size ``n`` and measure every endpoint once, keyed by url name."""
+    fixtures = seed_fixtures(n)
+    client = APIClient(raise_request_exception=False)
+    client.credentials(HTTP_AUTHORIZATION=f"Api-Key {fixtures['api_key']}")
+    results = {}
+    for endpoint in endpoints if endpoints is not None else iter_endpoints():
+        if endpoint.name in SKIP:
+            continue
+        results[endpoint.name] = {"route": endpoint.route, **asdict(measure(client, build_url(endpoint, fixtures)))}
+    return results
+
+
+def find_scaling(small: dict[str, dict], large: dict[str, dict], slack: int = SCALING_SLACK) -> dict[str, dict]:
+    """Endpoints answering 200 at both sizes whose query count grows with the fixture size."""
+    scaling = {}
+    for name, s in small.items():
+        l = large.get(name)  # noqa: E741
+        if not l or s["status"] != 200 or l["status"] != 200:
+            continue
+        if l["queries"] > s["queries"] + slack:
+            scaling[name] = {"small": s["queries"], "large": l["queries"]}
+    return scaling
+
+
+def build_report(runs: dict[str, dict[str, dict]], sizes: dict[str, int]) -> dict[str, Any]:
+    """Merge per-size runs into ``{"sizes", "endpoints": {name: {"route", <size>: measurement}}, "scaling"}``."""
+    endpoints: dict[str, dict[str, Any]] = {}
+    for size, run in runs.items():
+        for name, result in sorted(run.items()):
+            measurement = dict(result)
+            route = measurement.pop("route")
+            endpoints.setdefault(name, {"route": route})[size] = measurement
+    return {
+        "sizes": dict(sizes),
+        "endpoints": dict(sorted(endpoints.items())),
+        "scaling": find_scaling(runs.get("small", {}), runs.get("large", {})),
+    }
+
+
+def diff_reports(old: dict[str, Any], new: dict[str, Any], size: str = "large") -> list[dict[str, Any]]:
+    """Endpoints whose query count at ``size`` changed between two reports, largest increase first."""
+    changes = []
+    for name in sorted(set(old["endpoints"]) | set(new["endpoints"])):
+        before = old["endpoints"].get(name, {}).get(size)
+        after = new["endpoints"].get(name, {}).get(size)
+        if before and after and before["queries"] == after["queries"]:
+            continue
+        changes.append(
+            {
+                "endpoint": name,
+                "before": before["queries"] if before else None,
+                "after": after["queries"] if after else None,
+                "db_ms_before": before["db_ms"] if before else None,
+                "db_ms_after": after["db_ms"] if after else None,
+            }
+        )
+    return sorted(changes, key=lambda c: (c["after"] or 0) - (c["before"] or 0), reverse=True)
+
+
+class _Rollback(Exception):
+    pass
+
+
+def run_audit(sizes: dict[str, int] | None = None, endpoints: list[Endpoint] | None = None) -> dict[str, Any]:
+    """Audit every endpoint at each size, each in its own rolled-back transaction, and build the report."""
+    runs = {}
+    for label, n in (sizes or SIZES).items():
+        try:
+            with transaction.atomic():
+                runs[label] = audit_endpoints(n, endpoints)
+                raise _Rollback
+        except _Rollback:
+            pass
+    return build_report(runs, sizes or SIZES)
@@ -25,3 +25,14 @@ class ReferenceNormalizeRequestSerializer(serializers.Serializer):
 
 class ReferenceNormalizeResponseSerializer(serializers.Serializer):
     normalized = serializers.ListField(child=serializers.DictField())
+
+
+class ReferenceExtractRequestSerializer(serializers.Serializer):
+    items = serializers.ListField(
+        child=serializers.CharField(allow_blank=True, trim_whitespace=False), allow_empty=False
+    )
+
+
+class ReferenceExtractResponseSerializer(serializers.Serializer):
+    results = serializers.ListField(child=serializers.DictField())
+    count = serializers.IntegerField()
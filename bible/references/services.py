@@ -5,9 +5,11 @@ from __future__ import annotations
 import re
 import unicodedata
 
+from django.conf import settings
 from django.core.cache import cache
 
 from bible.models import BookName, CanonicalBook, Language
+from common.warm_start import process_value, register
 
 _NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
 
@@ -80,7 +82,15 @@ def _build_alias_map(lang_code: str) -> dict[str, CanonicalBook]:
 
 
 def get_alias_map(lang_code: str) -> dict[str, CanonicalBook]:
-    """Get alias -> CanonicalBook map for language, cached in memory and Redis."""
+    """Get alias -> CanonicalBook map for language, cached in process memory and Redis."""
+    maps = process_value("ref_aliases")
+    mapping = maps.get(lang_code)
+    if mapping is None:
+        mapping = maps[lang_code] = _load_alias_map(lang_code)
+    return mapping
+
+
+def _load_alias_map(lang_code: str) -> dict[str, CanonicalBook]:
     cache_key = _cache_key(lang_code)
     data = cache.get(cache_key)
     if data is not None:
@@ -92,6 +102,14 @@ def get_alias_map(lang_code: str) -> dict[str, CanonicalBook]:
     return mapping
 
 
+def _prebuild_alias_maps() -> dict[str, dict[str, CanonicalBook]]:
+    return {lang: _load_alias_map(lang) for lang in settings.WARM_START_LANGUAGES}
+
+
+# Per-language maps fill on first use; warm starts preload WARM_START_LANGUAGES
+register("ref_aliases", dict, datasets=("books",), prebuild=_prebuild_alias_maps)
+
+
 def resolve_book_by_alias(book_raw: str, lang_code: str) -> CanonicalBook | None:
     """Resolve a raw book string to CanonicalBook using alias map for language."""
     aliases = get_alias_map(lang_code)
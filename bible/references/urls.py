@@ -2,7 +2,7 @@
 
 from django.urls import path
 
-from .views import ReferenceNormalizeView, ReferenceParseView, ReferenceResolveView
+from .views import ReferenceExtractView, ReferenceNormalizeView, ReferenceParseView, ReferenceResolveView
 
 app_name = "references"
 
@@ -10,4 +10,5 @@ urlpatterns = [
     path("parse/", ReferenceParseView.as_view(), name="references_parse"),
     path("resolve/", ReferenceResolveView.as_view(), name="references_resolve"),
     path("normalize/", ReferenceNormalizeView.as_view(), name="references_normalize"),
+    path("extract/", ReferenceExtractView.as_view(), name="references_extract"),
 ]
@@ -12,10 +12,13 @@ from rest_framework.views import APIView
 
 from bible.utils import get_book_display_name, get_canonical_book_by_name
 from bible.utils.i18n import mark_response_language_sensitive
+from bible.utils.ref_extractor import get_extractor
 from common.exceptions import ValidationError as APIValidationError
 from common.openapi import get_error_responses
 
 from .serializers import (
+    ReferenceExtractRequestSerializer,
+    ReferenceExtractResponseSerializer,
     ReferenceNormalizeRequestSerializer,
     ReferenceNormalizeResponseSerializer,
     ReferenceParseResponseSerializer,
@@ -24,6 +27,9 @@ from .serializers import (
 )
 from .services import resolve_book_by_alias
 
+MAX_EXTRACT_ITEMS = 100
+MAX_EXTRACT_CHARS = 1_000_000
+
 _SEGMENT_SPLIT_RE = re.compile(r"[;\uFF1B]+")  # semicolon, fullwidth semicolon
 _REF_RE = re.compile(
     r"^\s*(?P<book>[1-3]?\s?[A-Za-zÀ-ÿ\.]+)\s+"  # book (with optional leading ordinal)
@@ -205,3 +211,46 @@ class ReferenceNormalizeView(APIView):
                 )
 
         return Response({"normalized": normalized}, status=status.HTTP_200_OK)
+
+
+class ReferenceExtractView(APIView):
+    """Find every scripture reference inside free text (commentaries, notes, articles)."""
+
+    permission_classes = [IsAuthenticated]
+    throttle_scope = "search"
+
+    @extend_schema(
+        summary="Extract references from free text",
+        description=(
+            "Scans each item once and returns every reference found, normalized to OSIS with "
+            "chapter/verse ranges and character offsets. Verse lists (`John 3:16, 18`) and "
+            "same-book chapter lists (`Gen 1:1; 2:4`) yield one reference per part."
+        ),
+        request=ReferenceExtractRequestSerializer,
+        responses={200: ReferenceExtractResponseSerializer, **get_error_responses()},
+        tags=["references"],
+    )
+    def post(self, request):
+        payload = ReferenceExtractRequestSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+        items = payload.validated_data["items"]
+        if len(items) > MAX_EXTRACT_ITEMS:
+            return Response(
+                {"detail": f"Too many items (max {MAX_EXTRACT_ITEMS})", "code": "payload_too_large"},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+        if sum(len(s) for s in items) > MAX_EXTRACT_CHARS:
+            return Response(
+                {"detail": f"Text too long (max {MAX_EXTRACT_CHARS} characters)", "code": "payload_too_large"},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        found = get_extractor().extract_many(items)
+        results = [
+            {"index": i, "references": [ref.as_dict(text) for ref in refs]}
+            for i, (text, refs) in enumerate(zip(items, found, strict=True))
+        ]
+        return Response(
+            {"results": results, "count": sum(len(refs) for refs in found)},
+            status=status.HTTP_200_OK,
+        )
@@ -47,6 +47,8 @@ class StudyListSerializer(serializers.ModelSerializer):
         request = self.context.get("request")
         if not request or not request.user.is_authenticated:
             return False
+        if hasattr(obj, "is_bookmarked_by_user"):
+            return obj.is_bookmarked_by_user
         return StudyBookmark.objects.filter(
             study=obj, user=request.user
         ).exists()
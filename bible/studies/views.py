@@ -2,7 +2,7 @@
 
 import copy
 
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.utils.text import slugify
@@ -25,6 +25,15 @@ from .serializers import (
 )
 
 
+def with_bookmark_flag(queryset, user):
+    """Annotate ``is_bookmarked_by_user`` so list serializers don't check bookmarks per row."""
+    if not user.is_authenticated:
+        return queryset
+    return queryset.annotate(
+        is_bookmarked_by_user=Exists(StudyBookmark.objects.filter(study=OuterRef("pk"), user=user))
+    )
+
+
 class StudyListView(generics.ListAPIView):
     """List studies with filtering."""
 
@@ -80,7 +89,7 @@ class StudyListView(generics.ListAPIView):
         if tag:
             queryset = queryset.filter(tags__contains=[tag])
 
-        return queryset.order_by("-updated_at")
+        return with_bookmark_flag(queryset, self.request.user).order_by("-updated_at")
 
     @extend_schema(
         summary="List studies",
@@ -348,9 +357,8 @@ class StudyBookmarkedListView(generics.ListAPIView):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return Study.objects.filter(
-            bookmarks__user=self.request.user
-        ).select_related("author").order_by("-bookmarks__created_at")
+        queryset = Study.objects.filter(bookmarks__user=self.request.user).select_related("author")
+        return with_bookmark_flag(queryset, self.request.user).order_by("-bookmarks__created_at")
 
     @extend_schema(
         summary="List bookmarked studies",
@@ -370,11 +378,12 @@ class StudyFeaturedListView(generics.ListAPIView):
     permission_classes = [AllowAny]
 
     def get_queryset(self):
-        return Study.objects.filter(
+        queryset = Study.objects.filter(
             is_published=True,
             visibility="public",
             source_validation_id__gt="",
-        ).select_related("author").order_by("-view_count")
+        ).select_related("author")
+        return with_bookmark_flag(queryset, self.request.user).order_by("-view_count")
 
     @extend_schema(
         summary="List featured studies",
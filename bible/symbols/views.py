@@ -109,7 +109,7 @@ class BiblicalSymbolViewSet(viewsets.ReadOnlyModelViewSet):
         occurrences = (
             SymbolOccurrence.objects
             .filter(verse__book=canonical_book, verse__chapter=int(chapter))
-            .select_related("symbol")
+            .select_related("symbol", "verse")
         )
 
         symbol_verses = defaultdict(dict)
@@ -173,7 +173,7 @@ class BiblicalSymbolViewSet(viewsets.ReadOnlyModelViewSet):
         if namespace:
             qs = qs.filter(namespace=namespace)
 
-        qs = qs.order_by("-boost", "-priority")[:limit]
+        qs = qs.prefetch_related("meanings").order_by("-boost", "-priority")[:limit]
         serializer = SymbolListSerializer(qs, many=True)
         return Response(serializer.data)
 
@@ -1,3 +1,4 @@
 from .catalog_importer import CatalogImporter
+from .theme_matrix import load_theme_distribution, rebuild_theme_matrix
 
-__all__ = ["CatalogImporter"]
+__all__ = ["CatalogImporter", "load_theme_distribution", "rebuild_theme_matrix"]
@@ -0,0 +1,145 @@
+"""
+Precomputed theme co-occurrence matrix and chapter distribution.
+
+Both tables are derived from ``verse_themes`` with set-based SQL so a rebuild
+costs a handful of statements regardless of corpus size:
+
+- ``theme_cooccurrence``: sparse theme × theme matrix (only non-zero pairs,
+  stored in both directions so lookups are a single index scan).
+- ``theme_chapter_distribution``: verse count and first verse per
+  (theme, book, chapter); book totals are aggregated from it.
+
+Backfilled from existing links by migration 0023, rebuilt in full after
+``bible themes import`` (or on demand with ``python manage.py bible themes rebuild-matrix``) and per
+theme after single ``VerseTheme`` writes (or ``Verse.themes`` changes) commit. Reads never write.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+
+from django.db import connection, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from bible.models import ThemeChapterDistribution, VerseTheme
+
+logger = logging.getLogger(__name__)
+
+_COOCCURRENCE_SQL = """
+INSERT INTO theme_cooccurrence (theme_id, related_theme_id, shared_verse_count, updated_at)
+SELECT a.theme_id, b.theme_id, COUNT(*), NOW()
+FROM verse_themes a
+JOIN verse_themes b ON b.verse_id = a.verse_id AND b.theme_id <> a.theme_id
+{where}
+GROUP BY a.theme_id, b.theme_id
+"""
+
+_DISTRIBUTION_SQL = """
+INSERT INTO theme_chapter_distribution (theme_id, book_id, chapter, verse_count, first_verse, updated_at)
+SELECT vt.theme_id, v.book_id, v.chapter, COUNT(*), MIN(v.number), NOW()
+FROM verse_themes vt
+JOIN verses v ON v.id = vt.verse_id
+{where}
+GROUP BY vt.theme_id, v.book_id, v.chapter
+"""
+
+
+@dataclass
+class ThemeMatrixResult:
+    themes: int = 0
+    cooccurrence_rows: int = 0
+    distribution_rows: int = 0
+    duration_seconds: float = 0.0
+
+
+def rebuild_theme_matrix(theme_ids: list[int] | None = None) -> ThemeMatrixResult:
+    """
+    Rebuild co-occurrence and distribution rows.
+
+    Args:
+        theme_ids: Restrict the rebuild to these themes. Co-occurrence pairs
+            touching them are refreshed in both directions so the matrix stays
+            symmetric. ``None`` rebuilds everything.
+    """
+    start = time.time()
+    result = ThemeMatrixResult()
+    params: list = []
+
+    if theme_ids is not None:
+        theme_ids = list(theme_ids)
+        if not theme_ids:
+            return result
+        params = [theme_ids]
+
+    with transaction.atomic(), connection.cursor() as cur:
+        # One rebuild at a time: concurrent DELETE + INSERT of the same pairs would collide on
+        # uniq_theme_cooccurrence_pair
+        cur.execute("SELECT pg_advisory_xact_lock(hashtext('theme_matrix'))")
+        if theme_ids is None:
+            cur.execute("DELETE FROM theme_cooccurrence")
+            cur.execute("DELETE FROM theme_chapter_distribution")
+        else:
+            cur.execute(
+                "DELETE FROM theme_cooccurrence WHERE theme_id = ANY(%s) OR related_theme_id = ANY(%s)",
+                params * 2,
+            )
+            cur.execute("DELETE FROM theme_chapter_distribution WHERE theme_id = ANY(%s)", params)
+
+        cur.execute(
+            _COOCCURRENCE_SQL.format(where="WHERE a.theme_id = ANY(%s) OR b.theme_id = ANY(%s)" if params else ""),
+            params * 2,
+        )
+        result.cooccurrence_rows = cur.rowcount
+        cur.execute(_DISTRIBUTION_SQL.format(where="WHERE vt.theme_id = ANY(%s)" if params else ""), params)
+        result.distribution_rows = cur.rowcount
+
+    result.themes = len(theme_ids) if theme_ids is not None else VerseTheme.objects.values("theme").distinct().count()
+    result.duration_seconds = time.time() - start
+    logger.info(
+        "Theme matrix rebuilt: %d themes, %d co-occurrence rows, %d distribution rows in %.2fs",
+        result.themes,
+        result.cooccurrence_rows,
+        result.distribution_rows,
+        result.duration_seconds,
+    )
+    return result
+
+
+def load_theme_distribution(theme_id: int) -> list[ThemeChapterDistribution]:
+    """Return a theme's chapter distribution in canonical order (one query)."""
+    return list(
+        ThemeChapterDistribution.objects.filter(theme_id=theme_id)
+        .select_related("book", "book__testament")
+        .order_by("book__canonical_order", "chapter")
+    )
+
+
+@receiver(post_save, sender=VerseTheme, dispatch_uid="theme_matrix_refresh_save")
+@receiver(post_delete, sender=VerseTheme, dispatch_uid="theme_matrix_refresh_delete")
+def refresh_theme_matrix(sender, instance, **kwargs) -> None:
+    """Refresh the linked theme's rows once the write commits."""
+    theme_id = instance.theme_id
+    transaction.on_commit(lambda: rebuild_theme_matrix([theme_id]))
+
+
+@receiver(m2m_changed, sender=VerseTheme, dispatch_uid="theme_matrix_refresh_m2m")
+def refresh_theme_matrix_m2m(sender, instance, action, reverse, pk_set, **kwargs) -> None:
+    """Same for ``verse.themes`` / ``theme.verses`` add, remove and clear, which skip the row signals."""
+    if action == "pre_clear" and not reverse:
+        # post_clear carries no pk_set; remember which themes the verse is leaving
+        instance._theme_matrix_cleared = list(
+            VerseTheme.objects.filter(verse=instance).values_list("theme_id", flat=True)
+        )
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if reverse:
+        theme_ids = [instance.pk]
+    elif action == "post_clear":
+        theme_ids = instance.__dict__.pop("_theme_matrix_cleared", [])
+    else:
+        theme_ids = sorted(pk_set or ())
+    if theme_ids:
+        transaction.on_commit(lambda: rebuild_theme_matrix(theme_ids))
@@ -9,9 +9,8 @@ from rest_framework.views import APIView
 
 from common.openapi import LANG_PARAMETER, get_error_responses
 
-from ..models import CanonicalBook
+from ..models import BookName, CanonicalBook, ThemeCooccurrence, Verse, VerseTheme
 from ..models import Theme as LegacyTheme
-from ..models import VerseTheme
 from .models import Theme
 from .serializers import (
     ConceptMapSerializer,
@@ -24,6 +23,7 @@ from .serializers import (
     ThemeSerializer,
     ThemeStatisticsSerializer,
 )
+from .services import load_theme_distribution
 
 DETAIL_PARAM = OpenApiParameter(
     name="detail",
@@ -146,31 +146,36 @@ class ThemeStatisticsView(APIView):
         version_count = verse_links.values("verse__version").distinct().count()
 
         # Get top books with most verses for this theme
-        top_books_data = (
-            verse_links.values("verse__book__osis_code", "verse__book__canonical_order")
+        top_books_data = list(
+            verse_links.values("verse__book_id", "verse__book__osis_code", "verse__book__canonical_order")
             .annotate(verse_count=Count("verse"))
             .order_by("-verse_count")[:10]
         )
 
-        top_books = []
-        for book_data in top_books_data:
-            book = CanonicalBook.objects.get(osis_code=book_data["verse__book__osis_code"])
-            lang_code = request.lang_code if hasattr(request, "lang_code") else "en"
-            book_name = book.names.filter(language__code=lang_code, version__isnull=True).first()
-            top_books.append(
-                {
-                    "osis_code": book_data["verse__book__osis_code"],
-                    "name": book_name.name if book_name else book_data["verse__book__osis_code"],
-                    "canonical_order": book_data["verse__book__canonical_order"],
-                    "verse_count": book_data["verse_count"],
-                }
-            )
+        lang_code = request.lang_code if hasattr(request, "lang_code") else "en"
+        book_names = dict(
+            BookName.objects.filter(
+                canonical_book_id__in={row["verse__book_id"] for row in top_books_data},
+                language__code=lang_code,
+                version__isnull=True,
+            ).values_list("canonical_book_id", "name")
+        )
+
+        top_books = [
+            {
+                "osis_code": book_data["verse__book__osis_code"],
+                "name": book_names.get(book_data["verse__book_id"], book_data["verse__book__osis_code"]),
+                "canonical_order": book_data["verse__book__canonical_order"],
+                "verse_count": book_data["verse_count"],
+            }
+            for book_data in top_books_data
+        ]
 
         # Testament distribution
-        testament_distribution = {}
-        for link in verse_links:
-            testament_name = link.verse.book.testament.name
-            testament_distribution[testament_name] = testament_distribution.get(testament_name, 0) + 1
+        testament_distribution = {
+            row["verse__book__testament__name"]: row["count"]
+            for row in verse_links.values("verse__book__testament__name").annotate(count=Count("id")).order_by()
+        }
 
         statistics_data = {
             "theme_id": theme.id,
@@ -329,62 +334,49 @@ class ThemeProgressionView(APIView):
 
         theme = get_object_or_404(LegacyTheme, id=theme_id)
 
-        # Get verse-theme associations ordered by canonical book order
-        verse_themes = (
-            VerseTheme.objects.filter(theme=theme)
-            .select_related("verse__book", "verse__book__testament")
-            .order_by("verse__book__canonical_order")
-        )
+        # Precomputed (theme, book, chapter) rows already in canonical order
+        distribution = load_theme_distribution(theme.id)
 
-        if not verse_themes.exists():
+        if not distribution:
             return Response({"detail": f'No verses found for theme "{theme.name}".'}, status=404)
 
+        lang_code = request.lang_code if hasattr(request, "lang_code") else "en"
+        book_names = dict(
+            BookName.objects.filter(
+                canonical_book_id__in={row.book_id for row in distribution},
+                language__code=lang_code,
+                version__isnull=True,
+            ).values_list("canonical_book_id", "name")
+        )
+
         # Group by book for progression analysis
         book_progression = {}
         testament_summary = {"OLD": {"book_count": 0, "verse_count": 0}, "NEW": {"book_count": 0, "verse_count": 0}}
 
-        for vt in verse_themes:
-            book = vt.verse.book
+        for row in distribution:
+            book = row.book
             testament_name = book.testament.name
+            summary = testament_summary.setdefault(testament_name, {"book_count": 0, "verse_count": 0})
 
             if book.osis_code not in book_progression:
-                lang_code = request.lang_code if hasattr(request, "lang_code") else "en"
-                book_name = book.names.filter(language__code=lang_code, version__isnull=True).first()
                 book_progression[book.osis_code] = {
                     "osis_code": book.osis_code,
-                    "name": book_name.name if book_name else book.osis_code,
+                    "name": book_names.get(book.id, book.osis_code),
                     "canonical_order": book.canonical_order,
                     "testament": testament_name,
                     "verse_count": 0,
-                    "chapters": set(),
-                    "first_occurrence": {"chapter": vt.verse.chapter, "verse": vt.verse.number},
-                    "verses": [],
+                    "chapter_distribution": {},
+                    "first_occurrence": {"chapter": row.chapter, "verse": row.first_verse},
                 }
-                testament_summary[testament_name]["book_count"] += 1
+                summary["book_count"] += 1
 
-            book_progression[book.osis_code]["verse_count"] += 1
-            book_progression[book.osis_code]["chapters"].add(vt.verse.chapter)
-            book_progression[book.osis_code]["verses"].append(
-                {
-                    "chapter": vt.verse.chapter,
-                    "verse": vt.verse.number,
-                    "text_preview": vt.verse.text[:100] + "..." if len(vt.verse.text) > 100 else vt.verse.text,
-                }
-            )
-            testament_summary[testament_name]["verse_count"] += 1
+            book_progression[book.osis_code]["verse_count"] += row.verse_count
+            book_progression[book.osis_code]["chapter_distribution"][row.chapter] = row.verse_count
+            summary["verse_count"] += row.verse_count
 
-        # Convert to list and sort by canonical order
         progression_data = []
-        for book_data in sorted(book_progression.values(), key=lambda x: x["canonical_order"]):
-            # Calculate chapter distribution
-            chapters = sorted(book_data["chapters"])
-            chapter_distribution = {}
-            for verse in book_data["verses"]:
-                chapter = verse["chapter"]
-                if chapter not in chapter_distribution:
-                    chapter_distribution[chapter] = 0
-                chapter_distribution[chapter] += 1
-
+        for book_data in book_progression.values():
+            chapters = sorted(book_data["chapter_distribution"])
             progression_data.append(
                 {
                     "osis_code": book_data["osis_code"],
@@ -395,7 +387,7 @@ class ThemeProgressionView(APIView):
                     "chapter_count": len(chapters),
                     "chapters": chapters,
                     "first_occurrence": book_data["first_occurrence"],
-                    "chapter_distribution": chapter_distribution,
+                    "chapter_distribution": book_data["chapter_distribution"],
                     "intensity": book_data["verse_count"],  # Could be normalized later
                 }
             )
@@ -459,59 +451,34 @@ class ConceptMapView(APIView):
         if not main_theme:
             return Response({"detail": f'No theme found matching concept "{concept}".'}, status=404)
 
-        # Get all verses associated with the main theme
-        main_theme_verses = set(VerseTheme.objects.filter(theme=main_theme).values_list("verse_id", flat=True))
+        # Main theme size from the precomputed distribution
+        total_main_theme_verses = sum(row.verse_count for row in load_theme_distribution(main_theme.id))
 
-        if not main_theme_verses:
+        if not total_main_theme_verses:
             return Response({"detail": f'No verses found for theme "{main_theme.name}".'}, status=404)
 
-        # Find co-occurring themes (themes that appear in the same verses)
-        co_occurring_themes = {}
-
-        # Get all theme-verse associations for verses that contain the main theme
-        related_verse_themes = (
-            VerseTheme.objects.filter(verse_id__in=main_theme_verses)
-            .exclude(theme=main_theme)
-            .select_related("theme", "verse")
+        # Co-occurring themes (themes sharing verses) from the sparse matrix
+        cooccurrences = (
+            ThemeCooccurrence.objects.filter(theme=main_theme)
+            .select_related("related_theme")
+            .order_by("-shared_verse_count", "related_theme__name")
         )
 
-        for vt in related_verse_themes:
-            theme_name = vt.theme.name
-            if theme_name not in co_occurring_themes:
-                co_occurring_themes[theme_name] = {
-                    "theme_id": vt.theme.id,
-                    "theme_name": theme_name,
-                    "co_occurrence_count": 0,
-                    "shared_verses": set(),
-                    "strength": 0.0,
-                }
-
-            co_occurring_themes[theme_name]["co_occurrence_count"] += 1
-            co_occurring_themes[theme_name]["shared_verses"].add(vt.verse_id)
-
-        # Calculate relationship strength and format co-occurrence data
-        total_main_theme_verses = len(main_theme_verses)
         co_occurrence_data = []
-
-        for _theme_name, data in co_occurring_themes.items():
+        for row in cooccurrences:
             # Strength based on percentage of shared verses
-            strength = len(data["shared_verses"]) / total_main_theme_verses
-            data["strength"] = round(strength, 3)
-
+            strength = round(row.shared_verse_count / total_main_theme_verses, 3)
             co_occurrence_data.append(
                 {
-                    "theme_id": data["theme_id"],
-                    "theme_name": data["theme_name"],
-                    "co_occurrence_count": data["co_occurrence_count"],
-                    "shared_verse_count": len(data["shared_verses"]),
-                    "strength": data["strength"],
-                    "relationship_type": self._categorize_relationship(data["strength"]),
+                    "theme_id": row.related_theme_id,
+                    "theme_name": row.related_theme.name,
+                    "co_occurrence_count": row.shared_verse_count,
+                    "shared_verse_count": row.shared_verse_count,
+                    "strength": strength,
+                    "relationship_type": self._categorize_relationship(strength),
                 }
             )
 
-        # Sort by strength (strongest relationships first)
-        co_occurrence_data.sort(key=lambda x: x["strength"], reverse=True)
-
         # Get top related themes (limit to avoid overwhelming response)
         related_themes = co_occurrence_data[:15]
 
@@ -531,27 +498,23 @@ class ConceptMapView(APIView):
             "main_theme_verse_count": total_main_theme_verses,
         }
 
-        # Get example verses showing concept relationships
+        # Example verses containing both the main theme and the strongest related theme
         verse_examples = []
         if related_themes:
-            # Get verses that contain the main theme and the strongest related theme
-            strongest_related_theme_id = related_themes[0]["theme_id"]
-            example_verse_ids = list(
-                VerseTheme.objects.filter(
-                    verse_id__in=main_theme_verses, theme_id=strongest_related_theme_id
-                ).values_list("verse_id", flat=True)[:3]
+            example_verses = (
+                Verse.objects.filter(theme_links__theme=main_theme)
+                .filter(theme_links__theme_id=related_themes[0]["theme_id"])
+                .select_related("book", "version")
+                .prefetch_related("themes", "book__names")[:3]
             )
 
-            for verse_id in example_verse_ids:
-                verse = VerseTheme.objects.filter(verse_id=verse_id).first().verse
-                related_theme_names = [vt.theme.name for vt in VerseTheme.objects.filter(verse_id=verse_id)]
-
+            for verse in example_verses:
                 verse_examples.append(
                     {
-                        "verse_id": verse_id,
+                        "verse_id": verse.id,
                         "reference": verse.reference,
                         "text_preview": verse.text[:150] + "..." if len(verse.text) > 150 else verse.text,
-                        "related_themes": related_theme_names,
+                        "related_themes": [t.name for t in verse.themes.all()],
                     }
                 )
 
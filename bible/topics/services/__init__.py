@@ -2,10 +2,13 @@
 
 from .import_service import ImportStats, TopicImportService
 from .importer import ImportResult, TopicImporter
+from .study_cache import get_study, prebuild_studies
 
 __all__ = [
     "TopicImportService",
     "ImportStats",
     "TopicImporter",
     "ImportResult",
+    "get_study",
+    "prebuild_studies",
 ]
@@ -17,7 +17,7 @@ from typing import Any
 from django.db import transaction
 from django.utils.text import slugify
 
-from bible.models import Language, Theme, Verse
+from bible.models import Language, Theme
 from bible.models.topics import (
     Topic,
     TopicAspect,
@@ -81,7 +81,6 @@ class TopicImportService:
         # Cache for lookups
         self._language_cache: dict[str, Language] = {}
         self._theme_cache: dict[str, Theme] = {}
-        self._verse_cache: dict[str, Verse] = {}
 
     def get_language(self, code: str) -> Language | None:
         """Get or cache a language by code."""
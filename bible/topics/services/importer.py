@@ -18,13 +18,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from django.db import DatabaseError, IntegrityError, transaction
+from django.db import transaction
 from django.utils import timezone
 from django.utils.text import slugify
 
 from bible.models import (
     CanonicalBook,
-    CrossReference,
     Language,
     Theme,
     Topic,
@@ -37,7 +36,6 @@ from bible.models import (
     TopicRelation,
     TopicThemeLink,
     TopicVerse,
-    Verse,
 )
 from bible.entities.models import (
     CanonicalEntity,
@@ -45,6 +43,8 @@ from bible.entities.models import (
     EntityRelationship,
     RelationshipType,
 )
+from bible.utils.ref_parser import parse_ref
+from bible.utils.verse_index import VerseIndex
 
 logger = logging.getLogger(__name__)
 
@@ -120,10 +120,16 @@ class TopicImporter:
 
     def __init__(self, dataset_path: Path | None = None):
         self.dataset_path = dataset_path or self.DATASET_PATH
-        self._book_cache: dict[str, CanonicalBook] = {}
         self._language_cache: dict[str, Language] = {}
         self._theme_cache: dict[str, Theme] = {}
-        self._verse_cache: dict[str, Verse] = {}
+        self._verse_index: VerseIndex | None = None
+
+    @property
+    def verse_index(self) -> VerseIndex:
+        """Book / verse / cross-reference coordinates, loaded once per importer."""
+        if self._verse_index is None:
+            self._verse_index = VerseIndex()
+        return self._verse_index
 
     def import_all(self, update_existing: bool = False, limit: int | None = None) -> ImportResult:
         """Import all topics from dataset."""
@@ -483,7 +489,7 @@ class TopicImporter:
     def _import_verses(self, topic: Topic, data: dict) -> int:
         """Import topic-verse links."""
         biblical_refs = data.get("biblical_references", [])
-        count = 0
+        links: dict[int, TopicVerse] = {}
 
         # Clear existing links for clean import
         topic.verse_links.all().delete()
@@ -504,17 +510,13 @@ class TopicImporter:
             if not book:
                 continue
 
-            for verse_num in verses:
-                verse = self._get_verse(book, chapter, verse_num)
-                if verse:
-                    TopicVerse.objects.get_or_create(
-                        topic=topic,
-                        verse=verse,
-                        defaults={"relevance_score": 1.0},
-                    )
-                    count += 1
+            verse_ids = self.verse_index.resolve_many([(osis_code, chapter, verse_num) for verse_num in verses])
+            for verse_id in verse_ids.tolist():
+                if verse_id:
+                    links.setdefault(verse_id, TopicVerse(topic=topic, verse_id=verse_id, relevance_score=1.0))
 
-        return count
+        TopicVerse.objects.bulk_create(links.values(), batch_size=1000, ignore_conflicts=True)
+        return len(links)
 
     def _import_themes(self, topic: Topic, data: dict) -> int:
         """Import AI-extracted theme links."""
@@ -563,7 +565,7 @@ class TopicImporter:
     def _import_crossrefs(self, topic: Topic, data: dict) -> int:
         """Import cross-reference links."""
         crossref_network = data.get("cross_reference_network", {})
-        count = 0
+        links: dict[int, TopicCrossReference] = {}
 
         if not crossref_network:
             return 0
@@ -583,16 +585,18 @@ class TopicImporter:
                     continue
 
                 # Try to find matching CrossReference in DB
-                crossref = self._find_crossref(from_ref, to_verse)
-                if crossref:
-                    TopicCrossReference.objects.get_or_create(
-                        topic=topic,
-                        cross_reference=crossref,
-                        defaults={"relevance_score": min(score / 10.0, 1.0)},
+                crossref_id = self._find_crossref(from_ref, to_verse)
+                if crossref_id:
+                    # First mention wins, as with the former get_or_create
+                    links.setdefault(
+                        crossref_id,
+                        TopicCrossReference(
+                            topic=topic, cross_reference_id=crossref_id, relevance_score=min(score / 10.0, 1.0)
+                        ),
                     )
-                    count += 1
 
-        return count
+        TopicCrossReference.objects.bulk_create(links.values(), batch_size=1000, ignore_conflicts=True)
+        return len(links)
 
     def _import_pipeline_metadata(self, topic: Topic, data: dict):
         """Import pipeline processing metadata."""
@@ -630,28 +634,12 @@ class TopicImporter:
         return self._language_cache.get(code)
 
     def _get_book(self, osis_code: str) -> CanonicalBook | None:
-        """Get book from cache or DB."""
-        if osis_code not in self._book_cache:
-            try:
-                self._book_cache[osis_code] = CanonicalBook.objects.get(osis_code=osis_code)
-            except CanonicalBook.DoesNotExist:
-                return None
-        return self._book_cache.get(osis_code)
+        """Get book from the verse index."""
+        return self.verse_index.book(osis_code)
 
-    def _get_verse(self, book: CanonicalBook, chapter: int, verse: int) -> Verse | None:
-        """Get verse from cache or DB."""
-        cache_key = f"{book.osis_code}.{chapter}.{verse}"
-        if cache_key not in self._verse_cache:
-            try:
-                # Get any verse for this reference (any version)
-                self._verse_cache[cache_key] = Verse.objects.filter(
-                    book__osis_code=book.osis_code,
-                    chapter=chapter,
-                    verse=verse,
-                ).first()
-            except (DatabaseError, IntegrityError, ValueError):
-                return None
-        return self._verse_cache.get(cache_key)
+    def _get_verse(self, book: CanonicalBook, chapter: int, verse: int) -> int | None:
+        """Get the id of any verse (any version) for this reference from the verse index."""
+        return self.verse_index.resolve(book.osis_code, chapter, verse)
 
     def _get_or_create_theme(self, label: str) -> Theme | None:
         """Get or create a theme."""
@@ -666,18 +654,14 @@ class TopicImporter:
             self._theme_cache[normalized] = theme
         return self._theme_cache.get(normalized)
 
-    def _find_crossref(self, from_ref: str, to_ref: str) -> CrossReference | None:
-        """Find a CrossReference matching the refs."""
-        # Parse from_ref (e.g., "Genesis 12:1")
+    def _find_crossref(self, from_ref: str, to_ref: str) -> int | None:
+        """Find the id of the CrossReference matching the refs."""
+        # Parse from_ref (e.g., "Genesis 12:1", "1 John 4:8")
         try:
-            from_parts = from_ref.replace(":", " ").split()
-            if len(from_parts) < 3:
+            from_osis, from_chapter, from_verse, _ = parse_ref(from_ref)
+            if not from_osis or not from_verse:
                 return None
 
-            from_book_name = from_parts[0]
-            from_chapter = int(from_parts[1])
-            from_verse = int(from_parts[2])
-
             # Parse to_ref (e.g., "GEN.12.1")
             to_parts = to_ref.split(".")
             if len(to_parts) < 3:
@@ -692,13 +676,7 @@ class TopicImporter:
                 return None
 
             # Find matching CrossReference
-            return CrossReference.objects.filter(
-                from_chapter=from_chapter,
-                from_verse=from_verse,
-                to_chapter=to_chapter,
-                to_verse_start=to_verse,
-                to_book__osis_code=to_osis,
-            ).first()
+            return self.verse_index.crossref_id((from_osis, from_chapter, from_verse), (to_osis, to_chapter, to_verse))
 
         except (ValueError, IndexError):
             return None
@@ -1004,9 +982,9 @@ class TopicImporter:
             if not book:
                 return
             
-            verse = self._get_verse(book, chapter, verse_num)
-            if verse:
-                aspect.verses.add(verse)
+            verse_id = self._get_verse(book, chapter, verse_num)
+            if verse_id:
+                aspect.verses.add(verse_id)
                 
         except (ValueError, IndexError):
             pass
@@ -1104,9 +1082,9 @@ class TopicImporter:
             if not book:
                 return
             
-            verse = self._get_verse(book, chapter, verse_num)
-            if verse:
-                aspect.verses.add(verse)
+            verse_id = self._get_verse(book, chapter, verse_num)
+            if verse_id:
+                aspect.verses.add(verse_id)
                 
         except (ValueError, IndexError):
             pass
@@ -0,0 +1,112 @@
+"""
+Memoized topic study payloads.
+
+A composed study depends on topic data plus cross references, themes, book
+names, commentaries, entities and symbols. Documents are cached per (topic,
+language) under a key stamped with the ``common.content_cache`` generations of
+exactly those datasets. Any import or edit touching one of them retires every
+dependent document without a scan or delete; ``prebuild_studies`` composes them
+again ahead of traffic.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+from bible.models import Topic
+from common.content_cache import get_generations
+
+from .study_composer import StudyComposer
+
+logger = logging.getLogger(__name__)
+
+STUDY_DATASETS = ("topics", "crossrefs", "themes", "books", "commentaries", "entities", "symbols")
+STUDY_CACHE_KEY = "topic-study:{slug}:{lang}:{stamp}"
+PREBUILD_BATCH_SIZE = 100
+
+
+def study_cache_timeout() -> int:
+    return getattr(settings, "TOPIC_STUDY_CACHE_TIMEOUT", 7 * 86400)
+
+
+def _stamp(generations: dict[str, int]) -> str:
+    raw = ".".join(str(generations[dataset]) for dataset in STUDY_DATASETS)
+    return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+
+def study_cache_key(slug: str, lang_code: str, generations: dict[str, int] | None = None) -> str:
+    """Cache key of a study at the current (or given) dataset generations."""
+    generations = generations or get_generations(STUDY_DATASETS)
+    return STUDY_CACHE_KEY.format(slug=slug, lang=lang_code.lower(), stamp=_stamp(generations))
+
+
+def _topics():
+    return Topic.objects.prefetch_related("names__language")
+
+
+def get_study(slug: str, lang_code: str) -> dict[str, Any] | None:
+    """Study payload of ``slug`` in ``lang_code``, composed on a miss; ``None`` if the topic doesn't exist."""
+    key = study_cache_key(slug, lang_code)
+    payload = cache.get(key)
+    if payload is not None:
+        return payload
+
+    topic = _topics().filter(slug=slug).first()
+    if topic is None:
+        return None
+    payload = StudyComposer(topic, lang_code=lang_code).compose()
+    cache.set(key, payload, timeout=study_cache_timeout())
+    return payload
+
+
+def prebuild_studies(lang_codes: list[str], slugs: list[str] | None = None, *, force: bool = False) -> dict[str, Any]:
+    """Compose and cache studies of every topic (or ``slugs``) in each language.
+
+    Documents already cached at the current generations are skipped unless ``force``.
+    """
+    generations = get_generations(STUDY_DATASETS)
+    topics = _topics().order_by("slug")
+    if slugs:
+        topics = topics.filter(slug__in=slugs)
+
+    stats: dict[str, Any] = {"topics": 0, "built": 0, "cached": 0, "failed": 0}
+    started = time.perf_counter()
+    batch: list[Topic] = []
+
+    def flush():
+        keys = {
+            (topic.slug, lang): study_cache_key(topic.slug, lang, generations) for topic in batch for lang in lang_codes
+        }
+        present = set() if force else set(cache.get_many(list(keys.values())))
+        built = {}
+        for topic in batch:
+            for lang in lang_codes:
+                key = keys[(topic.slug, lang)]
+                if key in present:
+                    stats["cached"] += 1
+                    continue
+                try:
+                    built[key] = StudyComposer(topic, lang_code=lang).compose()
+                except Exception:
+                    logger.exception("Failed to compose study for %s (%s)", topic.slug, lang)
+                    stats["failed"] += 1
+        cache.set_many(built, timeout=study_cache_timeout())
+        stats["built"] += len(built)
+        batch.clear()
+
+    for topic in topics.iterator(chunk_size=PREBUILD_BATCH_SIZE):
+        stats["topics"] += 1
+        batch.append(topic)
+        if len(batch) >= PREBUILD_BATCH_SIZE:
+            flush()
+    if batch:
+        flush()
+
+    stats["seconds"] = round(time.perf_counter() - started, 2)
+    return stats
@@ -8,28 +8,86 @@ Takes a Topic slug and assembles:
 - Commentary voices from patristic and historical authors
 - Related themes with progression data
 - Entities and symbols mentioned in the topic's verses
+
+Builders run in two stages. The first loads everything that only needs the
+topic (metadata, theme links, cross references, aspects, related topics); the
+second loads what hangs off the cross references (book names, commentaries,
+entities, symbols). Within a stage the queries are independent and run on a
+shared thread pool of ``STUDY_COMPOSER_WORKERS`` threads, each with its own
+database connection and a copy of the caller's context variables (request id,
+statement timeout, replica routing). Inside a transaction they run inline instead, since other
+connections could not see its uncommitted rows.
 """
 
 from __future__ import annotations
 
+import contextvars
 import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from django.db.models import Prefetch, Q
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.db.models import Exists, OuterRef, Prefetch, Q
 
-from bible.commentaries import Author, CommentaryEntry
-from bible.entities.models import CanonicalEntity, VerseMention as EntityVerseMention
+from bible.commentaries import CommentaryEntry
+from bible.entities.models import CanonicalEntity, EntityVerseLink
 from bible.models import (
+    BookName,
     Topic,
     TopicAspect,
+    TopicContent,
     TopicCrossReference,
-    TopicDefinition,
-    TopicThemeLink,
+    TopicName,
 )
 from bible.symbols.models import BiblicalSymbol, SymbolOccurrence
+from bible.utils import get_book_display_name
 
 logger = logging.getLogger(__name__)
 
+# Cross references shown in "connections"; the first ones also seed commentary and entity lookups
+MAX_CONNECTIONS = 100
+COMMENTARY_XREFS = 30
+BOOK_XREFS = 50
+
+_OLD_TESTAMENT_NAMES = {"old testament", "antigo testamento", "ot", "at"}
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def composer_workers() -> int:
+    return getattr(settings, "STUDY_COMPOSER_WORKERS", 4)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=composer_workers(), thread_name_prefix="study-composer")
+    return _executor
+
+
+def _in_worker(fn: Callable[[], Any]) -> Any:
+    try:
+        return fn()
+    finally:
+        # Same connection housekeeping as the end of a request (honours CONN_MAX_AGE)
+        close_old_connections()
+
+
+def run_concurrently(tasks: dict[str, Callable[[], Any]]) -> dict[str, Any]:
+    """Run independent ``tasks`` on the composer pool and return their results by name."""
+    if len(tasks) < 2 or composer_workers() < 2 or connection.in_atomic_block:
+        return {name: fn() for name, fn in tasks.items()}
+    executor = _get_executor()
+    # One context copy per task: a Context can only be entered by one thread at a time
+    futures = {name: executor.submit(contextvars.copy_context().run, _in_worker, fn) for name, fn in tasks.items()}
+    return {name: future.result() for name, future in futures.items()}
+
 
 class StudyComposer:
     """Composes a unified study payload for a given topic."""
@@ -40,27 +98,86 @@ class StudyComposer:
 
     def compose(self) -> dict[str, Any]:
         """Build the full study payload."""
+        loaded = run_concurrently(
+            {
+                "meta": self._build_meta,
+                "theme_links": self._load_theme_links,
+                "xrefs": self._load_cross_references,
+                "aspects": self._build_aspects,
+                "related_topics": self._build_related,
+            }
+        )
+        xrefs = loaded["xrefs"]
+        books = self._topic_books(xrefs)
+        book_ids = sorted(self._topic_books(xrefs[:BOOK_XREFS]))
+        linked = run_concurrently(
+            {
+                "book_names": lambda: self._load_book_names(books),
+                "commentaries": lambda: self._load_commentaries(xrefs[:COMMENTARY_XREFS]),
+                "entities": lambda: self._build_entities(book_ids),
+                "symbols": lambda: self._build_symbols(book_ids),
+            }
+        )
+        book_names = linked["book_names"]
         return {
-            "meta": self._build_meta(),
-            "gold_references": self._build_gold_references(),
-            "connections": self._build_connections(),
-            "commentaries": self._build_commentaries(),
-            "aspects": self._build_aspects(),
-            "themes": self._build_themes(),
-            "entities": self._build_entities(),
-            "symbols": self._build_symbols(),
-            "related_topics": self._build_related(),
+            "meta": loaded["meta"],
+            "gold_references": self._build_gold_references(loaded["theme_links"]),
+            "connections": self._build_connections(xrefs, book_names),
+            "commentaries": self._build_commentaries(linked["commentaries"], books, book_names),
+            "aspects": loaded["aspects"],
+            "themes": self._build_themes(loaded["theme_links"][:20]),
+            "entities": linked["entities"],
+            "symbols": linked["symbols"],
+            "related_topics": loaded["related_topics"],
         }
 
+    # === Loaders (one query each) ===
+
+    def _load_theme_links(self) -> list:
+        return list(self.topic.theme_links.order_by("-relevance_score", "id"))
+
+    def _load_cross_references(self) -> list:
+        return list(
+            TopicCrossReference.objects.filter(topic=self.topic)
+            .select_related(
+                "cross_reference__from_book__testament",
+                "cross_reference__to_book__testament",
+            )
+            .order_by("-relevance_score", "id")[:MAX_CONNECTIONS]
+        )
+
+    def _load_book_names(self, books: dict) -> dict[int, str]:
+        """Display names of ``books`` (id → CanonicalBook) in the request language (one query)."""
+        if not books:
+            return {}
+        names = BookName.objects.filter(canonical_book_id__in=books, version__isnull=True).select_related("language")
+        by_book: dict[int, list] = {}
+        for name in names:
+            by_book.setdefault(name.canonical_book_id, []).append(name)
+        for book_id, book in books.items():
+            book._prefetched_objects_cache = {"names": by_book.get(book_id, [])}
+        return {book_id: get_book_display_name(book, self.lang_code) for book_id, book in books.items()}
+
+    def _load_commentaries(self, xrefs: list) -> list:
+        """Commentary entries on the verses at either end of the topic's strongest cross references."""
+        verse_filters = self._get_topic_verse_filters(xrefs)
+        if verse_filters is None:
+            return []
+        return list(
+            CommentaryEntry.objects.filter(verse_filters)
+            .select_related("author", "source")
+            .order_by("author__birth_year", "book__canonical_order", "chapter", "verse_start", "id")[:50]
+        )
+
+    # === Builders ===
+
     def _build_meta(self) -> dict:
         """Topic metadata."""
         topic = self.topic
         display_name = topic.get_display_name(self.lang_code)
 
         # Get content/outline if available
-        content = topic.contents.filter(
-            language__code__startswith=self.lang_code[:2]
-        ).first()
+        content = TopicContent.objects.filter(topic=topic, language__code__startswith=self.lang_code[:2]).first()
         outline = content.outline if content else ""
 
         return {
@@ -77,7 +194,10 @@ class StudyComposer:
             "outline": outline,
         }
 
-    def _build_gold_references(self) -> list[dict]:
+    def _theme_label(self, link) -> str:
+        return (link.label_original if self.lang_code.startswith("pt") else link.label_en) or link.label_normalized
+
+    def _build_gold_references(self, theme_links: list) -> list[dict]:
         """
         Anchor verses from themes, ordered by relevance.
         These are the 'gold references' — the most important verses for this topic.
@@ -85,39 +205,26 @@ class StudyComposer:
         anchor_verses = []
         seen_refs = set()
 
-        for link in self.topic.theme_links.all().order_by("-relevance_score"):
-            label = (
-                link.label_original
-                if self.lang_code.startswith("pt")
-                else link.label_en
-            ) or link.label_normalized
-
-            for verse_ref in link.anchor_verses:
+        for link in theme_links:
+            label = self._theme_label(link)
+            for verse_ref in link.anchor_verses or []:
                 if verse_ref not in seen_refs:
                     seen_refs.add(verse_ref)
-                    anchor_verses.append({
-                        "reference": verse_ref,
-                        "theme_label": label,
-                        "relevance_score": link.relevance_score,
-                    })
+                    anchor_verses.append(
+                        {
+                            "reference": verse_ref,
+                            "theme_label": label,
+                            "relevance_score": link.relevance_score,
+                        }
+                    )
 
         return anchor_verses
 
-    def _build_connections(self) -> dict:
+    def _build_connections(self, xrefs: list, book_names: dict[int, str]) -> dict:
         """
         Cross-references grouped by testament direction.
         Groups: ot_to_nt (prophecy→fulfillment), within_ot, within_nt, nt_to_ot.
         """
-        cross_refs = (
-            TopicCrossReference.objects.filter(topic=self.topic)
-            .select_related(
-                "cross_reference",
-                "cross_reference__from_book",
-                "cross_reference__to_book",
-            )
-            .order_by("-relevance_score")[:100]
-        )
-
         groups = {
             "ot_to_nt": [],
             "within_ot": [],
@@ -125,30 +232,29 @@ class StudyComposer:
             "nt_to_ot": [],
         }
 
-        for tcr in cross_refs:
+        for tcr in xrefs:
             xref = tcr.cross_reference
-            if not xref:
-                continue
-
             from_book = xref.from_book
             to_book = xref.to_book
-            if not from_book or not to_book:
-                continue
+
+            to_verse = str(xref.to_verse_start)
+            if xref.to_verse_end and xref.to_verse_end != xref.to_verse_start:
+                to_verse += f"-{xref.to_verse_end}"
 
             entry = {
-                "from_ref": f"{from_book.name} {xref.from_chapter}:{xref.from_verse}",
-                "to_ref": f"{to_book.name} {xref.to_chapter}:{xref.to_verse}",
+                "from_ref": f"{book_names[from_book.id]} {xref.from_chapter}:{xref.from_verse}",
+                "to_ref": f"{book_names[to_book.id]} {xref.to_chapter}:{to_verse}",
                 "from_book_osis": from_book.osis_code,
                 "to_book_osis": to_book.osis_code,
                 "votes": xref.votes,
                 "confidence": xref.confidence,
                 "strength": xref.strength,
                 "relevance_score": tcr.relevance_score,
-                "sources": xref.sources if hasattr(xref, "sources") else [],
+                "sources": [xref.source] if xref.source else [],
             }
 
-            from_ot = from_book.testament == "OT"
-            to_ot = to_book.testament == "OT"
+            from_ot = self._is_old_testament(from_book)
+            to_ot = self._is_old_testament(to_book)
 
             if from_ot and not to_ot:
                 groups["ot_to_nt"].append(entry)
@@ -164,38 +270,30 @@ class StudyComposer:
             "groups": groups,
         }
 
-    def _build_commentaries(self) -> list[dict]:
+    def _build_commentaries(self, entries: list, books: dict, book_names: dict[int, str]) -> list[dict]:
         """
         Commentary entries from patristic and historical authors.
         Fetches commentaries for verses referenced by this topic.
         """
-        # Get book OSIS codes and chapters from cross-references
-        verse_filters = self._get_topic_verse_filters()
-        if not verse_filters:
-            return []
-
-        entries = (
-            CommentaryEntry.objects.filter(verse_filters)
-            .select_related("author", "source", "book")
-            .order_by("author__birth_year", "book__order", "chapter", "verse_start")[:50]
-        )
-
         result = []
         for entry in entries:
             author = entry.author
-            result.append({
-                "author_name": author.name if author else "Unknown",
-                "author_short": author.short_name if author else "",
-                "author_type": author.author_type if author else "",
-                "tradition": author.tradition if author else "",
-                "century": self._year_to_century(author.birth_year) if author and author.birth_year else "",
-                "is_saint": author.is_saint if author else False,
-                "verse_ref": f"{entry.book.name} {entry.chapter}:{entry.verse_start}" if entry.book else "",
-                "book_osis": entry.book.osis_code if entry.book else "",
-                "content": entry.content[:500] if entry.content else "",
-                "content_full": entry.content or "",
-                "source": entry.source.name if entry.source else "",
-            })
+            body = entry.body_text or ""
+            result.append(
+                {
+                    "author_name": author.name if author else "Unknown",
+                    "author_short": author.short_name if author else "",
+                    "author_type": author.author_type if author else "",
+                    "tradition": author.tradition if author else "",
+                    "century": self._year_to_century(author.birth_year) if author and author.birth_year else "",
+                    "is_saint": author.is_saint if author else False,
+                    "verse_ref": f"{book_names.get(entry.book_id, '')} {entry.chapter}:{entry.verse_start}",
+                    "book_osis": books[entry.book_id].osis_code if entry.book_id in books else "",
+                    "content": body[:500],
+                    "content_full": body,
+                    "source": entry.source.name if entry.source else "",
+                }
+            )
 
         return result
 
@@ -209,94 +307,70 @@ class StudyComposer:
 
         result = []
         for aspect in aspects:
-            label = None
-            for lbl in aspect.labels.all():
-                if lbl.language.code.startswith(self.lang_code[:2]):
-                    label = lbl.label
-                    break
-            if not label:
-                label = aspect.labels.first()
-                label = label.label if label else aspect.aspect_key
-
-            result.append({
-                "key": aspect.aspect_key,
-                "label": label,
-                "order": aspect.order,
-                "verse_count": aspect.verse_count,
-                "verse_refs": aspect.verse_refs[:20] if aspect.verse_refs else [],
-            })
+            labels = list(aspect.labels.all())
+            label = next(
+                (lbl.label for lbl in labels if lbl.language.code.startswith(self.lang_code[:2])),
+                labels[0].label if labels else aspect.canonical_label or aspect.slug,
+            )
+
+            result.append(
+                {
+                    "key": aspect.slug,
+                    "label": label,
+                    "order": aspect.order,
+                    "verse_count": aspect.verse_count,
+                    "verse_refs": aspect.raw_references[:20] if aspect.raw_references else [],
+                }
+            )
 
         return result
 
-    def _build_themes(self) -> list[dict]:
+    def _build_themes(self, theme_links: list) -> list[dict]:
         """Themes linked to this topic with anchor verses and relevance."""
-        links = (
-            self.topic.theme_links.all()
-            .select_related("theme")
-            .order_by("-relevance_score")[:20]
-        )
-
-        result = []
-        for link in links:
-            theme = link.theme
-            label = (
-                link.label_original
-                if self.lang_code.startswith("pt")
-                else link.label_en
-            ) or link.label_normalized
-
-            result.append({
-                "theme_id": theme.id if theme else None,
-                "label": label,
+        return [
+            {
+                "theme_id": link.theme_id,
+                "label": self._theme_label(link),
                 "relevance_score": link.relevance_score,
                 "anchor_verses": link.anchor_verses[:10] if link.anchor_verses else [],
-                "grade": link.grade,
-            })
-
-        return result
+                "confidence": link.confidence,
+            }
+            for link in theme_links
+        ]
 
-    def _build_entities(self) -> list[dict]:
-        """Entities mentioned in the topic's key verses."""
-        # Get OSIS codes from the topic's cross-references
-        books = self._get_topic_books()
-        if not books:
+    def _build_entities(self, book_ids: list[int]) -> list[dict]:
+        """Entities mentioned in the books of the topic's key verses."""
+        if not book_ids:
             return []
 
-        entities = (
-            CanonicalEntity.objects.filter(
-                verse_mentions__book_osis__in=books
-            )
-            .distinct()[:30]
-        )
+        entities = CanonicalEntity.objects.filter(
+            Exists(EntityVerseLink.objects.filter(entity=OuterRef("pk"), verse__book_id__in=book_ids))
+        ).order_by("canonical_id")[:30]
 
         return [
             {
                 "canonical_id": e.canonical_id,
-                "name": e.name,
+                "name": e.primary_name,
                 "namespace": e.namespace,
                 "description": (e.description or "")[:200],
             }
             for e in entities
         ]
 
-    def _build_symbols(self) -> list[dict]:
-        """Symbols found in the topic's key verses."""
-        books = self._get_topic_books()
-        if not books:
+    def _build_symbols(self, book_ids: list[int]) -> list[dict]:
+        """Symbols found in the books of the topic's key verses."""
+        if not book_ids:
             return []
 
-        symbols = (
-            BiblicalSymbol.objects.filter(
-                occurrences__book_osis__in=books
-            )
-            .distinct()[:20]
-        )
+        symbols = BiblicalSymbol.objects.filter(
+            Exists(SymbolOccurrence.objects.filter(symbol=OuterRef("pk"), verse__book_id__in=book_ids))
+        ).order_by("canonical_id")[:20]
 
         return [
             {
                 "canonical_id": s.canonical_id,
-                "name": s.name,
-                "name_pt": s.name_pt or s.name,
+                "name": s.primary_name,
+                "name_pt": s.primary_name_pt or s.primary_name,
                 "literal_meaning": s.literal_meaning or "",
                 "namespace": s.namespace,
             }
@@ -308,7 +382,8 @@ class StudyComposer:
         relations = (
             self.topic.outgoing_relations.all()
             .select_related("target")
-            .prefetch_related("target__names", "target__names__language")[:10]
+            .prefetch_related(Prefetch("target__names", queryset=TopicName.objects.select_related("language")))
+            .order_by("id")[:10]
         )
 
         return [
@@ -323,59 +398,39 @@ class StudyComposer:
 
     # === Helpers ===
 
-    def _get_topic_books(self) -> list[str]:
-        """Get distinct OSIS book codes from topic's cross-references."""
-        xrefs = TopicCrossReference.objects.filter(
-            topic=self.topic
-        ).select_related("cross_reference__from_book")[:50]
-
-        books = set()
+    @staticmethod
+    def _topic_books(xrefs: list) -> dict:
+        """Books at either end of ``xrefs``, by id."""
+        books = {}
         for tcr in xrefs:
-            if tcr.cross_reference and tcr.cross_reference.from_book:
-                books.add(tcr.cross_reference.from_book.osis_code)
-            if tcr.cross_reference and tcr.cross_reference.to_book:
-                books.add(tcr.cross_reference.to_book.osis_code)
-        return list(books)
+            books[tcr.cross_reference.from_book_id] = tcr.cross_reference.from_book
+            books[tcr.cross_reference.to_book_id] = tcr.cross_reference.to_book
+        return books
 
-    def _get_topic_verse_filters(self) -> Q | None:
+    @staticmethod
+    def _get_topic_verse_filters(xrefs: list) -> Q | None:
         """Build Q filter for commentary lookup based on topic's verse references."""
-        xrefs = TopicCrossReference.objects.filter(
-            topic=self.topic
-        ).select_related(
-            "cross_reference__from_book", "cross_reference__to_book"
-        )[:30]
-
         filters = Q()
         seen = set()
         for tcr in xrefs:
             xref = tcr.cross_reference
-            if not xref:
-                continue
-
-            # From verse
-            if xref.from_book:
-                key = (xref.from_book.osis_code, xref.from_chapter, xref.from_verse)
+            for key in (
+                (xref.from_book_id, xref.from_chapter, xref.from_verse),
+                (xref.to_book_id, xref.to_chapter, xref.to_verse_start),
+            ):
                 if key not in seen:
                     seen.add(key)
-                    filters |= Q(
-                        book__osis_code=xref.from_book.osis_code,
-                        chapter=xref.from_chapter,
-                        verse_start=xref.from_verse,
-                    )
-
-            # To verse
-            if xref.to_book:
-                key = (xref.to_book.osis_code, xref.to_chapter, xref.to_verse)
-                if key not in seen:
-                    seen.add(key)
-                    filters |= Q(
-                        book__osis_code=xref.to_book.osis_code,
-                        chapter=xref.to_chapter,
-                        verse_start=xref.to_verse,
-                    )
+                    filters |= Q(book_id=key[0], chapter=key[1], verse_start=key[2])
 
         return filters if seen else None
 
+    @staticmethod
+    def _is_old_testament(book) -> bool:
+        testament = book.testament
+        if testament is None:
+            return False
+        return testament.order == 1 or testament.name.lower() in _OLD_TESTAMENT_NAMES
+
     @staticmethod
     def _year_to_century(year: int) -> str:
         """Convert birth year to century string (e.g., 354 → 'IV')."""
@@ -383,10 +438,26 @@ class StudyComposer:
             return ""
         century = (abs(year) - 1) // 100 + 1
         roman = {
-            1: "I", 2: "II", 3: "III", 4: "IV", 5: "V",
-            6: "VI", 7: "VII", 8: "VIII", 9: "IX", 10: "X",
-            11: "XI", 12: "XII", 13: "XIII", 14: "XIV", 15: "XV",
-            16: "XVI", 17: "XVII", 18: "XVIII", 19: "XIX", 20: "XX",
+            1: "I",
+            2: "II",
+            3: "III",
+            4: "IV",
+            5: "V",
+            6: "VI",
+            7: "VII",
+            8: "VIII",
+            9: "IX",
+            10: "X",
+            11: "XI",
+            12: "XII",
+            13: "XIII",
+            14: "XIV",
+            15: "XV",
+            16: "XVI",
+            17: "XVII",
+            18: "XVIII",
+            19: "XIX",
+            20: "XX",
         }
         suffix = " a.C." if year < 0 else ""
         return f"{roman.get(century, str(century))}{suffix}"
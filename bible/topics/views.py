@@ -48,7 +48,7 @@ def get_topic_queryset():
         "contents",
         "contents__language",
         Prefetch("definitions", queryset=TopicDefinition.objects.order_by("source")),
-        Prefetch("aspects", queryset=TopicAspect.objects.order_by("order")),
+        Prefetch("aspects", queryset=TopicAspect.objects.order_by("order").prefetch_related("labels__language")),
         Prefetch(
             "theme_links",
             queryset=TopicThemeLink.objects.select_related("theme").order_by("-relevance_score"),
@@ -222,7 +222,7 @@ class TopicSearchView(LanguageSensitiveMixin, generics.GenericAPIView):
 
         topics = (
             Topic.objects.filter(name_query | content_query)
-            .prefetch_related("names", "contents")
+            .prefetch_related("names__language", "contents__language")
             .distinct()
             .order_by("-total_verses", "name_normalized")
         )
@@ -239,10 +239,9 @@ class TopicSearchView(LanguageSensitiveMixin, generics.GenericAPIView):
                 continue
             added_slugs.add(topic.slug)
 
-            # Get summary preview
-            content = topic.contents.filter(language__code=lang_code).first()
-            if not content:
-                content = topic.contents.filter(language__code="en").first()
+            # Get summary preview (from the prefetched contents, one per language)
+            contents = {c.language.code: c for c in topic.contents.all()}
+            content = contents.get(lang_code) or contents.get("en")
 
             summary_preview = ""
             if content and content.summary:
@@ -252,7 +251,7 @@ class TopicSearchView(LanguageSensitiveMixin, generics.GenericAPIView):
             match_type = "name"
             if query.lower() in topic.name_normalized:
                 match_type = "name"
-            elif topic.names.filter(aliases__icontains=query).exists():
+            elif any(query.lower() in alias.lower() for name in topic.names.all() for alias in name.aliases):
                 match_type = "alias"
             else:
                 match_type = "content"
@@ -714,7 +713,8 @@ class TopicStudyView(LanguageSensitiveMixin, APIView):
 
     Aggregates data from multiple sources: anchor verses, cross-references,
     commentaries, themes, entities, symbols, and related topics into a single
-    response designed for deep study experiences.
+    response designed for deep study experiences. Composed payloads are cached
+    per (topic, language) until one of their datasets changes.
     """
 
     permission_classes = [AllowAny]
@@ -747,9 +747,10 @@ class TopicStudyView(LanguageSensitiveMixin, APIView):
         },
     )
     def get(self, request, slug):
-        try:
-            topic = get_topic_queryset().get(slug=slug)
-        except Topic.DoesNotExist:
+        from .services.study_cache import get_study
+
+        payload = get_study(slug, getattr(request, "lang_code", "pt"))
+        if payload is None:
             return build_error_response(
                 f'Topic "{slug}" not found.',
                 "not_found",
@@ -758,11 +759,4 @@ class TopicStudyView(LanguageSensitiveMixin, APIView):
                 vary_accept_language=True,
             )
 
-        lang_code = getattr(request, "lang_code", "pt")
-
-        from .services.study_composer import StudyComposer
-
-        composer = StudyComposer(topic, lang_code=lang_code)
-        payload = composer.compose()
-
         return Response(payload)
@@ -62,6 +62,10 @@ def get_book_display_name(canonical_book: CanonicalBook, language_code: str = "e
 
     lang_code = language_code.strip()
 
+    prefetched = _prefetched_generic_names(canonical_book)
+    if prefetched is not None:
+        return _pick_display_name(canonical_book, prefetched, lang_code)
+
     # Try exact match first
     book_name = canonical_book.names.filter(language__code__iexact=lang_code, version__isnull=True).first()
     if book_name:
@@ -85,6 +89,48 @@ def get_book_display_name(canonical_book: CanonicalBook, language_code: str = "e
     return canonical_book.osis_code
 
 
+def prefetched_book_names(canonical_book: CanonicalBook) -> list | None:
+    """The book's names when ``names__language`` was prefetched, else None."""
+    from ..models import BookName
+
+    names = getattr(canonical_book, "_prefetched_objects_cache", {}).get("names")
+    if names is None or not all(BookName.language.is_cached(n) for n in names):
+        return None
+    return names
+
+
+def _prefetched_generic_names(canonical_book: CanonicalBook) -> dict[str, str] | None:
+    """
+    Return {language_code (lower): name} from prefetched names, or None.
+
+    Only used when ``book__names__language`` was prefetched, so resolving
+    display names for a list of verses costs no extra queries.
+    """
+    names = prefetched_book_names(canonical_book)
+    if names is None:
+        return None
+
+    by_lang: dict[str, str] = {}
+    for n in names:
+        if n.version_id is None:
+            by_lang.setdefault(n.language.code.lower(), n.name)
+    return by_lang
+
+
+def _pick_display_name(canonical_book: CanonicalBook, by_lang: dict[str, str], lang_code: str) -> str:
+    """Apply the exact → base language → English → OSIS fallback to prefetched names."""
+    lang_lower = lang_code.lower()
+    candidates = [lang_lower]
+    if "-" in lang_lower:
+        candidates.append(lang_lower.split("-")[0])
+    if lang_lower != "en":
+        candidates.append("en")
+    for code in candidates:
+        if code in by_lang:
+            return by_lang[code]
+    return canonical_book.osis_code
+
+
 def get_book_abbreviation(canonical_book: CanonicalBook, language_code: str = "en") -> str:
     """
     Get the abbreviation for a canonical book in the specified language.
@@ -96,6 +142,10 @@ def get_book_abbreviation(canonical_book: CanonicalBook, language_code: str = "e
     Returns:
         Abbreviation for the book
     """
-    book_name = canonical_book.names.filter(language__code=language_code, version__isnull=True).first()
+    prefetched = prefetched_book_names(canonical_book)
+    if prefetched is not None:
+        book_name = next((n for n in prefetched if n.version_id is None and n.language.code == language_code), None)
+    else:
+        book_name = canonical_book.names.filter(language__code=language_code, version__isnull=True).first()
 
     return book_name.abbreviation if book_name else canonical_book.osis_code[:3]
@@ -203,6 +203,11 @@ BOOK_TO_OSIS: dict[str, str] = {
     "3 ma": "3Macc",
 }
 
+_MULTI_WORD_REF_RE = re.compile(
+    r'^(\d?\s*[A-Za-zÀ-ÿ.]+(?:\s+(?:de|dos|of|do)\s+[A-Za-zÀ-ÿ.]+)*\.?)\s+(\d+)(?:[:.]\s*(\d+)(?:\s*[-–]\s*(\d+))?)?'
+)
+_SINGLE_WORD_REF_RE = re.compile(r'^(\d?\s*[A-Za-zÀ-ÿ.]+\.?)\s+(\d+)(?:[:.]\s*(\d+)(?:\s*[-–]\s*(\d+))?)?')
+
 
 def parse_ref(ref: str) -> tuple[str | None, int | None, int | None, int | None]:
     """
@@ -225,16 +230,10 @@ def parse_ref(ref: str) -> tuple[str | None, int | None, int | None, int | None]
     ref = ref.strip()
 
     # Try multi-word book names first (e.g., "Cantares de Salomão 4:14", "Song of Solomon 2:1")
-    multi_match = re.match(
-        r'^(\d?\s*[A-Za-zÀ-ÿ.]+(?:\s+(?:de|dos|of|do)\s+[A-Za-zÀ-ÿ.]+)*\.?)\s+(\d+)(?:[:.]\s*(\d+)(?:\s*[-–]\s*(\d+))?)?',
-        ref,
-    )
+    multi_match = _MULTI_WORD_REF_RE.match(ref)
 
     # Fallback: single-word book name
-    single_match = re.match(
-        r'^(\d?\s*[A-Za-zÀ-ÿ.]+\.?)\s+(\d+)(?:[:.]\s*(\d+)(?:\s*[-–]\s*(\d+))?)?',
-        ref,
-    )
+    single_match = _SINGLE_WORD_REF_RE.match(ref)
 
     # Try multi-word first, then single-word
     match = None
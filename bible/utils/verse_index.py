@@ -0,0 +1,184 @@
+"""
+Shared verse-coordinate index for importers and linkers.
+
+Importers resolve the same references over and over: "which verse row is
+Gen 12:1?" or "which cross-reference links Gen 12:1 to Heb 11:8?". Instead
+of one query per reference (plus an ad-hoc dict cache in every importer),
+a ``VerseIndex`` bulk-loads the coordinates once per import run into sorted
+numpy arrays and answers lookups with ``np.searchsorted``:
+
+    index = VerseIndex(version=version)
+    ids = index.resolve_many([("Gen", 12, 1), ("John", 3, 16)])  # array([..., ...]); 0 = not found
+    verse_id = index.resolve("Gen", 12, 1)                      # int | None
+    xref_id = index.crossref_id(("Gen", 12, 1), ("Heb", 11, 8))
+
+Books are loaded eagerly (one query); verses and cross-references lazily on
+first use (one query each). Coordinates are packed with ``pack_coordinate``
+using a dense per-index book slot, so keys stay small regardless of the
+database ids.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+
+# Packed verse coordinate: book | chapter (10 bits) | verse (10 bits)
+_BOOK_SHIFT = 20
+_CHAPTER_SHIFT = 10
+COORDINATE_FIELD_MASK = (1 << 10) - 1
+
+# Cross-reference keys are (from coordinate, to coordinate) packed side by side
+_PAIR_SHIFT = 31
+
+Ref = tuple[str, int, int]
+
+
+def pack_coordinate(book_id: int, chapter: int, verse: int) -> int:
+    """Pack a (book, chapter, verse) coordinate into a single sortable integer."""
+    return (book_id << _BOOK_SHIFT) | (chapter << _CHAPTER_SHIFT) | verse
+
+
+def unpack_coordinate(key: int) -> tuple[int, int, int]:
+    """Inverse of ``pack_coordinate``."""
+    return key >> _BOOK_SHIFT, (key >> _CHAPTER_SHIFT) & COORDINATE_FIELD_MASK, key & COORDINATE_FIELD_MASK
+
+
+def _lookup(keys: np.ndarray, values: np.ndarray, wanted: np.ndarray) -> np.ndarray:
+    """Vectorized sorted-array lookup; missing keys map to 0."""
+    if not len(keys) or not len(wanted):
+        return np.zeros(len(wanted), dtype=np.int64)
+    pos = np.searchsorted(keys, wanted)
+    pos = np.minimum(pos, len(keys) - 1)
+    return np.where(keys[pos] == wanted, values[pos], 0)
+
+
+class VerseIndex:
+    """
+    In-memory (book, chapter, verse) → verse id and (from, to) → cross-reference id index.
+
+    With ``version`` the index holds that version's verses only; without it,
+    every version is loaded and the lowest verse id wins for each coordinate
+    ("any version", as the topic importer expects).
+    """
+
+    def __init__(self, version=None):
+        from bible.models import CanonicalBook
+
+        self.version_id = getattr(version, "pk", version)
+        self.books = {book.osis_code: book for book in CanonicalBook.objects.order_by("id")}
+        self._slots = {book.id: slot for slot, book in enumerate(self.books.values(), start=1)}
+        self._osis_slots = {book.osis_code: self._slots[book.id] for book in self.books.values()}
+        self._slot_by_id = np.zeros(max(self._slots, default=0) + 1, dtype=np.int64)
+        self._slot_by_id[list(self._slots)] = list(self._slots.values())
+        self._verse_keys: np.ndarray | None = None
+        self._verse_ids: np.ndarray | None = None
+        self._crossref_keys: np.ndarray | None = None
+        self._crossref_ids: np.ndarray | None = None
+
+    # --- Books ---
+
+    def book(self, osis_code: str):
+        """``CanonicalBook`` for an OSIS code, or ``None``."""
+        return self.books.get(osis_code)
+
+    def book_id(self, osis_code: str) -> int | None:
+        book = self.books.get(osis_code)
+        return book.id if book else None
+
+    # --- Verses ---
+
+    def resolve(self, osis_code: str, chapter: int, verse: int) -> int | None:
+        """Verse id for a single reference, or ``None`` when it does not exist."""
+        verse_id = int(self.resolve_many([(osis_code, chapter, verse)])[0])
+        return verse_id or None
+
+    def resolve_many(self, refs: Iterable[Ref]) -> np.ndarray:
+        """Verse ids for ``(osis_code, chapter, verse)`` refs, in order; 0 marks a missing verse."""
+        self._load_verses()
+        return _lookup(self._verse_keys, self._verse_ids, self._pack_refs(refs))
+
+    def _load_verses(self):
+        if self._verse_keys is not None:
+            return
+        from bible.models import Verse
+
+        qs = Verse.objects.all()
+        if self.version_id is not None:
+            qs = qs.filter(version_id=self.version_id)
+        rows = np.array(list(qs.order_by().values_list("book_id", "chapter", "number", "id")), dtype=np.int64).reshape(
+            -1, 4
+        )
+        keys = self._pack_columns(rows[:, 0], rows[:, 1], rows[:, 2])
+        # Sort by (key, id) so np.unique keeps the lowest id per coordinate
+        order = np.lexsort((rows[:, 3], keys))
+        keys, ids = keys[order], rows[order, 3]
+        self._verse_keys, first = np.unique(keys, return_index=True)
+        self._verse_ids = ids[first]
+
+    # --- Cross-references ---
+
+    def crossref_id(self, from_ref: Ref, to_ref: Ref) -> int | None:
+        """Id of the cross-reference from ``from_ref`` to a range starting at ``to_ref``, or ``None``."""
+        crossref_id = int(self.crossref_ids([(from_ref, to_ref)])[0])
+        return crossref_id or None
+
+    def crossref_ids(self, pairs: Iterable[tuple[Ref, Ref]]) -> np.ndarray:
+        """Cross-reference ids for ``(from_ref, to_ref)`` pairs, in order; 0 marks a missing link."""
+        pairs = list(pairs)
+        self._load_crossrefs()
+        from_keys = self._pack_refs(p[0] for p in pairs)
+        to_keys = self._pack_refs(p[1] for p in pairs)
+        wanted = np.where((from_keys >= 0) & (to_keys >= 0), (from_keys << _PAIR_SHIFT) | to_keys, -1)
+        return _lookup(self._crossref_keys, self._crossref_ids, wanted)
+
+    def _load_crossrefs(self):
+        if self._crossref_keys is not None:
+            return
+        from bible.models import CrossReference
+
+        rows = np.array(
+            list(
+                CrossReference.objects.order_by().values_list(
+                    "from_book_id", "from_chapter", "from_verse", "to_book_id", "to_chapter", "to_verse_start", "id"
+                )
+            ),
+            dtype=np.int64,
+        ).reshape(-1, 7)
+        from_keys = self._pack_columns(rows[:, 0], rows[:, 1], rows[:, 2])
+        to_keys = self._pack_columns(rows[:, 3], rows[:, 4], rows[:, 5])
+        keys = (from_keys << _PAIR_SHIFT) | to_keys
+        order = np.lexsort((rows[:, 6], keys))
+        keys, ids = keys[order], rows[order, 6]
+        self._crossref_keys, first = np.unique(keys, return_index=True)
+        self._crossref_ids = ids[first]
+
+    # --- Packing ---
+
+    def _pack_columns(self, book_ids: np.ndarray, chapters: np.ndarray, verses: np.ndarray) -> np.ndarray:
+        known = book_ids < len(self._slot_by_id)
+        slots = np.where(known, self._slot_by_id[np.where(known, book_ids, 0)], 0)
+        return self._pack(slots, chapters, verses)
+
+    def _pack_refs(self, refs: Iterable[Ref]) -> np.ndarray:
+        refs = list(refs)
+        if not refs:
+            return np.zeros(0, dtype=np.int64)
+        slots = np.array([self._osis_slots.get(osis, 0) for osis, _, _ in refs], dtype=np.int64)
+        chapters = np.array([chapter or 0 for _, chapter, _ in refs], dtype=np.int64)
+        verses = np.array([verse or 0 for _, _, verse in refs], dtype=np.int64)
+        return self._pack(slots, chapters, verses)
+
+    @staticmethod
+    def _pack(slots: np.ndarray, chapters: np.ndarray, verses: np.ndarray) -> np.ndarray:
+        """Pack coordinate columns; unknown books and out-of-range numbers become -1 (never matches)."""
+        valid = (
+            (slots > 0)
+            & (chapters > 0)
+            & (chapters <= COORDINATE_FIELD_MASK)
+            & (verses > 0)
+            & (verses <= COORDINATE_FIELD_MASK)
+        )
+        keys = (slots << _BOOK_SHIFT) | (chapters << _CHAPTER_SHIFT) | verses
+        return np.where(valid, keys, -1)
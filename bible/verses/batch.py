@@ -0,0 +1,88 @@
+"""
+Bulk multi-reference verse fetch.
+
+Every reference in a batch is reduced to a ``(book, start chapter:verse, end
+chapter:verse)`` span. All spans are then fetched in a single query: the span
+coordinates are passed as parallel arrays, ``unnest``-ed into a row set and
+joined to ``verses`` with row-value comparisons, which the unique
+``(book, version, chapter, number)`` index answers as one range scan per span.
+Verses shared by overlapping spans come back once, tagged with every span
+that contains them.
+"""
+
+from dataclasses import dataclass
+
+from django.db import connection
+
+# Open-ended span bounds ("John 3" = 3:0 through 3:LAST_VERSE)
+LAST_VERSE = 10_000
+
+
+@dataclass(frozen=True)
+class Span:
+    book_id: int
+    chapter_start: int
+    verse_start: int
+    chapter_end: int
+    verse_end: int
+
+
+def span_for_entry(book_id: int, entry: dict) -> Span | None:
+    """Span covered by one parsed reference item, or ``None`` when it names no chapter."""
+    chapter = entry.get("chapter")
+    if chapter is None:
+        return None
+    chapter_end = entry.get("chapter_end") or chapter
+    return Span(
+        book_id=book_id,
+        chapter_start=chapter,
+        verse_start=entry.get("verse_start") or 0,
+        chapter_end=chapter_end,
+        verse_end=entry.get("verse_end") or LAST_VERSE,
+    )
+
+
+_BATCH_SQL = """
+SELECT v.id, v.book_id, v.version_id, v.chapter, v.number, v.text, array_agg(s.idx ORDER BY s.idx)
+FROM unnest(%s::int[], %s::bigint[], %s::int[], %s::int[], %s::int[], %s::int[])
+     AS s(idx, book_id, chapter_start, verse_start, chapter_end, verse_end)
+JOIN verses v
+  ON v.book_id = s.book_id
+ AND v.version_id = %s
+ AND (v.chapter, v.number) >= (s.chapter_start, s.verse_start)
+ AND (v.chapter, v.number) <= (s.chapter_end, s.verse_end)
+JOIN canonical_books cb ON cb.id = v.book_id
+GROUP BY v.id, cb.canonical_order
+ORDER BY cb.canonical_order, v.chapter, v.number
+LIMIT %s
+"""
+
+
+def fetch_spans(spans: list[Span], version_id: int, limit: int) -> tuple[list[tuple], dict[int, list[int]]]:
+    """Distinct verses covered by ``spans`` in canonical order, at most ``limit`` rows.
+
+    Returns ``COMPACT_VERSE_VALUES`` rows and, per span index, the ids of its verses.
+    """
+    if not spans:
+        return [], {}
+    params = [
+        list(range(len(spans))),
+        [s.book_id for s in spans],
+        [s.chapter_start for s in spans],
+        [s.verse_start for s in spans],
+        [s.chapter_end for s in spans],
+        [s.verse_end for s in spans],
+        version_id,
+        limit,
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(_BATCH_SQL, params)
+        fetched = cursor.fetchall()
+
+    rows = []
+    members: dict[int, list[int]] = {i: [] for i in range(len(spans))}
+    for *row, span_indexes in fetched:
+        rows.append(tuple(row))
+        for idx in span_indexes:
+            members[idx].append(row[0])
+    return rows, members
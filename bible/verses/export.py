@@ -0,0 +1,112 @@
+"""
+Streaming bulk export for whole versions, books or chapter spans.
+
+Rows are read through a server-side cursor (``QuerySet.iterator``) and written
+as NDJSON, one verse per line, so memory stays flat regardless of export size. Under ASGI the same rows are
+streamed through an async iterator (``aiter_ndjson``): Django buffers a
+synchronous streaming body in full before sending it there.
+The ETag is derived from the ``verses``/``books`` content-cache generations
+(``common.content_cache``), so revalidation costs no query at all.
+"""
+
+import hashlib
+import json
+from gzip import GzipFile
+
+from asgiref.sync import sync_to_async
+from django.utils.text import StreamingBuffer
+
+from common.content_cache import get_generations
+
+# Rows fetched per server-side cursor round-trip; also the number of lines per written chunk
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_VALUES = ("id", "book__osis_code", "chapter", "number", "text")
+
+# Content-cache datasets an export is read from (verse text and version rows, book codes)
+EXPORT_DATASETS = ("books", "verses")
+
+
+def export_queryset(version, book=None, chapter_start=None, chapter_end=None):
+    """Verses of ``version`` (optionally narrowed to a book / chapter span) in canonical order."""
+    from ..models import Verse
+
+    qs = Verse.objects.filter(version=version)
+    if book is not None:
+        qs = qs.filter(book=book)
+        if chapter_start is not None:
+            qs = qs.filter(chapter__gte=chapter_start)
+        if chapter_end is not None:
+            qs = qs.filter(chapter__lte=chapter_end)
+    return qs.order_by("book__canonical_order", "chapter", "number")
+
+
+def export_etag(version, scope: tuple = ()) -> str:
+    """Weak ETag for an export slice; changes whenever the verse or book datasets are written.
+
+    ``scope`` identifies the slice (book id, chapter span) so different slices never share a tag.
+    """
+    generations = get_generations(EXPORT_DATASETS)
+    raw = "|".join(str(part) for part in (version.pk, *scope, *(generations[d] for d in EXPORT_DATASETS)))
+    return f'W/"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an ``Accept-Encoding`` value allows gzip, honouring q-values (``gzip;q=0`` refuses it)."""
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding:
+            qualities[coding.lower()] = quality
+    quality = qualities.get("gzip", qualities.get("x-gzip", qualities.get("*", 0.0)))
+    return quality > 0
+
+
+def iter_ndjson(version, queryset, chunk_size: int = EXPORT_CHUNK_SIZE):
+    """Yield NDJSON chunks of ``chunk_size`` verse lines each."""
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    code = version.code
+    lines = []
+    for pk, osis_code, chapter, number, text in queryset.values_list(*EXPORT_VALUES).iterator(chunk_size=chunk_size):
+        lines.append(
+            dumps({"id": pk, "version": code, "book": osis_code, "chapter": chapter, "verse": number, "text": text})
+        )
+        if len(lines) >= chunk_size:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+async def aiter_ndjson(version, queryset, chunk_size: int = EXPORT_CHUNK_SIZE):
+    """``iter_ndjson`` for ASGI responses; each chunk is read in the request's sync thread."""
+    chunks = iter_ndjson(version, queryset, chunk_size)
+    next_chunk = sync_to_async(next)
+    try:
+        while (chunk := await next_chunk(chunks, None)) is not None:
+            yield chunk
+    finally:
+        # Closes the server-side cursor even when the client goes away mid-export
+        await sync_to_async(chunks.close)()
+
+
+async def acompress_sequence(chunks):
+    """Async ``django.utils.text.compress_sequence``: one gzip stream over an async iterable."""
+    buf = StreamingBuffer()
+    with GzipFile(mode="wb", compresslevel=6, fileobj=buf, mtime=0) as zfile:
+        # gzip header
+        yield buf.read()
+        async for item in chunks:
+            zfile.write(item)
+            data = buf.read()
+            if data:
+                yield data
+    yield buf.read()
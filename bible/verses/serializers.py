@@ -3,6 +3,11 @@
 from rest_framework import serializers
 
 from ..models import CanonicalBook, License, Verse, Version
+from ..versions.services import get_version_registry
+
+# Compact layout: verses as flat rows read straight from values_list()
+COMPACT_VERSE_FIELDS = ["id", "book", "version", "chapter", "verse", "text"]
+COMPACT_VERSE_VALUES = ("id", "book_id", "version_id", "chapter", "number", "text")
 
 
 class BookNestedSerializer(serializers.ModelSerializer):
@@ -78,6 +83,63 @@ class VerseSerializer(serializers.ModelSerializer):
         ]
 
 
+def wants_compact_layout(request) -> bool:
+    """True when the client negotiated the compact verse layout (``?layout=compact``)."""
+    return request.query_params.get("layout") == "compact"
+
+
+def compact_verses_payload(rows, context: dict) -> dict:
+    """
+    Fast path for bulk verse lists.
+
+    ``rows`` are ``COMPACT_VERSE_VALUES`` tuples. Each distinct book and version is
+    serialized once into ``included``; verses are emitted as flat rows (ordered as
+    ``COMPACT_VERSE_FIELDS``) that reference them by OSIS code and version code.
+    """
+    rows = list(rows)
+    book_ids = {row[1] for row in rows}
+    version_ids = {row[2] for row in rows}
+
+    books = []
+    if book_ids:
+        books = list(
+            CanonicalBook.objects.filter(id__in=book_ids)
+            .select_related("testament")
+            .prefetch_related("names__language")
+            .order_by("canonical_order")
+        )
+    versions = [v for v in get_version_registry() if v.id in version_ids]
+    missing = version_ids - {v.id for v in versions}
+    if missing:
+        versions += list(Version.objects.filter(id__in=missing).select_related("language", "license"))
+
+    book_codes = {b.id: b.osis_code for b in books}
+    version_codes = {v.id: v.code for v in versions}
+
+    return {
+        "included": {
+            "books": BookNestedSerializer(books, many=True, context=context).data,
+            "versions": VersionNestedSerializer(versions, many=True).data,
+        },
+        "fields": COMPACT_VERSE_FIELDS,
+        "verses": [
+            [pk, book_codes[book_id], version_codes[version_id], chapter, number, text]
+            for pk, book_id, version_id, chapter, number, text in rows
+        ],
+    }
+
+
+class VersesBatchRequestSerializer(serializers.Serializer):
+    """Payload of the bulk multi-reference fetch."""
+
+    refs = serializers.ListField(
+        child=serializers.CharField(max_length=200),
+        allow_empty=False,
+        help_text="References such as 'John 3:16-18', 'Rom 8' or 'Gen 1:31-2:3'; ';' separates several in one string",
+    )
+    version = serializers.CharField(required=False, help_text="Version code or ID (default: language default)")
+
+
 class VersionSerializer(serializers.ModelSerializer):
     """Enhanced version serializer with blueprint support."""
 
@@ -7,10 +7,12 @@ from django.urls import path
 from .views import (
     VerseDetailView,
     VerseListView,
+    VersesBatchView,
     VersesByChapterView,
     VersesByReferenceView,
     VersesByThemeView,
     VersesCompareView,
+    VersesExportView,
     VersesRangeView,
 )
 
@@ -38,11 +40,21 @@ urlpatterns = [
         VersesRangeView.as_view(),
         name="verses_range",
     ),
+    path(
+        "batch/",
+        VersesBatchView.as_view(),
+        name="verses_batch",
+    ),
     path(
         "compare/",
         VersesCompareView.as_view(),
         name="verses_compare",
     ),
+    path(
+        "export/",
+        VersesExportView.as_view(),
+        name="verses_export",
+    ),
     path(
         "by-theme/<int:theme_id>/",
         VersesByThemeView.as_view(),
@@ -1,9 +1,13 @@
 """Views for verses domain."""
 
 import urllib.parse
+from collections import Counter
 
-from django.db.models import Q
-from django.http import Http404
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Q, prefetch_related_objects
+from django.http import Http404, HttpResponseNotModified, StreamingHttpResponse
+from django.utils.http import parse_etags
+from django.utils.text import compress_sequence
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schema
 from rest_framework import filters, generics, status
@@ -14,19 +18,41 @@ from rest_framework.views import APIView
 from bible.references.services import resolve_book_by_alias
 from bible.references.views import _parse_reference_string  # reuse parser
 from bible.utils.i18n import mark_response_language_sensitive
+from common.content_cache import ContentCacheMixin
 from common.exceptions import build_error_response
 from common.mixins import LanguageSensitiveMixin
+from common.observability.topk import record_passage
 from common.openapi import LANG_PARAMETER, get_error_responses
 from common.pagination import StandardResultsSetPagination
 
-from ..models import Verse, Version
-from ..utils import get_canonical_book_by_name
-from ..versions.services import get_default_version_for_lang, get_version_by_ref
+from ..models import Verse
+from ..utils import get_book_display_name, get_canonical_book_by_name
+from ..versions.services import get_default_version_for_lang, get_version_by_ref, get_versions_by_refs
+from .batch import fetch_spans, span_for_entry
+from .export import accepts_gzip, acompress_sequence, aiter_ndjson, export_etag, export_queryset, iter_ndjson
 from .filters import VerseFilter
-from .serializers import VerseSerializer
-
-
-class VersesByChapterView(LanguageSensitiveMixin, generics.ListAPIView):
+from .serializers import (
+    COMPACT_VERSE_VALUES,
+    VersesBatchRequestSerializer,
+    VerseSerializer,
+    compact_verses_payload,
+    wants_compact_layout,
+)
+
+# Per-request (range) and per-version (compare) verse cap
+MAX_RANGE_VERSES = 300
+# Bulk multi-reference fetch: references per payload and distinct verses per response
+MAX_BATCH_REFS = 100
+MAX_BATCH_VERSES = 2000
+
+LAYOUT_COMPACT_PARAMETER = OpenApiParameter(
+    name="layout",
+    description="Set to 'compact' to return verses as flat rows with book and version objects listed once under 'included' (optional)",
+    enum=["compact"],
+)
+
+
+class VersesByChapterView(ContentCacheMixin, LanguageSensitiveMixin, generics.ListAPIView):
     serializer_class = VerseSerializer
     filterset_class = VerseFilter
     filterset_fields = ["version"]
@@ -36,6 +62,14 @@ class VersesByChapterView(LanguageSensitiveMixin, generics.ListAPIView):
     ordering = ["number"]
     pagination_class = StandardResultsSetPagination
     permission_classes = [AllowAny]  # Public endpoint for development
+    content_datasets = ("verses", "books")
+
+    book = None
+
+    def content_cache_hit(self, request, meta):
+        # Cached chapters are the most requested ones: keep them in the hot-passage sketch
+        if meta:
+            record_passage(*meta)
 
     def get_queryset(self):
         book_name = self.kwargs["book_name"]
@@ -43,7 +77,7 @@ class VersesByChapterView(LanguageSensitiveMixin, generics.ListAPIView):
         book_name = urllib.parse.unquote(book_name)
         chapter = self.kwargs["chapter"]
         try:
-            book = get_canonical_book_by_name(book_name)
+            book = self.book = get_canonical_book_by_name(book_name)
             qs = (
                 Verse.objects.filter(book=book, chapter=chapter)
                 .select_related(
@@ -53,7 +87,7 @@ class VersesByChapterView(LanguageSensitiveMixin, generics.ListAPIView):
                     "version__language",  # Para language_code
                     "version__license",  # Para license info
                 )
-                .prefetch_related("book__names")
+                .prefetch_related("book__names__language")
                 .order_by("number")
             )
 
@@ -82,6 +116,7 @@ class VersesByChapterView(LanguageSensitiveMixin, generics.ListAPIView):
                 description="Filter by version ID. If not provided, uses default version for request language (optional)",
             ),
             OpenApiParameter(name="search", description="Search within verse text content (optional)"),
+            LAYOUT_COMPACT_PARAMETER,
         ],
         responses={
             200: VerseSerializer(many=True),
@@ -98,23 +133,27 @@ class VersesByChapterView(LanguageSensitiveMixin, generics.ListAPIView):
         ],
     )
     def get(self, request, *args, **kwargs):
-        # Handle book not found case before calling super()
-        qs = self.get_queryset()
-        if not qs.exists():
-            try:
-                # URL decode the book_name parameter for error handling
-                book_name = urllib.parse.unquote(self.kwargs["book_name"])
-                get_canonical_book_by_name(book_name)
-            except Http404:
-                return build_error_response(
-                    "Book not found",
-                    "not_found",
-                    status.HTTP_404_NOT_FOUND,
-                    request=request,
-                    vary_accept_language=True,
-                )
+        queryset = self.get_queryset()
+        # get_queryset() already resolved the book; an unknown book needs no extra round-trip
+        if self.book is None:
+            return build_error_response(
+                "Book not found",
+                "not_found",
+                status.HTTP_404_NOT_FOUND,
+                request=request,
+                vary_accept_language=True,
+            )
 
-        return super().get(request, *args, **kwargs)
+        self.content_cache_meta = (self.book.osis_code, self.kwargs["chapter"])
+        record_passage(*self.content_cache_meta)
+        queryset = self.filter_queryset(queryset)
+        if wants_compact_layout(request):
+            page = self.paginate_queryset(queryset.prefetch_related(None).values_list(*COMPACT_VERSE_VALUES))
+            return self.get_paginated_response(compact_verses_payload(page, self.get_serializer_context()))
+
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
 
 class VerseListView(LanguageSensitiveMixin, generics.ListAPIView):
@@ -132,7 +171,7 @@ class VerseListView(LanguageSensitiveMixin, generics.ListAPIView):
         """Queryset base com otimizações."""
         qs = Verse.objects.select_related(
             "book", "book__testament", "version", "version__language", "version__license"
-        ).prefetch_related("book__names")
+        ).prefetch_related("book__names__language")
 
         # Aplicar versão padrão se não especificada
         version_param = self.request.query_params.get("version") or self.request.query_params.get("version_code")
@@ -192,7 +231,7 @@ class VerseDetailView(LanguageSensitiveMixin, generics.RetrieveAPIView):
         """Otimizar queries com select_related."""
         return Verse.objects.select_related(
             "book", "book__testament", "version", "version__language", "version__license"
-        ).prefetch_related("book__names")
+        ).prefetch_related("book__names__language")
 
     @extend_schema(
         summary="Get verse by id",
@@ -225,7 +264,7 @@ class VersesByThemeView(LanguageSensitiveMixin, generics.ListAPIView):
         return (
             Verse.objects.filter(theme_links__theme_id=theme_id)
             .select_related("book", "book__testament", "version", "version__language", "version__license")
-            .prefetch_related("book__names")
+            .prefetch_related("book__names__language")
             .order_by("book__canonical_order", "chapter", "number")
         )
 
@@ -299,6 +338,7 @@ class VersesByReferenceView(LanguageSensitiveMixin, generics.ListAPIView):
                 name="version",
                 description="Version code (e.g., 'NVI', 'KJV') or ID. If not provided, uses default version for request language (optional)",
             ),
+            LAYOUT_COMPACT_PARAMETER,
         ],
         responses={200: VerseSerializer(many=True), **get_error_responses()},
         examples=[
@@ -352,6 +392,7 @@ class VersesByReferenceView(LanguageSensitiveMixin, generics.ListAPIView):
                 vary_accept_language=True,
             )
 
+        record_passage(book.osis_code, entry.get("chapter"), entry.get("verse_start"), entry.get("verse_end"))
         version_param = request.query_params.get("version")
         qs = Verse.objects.filter(book=book)
         if entry.get("chapter"):
@@ -363,12 +404,16 @@ class VersesByReferenceView(LanguageSensitiveMixin, generics.ListAPIView):
 
         qs = (
             qs.select_related("book", "book__testament", "version", "version__language", "version__license")
-            .prefetch_related("book__names")
+            .prefetch_related("book__names__language")
             .order_by("book__canonical_order", "chapter", "number")
         )
 
         qs = _apply_version_filter(qs, version_param, lang)
 
+        if wants_compact_layout(request):
+            rows = qs.prefetch_related(None).values_list(*COMPACT_VERSE_VALUES)
+            return Response(compact_verses_payload(rows, {"request": request}))
+
         serializer = VerseSerializer(qs, many=True)
         return Response(serializer.data)
 
@@ -391,12 +436,14 @@ class VersesRangeView(LanguageSensitiveMixin, generics.ListAPIView):
                 name="version",
                 description="Version code (e.g., 'NVI', 'KJV') or ID. If not provided, uses default version for request language (optional)",
             ),
+            LAYOUT_COMPACT_PARAMETER,
         ],
         responses={200: VerseSerializer(many=True), **get_error_responses()},
         examples=[
             OpenApiExample("Cross-chapter range", value={"ref": "Jo 1:31-2:3"}, request_only=True),
             OpenApiExample("Chapter range", value={"ref": "Jo 1-3"}, request_only=True),
             OpenApiExample("Single chapter with verses", value={"ref": "Jo 3:16-20"}, request_only=True),
+            OpenApiExample("Compact rows", value={"ref": "Jo 1-3", "layout": "compact"}, request_only=True),
         ],
     )
     def get(self, request, *args, **kwargs):
@@ -482,26 +529,131 @@ class VersesRangeView(LanguageSensitiveMixin, generics.ListAPIView):
         # Version filtering
         qs = _apply_version_filter(qs, version_param, lang)
 
-        # Safety limit: cap large ranges
-        if qs.count() > 300:
+        qs = qs.order_by("book__canonical_order", "chapter", "number")
+        if wants_compact_layout(request):
+            qs = qs.values_list(*COMPACT_VERSE_VALUES)
+        else:
+            qs = qs.select_related("book", "book__testament", "version", "version__language", "version__license")
+
+        # Safety limit: fetch one row past the cap instead of running a separate COUNT
+        rows = list(qs[: MAX_RANGE_VERSES + 1])
+        if len(rows) > MAX_RANGE_VERSES:
             return build_error_response(
-                "Range too large (max 300 verses)",
+                f"Range too large (max {MAX_RANGE_VERSES} verses)",
                 "payload_too_large",
                 status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
                 request=request,
                 vary_accept_language=True,
             )
 
-        serializer = VerseSerializer(
-            qs.select_related("book", "book__testament", "version", "version__language", "version__license")
-            .prefetch_related("book__names")
-            .order_by("book__canonical_order", "chapter", "number"),
-            many=True,
-            context={"request": request},
-        )
+        if wants_compact_layout(request):
+            return Response(compact_verses_payload(rows, {"request": request}))
+
+        prefetch_related_objects(rows, "book__names__language")
+        serializer = VerseSerializer(rows, many=True, context={"request": request})
         return Response(serializer.data)
 
 
+class VersesBatchView(LanguageSensitiveMixin, APIView):
+    @extend_schema(
+        summary="Fetch verses for many references",
+        description=(
+            "Resolve up to 100 references (single verses, ranges and cross-chapter spans) and fetch all of their "
+            "verses in one query. Verses are returned once in compact rows, in canonical order; each result lists "
+            f"the ids of its verses. Maximum {MAX_BATCH_VERSES} distinct verses per request."
+        ),
+        tags=["verses"],
+        parameters=[LANG_PARAMETER],
+        request=VersesBatchRequestSerializer,
+        responses={200: dict, **get_error_responses()},
+        examples=[
+            OpenApiExample(
+                "Reading plan",
+                value={"refs": ["Gen 1:31-2:3", "Ps 23", "John 3:16-18; Rom 8:28"], "version": "KJV"},
+                request_only=True,
+            ),
+        ],
+    )
+    def post(self, request, *args, **kwargs):
+        mark_response_language_sensitive(request)
+        payload = VersesBatchRequestSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+        refs = payload.validated_data["refs"]
+        if len(refs) > MAX_BATCH_REFS:
+            return build_error_response(
+                f"Too many references (max {MAX_BATCH_REFS})",
+                "payload_too_large",
+                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                request=request,
+                vary_accept_language=True,
+            )
+
+        lang = getattr(request, "lang_code", "en")
+        version_param = payload.validated_data.get("version")
+        version = get_version_by_ref(version_param) if version_param else get_default_version_for_lang(lang)
+        if version is None:
+            return build_error_response(
+                "Version not found", "not_found", status.HTTP_404_NOT_FOUND, request=request, vary_accept_language=True
+            )
+
+        # Resolve every reference against the cached alias registry (one lookup per distinct book string)
+        books = {}
+        results: list[dict] = []
+        spans = []
+        for ref in refs:
+            parsed = _parse_reference_string(ref)
+            if not parsed["items"]:
+                results.append({"input": ref, "error": "unparsed"})
+                continue
+            for entry in parsed["items"]:
+                if not entry.get("parsed"):
+                    results.append({"input": ref, "raw": entry["raw"], "error": "unparsed"})
+                    continue
+                book_raw = entry["book_raw"]
+                if book_raw not in books:
+                    books[book_raw] = _resolve_book(book_raw, lang)
+                book = books[book_raw]
+                if book is None:
+                    results.append({"input": ref, "raw": entry["raw"], "error": "book_not_found"})
+                    continue
+                span = span_for_entry(book.id, entry)
+                if span is None:
+                    results.append({"input": ref, "raw": entry["raw"], "error": "chapter_required"})
+                    continue
+                results.append(
+                    {
+                        "input": ref,
+                        "raw": entry["raw"],
+                        "book": book.osis_code,
+                        "chapter": span.chapter_start,
+                        "verse_start": entry.get("verse_start"),
+                        "chapter_end": span.chapter_end,
+                        "verse_end": entry.get("verse_end"),
+                        "span": len(spans),
+                    }
+                )
+                spans.append(span)
+
+        # Fetch one row past the cap instead of counting first
+        rows, members = fetch_spans(spans, version.id, MAX_BATCH_VERSES + 1)
+        if len(rows) > MAX_BATCH_VERSES:
+            return build_error_response(
+                f"Too many verses (max {MAX_BATCH_VERSES} per request)",
+                "payload_too_large",
+                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                request=request,
+                vary_accept_language=True,
+            )
+
+        for result in results:
+            if "span" in result:
+                result["verse_ids"] = members[result.pop("span")]
+
+        data = compact_verses_payload(rows, {"request": request})
+        data["results"] = results
+        return Response(data)
+
+
 class VersesCompareView(LanguageSensitiveMixin, APIView):
     permission_classes = [AllowAny]  # Public endpoint for verse comparison
 
@@ -521,6 +673,11 @@ class VersesCompareView(LanguageSensitiveMixin, APIView):
                 description="Comma-separated list of version codes or IDs (e.g., 'KJV,NVI,ARA'). Maximum 5 versions per request.",
                 required=True,
             ),
+            OpenApiParameter(
+                name="layout",
+                description="Set to 'aligned' for one row per verse with each version's text side by side, or 'compact' for flat verse rows; book and version metadata are returned once in both (optional)",
+                enum=["aligned", "compact"],
+            ),
         ],
         responses={200: VerseSerializer(many=True), **get_error_responses()},
         examples=[
@@ -530,6 +687,16 @@ class VersesCompareView(LanguageSensitiveMixin, APIView):
             OpenApiExample(
                 "Compare verse range", value={"ref": "Jo 3:16-18", "versions": "NIV,KJV"}, request_only=True
             ),
+            OpenApiExample(
+                "Aligned rows",
+                value={"ref": "Jo 3:16-18", "versions": "NIV,KJV", "layout": "aligned"},
+                request_only=True,
+            ),
+            OpenApiExample(
+                "Compact rows",
+                value={"ref": "Jo 3:16-18", "versions": "NIV,KJV", "layout": "compact"},
+                request_only=True,
+            ),
         ],
     )
     def get(self, request):
@@ -577,34 +744,62 @@ class VersesCompareView(LanguageSensitiveMixin, APIView):
                 vary_accept_language=True,
             )
 
-        # For each version, get verses
-        results = []
-        for vref in versions_list:
-            v_obj = get_version_by_ref(vref)
-            if not v_obj:
-                results.append({"version": vref, "error": "version_not_found"})
-                continue
+        resolved = get_versions_by_refs(versions_list)
+        version_ids = list(dict.fromkeys(v.id for v in resolved.values() if v))
 
-            qs = Verse.objects.filter(book=book, version=v_obj)
-            if entry.get("chapter"):
-                qs = qs.filter(chapter=entry["chapter"])
-            if entry.get("verse_start"):
-                qs = qs.filter(number__gte=entry["verse_start"])  # if only one verse, same num
-            if entry.get("verse_end"):
-                qs = qs.filter(number__lte=entry["verse_end"])  # same-chapter MVP
-            # Safety: cap per-version
-            if qs.count() > 300:
+        # One query for every requested version; rows are grouped per version below
+        qs = Verse.objects.filter(book=book, version_id__in=version_ids)
+        if entry.get("chapter"):
+            qs = qs.filter(chapter=entry["chapter"])
+        if entry.get("verse_start"):
+            qs = qs.filter(number__gte=entry["verse_start"])  # if only one verse, same num
+        if entry.get("verse_end"):
+            qs = qs.filter(number__lte=entry["verse_end"])  # same-chapter MVP
+
+        compact = wants_compact_layout(request)
+        qs = qs.order_by("chapter", "number", "version_id")
+        if compact:
+            qs = qs.values_list(*COMPACT_VERSE_VALUES)
+        else:
+            qs = qs.select_related("book", "book__testament", "version", "version__language", "version__license")
+
+        # Safety: cap per-version without a separate COUNT. With N versions, fetching
+        # N * cap + 1 rows is enough to see any version that goes over the cap.
+        rows = list(qs[: len(version_ids) * MAX_RANGE_VERSES + 1])
+        sizes = Counter(row[2] if compact else row.version_id for row in rows)
+        for v_obj in resolved.values():
+            if v_obj and sizes.get(v_obj.id, 0) > MAX_RANGE_VERSES:
                 return Response(
                     {
-                        "detail": f"Range too large for version {v_obj.code} (max 300 verses)",
+                        "detail": f"Range too large for version {v_obj.code} (max {MAX_RANGE_VERSES} verses)",
                         "code": "payload_too_large",
                     },
                     status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
                 )
+
+        if compact:
+            payload = compact_verses_payload(rows, {"request": request})
+            payload["versions"] = _requested_versions(versions_list, resolved)
+            return Response(payload)
+
+        prefetch_related_objects(rows, "book__names__language")
+
+        if request.query_params.get("layout") == "aligned":
+            return Response(_aligned_compare_payload(book, versions_list, resolved, rows, lang))
+
+        verses_by_version: dict[int, list[Verse]] = {}
+        for verse in rows:
+            verses_by_version.setdefault(verse.version_id, []).append(verse)
+
+        results = []
+        for vref in versions_list:
+            v_obj = resolved.get(vref)
+            if not v_obj:
+                results.append({"version": vref, "error": "version_not_found"})
+                continue
+
             verses = VerseSerializer(
-                qs.select_related("book", "book__testament", "version", "version__language", "version__license")
-                .prefetch_related("book__names")
-                .order_by("number"),
+                verses_by_version.get(v_obj.id, []),
                 many=True,
                 context={"request": request},
             ).data
@@ -618,3 +813,130 @@ class VersesCompareView(LanguageSensitiveMixin, APIView):
             )
 
         return Response({"results": results})
+
+
+class VersesExportView(APIView):
+    """GET /api/v1/bible/verses/export/ — stream a whole version, book or chapter span as NDJSON."""
+
+    @extend_schema(
+        summary="Stream verses in bulk (NDJSON)",
+        description="""Stream every verse of a version, optionally narrowed to a book or chapter span, as
+        newline-delimited JSON (one verse per line). Rows are read with a server-side cursor, so exports of
+        any size stream with flat memory. Responses are gzip-compressed when the client sends
+        `Accept-Encoding: gzip` and carry an ETag; send it back in `If-None-Match` to get 304 when the
+        version has not changed.""",
+        tags=["verses"],
+        parameters=[
+            OpenApiParameter(name="version", description="Version code (e.g., 'KJV') or ID", required=True),
+            OpenApiParameter(name="book", description="Book OSIS code or name to export a single book (optional)"),
+            OpenApiParameter(name="chapter_start", type=int, description="First chapter (requires book, optional)"),
+            OpenApiParameter(name="chapter_end", type=int, description="Last chapter (requires book, optional)"),
+        ],
+        responses={
+            (200, "application/x-ndjson"): {"type": "string", "format": "binary"},
+            304: None,
+            **get_error_responses(),
+        },
+        examples=[
+            OpenApiExample("Whole version", value={"version": "KJV"}, request_only=True),
+            OpenApiExample(
+                "Chapter span",
+                value={"version": "KJV", "book": "John", "chapter_start": 1, "chapter_end": 3},
+                request_only=True,
+            ),
+        ],
+    )
+    def get(self, request):
+        version = get_version_by_ref(request.query_params.get("version", "").strip())
+        if version is None:
+            return build_error_response("Version not found", "not_found", status.HTTP_404_NOT_FOUND, request=request)
+
+        book = None
+        book_raw = request.query_params.get("book", "").strip()
+        if book_raw:
+            book = _resolve_book(urllib.parse.unquote(book_raw), getattr(request, "lang_code", "en"))
+            if book is None:
+                return build_error_response("Book not found", "not_found", status.HTTP_404_NOT_FOUND, request=request)
+
+        try:
+            chapter_start, chapter_end = (
+                int(request.query_params[name]) if request.query_params.get(name) else None
+                for name in ("chapter_start", "chapter_end")
+            )
+        except ValueError:
+            return build_error_response(
+                "chapter_start and chapter_end must be integers",
+                "validation_error",
+                status.HTTP_400_BAD_REQUEST,
+                request=request,
+            )
+        if book is None and (chapter_start or chapter_end):
+            return build_error_response(
+                "Chapter span requires 'book'", "validation_error", status.HTTP_400_BAD_REQUEST, request=request
+            )
+
+        qs = export_queryset(version, book, chapter_start, chapter_end)
+        etag = export_etag(version, (getattr(book, "pk", None), chapter_start, chapter_end))
+        if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+        if etag in if_none_match or "*" in if_none_match:
+            not_modified = HttpResponseNotModified()
+            not_modified["ETag"] = etag
+            return not_modified
+
+        gzip = accepts_gzip(request.headers.get("Accept-Encoding", ""))
+        if isinstance(request._request, ASGIRequest):
+            # ASGI consumes a sync iterator with list() before sending; stream asynchronously instead
+            content = aiter_ndjson(version, qs)
+            body = acompress_sequence(content) if gzip else content
+        else:
+            content = iter_ndjson(version, qs)
+            body = compress_sequence(content) if gzip else content
+        response = StreamingHttpResponse(body, content_type="application/x-ndjson; charset=utf-8")
+        if gzip:
+            response["Content-Encoding"] = "gzip"
+        filename = "-".join(filter(None, [version.code, getattr(book, "osis_code", None)]))
+        response["Content-Disposition"] = f'attachment; filename="{filename}.ndjson"'
+        response["ETag"] = etag
+        response["Vary"] = "Accept-Encoding"
+        return response
+
+
+def _aligned_compare_payload(book, versions_list, resolved, rows, lang: str) -> dict:
+    """Parallel layout for compare: one row per verse with each version's text side by side.
+
+    Book and version metadata are emitted once instead of being nested in every verse.
+    """
+    codes = {v.id: v.code for v in resolved.values() if v}
+    aligned: dict[tuple[int, int], dict] = {}
+    for verse in rows:
+        row = aligned.setdefault(
+            (verse.chapter, verse.number), {"chapter": verse.chapter, "verse": verse.number, "texts": {}}
+        )
+        row["texts"][codes[verse.version_id]] = verse.text
+
+    return {
+        "book": {
+            "osis_code": book.osis_code,
+            "name": get_book_display_name(rows[0].book if rows else book, lang),
+        },
+        "versions": _requested_versions(versions_list, resolved),
+        "rows": list(aligned.values()),
+    }
+
+
+def _requested_versions(versions_list, resolved) -> list[dict]:
+    """Per requested version ref, in request order: its summary or a ``version_not_found`` marker."""
+    versions = []
+    for vref in versions_list:
+        v_obj = resolved.get(vref)
+        if not v_obj:
+            versions.append({"version": vref, "error": "version_not_found"})
+            continue
+        versions.append(
+            {
+                "version": v_obj.code,
+                "abbreviation": v_obj.abbreviation,
+                "language": getattr(v_obj.language, "code", None),
+            }
+        )
+    return versions
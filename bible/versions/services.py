@@ -8,8 +8,15 @@ Consolidates version lookup logic previously duplicated across:
 
 from __future__ import annotations
 
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
 from ..models import Version
 
+VERSION_REGISTRY_CACHE_KEY = "version_registry:v1"
+VERSION_REGISTRY_TTL = 60 * 30  # 30 minutes
+
 
 def get_default_version_for_lang(lang_code: str) -> Version | None:
     """Get default active version for a language with fallback strategy.
@@ -72,3 +79,45 @@ def get_version_by_ref(version_ref: str) -> Version | None:
             Version.objects.filter(code__iexact=version_ref).first()
             or Version.objects.filter(code__iendswith=f"_{version_ref}").first()
         )
+
+
+def get_version_registry() -> list[Version]:
+    """Return all versions (with language and license loaded), cached in the Django cache.
+
+    The versions table is tiny and read on almost every verse request, so it is
+    loaded once per ``VERSION_REGISTRY_TTL`` and invalidated whenever a Version
+    is saved or deleted.
+    """
+    versions = cache.get(VERSION_REGISTRY_CACHE_KEY)
+    if versions is None:
+        versions = list(Version.objects.select_related("language", "license").order_by("language_id", "code"))
+        cache.set(VERSION_REGISTRY_CACHE_KEY, versions, timeout=VERSION_REGISTRY_TTL)
+    return versions
+
+
+def get_versions_by_refs(version_refs: list[str]) -> dict[str, Version | None]:
+    """Resolve several version references at once against the cached registry.
+
+    Applies the same rules as ``get_version_by_ref`` (ID, exact code, code
+    suffix) without touching the database when the registry is warm.
+    """
+    registry = get_version_registry()
+    by_id = {v.id: v for v in registry}
+
+    resolved: dict[str, Version | None] = {}
+    for ref in version_refs:
+        try:
+            resolved[ref] = by_id.get(int(ref))
+        except (ValueError, TypeError):
+            key = str(ref).lower()
+            resolved[ref] = next((v for v in registry if v.code.lower() == key), None) or next(
+                (v for v in registry if v.code.lower().endswith(f"_{key}")), None
+            )
+    return resolved
+
+
+@receiver(post_save, sender=Version)
+@receiver(post_delete, sender=Version)
+def invalidate_version_registry(**kwargs) -> None:
+    """Drop the cached registry whenever a version changes."""
+    cache.delete(VERSION_REGISTRY_CACHE_KEY)
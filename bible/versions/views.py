@@ -18,7 +18,7 @@ class VersionListView(generics.ListAPIView):
     permission_classes = [AllowAny]  # Public endpoint for development
 
     def get_queryset(self):
-        qs = Version.objects.all().order_by("name")
+        qs = Version.objects.select_related("language").order_by("name")
         language = self.request.query_params.get("language")
         if language:
             try:
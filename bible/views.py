@@ -2,6 +2,7 @@
 Bible API views.
 """
 
+from django.conf import settings
 from django.core.cache import cache
 from django.db import DatabaseError, OperationalError, connections
 from django.http import HttpResponse
@@ -10,6 +11,8 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from common import warm_start
+
 
 class BibleOverviewAPIView(APIView):
     """
@@ -59,18 +62,25 @@ class BibleOverviewAPIView(APIView):
 
 
 class ReadinessCheckView(APIView):
-    """Readiness probe: checks DB and cache connectivity."""
+    """Readiness probe: checks DB and cache connectivity and reports this worker's warm-start state."""
 
     authentication_classes = []
     permission_classes = []
 
     @extend_schema(
         summary="Readiness check",
-        description="Returns 200 when DB and cache are reachable; otherwise 503 with details.",
+        description=(
+            "Returns 200 when DB and cache are reachable (and, with WARM_START_REQUIRED, the worker's "
+            "in-process caches are warm); otherwise 503 with details."
+        ),
         responses={
             200: {
                 "type": "object",
-                "properties": {"status": {"type": "string"}, "checks": {"type": "object"}},
+                "properties": {
+                    "status": {"type": "string"},
+                    "checks": {"type": "object"},
+                    "warm_start": {"type": "object"},
+                },
             },
             503: {
                 "type": "object",
@@ -98,11 +108,17 @@ class ReadinessCheckView(APIView):
         except (ConnectionError, TimeoutError, OSError):
             cache_ok = False
 
+        # Warm-start state of the worker answering the probe
+        warm = warm_start.status()
+        warm_ok = warm["state"] == warm_start.WARM or not settings.WARM_START_REQUIRED
+
         checks["database"] = db_ok
         checks["cache"] = cache_ok
-        status_code = status.HTTP_200_OK if (db_ok and cache_ok) else status.HTTP_503_SERVICE_UNAVAILABLE
+        checks["warm"] = warm["state"] == warm_start.WARM
+        ready = db_ok and cache_ok and warm_ok
+        status_code = status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE
         return Response(
-            {"status": "ready" if status_code == 200 else "not_ready", "checks": checks}, status=status_code
+            {"status": "ready" if ready else "not_ready", "checks": checks, "warm_start": warm}, status=status_code
         )
 
 
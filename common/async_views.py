@@ -0,0 +1,60 @@
+"""
+Async-capable DRF views for ASGI deployments.
+
+DRF dispatches synchronously, so an ``async def`` handler on a plain
+``APIView`` would return an unawaited coroutine. ``AsyncAPIView`` runs
+authentication, permissions and throttling in a thread (they may query the
+database), then awaits the handler on the event loop, so a request waiting on
+OpenAI or Postgres holds no worker thread. Under WSGI and in the test client,
+Django runs the view through ``async_to_sync`` like any other async view.
+"""
+
+import inspect
+
+from asgiref.sync import markcoroutinefunction, sync_to_async
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    ``APIView`` with ``async def`` handlers.
+
+    Usage:
+        class MyView(AsyncAPIView):
+            async def get(self, request):
+                result = await some_io()
+                return Response(result)
+
+    Exception handling, content negotiation and ``finalize_response`` behave
+    as in ``APIView``.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # DRF wraps the view in csrf_exempt's plain function; mark it again so Django awaits it
+        return markcoroutinefunction(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
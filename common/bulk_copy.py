@@ -0,0 +1,88 @@
+"""
+PostgreSQL ``COPY FROM STDIN`` helpers for bulk loaders.
+
+Rows are serialized in COPY text format into a bounded in-memory buffer and
+flushed every ``chunk_size`` rows, so arbitrarily long row iterators stream
+through with flat memory. Loaders typically copy into a temporary staging
+table and merge into the real table with one set-based statement.
+"""
+
+import io
+
+from django.db import connection
+from django.db.models import DateTimeField
+from django.utils import timezone
+
+# Rows buffered per COPY round-trip
+COPY_CHUNK_SIZE = 10_000
+
+_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def copy_supported() -> bool:
+    """Whether the default connection can stream ``COPY FROM STDIN``."""
+    return connection.vendor == "postgresql"
+
+
+def copy_value(value) -> str:
+    """Serialize one value in COPY text format (``\\N`` for NULL)."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return str(value).translate(_ESCAPES)
+
+
+def column_defaults(model, exclude=()) -> tuple[list[str], list]:
+    """Columns and DB-ready values for every concrete field of ``model`` not in ``exclude``.
+
+    Used to fill the columns a staging table does not carry when merging with
+    ``INSERT ... SELECT``: model defaults, ``now()`` for auto timestamps, ``''`` for
+    blank text and NULL for nullable fields.
+    """
+    columns, values = [], []
+    now = timezone.now()
+    for field in model._meta.concrete_fields:
+        if field.primary_key or field.column in exclude:
+            continue
+        if isinstance(field, DateTimeField) and (field.auto_now or field.auto_now_add):
+            value = now
+        elif field.has_default():
+            value = field.get_default()
+        elif field.null:
+            value = None
+        elif field.blank and field.get_internal_type() in ("CharField", "TextField", "URLField", "SlugField"):
+            value = ""
+        else:
+            raise ValueError(f"{model.__name__}.{field.name} needs a staged value")
+        columns.append(field.column)
+        values.append(field.get_db_prep_save(value, connection))
+    return columns, values
+
+
+def copy_rows(cursor, table: str, columns, rows, chunk_size: int = COPY_CHUNK_SIZE) -> int:
+    """Stream ``rows`` (tuples matching ``columns``) into ``table`` with COPY; returns the number of rows sent."""
+    quote = connection.ops.quote_name
+    sql = f"COPY {quote(table)} ({', '.join(quote(c) for c in columns)}) FROM STDIN"
+    raw = getattr(cursor, "cursor", cursor)
+    buffer = io.StringIO()
+    pending = total = 0
+
+    def flush():
+        buffer.seek(0)
+        raw.copy_expert(sql, buffer)
+        buffer.seek(0)
+        buffer.truncate()
+
+    for row in rows:
+        buffer.write("\t".join(copy_value(value) for value in row))
+        buffer.write("\n")
+        pending += 1
+        if pending >= chunk_size:
+            flush()
+            total += pending
+            pending = 0
+    if pending:
+        flush()
+        total += pending
+    return total
@@ -0,0 +1,258 @@
+"""Content-versioned HTTP caching for read endpoints over rarely-changing data.
+
+Each dataset (``verses``, ``books``, ``crossrefs``, ``themes``, ``topics``,
+``entities``, ``symbols``, ``commentaries``) has a generation counter in the
+shared cache. Saving or deleting one of its models bumps it, and so do the bulk
+importers (``manage.py bible ...``), which bypass model signals.
+
+A view using ``ContentCacheMixin`` derives a strong ETag from the request (URL
+with sorted query string, ``Accept-Language``, negotiated format) and the
+current generations of the datasets it reads. After authentication:
+
+- ``If-None-Match`` carrying the current tag is answered 304 without running
+  the view;
+- otherwise a rendered response stored under ``content:<tag>`` is replayed, or
+  the view runs and its 200 response is stored there.
+
+Bumping a generation changes every tag that depends on it, so invalidation is
+a single ``INCR``; superseded entries are never read again and age out. With
+read replicas, a bump also marks the dataset as recently written for as long as
+a replica may lag (``common.db.replicas.catch_up_seconds``); meanwhile misses
+over it read from the primary, so pre-write rows never land under the new tag.
+"""
+
+import hashlib
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+from rest_framework.response import Response
+
+from bible.commentaries.models import Author, CommentaryEntry
+from bible.entities.models import CanonicalEntity, EntityAlias, EntityVerseLink
+from bible.models import (
+    BookName,
+    CanonicalBook,
+    CrossReference,
+    Theme,
+    Topic,
+    TopicName,
+    TopicVerse,
+    Verse,
+    VerseTheme,
+    Version,
+)
+from bible.symbols.models import BiblicalSymbol, SymbolOccurrence
+from common.db.replicas import catch_up_seconds, replicas_enabled, use_primary
+
+DATASETS = ("verses", "books", "crossrefs", "themes", "topics", "entities", "symbols", "commentaries")
+
+GENERATION_KEY = "content-gen:{}"
+RESPONSE_KEY = "content:{}"
+WRITTEN_KEY = "content-written:{}"
+
+# Models whose single-row writes (admin, API) invalidate a dataset
+DATASET_MODELS = {
+    "verses": (Verse, Version),
+    "books": (CanonicalBook, BookName),
+    "crossrefs": (CrossReference,),
+    "themes": (Theme, VerseTheme),
+    "topics": (Topic, TopicName, TopicVerse),
+    "entities": (CanonicalEntity, EntityAlias, EntityVerseLink),
+    "symbols": (BiblicalSymbol, SymbolOccurrence),
+    "commentaries": (Author, CommentaryEntry),
+}
+
+
+def content_cache_enabled() -> bool:
+    return getattr(settings, "CONTENT_CACHE_ENABLED", True)
+
+
+def _seed() -> int:
+    # Counters start from the clock, so a flushed cache never hands out an old tag again
+    return time.time_ns() // 1_000_000
+
+
+def _validate(datasets) -> None:
+    unknown = set(datasets) - set(DATASETS)
+    if unknown:
+        raise ValueError(f"Unknown content dataset(s): {', '.join(sorted(unknown))}")
+
+
+def get_generations(datasets) -> dict[str, int]:
+    """Current generation of each dataset (one cache round-trip when all are set)."""
+    keys = {GENERATION_KEY.format(dataset): dataset for dataset in datasets}
+    found = cache.get_many(list(keys))
+    generations = {}
+    for key, dataset in keys.items():
+        value = found.get(key)
+        if value is None:
+            cache.add(key, _seed(), timeout=None)
+            value = cache.get(key)
+        generations[dataset] = int(value)
+    return generations
+
+
+def bump_generation(*datasets: str) -> None:
+    """Invalidate every cached response of ``datasets`` (default: all)."""
+    datasets = datasets or DATASETS
+    _validate(datasets)
+    for dataset in datasets:
+        key = GENERATION_KEY.format(dataset)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, _seed(), timeout=None)
+
+    window = catch_up_seconds()
+    if window:
+        marks = dict.fromkeys((WRITTEN_KEY.format(dataset) for dataset in datasets), 1)
+        cache.set_many(marks, timeout=math.ceil(window))
+        if transaction.get_connection().in_atomic_block:
+            # Replicas only start replaying the write once it commits
+            transaction.on_commit(lambda: cache.set_many(marks, timeout=math.ceil(window)))
+
+
+def prefer_primary_after_writes(datasets) -> None:
+    """Read from the primary for the rest of the request if ``datasets`` changed within the replica lag window."""
+    if replicas_enabled() and cache.get_many([WRITTEN_KEY.format(dataset) for dataset in datasets]):
+        use_primary()
+
+
+def content_etag(request, datasets, scope: str = "") -> str:
+    """Strong ETag of a GET request over ``datasets`` at their current generations."""
+    generations = get_generations(datasets)
+    query = "&".join(sorted(request.META.get("QUERY_STRING", "").split("&")))
+    renderer = getattr(request, "accepted_renderer", None)
+    raw = "|".join(
+        [
+            scope,
+            request.scheme,
+            request.get_host(),
+            request.path,
+            query,
+            request.META.get("HTTP_ACCEPT_LANGUAGE", "").strip().lower(),
+            getattr(renderer, "format", "") or "",
+            *(f"{dataset}={generations[dataset]}" for dataset in sorted(generations)),
+        ]
+    )
+    return f'"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+
+class _CachedResponse(Exception):
+    """Short-circuits ``APIView.dispatch`` from ``initial`` with a ready response."""
+
+    def __init__(self, response):
+        super().__init__()
+        self.response = response
+
+
+class ContentCacheMixin:
+    """
+    Serve GETs from the content-versioned cache.
+
+    Usage:
+        class MyView(ContentCacheMixin, LanguageSensitiveMixin, APIView):
+            content_datasets = ("verses", "books")
+
+    Authentication, permissions and throttling still run first; only the view
+    body is skipped on a 304 or a stored response. Only 200 responses are
+    stored. Responses carry ``ETag``, ``Cache-Control: private, max-age=...``
+    and ``X-Content-Cache: hit|miss|revalidated|bypass``.
+
+    Side effects the body would have had on every request (e.g. popularity
+    counters) go in ``content_cache_hit(request, meta)``: ``meta`` is whatever
+    the body stored in ``self.content_cache_meta`` on the miss, kept with the
+    response.
+
+    A body that knows it answered from data older than the current generations
+    (e.g. an in-memory index still rebuilding) sets ``self.content_cache_store``
+    to False: the response is sent without ETag and nothing is stored.
+
+    Under read replicas, a miss over a dataset written in the last
+    ``catch_up_seconds()`` runs its body on the primary.
+    """
+
+    content_datasets: tuple[str, ...] = ()
+    content_cache_hit = None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.content_etag = None
+        if request.method != "GET" or not self.content_datasets or not content_cache_enabled():
+            return
+
+        view = f"{type(self).__module__}.{type(self).__qualname__}"
+        etag = self.content_etag = content_etag(request, self.content_datasets, scope=view)
+        self.content_cache_meta = None
+        self.content_cache_store = True
+        revalidated = etag in parse_etags(request.headers.get("If-None-Match", ""))
+        # A 304 only needs the stored entry when the view replays side effects from it
+        stored = None
+        if not revalidated or self.content_cache_hit is not None:
+            stored = cache.get(RESPONSE_KEY.format(etag.strip('"')))
+        if revalidated:
+            response = HttpResponseNotModified()
+            response["X-Content-Cache"] = "revalidated"
+        elif stored is not None:
+            response = HttpResponse(stored[0], content_type=stored[1])
+            response["X-Content-Cache"] = "hit"
+        else:
+            prefer_primary_after_writes(self.content_datasets)
+            return
+
+        if self.content_cache_hit is not None:
+            # Entries stored before meta was kept are (content, content_type)
+            self.content_cache_hit(request, stored[2] if stored is not None and len(stored) > 2 else None)
+        raise _CachedResponse(response)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, _CachedResponse):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        etag = getattr(self, "content_etag", None)
+        if etag is None or response.status_code not in (200, 304):
+            return response
+        if not getattr(self, "content_cache_store", True):
+            response["X-Content-Cache"] = "bypass"
+            return response
+
+        if isinstance(response, Response):
+            response.render()
+            cache.set(
+                RESPONSE_KEY.format(etag.strip('"')),
+                (response.content, response["Content-Type"], getattr(self, "content_cache_meta", None)),
+                timeout=getattr(settings, "CONTENT_CACHE_TIMEOUT", 86400),
+            )
+            response["X-Content-Cache"] = "miss"
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, max_age=getattr(settings, "CONTENT_CACHE_MAX_AGE", 86400))
+        return response
+
+
+def _bump_on_write(dataset: str):
+    def receiver(**kwargs) -> None:
+        bump_generation(dataset)
+
+    return receiver
+
+
+_RECEIVERS = {dataset: _bump_on_write(dataset) for dataset in DATASETS}
+
+for _dataset, _models in DATASET_MODELS.items():
+    for _model in _models:
+        post_save.connect(
+            _RECEIVERS[_dataset], sender=_model, dispatch_uid=f"content-gen-{_dataset}-save-{_model.__name__}"
+        )
+        post_delete.connect(
+            _RECEIVERS[_dataset], sender=_model, dispatch_uid=f"content-gen-{_dataset}-delete-{_model.__name__}"
+        )
@@ -9,17 +9,24 @@ import json
 import logging
 import re
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
+import django
 from django.core.exceptions import FieldError
-from django.db import transaction
+from django.db import connection, connections, transaction
 
+from bible.crossrefs.ingest import ingest_cross_references
 from bible.models import CanonicalBook, CrossReference, Language, License, Testament, Verse, Version
+from common.bulk_copy import copy_rows
 
 logger = logging.getLogger(__name__)
 
+VERSE_STAGING_TABLE = "verse_load_staging"
+VERSE_STAGING_COLUMNS = ("ord", "book_id", "chapter", "number", "text")
+
 
 @dataclass
 class ProcessingResult:
@@ -143,6 +150,7 @@ class BibleDataEngine:
         self.data_dir = Path(data_dir)
         self.processed_dir = self.data_dir / "processed" / "bibles" / "canonical"
         self.external_dir = self.data_dir / "external" / "multilingual-collection" / "raw"
+        self._book_ids: dict[str, int] = {}
 
     def detect_language(self, filename: str) -> str:
         """Simple language detection from filename."""
@@ -233,7 +241,12 @@ class BibleDataEngine:
 
     @transaction.atomic
     def populate_version(self, version_file: Path, language_code: str, version_code: str) -> ProcessingResult:
-        """Populate single Bible version into database."""
+        """Populate single Bible version into database.
+
+        Verses are streamed as row tuples through ``COPY`` into a staging table and
+        applied to ``verses`` as one set-based diff (delete missing, update changed
+        text, insert new), so re-populating keeps verse ids and everything linked to them.
+        """
         try:
             with open(version_file, encoding="utf-8") as f:
                 bible_data = json.load(f)
@@ -241,128 +254,135 @@ class BibleDataEngine:
             if not self.validate_bible_json(bible_data):
                 return ProcessingResult(success=False, error_message="Invalid JSON structure")
 
-            # Ensure language exists
-            language, _ = Language.objects.get_or_create(
-                code=language_code, defaults={"name": self._get_language_name(language_code)}
-            )
-
-            # Ensure license exists
-            license_obj, _ = License.objects.get_or_create(code="PD", defaults={"name": "Public Domain"})
-
-            # Get version name from data
-            if isinstance(bible_data, dict):
-                version_name = bible_data.get("name", bible_data.get("translation", version_code.upper()))
-            else:
-                version_name = version_code.upper()
+            with transaction.atomic():
+                # Ensure language exists
+                language, _ = Language.objects.get_or_create(
+                    code=language_code, defaults={"name": self._get_language_name(language_code)}
+                )
 
-            # Create version
-            version, created = Version.objects.get_or_create(
-                code=version_code.upper(), defaults={"name": version_name, "language": language, "license": license_obj}
-            )
+                # Ensure license exists
+                license_obj, _ = License.objects.get_or_create(code="PD", defaults={"name": "Public Domain"})
 
-            if not created:
-                # Clear existing verses
-                Verse.objects.filter(version=version).delete()
+                # Get version name from data
+                if isinstance(bible_data, dict):
+                    version_name = bible_data.get("name", bible_data.get("translation", version_code.upper()))
+                else:
+                    version_name = version_code.upper()
 
-            # Process books and verses - handle both formats
-            verses_created = 0
-            verse_batch = []
+                version, _ = Version.objects.get_or_create(
+                    code=version_code.upper(),
+                    defaults={"name": version_name, "language": language, "license": license_obj},
+                )
 
-            # Determine format and extract books
-            if isinstance(bible_data, list):
-                # Format 1: List of books (Portuguese format)
-                books_data = bible_data
-            else:
-                # Format 2: Dict with books array (Standard format)
-                books_data = bible_data["books"]
-
-            for book_data in books_data:
-                # Handle different book name fields
-                if "abbrev" in book_data:
-                    # Portuguese format uses abbreviation
-                    book_name = book_data["abbrev"]
-                elif "name" in book_data:
-                    # Standard format uses name
-                    book_name = book_data["name"]
-                else:
-                    logger.warning("Book missing name/abbreviation")
-                    continue
+                # Format 1 (Portuguese) is a list of books; format 2 has a "books" array
+                books_data = bible_data if isinstance(bible_data, list) else bible_data["books"]
+                del bible_data
 
-                if book_name not in self.BOOK_MAPPING:
-                    logger.warning(f"Unknown book: {book_name}")
-                    continue
+                stats = self._swap_version_verses(version, self._iter_verse_rows(books_data))
 
-                book_info = self.BOOK_MAPPING[book_name]
-                canonical_book = self._ensure_canonical_book(book_info)
-
-                for chapter_num, chapter_data in enumerate(book_data["chapters"], 1):
-                    # Handle different chapter formats
-                    if isinstance(chapter_data, list):
-                        # Format 1: Chapter is array of verse strings
-                        for verse_num, verse_text in enumerate(chapter_data, 1):
-                            verse_text = verse_text.strip()
-                            if not verse_text:
-                                continue
-
-                            verse_batch.append(
-                                Verse(
-                                    book=canonical_book,
-                                    version=version,
-                                    chapter=chapter_num,
-                                    number=verse_num,
-                                    text=verse_text,
-                                )
-                            )
-                            verses_created += 1
-                    else:
-                        # Format 2: Chapter is dict with verses array
-                        verses_array = chapter_data.get("verses", []) if isinstance(chapter_data, dict) else []
-                        for verse_data in verses_array:
-                            if isinstance(verse_data, dict):
-                                verse_text = verse_data.get("text", "").strip()
-                                verse_num = verse_data.get("verse", len(verse_batch) + 1)
-                            else:
-                                # Fallback: treat as string
-                                verse_text = str(verse_data).strip()
-                                verse_num = len(verse_batch) + 1
-
-                            if not verse_text:
-                                continue
-
-                            verse_batch.append(
-                                Verse(
-                                    book=canonical_book,
-                                    version=version,
-                                    chapter=chapter_num,
-                                    number=verse_num,
-                                    text=verse_text,
-                                )
-                            )
-                            verses_created += 1
-
-                    # Batch insert every 1000 verses
-                    if len(verse_batch) >= 1000:
-                        Verse.objects.bulk_create(verse_batch)
-                        verse_batch = []
-
-            # Insert remaining verses
-            if verse_batch:
-                Verse.objects.bulk_create(verse_batch)
-
-            logger.info(f"Successfully populated {version_code} with {verses_created} verses")
+            verses_created = stats["staged"]
+            logger.info(
+                f"Successfully populated {version_code} with {verses_created} verses "
+                f"({stats['inserted']} new, {stats['updated']} changed, {stats['deleted']} removed)"
+            )
 
             return ProcessingResult(
                 success=True,
                 items_processed=verses_created,
-                details={"version": version_code, "verses": verses_created},
+                details={"version": version_code, "verses": verses_created, **stats},
             )
 
         except Exception as e:
             logger.error(f"Error populating {version_code}: {e}")
             return ProcessingResult(success=False, error_message=str(e))
 
-    def populate_all(self, language_filter: list[str] | None = None) -> ProcessingResult:
-        """Populate all processed Bible versions."""
+    def _iter_verse_rows(self, books_data: list):
+        """Yield ``(ord, book_id, chapter, number, text)`` rows for both JSON layouts."""
+        ordinal = 0
+        for book_data in books_data:
+            # Portuguese format uses abbreviation, standard format uses name
+            book_name = book_data.get("abbrev", book_data.get("name"))
+            if book_name is None:
+                logger.warning("Book missing name/abbreviation")
+                continue
+
+            book_info = self.BOOK_MAPPING.get(book_name)
+            if not book_info:
+                logger.warning(f"Unknown book: {book_name}")
+                continue
+            book_id = self._canonical_book_id(book_info)
+
+            for chapter_num, chapter_data in enumerate(book_data["chapters"], 1):
+                if isinstance(chapter_data, list):
+                    # Format 1: Chapter is array of verse strings
+                    verses = enumerate(chapter_data, 1)
+                else:
+                    # Format 2: Chapter is dict with verses array
+                    verses_array = chapter_data.get("verses", []) if isinstance(chapter_data, dict) else []
+                    verses = (
+                        (verse.get("verse", position), verse.get("text", ""))
+                        if isinstance(verse, dict)
+                        else (position, str(verse))
+                        for position, verse in enumerate(verses_array, 1)
+                    )
+
+                for verse_num, verse_text in verses:
+                    verse_text = verse_text.strip()
+                    if verse_text:
+                        yield ordinal, book_id, chapter_num, verse_num, verse_text
+                        ordinal += 1
+
+    def _canonical_book_id(self, book_info: dict) -> int:
+        """CanonicalBook id for a BOOK_MAPPING entry, creating the book on first use."""
+        osis = book_info["osis"]
+        if osis not in self._book_ids:
+            self._book_ids[osis] = self._ensure_canonical_book(book_info).id
+        return self._book_ids[osis]
+
+    def _swap_version_verses(self, version: Version, rows) -> dict[str, int]:
+        """COPY ``rows`` into a staging table and apply them to ``version``'s verses in one transaction."""
+        table = Verse._meta.db_table
+        match = "s.book_id = v.book_id AND s.chapter = v.chapter AND s.number = v.number"
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMP TABLE {VERSE_STAGING_TABLE} "
+                "(ord bigint, book_id bigint, chapter integer, number integer, text text) ON COMMIT DROP"
+            )
+            staged = copy_rows(cursor, VERSE_STAGING_TABLE, VERSE_STAGING_COLUMNS, rows)
+
+            cursor.execute(
+                f"DELETE FROM {table} v WHERE v.version_id = %s "
+                f"AND NOT EXISTS (SELECT 1 FROM {VERSE_STAGING_TABLE} s WHERE {match})",
+                [version.pk],
+            )
+            deleted = cursor.rowcount
+            cursor.execute(
+                f"UPDATE {table} v SET text = s.text, updated_at = now() FROM ("
+                f"SELECT DISTINCT ON (book_id, chapter, number) * FROM {VERSE_STAGING_TABLE} "
+                "ORDER BY book_id, chapter, number, ord"
+                f") s WHERE v.version_id = %s AND {match} AND v.text IS DISTINCT FROM s.text",
+                [version.pk],
+            )
+            updated = cursor.rowcount
+            cursor.execute(
+                f"INSERT INTO {table} (book_id, version_id, chapter, number, text, created_at, updated_at) "
+                "SELECT DISTINCT ON (book_id, chapter, number) book_id, %s, chapter, number, text, now(), now() "
+                f"FROM {VERSE_STAGING_TABLE} ORDER BY book_id, chapter, number, ord "
+                "ON CONFLICT DO NOTHING",
+                [version.pk],
+            )
+            inserted = cursor.rowcount
+            cursor.execute(f"DROP TABLE {VERSE_STAGING_TABLE}")
+
+        return {"staged": staged, "inserted": inserted, "updated": updated, "deleted": deleted}
+
+    def populate_all(self, language_filter: list[str] | None = None, workers: int = 1) -> ProcessingResult:
+        """Populate all processed Bible versions.
+
+        ``workers > 1`` loads versions in parallel processes (one DB connection each).
+        On an initial load into an empty ``verses`` table, secondary indexes are
+        dropped up front and rebuilt once at the end instead of per row.
+        """
         if not self.processed_dir.exists():
             return ProcessingResult(success=False, error_message="No processed data directory found")
 
@@ -370,6 +390,7 @@ class BibleDataEngine:
         total_verses = 0
         failed_versions = []
 
+        jobs = []
         for lang_dir in self.processed_dir.iterdir():
             if not lang_dir.is_dir():
                 continue
@@ -389,13 +410,24 @@ class BibleDataEngine:
                 version_file = version_dir / f"{version_code}.json"
 
                 if version_file.exists():
-                    result = self.populate_version(version_file, mapped_lang, version_code)
-                    total_versions += 1
+                    jobs.append((version_file, mapped_lang, version_code))
+
+        deferred_indexes = self._drop_verse_indexes() if jobs and not Verse.objects.exists() else []
+        try:
+            if workers > 1 and len(jobs) > 1:
+                results = self._populate_versions_parallel(jobs, workers)
+            else:
+                results = (self.populate_version(*job) for job in jobs)
+
+            for (_file, _lang, version_code), result in zip(jobs, results, strict=True):
+                total_versions += 1
 
-                    if result.success:
-                        total_verses += result.items_processed
-                    else:
-                        failed_versions.append((version_code, result.error_message))
+                if result.success:
+                    total_verses += result.items_processed
+                else:
+                    failed_versions.append((version_code, result.error_message))
+        finally:
+            self._restore_verse_indexes(deferred_indexes)
 
         # Also populate commentaries with multilingual support
         commentary_result = self.populate_commentaries(language_filter or ["pt-BR", "en-US"])
@@ -413,50 +445,58 @@ class BibleDataEngine:
             },
         )
 
-    def populate_cross_references(self, crossref_file: str = "data/external/cross-references.txt") -> ProcessingResult:
-        """Populate cross references from external file."""
+    def _populate_versions_parallel(self, jobs: list[tuple], workers: int) -> list[ProcessingResult]:
+        """Run populate_version for each job in a process pool."""
+        # Rows every version shares are created here so workers never race on them
+        License.objects.get_or_create(code="PD", defaults={"name": "Public Domain"})
+        for language_code in {job[1] for job in jobs}:
+            Language.objects.get_or_create(
+                code=language_code, defaults={"name": self._get_language_name(language_code)}
+            )
+        for book_info in self.BOOK_MAPPING.values():
+            self._canonical_book_id(book_info)
+
+        # Forked workers must not share the parent's socket
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as pool:
+            return list(pool.map(_populate_version_job, [(str(self.data_dir), *job) for job in jobs]))
+
+    def _drop_verse_indexes(self) -> list:
+        """Drop the secondary ``verses`` indexes for a bulk initial load; returns what to restore."""
+        indexes = list(Verse._meta.indexes)
+        with connection.schema_editor() as editor:
+            for index in indexes:
+                editor.remove_index(Verse, index)
+        logger.info(f"Deferred {len(indexes)} verse indexes until the load finishes")
+        return indexes
+
+    def _restore_verse_indexes(self, indexes: list):
+        if not indexes:
+            return
+        with connection.schema_editor() as editor:
+            for index in indexes:
+                editor.add_index(Verse, index)
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Verse._meta.db_table}")
+
+    def populate_cross_references(
+        self, crossref_file: str = "data/external/cross-references.txt", source: str = "openbible", min_votes: int = 0
+    ) -> ProcessingResult:
+        """Stream cross references from an OpenBible/TSK export (see ``bible.crossrefs.ingest``)."""
         crossref_path = Path(crossref_file)
         if not crossref_path.exists():
             return ProcessingResult(success=False, error_message=f"Cross reference file not found: {crossref_file}")
 
-        created_count = 0
-        crossref_batch = []
-
-        with open(crossref_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-
-                # Parse cross reference line (simplified)
-                parts = line.split("\t")
-                if len(parts) < 4:
-                    continue
-
-                try:
-                    from_ref, to_ref, weight = parts[0], parts[1], float(parts[2])
-
-                    # Find verses (simplified - assumes verses exist)
-                    from_verse = self._find_verse(from_ref)
-                    to_verse = self._find_verse(to_ref)
-
-                    if from_verse and to_verse:
-                        crossref_batch.append(CrossReference(from_verse=from_verse, to_verse=to_verse, weight=weight))
-                        created_count += 1
-
-                        if len(crossref_batch) >= 1000:
-                            CrossReference.objects.bulk_create(crossref_batch, ignore_conflicts=True)
-                            crossref_batch = []
-
-                except (ValueError, IndexError):
-                    continue
-
-        # Insert remaining cross references
-        if crossref_batch:
-            CrossReference.objects.bulk_create(crossref_batch, ignore_conflicts=True)
+        try:
+            stats = ingest_cross_references(crossref_path, source=source, min_votes=min_votes)
+        except Exception as e:
+            logger.error(f"Cross reference import failed: {e}")
+            return ProcessingResult(success=False, error_message=str(e))
 
         return ProcessingResult(
-            success=True, items_processed=created_count, details={"cross_references": created_count}
+            success=True,
+            items_processed=stats.created,
+            details={"cross_references": stats.created, **stats.as_dict()},
         )
 
     def get_status(self) -> dict[str, Any]:
@@ -753,8 +793,8 @@ class BibleDataEngine:
 
         return book
 
-    def _find_verse(self, verse_ref: str) -> Verse | None:
-        """Find verse from reference string (simplified)."""
-        # This would need proper parsing logic
-        # For now, return None to avoid errors
-        return None
+
+def _populate_version_job(job: tuple) -> ProcessingResult:
+    """Process-pool entry point for ``BibleDataEngine.populate_all(workers=...)``."""
+    data_dir, version_file, language_code, version_code = job
+    return BibleDataEngine(data_dir).populate_version(Path(version_file), language_code, version_code)
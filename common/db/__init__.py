@@ -0,0 +1,32 @@
+"""
+Database access layer: pooled connections, query routes and statement timeouts.
+
+``common.db.backends.postgresql`` is the Django engine; ``common.db.pool``
+holds the pools; ``common.db.routing`` picks the pool and timeout per route.
+"""
+
+from .pool import PoolTimeout, close_pools, pool_stats
+from .routing import (
+    ROUTE_OLTP,
+    ROUTE_SEARCH,
+    execute_prepared,
+    is_statement_timeout,
+    route_alias,
+    route_cursor,
+    statement_timeout,
+    to_numbered_placeholders,
+)
+
+__all__ = [
+    "ROUTE_OLTP",
+    "ROUTE_SEARCH",
+    "PoolTimeout",
+    "close_pools",
+    "execute_prepared",
+    "is_statement_timeout",
+    "pool_stats",
+    "route_alias",
+    "route_cursor",
+    "statement_timeout",
+    "to_numbered_placeholders",
+]
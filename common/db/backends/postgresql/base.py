@@ -0,0 +1,56 @@
+"""
+PostgreSQL backend with connection pooling and route statement timeouts.
+
+Extends django-prometheus' instrumented backend. With ``POOL`` in the
+database settings, connections are leased from ``common.db.pool`` and
+returned to it on ``close()``; without it the backend behaves like the
+parent. Every connection runs ``common.db.routing.apply_statement_timeout``.
+
+    DATABASES["default"] = {
+        "ENGINE": "common.db.backends.postgresql",
+        "POOL": {"max_size": 10, "timeout": 5, "max_lifetime": 1800},
+        ...
+    }
+"""
+
+import functools
+
+from django.db.backends.postgresql.creation import DatabaseCreation as PostgresDatabaseCreation
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+from django_prometheus.db.backends.postgresql.base import DatabaseWrapper as PrometheusDatabaseWrapper
+
+from common.db.pool import close_pools, get_pool
+from common.db.routing import apply_statement_timeout
+
+
+class DatabaseCreation(PostgresDatabaseCreation):
+    def destroy_test_db(self, *args, **kwargs):
+        # Idle pooled connections to the test database would block DROP DATABASE
+        close_pools()
+        return super().destroy_test_db(*args, **kwargs)
+
+
+class DatabaseWrapper(PrometheusDatabaseWrapper):
+    creation_class = DatabaseCreation
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.execute_wrappers.append(apply_statement_timeout)
+        self._pool = None
+
+    def get_new_connection(self, conn_params):
+        options = self.settings_dict.get("POOL")
+        if not options:
+            return super().get_new_connection(conn_params)
+        self._pool = get_pool(self.alias, conn_params, options)
+        # The parent sets isolation_level while connecting; a reused connection still needs it
+        self.isolation_level = IsolationLevel(
+            self.settings_dict["OPTIONS"].get("isolation_level", IsolationLevel.READ_COMMITTED)
+        )
+        return self._pool.getconn(functools.partial(super().get_new_connection, conn_params))
+
+    def _close(self):
+        if self.connection is None or self._pool is None:
+            return super()._close()
+        with self.wrap_database_errors:
+            self._pool.putconn(self.connection)
@@ -0,0 +1,217 @@
+"""
+Bounded psycopg2 connection pool behind the ``common.db`` database backend.
+
+Django opens a connection per thread and, with ``CONN_MAX_AGE=0``, closes it at
+the end of every request. With the pooled backend ``close()`` hands the raw
+connection back here instead, so the next request (on any thread) skips the
+TCP/auth handshake and the server never sees more than ``max_size``
+connections per pool and process. When every connection is leased, callers
+wait up to ``timeout`` seconds and then fail with ``PoolTimeout`` instead of
+piling more connections onto Postgres.
+
+Each database alias gets its own pool (``default`` for OLTP reads, ``search``
+for vector/BM25 queries), so a burst of slow searches cannot starve cheap
+lookups of connections. Occupancy, waiters, wait time and timeouts are
+exported to Prometheus per alias.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from django.db.utils import OperationalError
+from psycopg2 import extensions
+
+from common.observability.metrics import DB_POOL_CONNECTIONS, DB_POOL_TIMEOUTS, DB_POOL_WAIT, DB_POOL_WAITING
+
+# Per raw-connection session state (creation time, prepared statements, statement_timeout);
+# lives exactly as long as the psycopg2 connection, across checkouts.
+_sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+_pools: dict[tuple, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+class PoolTimeout(OperationalError):
+    """No connection became free within the pool's ``timeout``."""
+
+
+def session_state(conn) -> dict[str, Any]:
+    """Mutable state attached to a raw psycopg2 connection."""
+    state = _sessions.get(conn)
+    if state is None:
+        state = _sessions.setdefault(conn, {"created_at": time.monotonic()})
+    return state
+
+
+class ConnectionPool:
+    """Thread-safe pool of raw DB-API connections, created lazily up to ``max_size``."""
+
+    def __init__(self, alias: str, *, max_size: int, timeout: float = 5.0, max_lifetime: float = 1800.0):
+        self.alias = alias
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self._idle: deque = deque()
+        self._size = 0  # open connections, idle + leased
+        self._waiting = 0
+        self._cond = threading.Condition()
+
+    def getconn(self, connect: Callable[[], Any]):
+        """Lease an idle connection, open a new one while below ``max_size``, or wait for a release."""
+        start = time.monotonic()
+        deadline = start + self.timeout
+        stale = []
+        try:
+            with self._cond:
+                while True:
+                    while self._idle:
+                        conn = self._idle.pop()  # LIFO: the most recently used connection is the warmest
+                        if self._usable(conn):
+                            self._observe_wait(start)
+                            return conn
+                        stale.append(conn)
+                        self._size -= 1
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        DB_POOL_TIMEOUTS.labels(alias=self.alias).inc()
+                        raise PoolTimeout(
+                            f"connection pool '{self.alias}' exhausted: {self.max_size} connections "
+                            f"in use for {self.timeout:g}s"
+                        )
+                    self._waiting += 1
+                    self._export()
+                    try:
+                        self._cond.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+                self._observe_wait(start)
+        finally:
+            for conn in stale:
+                _close_quietly(conn)
+
+        try:
+            conn = connect()
+        except BaseException:
+            with self._cond:
+                self._size -= 1
+                self._export()
+                self._cond.notify()
+            raise
+        session_state(conn)
+        return conn
+
+    def putconn(self, conn) -> None:
+        """Return a leased connection; broken or expired connections are closed instead of kept."""
+        keep = self._reset(conn) and self._usable(conn)
+        if not keep:
+            _close_quietly(conn)
+        with self._cond:
+            if keep:
+                self._idle.append(conn)
+            else:
+                self._size -= 1
+            self._export()
+            self._cond.notify()
+
+    def close(self) -> None:
+        """Close idle connections; leased ones are closed when returned."""
+        with self._cond:
+            idle, self._idle = list(self._idle), deque()
+            self._size -= len(idle)
+            self._export()
+        for conn in idle:
+            _close_quietly(conn)
+        self.max_lifetime = 0  # anything still leased is discarded on return
+
+    def stats(self) -> dict[str, int]:
+        with self._cond:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "waiting": self._waiting,
+                "max_size": self.max_size,
+            }
+
+    def _usable(self, conn) -> bool:
+        if conn.closed:
+            return False
+        return time.monotonic() - session_state(conn)["created_at"] < self.max_lifetime
+
+    @staticmethod
+    def _reset(conn) -> bool:
+        """Roll back whatever the borrower left open; False if the connection is unusable."""
+        if conn.closed:
+            return False
+        try:
+            if conn.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+            return conn.info.transaction_status == extensions.TRANSACTION_STATUS_IDLE
+        except Exception:
+            return False
+
+    def _observe_wait(self, start: float) -> None:
+        DB_POOL_WAIT.labels(alias=self.alias).observe(time.monotonic() - start)
+        self._export()
+
+    def _export(self) -> None:
+        idle = len(self._idle)
+        DB_POOL_CONNECTIONS.labels(alias=self.alias, state="idle").set(idle)
+        DB_POOL_CONNECTIONS.labels(alias=self.alias, state="in_use").set(self._size - idle)
+        DB_POOL_WAITING.labels(alias=self.alias).set(self._waiting)
+
+
+def _close_quietly(conn) -> None:
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+def get_pool(alias: str, conn_params: dict[str, Any], options: dict[str, Any]) -> ConnectionPool:
+    """Pool for ``alias`` and these connection parameters (a test database gets its own), per process."""
+    key = (os.getpid(), alias, tuple(sorted((k, str(v)) for k, v in conn_params.items())))
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = _pools[key] = ConnectionPool(
+                    alias,
+                    max_size=int(options.get("max_size", 10)),
+                    timeout=float(options.get("timeout", 5.0)),
+                    max_lifetime=float(options.get("max_lifetime", 1800)),
+                )
+    return pool
+
+
+def close_pools() -> None:
+    """Close every idle pooled connection of this process (e.g. before dropping the test database)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+def pool_stats() -> dict[str, dict[str, int]]:
+    """Occupancy per alias, summed over the pools of this process."""
+    totals: dict[str, dict[str, int]] = {}
+    pid = os.getpid()
+    for (owner, alias, _), pool in list(_pools.items()):
+        if owner != pid:
+            continue
+        alias_totals = totals.setdefault(alias, {})
+        for name, value in pool.stats().items():
+            alias_totals[name] = alias_totals.get(name, 0) + value
+    return totals
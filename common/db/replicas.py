@@ -0,0 +1,164 @@
+"""
+Read-replica selection with lag awareness and read-your-writes stickiness.
+
+Replicas (``settings.DB_REPLICA_ALIASES``, built from ``DATABASE_REPLICA_URLS``)
+serve reads only inside safe (GET/HEAD/OPTIONS) requests; ``ReadReplicaMiddleware``
+turns them on per request. Everything else stays on the primary:
+
+- writes, and reads inside a transaction on the primary;
+- management commands, importers and embedding jobs (never enabled);
+- unsafe requests, and for ``DB_REPLICA_STICKY_SECONDS`` after a successful
+  one, the same client's following requests (pinned by a hash of its
+  credentials in the shared cache), so a client reads its own study edits and
+  comments even while replicas catch up;
+- content-cached views whose datasets changed within ``catch_up_seconds()``
+  (``common.content_cache``), so rows a replica has not replayed yet are never
+  stored under the new ETag.
+
+Each replica's lag is measured at most every ``DB_REPLICA_LAG_CHECK_INTERVAL``
+seconds per process; a replica more than ``DB_REPLICA_MAX_LAG_SECONDS`` behind,
+or unreachable, is skipped until the next check. One replica is chosen per
+request, so all its reads see the same snapshot age.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+from common.observability.metrics import DB_REPLICA_FALLBACKS, DB_REPLICA_LAG
+
+logger = logging.getLogger(__name__)
+
+_enabled: ContextVar[bool] = ContextVar("db_replicas_enabled", default=False)
+_chosen: ContextVar[str | None] = ContextVar("db_replica", default=None)
+
+# alias -> (checked_at, lag seconds or None when unreachable)
+_lag: dict[str, tuple[float, float | None]] = {}
+_lag_lock = threading.Lock()
+
+_LAG_SQL = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+
+
+def replica_aliases() -> list[str]:
+    return list(getattr(settings, "DB_REPLICA_ALIASES", []))
+
+
+def replica_lag(alias: str) -> float | None:
+    """Replay lag of ``alias`` in seconds (0 when caught up), ``None`` if unreachable; cached per process."""
+    now = time.monotonic()
+    checked = _lag.get(alias)
+    if checked and now - checked[0] < getattr(settings, "DB_REPLICA_LAG_CHECK_INTERVAL", 5.0):
+        return checked[1]
+    with _lag_lock:
+        checked = _lag.get(alias)
+        if checked and now - checked[0] < getattr(settings, "DB_REPLICA_LAG_CHECK_INTERVAL", 5.0):
+            return checked[1]
+        # Record the attempt first so concurrent requests don't all probe a dead replica
+        _lag[alias] = (now, checked[1] if checked else None)
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(_LAG_SQL)
+            lag = float(cursor.fetchone()[0])
+    except DatabaseError as e:
+        logger.warning("Read replica %s unavailable: %s", alias, e)
+        lag = None
+    _lag[alias] = (time.monotonic(), lag)
+    DB_REPLICA_LAG.labels(alias=alias).set(lag if lag is not None else -1)
+    return lag
+
+
+def pick_replica() -> str | None:
+    """Replica to read from in the current context, or ``None`` to stay on the primary."""
+    if not _enabled.get():
+        return None
+    chosen = _chosen.get()
+    if chosen is not None:
+        return chosen or None
+
+    max_lag = getattr(settings, "DB_REPLICA_MAX_LAG_SECONDS", 5.0)
+    healthy = []
+    for alias in replica_aliases():
+        lag = replica_lag(alias)
+        if lag is None:
+            DB_REPLICA_FALLBACKS.labels(reason="unavailable").inc()
+        elif lag > max_lag:
+            DB_REPLICA_FALLBACKS.labels(reason="lagging").inc()
+        else:
+            healthy.append(alias)
+    chosen = random.choice(healthy) if healthy else ""
+    _chosen.set(chosen)
+    return chosen or None
+
+
+def read_alias(default: str = DEFAULT_DB_ALIAS) -> str:
+    """Alias for a read: a healthy replica when allowed, else ``default``."""
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        return default  # the transaction's own writes are only visible on the primary
+    return pick_replica() or default
+
+
+def replicas_enabled() -> bool:
+    """Whether reads in the current context may go to a replica."""
+    return _enabled.get()
+
+
+def use_primary() -> None:
+    """Send the remaining reads of the current context to the primary."""
+    if _enabled.get():
+        _chosen.set("")
+
+
+def catch_up_seconds() -> float:
+    """How long after a commit a replica that passed its last lag check may still miss it (0 without replicas)."""
+    if not replica_aliases():
+        return 0.0
+    max_lag = getattr(settings, "DB_REPLICA_MAX_LAG_SECONDS", 5.0)
+    # A replica within max_lag at its last check may have fallen further behind until the next one
+    return max_lag + getattr(settings, "DB_REPLICA_LAG_CHECK_INTERVAL", 5.0)
+
+
+@contextmanager
+def use_replicas(enabled: bool = True):
+    """Allow (or forbid) replica reads inside the block; the replica is chosen on first read."""
+    enabled_token = _enabled.set(enabled and bool(replica_aliases()))
+    chosen_token = _chosen.set(None)
+    try:
+        yield
+    finally:
+        _chosen.reset(chosen_token)
+        _enabled.reset(enabled_token)
+
+
+def client_key(request) -> str | None:
+    """Stable, non-reversible id of the request's credentials (API key or session), if any."""
+    credential = request.META.get("HTTP_AUTHORIZATION") or request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    if not credential:
+        return None
+    return "db-pin:" + hashlib.sha256(credential.encode()).hexdigest()[:32]
+
+
+def is_pinned(key: str | None) -> bool:
+    return bool(key) and cache.get(key) is not None
+
+
+def pin(key: str | None) -> None:
+    """Keep ``key``'s reads on the primary while replicas may still miss its write."""
+    seconds = getattr(settings, "DB_REPLICA_STICKY_SECONDS", 15)
+    if key and seconds:
+        cache.set(key, 1, seconds)
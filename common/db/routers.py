@@ -0,0 +1,26 @@
+"""
+Database router: reads to a healthy replica when the request allows it, writes to the primary.
+
+Enable with ``DATABASE_ROUTERS = ["common.db.routers.ReplicaRouter"]``; with no
+replicas configured every query stays on ``default``.
+"""
+
+from django.db import DEFAULT_DB_ALIAS
+
+from .replicas import read_alias
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return read_alias()
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Primary, replicas and the search alias are the same database
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Search and replica aliases point at the primary's schema (or a physical copy of it)
+        return db == DEFAULT_DB_ALIAS
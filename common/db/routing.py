@@ -0,0 +1,149 @@
+"""
+Query routes: which connection pool a query runs on and how long it may run.
+
+- ``oltp``: the ``default`` alias — verse/book lookups, auth, ORM reads.
+- ``search``: ``settings.DB_SEARCH_ALIAS`` — vector, BM25 and rerank SQL from
+  ``bible.ai``, on a separate pool so slow searches cannot hold the
+  connections cheap lookups need. Falls back to ``default`` when the alias
+  is not configured (and in tests, where TestCase data lives on ``default``).
+  In safe requests it reads from a replica instead (``common.db.replicas``).
+
+``StatementTimeoutMiddleware`` gives every request the ``oltp`` timeout (or the
+view's ``statement_timeout_ms``); ``route_cursor("search")`` raises it to the
+search timeout for its block. The timeout is applied lazily by an execute
+wrapper, only when the connection's current value differs, so steady traffic
+on pooled connections costs no extra round trip. Outside requests (management
+commands, imports) no timeout is set.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import re
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+from .pool import session_state
+from .replicas import read_alias
+
+ROUTE_OLTP = "oltp"
+ROUTE_SEARCH = "search"
+
+_timeout_ms: ContextVar[int | None] = ContextVar("db_statement_timeout_ms", default=None)
+
+
+def route_alias(route: str) -> str:
+    """Database alias serving ``route``: search reads go to a replica when the request allows it."""
+    if route == ROUTE_SEARCH:
+        alias = getattr(settings, "DB_SEARCH_ALIAS", ROUTE_SEARCH)
+        return read_alias(alias if alias in settings.DATABASES else DEFAULT_DB_ALIAS)
+    return DEFAULT_DB_ALIAS
+
+
+def route_timeout_ms(route: str) -> int:
+    if route == ROUTE_SEARCH:
+        return getattr(settings, "DB_SEARCH_STATEMENT_TIMEOUT_MS", 15000)
+    return getattr(settings, "DB_OLTP_STATEMENT_TIMEOUT_MS", 5000)
+
+
+@contextmanager
+def statement_timeout(ms: int | None) -> Iterator[None]:
+    """Run the block's queries with ``statement_timeout = ms`` (``None`` or 0 = server default)."""
+    token = _timeout_ms.set(ms or None)
+    try:
+        yield
+    finally:
+        _timeout_ms.reset(token)
+
+
+def set_statement_timeout(ms: int | None) -> None:
+    """Replace the active timeout for the rest of the current context (e.g. a view's own limit)."""
+    _timeout_ms.set(ms or None)
+
+
+@contextmanager
+def route_cursor(route: str = ROUTE_SEARCH):
+    """Cursor on the route's connection; inside a request the route's timeout applies."""
+    try:
+        if _timeout_ms.get() is None:
+            with connections[route_alias(route)].cursor() as cursor:
+                yield cursor
+            return
+        with statement_timeout(route_timeout_ms(route)):
+            with connections[route_alias(route)].cursor() as cursor:
+                yield cursor
+    except DatabaseError as exc:
+        exc.db_route = route  # labels the timeout metric in the exception handler
+        raise
+
+
+def apply_statement_timeout(execute, sql, params, many, context):
+    """Execute wrapper (installed by ``common.db``'s backend) that applies the active timeout."""
+    ms = _timeout_ms.get()
+    if ms is not None:
+        _ensure_timeout(context["connection"], ms)
+    return execute(sql, params, many, context)
+
+
+def _ensure_timeout(conn, ms: int) -> None:
+    raw = conn.connection
+    if conn.in_atomic_block or not conn.autocommit:
+        # SET LOCAL is undone with its (sub)transaction, so it can't be cached
+        with raw.cursor() as cursor:
+            cursor.execute("SET LOCAL statement_timeout = %s", [ms])
+        return
+    state = session_state(raw)
+    if state.get("statement_timeout") != ms:
+        with raw.cursor() as cursor:
+            cursor.execute("SET statement_timeout = %s", [ms])
+        state["statement_timeout"] = ms
+
+
+def is_statement_timeout(exc: BaseException) -> bool:
+    """True for a query cancelled by ``statement_timeout`` (SQLSTATE 57014)."""
+    cause = exc.__cause__ or exc
+    return getattr(cause, "pgcode", None) == "57014"
+
+
+def to_numbered_placeholders(sql: str) -> str:
+    """``%s`` placeholders → ``$1, $2, ...`` (``%%`` → ``%``)."""
+    counter = itertools.count(1)
+    return re.sub(r"%%|%s", lambda m: "%" if m.group() == "%%" else f"${next(counter)}", sql)
+
+
+def execute_prepared(cursor, sql: str, params: Sequence[Any] = ()) -> None:
+    """
+    Run a hot ``%s``-style query as a server-side prepared statement.
+
+    The statement is prepared once per pooled connection and then only
+    bound and executed, skipping parse/analyze on every call. Prepared
+    statements survive transaction rollbacks and are evicted LRU beyond
+    ``DB_PREPARED_STATEMENTS_MAX`` per connection.
+    """
+    if not getattr(settings, "DB_PREPARED_STATEMENTS", True) or cursor.db.vendor != "postgresql":
+        cursor.execute(sql, params)
+        return
+
+    prepared: OrderedDict = session_state(cursor.db.connection).setdefault("prepared", OrderedDict())
+    name = "stmt_" + hashlib.sha1(sql.encode()).hexdigest()[:16]
+    if name in prepared:
+        prepared.move_to_end(name)
+    else:
+        with cursor.db.connection.cursor() as raw:
+            if len(prepared) >= getattr(settings, "DB_PREPARED_STATEMENTS_MAX", 100):
+                evicted, _ = prepared.popitem(last=False)
+                raw.execute(f"DEALLOCATE {evicted}")
+            raw.execute(f"PREPARE {name} AS {to_numbered_placeholders(sql)}")
+        prepared[name] = True
+
+    if params:
+        cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", list(params))
+    else:
+        cursor.execute(f"EXECUTE {name}")
@@ -6,6 +6,7 @@ import logging
 import uuid
 from typing import Any
 
+from django.db import DatabaseError
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import exception_handler
@@ -194,6 +195,34 @@ def _handle_drf_response(response: Response, *, request_id: str, request, contex
     return new_resp
 
 
+def _handle_database_overload(exc: DatabaseError, *, request_id: str, request, context: dict) -> Response | None:
+    """503 for a query cancelled by the route's statement_timeout or an exhausted connection pool."""
+    from .db import PoolTimeout, is_statement_timeout
+    from .db.routing import ROUTE_OLTP
+    from .observability.metrics import DB_STATEMENT_TIMEOUTS
+
+    if isinstance(exc, PoolTimeout):
+        detail, code = "The database is busy, please retry", "database_busy"
+    elif is_statement_timeout(exc):
+        detail, code = "The query took too long to complete", "query_timeout"
+        DB_STATEMENT_TIMEOUTS.labels(route=getattr(exc, "db_route", ROUTE_OLTP)).inc()
+    else:
+        return None
+
+    _log(
+        "warning",
+        "Database overload: %s",
+        exc,
+        context=context,
+        request=request,
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        error_code=code,
+    )
+    resp = Response(_response_payload(detail, code, request_id), status=status.HTTP_503_SERVICE_UNAVAILABLE)
+    _apply_headers(resp, retry_after="1")
+    return resp
+
+
 def custom_exception_handler(exc, context):
     """Standardized error responses for the API."""
     request = context.get("request")
@@ -202,6 +231,11 @@ def custom_exception_handler(exc, context):
     if isinstance(exc, APIError):
         return _handle_api_error(exc, request_id=request_id, request=request, context=context)
 
+    if isinstance(exc, DatabaseError):
+        resp = _handle_database_overload(exc, request_id=request_id, request=request, context=context)
+        if resp is not None:
+            return resp
+
     drf_resp = exception_handler(exc, context)
     if drf_resp is not None:
         return _handle_drf_response(drf_resp, request_id=request_id, request=request, context=context)
@@ -4,6 +4,8 @@ Middleware for Bible API.
 
 import uuid
 
+from .db.replicas import client_key, is_pinned, pin, replica_aliases, use_replicas
+from .db.routing import ROUTE_OLTP, route_timeout_ms, set_statement_timeout, statement_timeout
 from .logging import clear_request_context, set_request_context
 
 
@@ -46,3 +48,58 @@ class RequestIDMiddleware:
 
         clear_request_context()
         return response
+
+
+class StatementTimeoutMiddleware:
+    """
+    Bound every query of a request by the route's ``statement_timeout``.
+
+    Requests get ``DB_OLTP_STATEMENT_TIMEOUT_MS``; a view may declare its own
+    ``statement_timeout_ms`` (0 = server default), and search code raises it
+    for its queries with ``common.db.route_cursor``. Management commands and
+    other non-request code are not affected.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with statement_timeout(route_timeout_ms(ROUTE_OLTP)):
+            return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+        timeout = getattr(view_class, "statement_timeout_ms", None)
+        if timeout is not None:
+            set_statement_timeout(timeout)
+        return None
+
+
+class ReadReplicaMiddleware:
+    """
+    Serve reads of safe requests from a read replica, with read-your-writes stickiness.
+
+    GET/HEAD/OPTIONS requests may read from a healthy replica
+    (``common.db.replicas``). A successful unsafe request pins its client
+    (API key or session) to the primary for ``DB_REPLICA_STICKY_SECONDS``, so
+    the client's next reads include its own write. Without replicas this is a
+    no-op.
+    """
+
+    SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not replica_aliases():
+            return self.get_response(request)
+
+        key = client_key(request)
+        safe = request.method in self.SAFE_METHODS
+        with use_replicas(safe and not is_pinned(key)):
+            response = self.get_response(request)
+
+        if not safe and response.status_code < 400:
+            pin(key)
+        return response
@@ -0,0 +1,89 @@
+"""Bounded label values for business metrics.
+
+Client-supplied ``?version=`` / ``?lang=`` values are mapped onto the version
+registry (``bible.versions.services.get_version_registry``): known versions
+become their canonical code, known languages their registered code, and
+anything else collapses into ``other``. The per-process snapshot is refreshed
+every ``LABEL_REGISTRY_TTL`` seconds and whenever a Version changes, so the
+hot path does no I/O.
+"""
+import logging
+import threading
+import time
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from bible.models import Version
+
+logger = logging.getLogger(__name__)
+
+OTHER = "other"
+LABEL_REGISTRY_TTL = 300  # seconds
+
+_lock = threading.Lock()
+_snapshot: dict | None = None
+_expires_at = 0.0
+
+
+def _load() -> dict:
+    from bible.versions.services import get_version_registry
+
+    versions: dict[str, str] = {}
+    suffixes: dict[str, str] = {}
+    languages: dict[str, str] = {}
+    for version in get_version_registry():
+        code = version.code
+        versions[code.lower()] = code
+        if "_" in code:
+            suffixes.setdefault(code.split("_", 1)[1].lower(), code)
+        lang = version.language.code
+        languages[lang.lower()] = lang
+        languages.setdefault(lang.split("-")[0].lower(), lang.split("-")[0])
+    return {"versions": versions, "suffixes": suffixes, "languages": languages}
+
+
+def _registry() -> dict | None:
+    global _snapshot, _expires_at
+    now = time.monotonic()
+    if _snapshot is None or now >= _expires_at:
+        with _lock:
+            if _snapshot is None or now >= _expires_at:
+                try:
+                    _snapshot = _load()
+                except Exception:
+                    logger.debug("Failed to load label registry", exc_info=True)
+                    return _snapshot
+                _expires_at = now + LABEL_REGISTRY_TTL
+    return _snapshot
+
+
+@receiver(post_save, sender=Version)
+@receiver(post_delete, sender=Version)
+def reset_label_registry(**kwargs) -> None:
+    """Forget the snapshot so the next lookup reloads known versions/languages."""
+    global _snapshot, _expires_at
+    with _lock:
+        _snapshot = None
+        _expires_at = 0.0
+
+
+def version_label(raw: str | None) -> str:
+    """Canonical version code for ``raw`` (code or ``EN_``-less suffix), ``default`` when absent."""
+    if not raw:
+        return "default"
+    registry = _registry()
+    if registry is None:
+        return OTHER
+    key = raw.strip().lower()
+    return registry["versions"].get(key) or registry["suffixes"].get(key) or OTHER
+
+
+def lang_label(raw: str | None) -> str:
+    """Registered language code for ``raw``, ``unknown`` when absent."""
+    if not raw:
+        return "unknown"
+    registry = _registry()
+    if registry is None:
+        return OTHER
+    return registry["languages"].get(raw.strip().lower(), OTHER)
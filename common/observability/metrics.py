@@ -19,12 +19,8 @@ LATENCY = Histogram(
 )
 
 
-# Optional business metrics (placeholders; to be updated by business logic)
-BIBLE_VERSES_SERVED = Counter(
-    "bible_verses_served_total",
-    "Served verses by book/chapter/verse/version/lang",
-    ["book", "chapter", "verse", "version", "lang"],
-)
+# Per-verse popularity is tracked by the bounded top-K sketch in ``topk`` (served at
+# /metrics/hot-passages/), not as labels: book×chapter×verse would mean millions of series.
 
 INDEX_BUILDS = Gauge(
     "inprogress_index_builds",
@@ -44,3 +40,89 @@ RAG_RETRIEVE_LATENCY = Histogram(
     ["version", "lang"],
     buckets=[0.02, 0.05, 0.1, 0.2, 0.3, 0.5, 1, 2],
 )
+
+# Hybrid search pipeline metrics (labels are bounded: fixed stage/cache/pool names)
+HYBRID_STAGE_LATENCY = Histogram(
+    "hybrid_search_stage_latency_seconds",
+    "Latency of each hybrid search pipeline stage",
+    ["stage"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5],
+)
+
+HYBRID_STAGE_DB_QUERIES = Histogram(
+    "hybrid_search_stage_db_queries",
+    "Database queries issued per hybrid search stage",
+    ["stage"],
+    buckets=[0, 1, 2, 3, 5, 10, 20, 50],
+)
+
+HYBRID_STAGE_DB_TIME = Histogram(
+    "hybrid_search_stage_db_seconds",
+    "Database time spent per hybrid search stage",
+    ["stage"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2],
+)
+
+HYBRID_CACHE_TOTAL = Counter(
+    "hybrid_search_cache_total",
+    "Hybrid search cache lookups (embedding, expansion, nlp) by result",
+    ["cache", "result"],
+)
+
+HYBRID_POOL_SIZE = Histogram(
+    "hybrid_search_pool_size",
+    "Candidate pool sizes per hybrid search (bm25, vector, fused, returned)",
+    ["pool"],
+    buckets=[0, 5, 10, 20, 50, 100, 200, 300, 500, 1000],
+)
+
+HYBRID_MATCH_SOURCE = Counter(
+    "hybrid_search_match_source_total",
+    "Returned hybrid search hits by match source",
+    ["match_source"],
+)
+
+# Database connection pools (common.db.pool); labels: alias ∈ DATABASES, state ∈ {idle, in_use}
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Open pooled database connections by state",
+    ["alias", "state"],
+)
+
+DB_POOL_WAITING = Gauge(
+    "db_pool_waiting",
+    "Threads waiting for a free pooled connection",
+    ["alias"],
+)
+
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent acquiring a pooled database connection",
+    ["alias"],
+    buckets=[0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5],
+)
+
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "Pooled connection checkouts that gave up after the pool timeout",
+    ["alias"],
+)
+
+DB_STATEMENT_TIMEOUTS = Counter(
+    "db_statement_timeouts_total",
+    "Requests whose query hit the route's statement_timeout",
+    ["route"],
+)
+
+# Read replicas (common.db.replicas); lag is -1 while a replica is unreachable
+DB_REPLICA_LAG = Gauge(
+    "db_replica_lag_seconds",
+    "Replay lag of each read replica at its last check",
+    ["alias"],
+)
+
+DB_REPLICA_FALLBACKS = Counter(
+    "db_replica_fallbacks_total",
+    "Replica skipped when choosing where to read (reason: lagging, unavailable)",
+    ["reason"],
+)
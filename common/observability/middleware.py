@@ -3,13 +3,18 @@ import time
 
 from django.utils.deprecation import MiddlewareMixin
 
+from .labels import lang_label, version_label
 from .metrics import BUILD_INFO, LATENCY, REQUESTS
 
 logger = logging.getLogger(__name__)
 
 
 class ObservabilityMiddleware(MiddlewareMixin):
-    """Capture per-request custom metrics with business labels (lang, version, view)."""
+    """Capture per-request custom metrics with business labels (lang, version, view).
+
+    ``lang``/``version`` are normalized against the version registry (see ``labels``), so
+    unknown client values land in ``other`` instead of minting new series.
+    """
 
     _inited = False
 
@@ -33,9 +38,9 @@ class ObservabilityMiddleware(MiddlewareMixin):
     def __call__(self, request):
         start = time.perf_counter()
 
-        # Resolve business labels
-        lang = getattr(request, "lang_code", None) or request.GET.get("lang") or "unknown"
-        version = request.GET.get("version") or "default"
+        # Resolve business labels (raw client input is mapped onto known values to bound cardinality)
+        lang = lang_label(getattr(request, "lang_code", None) or request.GET.get("lang"))
+        version = version_label(request.GET.get("version"))
         try:
             view_name = getattr(request.resolver_match, "view_name", None) or "unknown"
         except Exception:
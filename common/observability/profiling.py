@@ -0,0 +1,345 @@
+"""Opt-in per-request profiling: sampled stacks plus the SQL timeline.
+
+A request is profiled when it carries ``X-Profile: 1`` with an admin-scoped API
+key, or when it is picked by ``PROFILING_SAMPLE_RATE`` (default off). While the
+view runs, a sampler thread snapshots the request thread's stack every
+``PROFILING_INTERVAL_MS`` and an execute wrapper records each query's
+fingerprint, offset, duration and row count. Finished profiles go into a
+per-process ring buffer of ``PROFILING_BUFFER_SIZE`` entries, readable through
+``/metrics/profiles/`` as speedscope JSON or collapsed stacks.
+"""
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PROFILE_HEADER = "HTTP_X_PROFILE"
+
+_SQL_STRING = re.compile(r"'(?:[^']|'')*'")
+_SQL_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SQL_IN_LIST = re.compile(r"\(\s*(?:\?|%s)(?:\s*,\s*(?:\?|%s))*\s*\)")
+_SQL_SPACE = re.compile(r"\s+")
+
+
+def fingerprint_sql(sql: str) -> str:
+    """Normalize a statement so queries differing only in literals share one fingerprint."""
+    sql = _SQL_STRING.sub("?", sql)
+    sql = _SQL_NUMBER.sub("?", sql)
+    sql = _SQL_IN_LIST.sub("(...)", sql)
+    return _SQL_SPACE.sub(" ", sql).strip()
+
+
+@lru_cache(maxsize=4096)
+def _short_path(filename: str) -> str:
+    """Path relative to the longest matching ``sys.path`` entry (keeps flame labels readable)."""
+    best = ""
+    for entry in sys.path:
+        if entry and filename.startswith(entry) and len(entry) > len(best):
+            best = entry
+    return filename[len(best) :].lstrip("/\\") if best else filename
+
+
+@dataclass(frozen=True)
+class Frame:
+    name: str
+    file: str
+    line: int
+
+
+@dataclass
+class QueryEvent:
+    fingerprint: str
+    start_ms: float
+    duration_ms: float
+    rows: int | None
+    alias: str = DEFAULT_DB_ALIAS
+
+
+@dataclass
+class Profile:
+    id: str
+    method: str
+    path: str
+    trigger: str
+    started_at: str
+    interval_ms: float
+    view: str = "unknown"
+    status: int = 0
+    duration_ms: float = 0.0
+    samples: Counter = field(default_factory=Counter)
+    queries: list[QueryEvent] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "view": self.view,
+            "status": self.status,
+            "trigger": self.trigger,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration_ms, 3),
+            "samples": sum(self.samples.values()),
+            "queries": len(self.queries),
+            "db_ms": round(sum(q.duration_ms for q in self.queries), 3),
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            **self.summary(),
+            "sql": [
+                {
+                    "fingerprint": q.fingerprint,
+                    "start_ms": round(q.start_ms, 3),
+                    "duration_ms": round(q.duration_ms, 3),
+                    "rows": q.rows,
+                    "alias": q.alias,
+                }
+                for q in self.queries
+            ],
+        }
+
+    def to_collapsed(self) -> str:
+        """Brendan Gregg's collapsed-stack format (``root;child;leaf count``), one stack per line."""
+        lines = [
+            f"{';'.join(frame.name for frame in stack)} {count}"
+            for stack, count in sorted(self.samples.items(), key=lambda item: [f.name for f in item[0]])
+        ]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def to_speedscope(self) -> dict:
+        """Speedscope file: a sampled CPU profile plus an evented profile of the SQL timeline."""
+        frames: list[dict] = []
+        index: dict[Frame, int] = {}
+
+        def frame_id(frame: Frame) -> int:
+            if frame not in index:
+                index[frame] = len(frames)
+                frames.append({"name": frame.name, "file": frame.file, "line": frame.line})
+            return index[frame]
+
+        stacks = [([frame_id(f) for f in stack], count) for stack, count in self.samples.items()]
+        events = []
+        for q in self.queries:
+            fid = frame_id(Frame(f"SQL {q.fingerprint}", "", 0))
+            events.append({"type": "O", "frame": fid, "at": round(q.start_ms, 3)})
+            events.append({"type": "C", "frame": fid, "at": round(q.start_ms + q.duration_ms, 3)})
+
+        end = round(self.duration_ms, 3)
+        title = f"{self.method} {self.path}"
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": title,
+            "exporter": "bible-api",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": f"{title} (stacks)",
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": end,
+                    "samples": [stack for stack, _ in stacks],
+                    "weights": [count * self.interval_ms for _, count in stacks],
+                },
+                {
+                    "type": "evented",
+                    "name": f"{title} (SQL)",
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": end,
+                    "events": events,
+                },
+            ],
+        }
+
+
+class ProfileStore:
+    """Bounded, thread-safe ring buffer of the most recent profiles."""
+
+    def __init__(self, capacity: int = 50):
+        self._profiles: deque[Profile] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self._profiles.maxlen
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def add(self, profile: Profile) -> None:
+        with self._lock:
+            self._profiles.append(profile)
+
+    def get(self, profile_id: str) -> Profile | None:
+        with self._lock:
+            return next((p for p in self._profiles if p.id == profile_id), None)
+
+    def recent(self) -> list[Profile]:
+        """Newest first."""
+        with self._lock:
+            return list(reversed(self._profiles))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+
+
+PROFILES = ProfileStore(capacity=getattr(settings, "PROFILING_BUFFER_SIZE", 50))
+
+
+class StackSampler:
+    """Background thread sampling one thread's Python stack at a fixed interval."""
+
+    def __init__(self, thread_id: int, interval: float, root_code=None):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.root_code = root_code
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[self._stack(frame)] += 1
+
+    def _stack(self, frame) -> tuple[Frame, ...]:
+        stack = []
+        while frame is not None and frame.f_code is not self.root_code:
+            code = frame.f_code
+            name = getattr(code, "co_qualname", code.co_name)
+            stack.append(
+                Frame(
+                    f"{name} ({_short_path(code.co_filename)}:{code.co_firstlineno})",
+                    code.co_filename,
+                    code.co_firstlineno,
+                )
+            )
+            frame = frame.f_back
+        stack.reverse()
+        return tuple(stack)
+
+
+class SQLTimeline:
+    """Execute wrapper recording each query's fingerprint, offset, duration and row count."""
+
+    def __init__(self, origin: float):
+        self.origin = origin
+        self.events: list[QueryEvent] = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            end = time.perf_counter()
+            rowcount = getattr(context.get("cursor"), "rowcount", -1)
+            self.events.append(
+                QueryEvent(
+                    fingerprint=fingerprint_sql(sql),
+                    start_ms=(start - self.origin) * 1000,
+                    duration_ms=(end - start) * 1000,
+                    rows=rowcount if rowcount is not None and rowcount >= 0 else None,
+                    alias=context["connection"].alias,
+                )
+            )
+
+
+def profiling_sample_rate() -> float:
+    return getattr(settings, "PROFILING_SAMPLE_RATE", 0.0)
+
+
+def profiling_interval() -> float:
+    return getattr(settings, "PROFILING_INTERVAL_MS", 5) / 1000
+
+
+def _has_admin_key(request) -> bool:
+    """Whether the request's ``Authorization: Api-Key`` header names an active admin-scoped key."""
+    from bible.models.auth import APIKey
+
+    parts = request.META.get("HTTP_AUTHORIZATION", "").split()
+    if len(parts) != 2 or parts[0].lower() != "api-key":
+        return False
+    api_key = APIKey.objects.filter(key=parts[1], is_active=True, user__is_active=True).first()
+    return api_key is not None and api_key.has_scope("admin")
+
+
+class ProfilingMiddleware:
+    """Profile opted-in or sampled requests into ``PROFILES``; a no-op for everything else.
+
+    Header-triggered profiles answer with ``X-Profile-Id`` so the caller can fetch
+    the result from ``/metrics/profiles/<id>/``.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        trigger = self._trigger(request)
+        if trigger is None:
+            return self.get_response(request)
+        return self._profile(request, trigger)
+
+    def _trigger(self, request) -> str | None:
+        if request.META.get(PROFILE_HEADER, "").strip().lower() in ("1", "true", "yes") and _has_admin_key(request):
+            return "header"
+        rate = profiling_sample_rate()
+        if rate > 0 and (rate >= 1 or random.random() < rate):
+            return "sample"
+        return None
+
+    def _profile(self, request, trigger):
+        interval = profiling_interval()
+        profile = Profile(
+            id=uuid.uuid4().hex[:16],
+            method=request.method,
+            path=request.path,
+            trigger=trigger,
+            started_at=datetime.now(UTC).isoformat(),
+            interval_ms=interval * 1000,
+        )
+        start = time.perf_counter()
+        timeline = SQLTimeline(start)
+        sampler = StackSampler(threading.get_ident(), interval, root_code=_PROFILE_ROOT)
+        with ExitStack() as stack:
+            stack.enter_context(sampler)
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(timeline))
+            response = self.get_response(request)
+
+        profile.duration_ms = (time.perf_counter() - start) * 1000
+        profile.status = getattr(response, "status_code", 0)
+        profile.view = getattr(getattr(request, "resolver_match", None), "view_name", None) or "unknown"
+        profile.samples = sampler.samples
+        profile.queries = timeline.events
+        PROFILES.add(profile)
+
+        if trigger == "header":
+            response["X-Profile-Id"] = profile.id
+        return response
+
+
+# Sampled stacks stop at the middleware frame, so flames start at the view stack
+_PROFILE_ROOT = ProfilingMiddleware._profile.__code__
@@ -0,0 +1,31 @@
+"""Per-block database query counting via ``connection.execute_wrapper``."""
+import time
+from contextlib import ExitStack, contextmanager
+
+from django.db import connections
+
+
+class QueryProbe:
+    """Execute wrapper that counts queries and accumulates their wall time."""
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.seconds += time.perf_counter() - start
+
+
+@contextmanager
+def probe_queries(using: str | None = None):
+    """Count the queries run on ``using`` (default: every alias) inside the block; yields the ``QueryProbe``."""
+    probe = QueryProbe()
+    with ExitStack() as stack:
+        for alias in [using] if using else connections:
+            stack.enter_context(connections[alias].execute_wrapper(probe))
+        yield probe
@@ -0,0 +1,107 @@
+"""Bounded heavy-hitter tracking (Space-Saving) for per-passage popularity.
+
+Per-verse Prometheus labels would mean millions of series; instead each
+process keeps a fixed-size Space-Saving sketch of the most requested
+passages, fed by a sampled ``record_passage`` call and read through
+``/metrics/hot-passages/``. Memory and scrape size stay flat regardless of
+traffic: at most ``capacity`` keys are tracked, and each reported count
+over-estimates the true count by at most its ``error``.
+"""
+import heapq
+import random
+import threading
+
+from django.conf import settings
+
+
+class SpaceSaving:
+    """Space-Saving top-K counter (Metwally et al.) with O(log k) updates."""
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self.total = 0
+        self._counts: dict[str, int] = {}
+        self._errors: dict[str, int] = {}
+        # Lazy min-heap of (count, key); entries whose count is stale are skipped on pop
+        self._heap: list[tuple[int, str]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def add(self, key: str, weight: int = 1) -> None:
+        with self._lock:
+            self.total += weight
+            counts = self._counts
+            if key in counts:
+                counts[key] += weight
+            elif len(counts) < self.capacity:
+                counts[key] = weight
+                self._errors[key] = 0
+            else:
+                floor, victim = self._pop_min()
+                del counts[victim]
+                del self._errors[victim]
+                counts[key] = floor + weight
+                self._errors[key] = floor
+            heapq.heappush(self._heap, (counts[key], key))
+            if len(self._heap) > 4 * self.capacity:
+                self._heap = [(count, k) for k, count in counts.items()]
+                heapq.heapify(self._heap)
+
+    def _pop_min(self) -> tuple[int, str]:
+        while True:
+            count, key = heapq.heappop(self._heap)
+            if self._counts.get(key) == count:
+                return count, key
+
+    def top(self, n: int = 10) -> list[tuple[str, int, int]]:
+        """The ``n`` heaviest keys as ``(key, count, error)``, highest count first."""
+        with self._lock:
+            items = heapq.nlargest(n, self._counts.items(), key=lambda item: item[1])
+            return [(key, count, self._errors[key]) for key, count in items]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.total = 0
+            self._counts.clear()
+            self._errors.clear()
+            self._heap.clear()
+
+
+HOT_PASSAGES = SpaceSaving(capacity=getattr(settings, "HOT_PASSAGES_CAPACITY", 1000))
+
+
+def passage_sample_rate() -> float:
+    return getattr(settings, "HOT_PASSAGES_SAMPLE_RATE", 0.1)
+
+
+def record_passage(osis: str, chapter: int | None = None, verse_start: int | None = None, verse_end=None) -> None:
+    """Count one served passage (``John.3`` / ``John.3.16`` / ``John.3.16-18``), subject to sampling."""
+    rate = passage_sample_rate()
+    if rate <= 0 or (rate < 1 and random.random() >= rate):
+        return
+    key = osis
+    if chapter:
+        key = f"{key}.{chapter}"
+        if verse_start:
+            key = f"{key}.{verse_start}"
+            if verse_end and verse_end != verse_start:
+                key = f"{key}-{verse_end}"
+    HOT_PASSAGES.add(key)
+
+
+def hot_passages(n: int = 20) -> dict:
+    """Estimated top-``n`` passages for this process, with counts scaled back up by the sample rate."""
+    rate = passage_sample_rate()
+    scale = 1 / rate if 0 < rate < 1 else 1
+    return {
+        "sample_rate": rate,
+        "capacity": HOT_PASSAGES.capacity,
+        "tracked": len(HOT_PASSAGES),
+        "observed": round(HOT_PASSAGES.total * scale),
+        "items": [
+            {"passage": key, "count": round(count * scale), "error": round(error * scale)}
+            for key, count, error in HOT_PASSAGES.top(n)
+        ],
+    }
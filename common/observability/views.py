@@ -0,0 +1,53 @@
+"""Admin endpoints for the per-request profiles kept by ``ProfilingMiddleware``."""
+from django.http import HttpResponse, JsonResponse
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from bible.auth.permissions import HasAPIScopes
+
+from .profiling import PROFILES
+
+PROFILE_OUTPUTS = ("speedscope", "collapsed", "json")
+
+
+class ProfileListView(APIView):
+    """Summaries of the profiles in this process's ring buffer, newest first."""
+
+    permission_classes = [HasAPIScopes]
+    required_scopes = ["admin"]
+
+    def get(self, request):
+        return Response(
+            {
+                "capacity": PROFILES.capacity,
+                "count": len(PROFILES),
+                "results": [profile.summary() for profile in PROFILES.recent()],
+            }
+        )
+
+    def delete(self, request):
+        PROFILES.clear()
+        return Response(status=204)
+
+
+class ProfileDetailView(APIView):
+    """One profile as speedscope JSON (default), collapsed stacks (``?output=collapsed``) or raw JSON."""
+
+    permission_classes = [HasAPIScopes]
+    required_scopes = ["admin"]
+
+    def get(self, request, profile_id):
+        profile = PROFILES.get(profile_id)
+        if profile is None:
+            return Response({"detail": "Profile not found (evicted or recorded by another process)."}, status=404)
+
+        output = request.query_params.get("output", "speedscope")
+        if output not in PROFILE_OUTPUTS:
+            return Response({"detail": f"output must be one of: {', '.join(PROFILE_OUTPUTS)}"}, status=400)
+        if output == "collapsed":
+            return HttpResponse(profile.to_collapsed(), content_type="text/plain; charset=utf-8")
+        if output == "json":
+            return Response(profile.to_dict())
+        response = JsonResponse(profile.to_speedscope())
+        response["Content-Disposition"] = f'inline; filename="profile-{profile.id}.speedscope.json"'
+        return response
@@ -0,0 +1,251 @@
+"""
+Warm-start snapshot of per-process registries.
+
+Worker processes keep a few read-mostly registries in memory: RAG book and
+version labels, reference alias maps, the NLP gazetteer, and the common query
+embeddings primed into the shared cache. Modules declare them with ``register``.
+``process_value`` serves a registry from process memory and rebuilds it when the
+content-cache generations of the datasets it derives from change (see
+``common.content_cache``).
+
+``python manage.py bible warm-start snapshot`` writes every registry to one
+versioned artifact during deploy (``WARM_START_SNAPSHOT``). ``BibleConfig.ready``
+loads it at worker boot:
+
+- sections whose recorded generations still match are installed as they are;
+- stale sections, or all of them when the file is missing or unreadable, are
+  built in a background thread.
+
+``status()`` reports cold / warming / warm. With ``WARM_START_REQUIRED`` the
+readiness probe answers 503 until the worker is warm.
+
+The artifact is pickled, which is the same trust level as the shared cache.
+Only load files written by the deploy itself.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import os
+import pickle
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import django
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from common.content_cache import get_generations
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"BIBLEWS"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct(">7sH")
+
+COLD, WARMING, WARM = "cold", "warming", "warm"
+
+# Modules that register their process-local values on import
+PROVIDERS = (
+    "bible.ai.services.rag",
+    "bible.ai.agents.tools.nlp_query_tool",
+    "bible.ai.embedding_cache",
+    "bible.references.services",
+)
+
+
+@dataclass(frozen=True)
+class Registry:
+    name: str
+    build: Callable[[], Any]  # value on a miss at request time
+    datasets: tuple[str, ...] = ()  # content-cache datasets the value derives from
+    prebuild: Callable[[], Any] | None = None  # fuller value for snapshots and boot warm-up
+    install: Callable[[Any], None] | None = None  # sections restored elsewhere (e.g. into the shared cache)
+
+
+_registries: dict[str, Registry] = {}
+# name -> (generations it was built at, value)
+_values: dict[str, tuple[dict[str, int], Any]] = {}
+_status: dict[str, Any] = {"state": COLD, "source": None, "boot_ms": None, "snapshot_created_at": None}
+_status_lock = threading.Lock()
+
+
+def register(
+    name: str,
+    build: Callable[[], Any],
+    datasets: tuple[str, ...] = (),
+    prebuild: Callable[[], Any] | None = None,
+    install: Callable[[Any], None] | None = None,
+) -> None:
+    _registries[name] = Registry(name, build, tuple(datasets), prebuild, install)
+
+
+def _generations(datasets) -> dict[str, int]:
+    return get_generations(datasets) if datasets else {}
+
+
+def process_value(name: str) -> Any:
+    """Registry ``name`` from process memory, rebuilt when its datasets' generations moved."""
+    registry = _registries[name]
+    generations = _generations(registry.datasets)
+    entry = _values.get(name)
+    if entry is not None and entry[0] == generations:
+        return entry[1]
+    value = registry.build()
+    _values[name] = (generations, value)
+    return value
+
+
+def status() -> dict[str, Any]:
+    with _status_lock:
+        return dict(_status)
+
+
+def _set_status(**fields) -> None:
+    with _status_lock:
+        _status.update(fields)
+
+
+def load_providers() -> None:
+    for module in PROVIDERS:
+        importlib.import_module(module)
+
+
+# ---------------------------------------------------------------------------
+# Artifact
+# ---------------------------------------------------------------------------
+
+
+def write_snapshot(path: str | Path) -> dict[str, Any]:
+    """Build every registry and write them atomically to ``path``; returns the payload header."""
+    load_providers()
+    sections = {}
+    for name, registry in sorted(_registries.items()):
+        generations = _generations(registry.datasets)  # read first: a concurrent write makes the section stale
+        sections[name] = {"generations": generations, "value": (registry.prebuild or registry.build)()}
+
+    payload = {"created_at": timezone.now().isoformat(), "django": django.get_version(), "sections": sections}
+    data = _HEADER.pack(MAGIC, FORMAT_VERSION) + zlib.compress(pickle.dumps(payload, pickle.HIGHEST_PROTOCOL))
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return {"created_at": payload["created_at"], "bytes": len(data), "sections": sorted(sections)}
+
+
+def read_snapshot(path: str | Path) -> dict[str, Any]:
+    """Decode an artifact; ``ValueError`` when it is not one of ours or from another format/Django version."""
+    data = Path(path).read_bytes()
+    if len(data) < _HEADER.size:
+        raise ValueError("truncated warm-start snapshot")
+    magic, version = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"not a warm-start snapshot (format {version})")
+    try:
+        payload = pickle.loads(zlib.decompress(data[_HEADER.size :]))
+    except (zlib.error, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as exc:
+        raise ValueError(f"corrupt warm-start snapshot: {exc}") from exc
+    if payload.get("django") != django.get_version():
+        raise ValueError(f"snapshot written by Django {payload.get('django')}")
+    return payload
+
+
+def stale_sections(payload: dict[str, Any]) -> list[str]:
+    """Registries the snapshot lacks or recorded at older dataset generations."""
+    sections = payload["sections"]
+    datasets = {dataset for registry in _registries.values() for dataset in registry.datasets}
+    current = _generations(sorted(datasets))
+    return [
+        name
+        for name, registry in _registries.items()
+        if name not in sections or sections[name]["generations"] != {d: current[d] for d in registry.datasets}
+    ]
+
+
+def install_snapshot(payload: dict[str, Any]) -> list[str]:
+    """Install the sections still current; returns the registries left to build."""
+    stale = stale_sections(payload)
+    for name, registry in _registries.items():
+        if name in stale:
+            continue
+        section = payload["sections"][name]
+        if registry.install:
+            registry.install(section["value"])
+        else:
+            _values[name] = (section["generations"], section["value"])
+    return stale
+
+
+# ---------------------------------------------------------------------------
+# Worker boot
+# ---------------------------------------------------------------------------
+
+
+def warm(names) -> list[str]:
+    """Build ``names`` now; returns the ones that failed."""
+    failed = []
+    for name in names:
+        registry = _registries[name]
+        if registry.install:
+            continue  # restored from snapshots only; its live source is already shared
+        try:
+            generations = _generations(registry.datasets)
+            _values[name] = (generations, (registry.prebuild or registry.build)())
+        except Exception as exc:
+            logger.warning("Warm-up of %s failed: %s", name, exc)
+            failed.append(name)
+    return failed
+
+
+def _warm_in_background(names, source: str, started: float) -> None:
+    delay = 1.0
+    try:
+        while names := warm(names):
+            time.sleep(delay)
+            delay = min(delay * 2, 30.0)
+    finally:
+        connection.close()
+    _set_status(state=WARM, source=source, boot_ms=round((time.monotonic() - started) * 1000, 1))
+    logger.info("Worker warm (%s) in %.0f ms", source, (time.monotonic() - started) * 1000)
+
+
+def boot() -> None:
+    """Load the warm-start snapshot, building whatever it lacks in the background."""
+    path = getattr(settings, "WARM_START_SNAPSHOT", "")
+    if not path and not getattr(settings, "WARM_START_REQUIRED", False):
+        return  # registries fill lazily on first use
+
+    load_providers()
+    started = time.monotonic()
+    missing = list(_registries)
+    if path:
+        try:
+            payload = read_snapshot(path)
+            missing = install_snapshot(payload)
+        except FileNotFoundError:
+            logger.warning("Warm-start snapshot %s not found; warming up from live sources", path)
+        except Exception as exc:
+            logger.warning("Ignoring warm-start snapshot %s: %s", path, exc)
+        else:
+            _set_status(snapshot_created_at=payload["created_at"])
+
+    if not missing:
+        elapsed = round((time.monotonic() - started) * 1000, 1)
+        _set_status(state=WARM, source="snapshot", boot_ms=elapsed)
+        logger.info("Worker warm from snapshot %s in %.1f ms", path, elapsed)
+        return
+
+    source = "snapshot+live" if len(missing) < len(_registries) else "live"
+    _set_status(state=WARMING, source=source)
+    threading.Thread(
+        target=_warm_in_background, args=(missing, source, started), name="warm-start", daemon=True
+    ).start()
@@ -2,6 +2,7 @@
 Django settings for Bible API project.
 """
 
+import copy
 from pathlib import Path
 
 import dj_database_url
@@ -66,6 +67,8 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 MIDDLEWARE = [
     "django_prometheus.middleware.PrometheusBeforeMiddleware",
     "common.middleware.RequestIDMiddleware",
+    "common.middleware.StatementTimeoutMiddleware",
+    "common.middleware.ReadReplicaMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -75,6 +78,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "common.observability.profiling.ProfilingMiddleware",
     "common.observability.middleware.ObservabilityMiddleware",
     "django_prometheus.middleware.PrometheusAfterMiddleware",
 ]
@@ -109,11 +113,12 @@ DATABASES = {
     )
 }
 
-# Instrument Postgres engine for django-prometheus if applicable
+# Instrument Postgres engine for django-prometheus if applicable; common.db's backend extends it
+# with connection pooling and route statement timeouts
 try:
     engine = DATABASES["default"].get("ENGINE", "")
     if engine.endswith("postgresql") or engine.endswith("postgresql_psycopg2"):
-        DATABASES["default"]["ENGINE"] = "django_prometheus.db.backends.postgresql"
+        DATABASES["default"]["ENGINE"] = "common.db.backends.postgresql"
 except (KeyError, AttributeError, ValueError):
     pass
 
@@ -158,6 +163,60 @@ except (KeyError, AttributeError, ValueError):
     # Fail silently to avoid breaking other configurations
     pass
 
+# Connection pools and query routes (common.db): "default" serves OLTP reads, the search alias
+# serves vector/BM25/rerank SQL from its own pool. Pool sizes are per process; 0 disables pooling.
+DB_POOL_SIZE = config("DB_POOL_SIZE", default=10, cast=int)
+DB_SEARCH_POOL_SIZE = config("DB_SEARCH_POOL_SIZE", default=5, cast=int)
+DB_POOL_TIMEOUT = config("DB_POOL_TIMEOUT", default=5.0, cast=float)  # wait for a free connection (s)
+DB_POOL_MAX_LIFETIME = config("DB_POOL_MAX_LIFETIME", default=1800, cast=int)  # recycle connections (s)
+DB_SEARCH_ALIAS = config("DB_SEARCH_ALIAS", default="search")  # "default" = share the OLTP pool
+DB_OLTP_STATEMENT_TIMEOUT_MS = config("DB_OLTP_STATEMENT_TIMEOUT_MS", default=5000, cast=int)
+DB_SEARCH_STATEMENT_TIMEOUT_MS = config("DB_SEARCH_STATEMENT_TIMEOUT_MS", default=15000, cast=int)
+DB_PREPARED_STATEMENTS = config("DB_PREPARED_STATEMENTS", default=True, cast=bool)
+DB_PREPARED_STATEMENTS_MAX = config("DB_PREPARED_STATEMENTS_MAX", default=100, cast=int)  # per connection
+
+_pool = {"timeout": DB_POOL_TIMEOUT, "max_lifetime": DB_POOL_MAX_LIFETIME}
+if DATABASES["default"].get("ENGINE") == "common.db.backends.postgresql":
+    if DB_POOL_SIZE:
+        DATABASES["default"]["POOL"] = {**_pool, "max_size": DB_POOL_SIZE}
+    if DB_SEARCH_ALIAS != "default":
+        _search = copy.deepcopy(DATABASES["default"])
+        _search.pop("POOL", None)
+        if DB_SEARCH_POOL_SIZE:
+            _search["POOL"] = {**_pool, "max_size": DB_SEARCH_POOL_SIZE}
+        # Prepared search statements keep per-call plans: the best HNSW/filter plan depends on the values
+        _search_opts = _search.setdefault("OPTIONS", {})
+        _search_opts["options"] = f"{_search_opts.get('options', '')} -c plan_cache_mode=force_custom_plan".strip()
+        _search["TEST"] = {"MIRROR": "default"}
+        DATABASES[DB_SEARCH_ALIAS] = _search
+
+# Read replicas (common.db.replicas): comma-separated URLs, added as "replica", "replica_2", ...
+# Safe requests read from a replica lagging at most DB_REPLICA_MAX_LAG_SECONDS; clients stay on the
+# primary for DB_REPLICA_STICKY_SECONDS after a write. A URL pointing at the primary works as a stand-in.
+DATABASE_REPLICA_URLS = config(
+    "DATABASE_REPLICA_URLS", default="", cast=lambda v: [s.strip() for s in v.split(",") if s.strip()]
+)
+DB_REPLICA_POOL_SIZE = config("DB_REPLICA_POOL_SIZE", default=10, cast=int)
+DB_REPLICA_MAX_LAG_SECONDS = config("DB_REPLICA_MAX_LAG_SECONDS", default=5.0, cast=float)
+DB_REPLICA_LAG_CHECK_INTERVAL = config("DB_REPLICA_LAG_CHECK_INTERVAL", default=5.0, cast=float)
+DB_REPLICA_STICKY_SECONDS = config("DB_REPLICA_STICKY_SECONDS", default=15, cast=int)
+DB_REPLICA_ALIASES = []
+
+for _index, _url in enumerate(DATABASE_REPLICA_URLS, start=1):
+    _replica = copy.deepcopy(DATABASES["default"])
+    _replica.update(dj_database_url.parse(_url))
+    _replica["OPTIONS"] = copy.deepcopy(DATABASES["default"].get("OPTIONS", {}))
+    _replica["ENGINE"] = DATABASES["default"]["ENGINE"]
+    _replica.pop("POOL", None)
+    if DB_REPLICA_POOL_SIZE and _replica["ENGINE"] == "common.db.backends.postgresql":
+        _replica["POOL"] = {**_pool, "max_size": DB_REPLICA_POOL_SIZE}
+    _replica["TEST"] = {"MIRROR": "default"}
+    _alias = "replica" if _index == 1 else f"replica_{_index}"
+    DATABASES[_alias] = _replica
+    DB_REPLICA_ALIASES.append(_alias)
+
+DATABASE_ROUTERS = ["common.db.routers.ReplicaRouter"]
+
 # Cache
 CACHES = {
     "default": {
@@ -169,6 +228,54 @@ CACHES = {
     }
 }
 
+# In-memory cross-reference graph: optional snapshot file loaded instead of scanning the table
+# (written by `python manage.py bible crossref-graph snapshot`; ignored when stale). Single-row
+# writes are picked up at most once per refresh interval, rebuilt in the background (0 = inline).
+CROSSREF_GRAPH_SNAPSHOT = config("CROSSREF_GRAPH_SNAPSHOT", default="")
+CROSSREF_GRAPH_REFRESH_INTERVAL = config("CROSSREF_GRAPH_REFRESH_INTERVAL", default=60.0, cast=float)
+
+# Per-process top-K sketch of requested passages (served at /metrics/hot-passages/)
+HOT_PASSAGES_CAPACITY = config("HOT_PASSAGES_CAPACITY", default=1000, cast=int)
+HOT_PASSAGES_SAMPLE_RATE = config("HOT_PASSAGES_SAMPLE_RATE", default=0.1, cast=float)
+
+# Opt-in request profiling (stack samples + SQL timeline), served at /metrics/profiles/.
+# Requests are profiled when sampled or when sent with `X-Profile: 1` and an admin-scoped API key.
+PROFILING_SAMPLE_RATE = config("PROFILING_SAMPLE_RATE", default=0.0, cast=float)
+PROFILING_INTERVAL_MS = config("PROFILING_INTERVAL_MS", default=5, cast=float)
+PROFILING_BUFFER_SIZE = config("PROFILING_BUFFER_SIZE", default=50, cast=int)
+
+# Content-versioned response cache (common.content_cache): strong ETags, 304s and server-side
+# entries keyed by dataset generations, which model writes and `manage.py bible` imports bump.
+CONTENT_CACHE_ENABLED = config("CONTENT_CACHE_ENABLED", default=True, cast=bool)
+CONTENT_CACHE_TIMEOUT = config("CONTENT_CACHE_TIMEOUT", default=86400, cast=int)  # server-side entry TTL (s)
+CONTENT_CACHE_MAX_AGE = config("CONTENT_CACHE_MAX_AGE", default=86400, cast=int)  # client Cache-Control max-age (s)
+
+# Topic study payloads (bible.topics.services.study_cache): cached per topic and language under the
+# generations of the datasets they read; warm with `manage.py bible topics prebuild-studies`.
+TOPIC_STUDY_CACHE_TIMEOUT = config("TOPIC_STUDY_CACHE_TIMEOUT", default=7 * 86400, cast=int)
+STUDY_COMPOSER_WORKERS = config("STUDY_COMPOSER_WORKERS", default=4, cast=int)  # 1 = compose sequentially
+
+# Async RAG endpoints (bible.ai.aio): vector queries on an asyncpg pool per event loop when served
+# over ASGI; False (or asyncpg missing) runs them on Django's connection in a thread.
+RAG_ASYNC_DB = config("RAG_ASYNC_DB", default=True, cast=bool)
+RAG_ASYNC_DB_POOL_SIZE = config("RAG_ASYNC_DB_POOL_SIZE", default=10, cast=int)
+
+# Query-expansion / NLP caches (bible.ai.usage_counters): rows read through the Django cache, hits
+# counted in memory and written in one batched UPDATE per table every interval (0 = no background
+# flusher; flush only when USAGE_FLUSH_MAX_PENDING keys are queued and at exit).
+AI_LOOKUP_CACHE_TIMEOUT = config("AI_LOOKUP_CACHE_TIMEOUT", default=86400, cast=int)
+USAGE_FLUSH_INTERVAL = config("USAGE_FLUSH_INTERVAL", default=30.0, cast=float)
+USAGE_FLUSH_MAX_PENDING = config("USAGE_FLUSH_MAX_PENDING", default=500, cast=int)
+
+# Warm-start snapshot (common.warm_start): in-process registries written during deploy with
+# `manage.py bible warm-start snapshot` and loaded at worker boot; stale or missing sections are built
+# in the background. With WARM_START_REQUIRED the readiness probe answers 503 until the worker is warm.
+WARM_START_SNAPSHOT = config("WARM_START_SNAPSHOT", default="")
+WARM_START_REQUIRED = config("WARM_START_REQUIRED", default=False, cast=bool)
+WARM_START_LANGUAGES = config(
+    "WARM_START_LANGUAGES", default="pt,en", cast=lambda v: [s.strip() for s in v.split(",") if s.strip()]
+)
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
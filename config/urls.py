@@ -11,6 +11,8 @@ from django_prometheus import exports as prometheus_exports
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
 from bible import views
+from common.observability.topk import hot_passages
+from common.observability.views import ProfileDetailView, ProfileListView
 
 
 def health_check(request):
@@ -23,6 +25,15 @@ def metrics(request):
     return JsonResponse({"metrics": {"requests_total": 0, "response_time_avg": 0, "database_connections": 0}})
 
 
+def hot_passages_view(request):
+    """Most requested passages in this process (bounded, sampled top-K sketch)."""
+    try:
+        n = max(1, min(int(request.GET.get("n", 20)), 100))
+    except ValueError:
+        n = 20
+    return JsonResponse(hot_passages(n))
+
+
 urlpatterns = [
     # Admin
     path("admin/", admin.site.urls),
@@ -33,6 +44,9 @@ urlpatterns = [
     path("health/liveness/", lambda r: JsonResponse({"status": "alive"})),
     path("health/readiness/", views.ReadinessCheckView.as_view(), name="readiness"),
     path("metrics/prometheus/", prometheus_exports.ExportToDjangoView, name="metrics_prometheus"),
+    path("metrics/hot-passages/", hot_passages_view, name="metrics_hot_passages"),
+    path("metrics/profiles/", ProfileListView.as_view(), name="metrics_profiles"),
+    path("metrics/profiles/<str:profile_id>/", ProfileDetailView.as_view(), name="metrics_profile_detail"),
     # API v1
     path(
         "api/v1/",
@@ -9,12 +9,20 @@ Usage:
     python manage.py bible crossrefs [--file PATH]
     python manage.py bible topics import [--letter A] [--limit 100] [--update]
     python manage.py bible topics status
+    python manage.py bible topics prebuild-studies [--langs pt,en] [--slugs abraham,moses] [--force]
     python manage.py bible entities import [--update]
     python manage.py bible entities status
     python manage.py bible symbols import [--update]
     python manage.py bible symbols status
     python manage.py bible themes import [--catalog PATH] [--version PT_NAA] [--update]
+    python manage.py bible themes rebuild-matrix
     python manage.py bible themes status
+    python manage.py bible ai build-neighbors [--versions PT_NAA,EN_KJV] [--top-n 20]
+    python manage.py bible commentaries benchmark-refs [--limit 5000] [--file PATH] [--repeat 3]
+    python manage.py bible content-cache bump [--datasets verses,crossrefs]
+    python manage.py bible content-cache status
+    python manage.py bible warm-start snapshot [--output PATH]
+    python manage.py bible warm-start status [--input PATH]
 """
 
 import time
@@ -25,6 +33,23 @@ from django.db import transaction
 
 from common.data_core import BibleDataEngine
 
+# Imports that rewrite API-visible data, and the content-cache datasets they invalidate
+# (bulk loads bypass the model signals in common.content_cache)
+CONTENT_DATASETS_BY_ACTION = {
+    ("populate", None): ("verses", "books"),
+    ("crossrefs", None): ("crossrefs",),
+    ("cleanup", None): ("verses", "books"),
+    ("topics", "import"): ("topics",),
+    ("topics", "update"): ("topics",),
+    ("entities", "import"): ("entities",),
+    ("entities", "populate-verse-links"): ("entities", "symbols"),
+    ("symbols", "import"): ("symbols",),
+    ("themes", "import"): ("themes",),
+    ("themes", "rebuild-matrix"): ("themes",),
+    ("commentaries", "import-authors"): ("commentaries",),
+    ("commentaries", "import-entries"): ("commentaries",),
+}
+
 
 class Command(BaseCommand):
     help = "Unified Bible data management tool"
@@ -48,6 +73,7 @@ class Command(BaseCommand):
         populate_parser.add_argument("--versions", help="Comma-separated version codes (e.g., NVI,KJV)")
         populate_parser.add_argument("--dry-run", action="store_true", help="Show what would be populated")
         populate_parser.add_argument("--clear-existing", action="store_true", help="Clear existing data first")
+        populate_parser.add_argument("--workers", type=int, default=1, help="Versions loaded in parallel processes")
 
         # status - show current state
         status_parser = subparsers.add_parser("status", help="Show data pipeline status")
@@ -61,6 +87,15 @@ class Command(BaseCommand):
         crossrefs_parser.add_argument(
             "--clear-existing", action="store_true", help="Clear existing cross references first"
         )
+        crossrefs_parser.add_argument("--source", default="openbible", help="Source label stored on each edge")
+        crossrefs_parser.add_argument("--min-votes", type=int, default=0, help="Skip edges with fewer community votes")
+
+        # crossref-graph - in-memory cross-reference graph
+        crossref_graph_parser = subparsers.add_parser("crossref-graph", help="Manage the in-memory cross-reference graph")
+        crossref_graph_subparsers = crossref_graph_parser.add_subparsers(dest="crossref_graph_action", help="Graph actions")
+        graph_snapshot = crossref_graph_subparsers.add_parser("snapshot", help="Build the graph and write a snapshot file")
+        graph_snapshot.add_argument("--output", help="Snapshot path (default: CROSSREF_GRAPH_SNAPSHOT setting)")
+        crossref_graph_subparsers.add_parser("status", help="Show graph size and build time")
 
         # commentaries - manage commentary data
         commentaries_parser = subparsers.add_parser("commentaries", help="Manage commentaries and authors")
@@ -76,10 +111,24 @@ class Command(BaseCommand):
         comm_entries.add_argument("--catena-path", help="Path to Catena Bible dataset")
         comm_entries.add_argument("--limit", type=int, help="Limit entries to import")
         comm_entries.add_argument("--clear-existing", action="store_true", help="Clear existing entries first")
+        comm_entries.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Parser processes; >1 loads through COPY + staging merge (PostgreSQL)",
+        )
 
         # commentaries status
         commentaries_subparsers.add_parser("status", help="Show commentaries data status")
 
+        # commentaries benchmark-refs
+        comm_refs = commentaries_subparsers.add_parser(
+            "benchmark-refs", help="Measure reference-extraction throughput (MB/s) over commentary text"
+        )
+        comm_refs.add_argument("--limit", type=int, default=5000, help="Commentary entries to scan")
+        comm_refs.add_argument("--file", help="Scan a UTF-8 text file instead of the database")
+        comm_refs.add_argument("--repeat", type=int, default=3, help="Timed passes (best is reported)")
+
         # cleanup - remove old/unused data
         cleanup_parser = subparsers.add_parser("cleanup", help="Clean up old or unused data")
         cleanup_parser.add_argument("--languages", action="store_true", help="Remove unused languages")
@@ -105,6 +154,14 @@ class Command(BaseCommand):
         # topics status
         topics_subparsers.add_parser("status", help="Show topics data status")
 
+        # topics prebuild-studies
+        topics_prebuild = topics_subparsers.add_parser(
+            "prebuild-studies", help="Compose and cache topic study payloads ahead of traffic"
+        )
+        topics_prebuild.add_argument("--langs", default="pt,en", help="Comma-separated language codes")
+        topics_prebuild.add_argument("--slugs", help="Comma-separated topic slugs (default: all topics)")
+        topics_prebuild.add_argument("--force", action="store_true", help="Recompose studies already cached")
+
         # entities - manage biblical entities from gazetteer
         entities_parser = subparsers.add_parser("entities", help="Manage biblical entities (people, places, etc.)")
         entities_subparsers = entities_parser.add_subparsers(dest="entities_action", help="Entities actions")
@@ -142,6 +199,11 @@ class Command(BaseCommand):
         themes_import.add_argument("--version", default="PT_NAA", help="Bible version code for verse lookup")
         themes_import.add_argument("--update", action="store_true", help="Update existing themes")
 
+        # themes rebuild-matrix
+        themes_subparsers.add_parser(
+            "rebuild-matrix", help="Rebuild theme co-occurrence matrix and chapter distribution"
+        )
+
         # themes status
         themes_subparsers.add_parser("status", help="Show themes data status")
 
@@ -184,6 +246,14 @@ class Command(BaseCommand):
         ai_analyze.add_argument("--model", default="gpt-4o-mini", help="AI model to use")
         ai_analyze.add_argument("--force", action="store_true", help="Re-analyze even if already done")
 
+        # ai build-neighbors
+        ai_neighbors = ai_subparsers.add_parser(
+            "build-neighbors", help="Precompute top-N semantic neighbors of every embedded verse"
+        )
+        ai_neighbors.add_argument("--versions", help="Comma-separated version codes (default: all embedded)")
+        ai_neighbors.add_argument("--top-n", type=int, default=20, help="Neighbors kept per verse")
+        ai_neighbors.add_argument("--block-size", type=int, default=512, help="Similarity rows per matrix product")
+
         # ai status
         ai_subparsers.add_parser("status", help="Show AI analysis status")
 
@@ -198,6 +268,21 @@ class Command(BaseCommand):
         # integration status
         int_subparsers.add_parser("status", help="Show matching status")
 
+        # content-cache - generations behind ETags and cached API responses
+        cc_parser = subparsers.add_parser("content-cache", help="Inspect or invalidate the content-versioned API cache")
+        cc_subparsers = cc_parser.add_subparsers(dest="content_cache_action", help="Content cache actions")
+        cc_bump = cc_subparsers.add_parser("bump", help="Invalidate cached responses of datasets")
+        cc_bump.add_argument("--datasets", help="Comma-separated datasets (default: all)")
+        cc_subparsers.add_parser("status", help="Show current dataset generations")
+
+        # warm-start - snapshot of per-process registries loaded at worker boot
+        ws_parser = subparsers.add_parser("warm-start", help="Write or inspect the worker warm-start snapshot")
+        ws_subparsers = ws_parser.add_subparsers(dest="warm_start_action", help="Warm-start actions")
+        ws_snapshot = ws_subparsers.add_parser("snapshot", help="Build in-process registries and write the snapshot")
+        ws_snapshot.add_argument("--output", help="Snapshot path (default: WARM_START_SNAPSHOT setting)")
+        ws_status = ws_subparsers.add_parser("status", help="Show a snapshot's sections and whether they are current")
+        ws_status.add_argument("--input", help="Snapshot path (default: WARM_START_SNAPSHOT setting)")
+
         # gazetteers - data quality pipeline
         gaz_parser = subparsers.add_parser("gazetteers", help="Gazetteer data quality pipeline")
         gaz_subparsers = gaz_parser.add_subparsers(dest="gazetteers_action", help="Gazetteers actions")
@@ -229,6 +314,8 @@ class Command(BaseCommand):
                 self.handle_status(engine, options)
             elif subcommand == "crossrefs":
                 self.handle_crossrefs(engine, options)
+            elif subcommand == "crossref-graph":
+                self.handle_crossref_graph(options)
             elif subcommand == "commentaries":
                 self.handle_commentaries(options)
             elif subcommand == "cleanup":
@@ -251,11 +338,75 @@ class Command(BaseCommand):
                 self.handle_integration(options)
             elif subcommand == "gazetteers":
                 self.handle_gazetteers(options)
+            elif subcommand == "content-cache":
+                self.handle_content_cache(options)
+            elif subcommand == "warm-start":
+                self.handle_warm_start(options)
             else:
                 raise CommandError(f"Unknown subcommand: {subcommand}")
+            self._invalidate_content_cache(subcommand, options)
         except Exception as e:
             raise CommandError(f"Command failed: {e}") from e
 
+    def _invalidate_content_cache(self, subcommand, options):
+        """Bump the content-cache generations of whatever a successful import rewrote."""
+        if options.get("dry_run"):
+            return
+        action = options.get(f"{subcommand}_action")
+        datasets = CONTENT_DATASETS_BY_ACTION.get((subcommand, action))
+        if datasets:
+            from common.content_cache import bump_generation
+
+            bump_generation(*datasets)
+            self.stdout.write(f"Content cache invalidated: {', '.join(datasets)}")
+
+    def handle_content_cache(self, options):
+        """Handle content-cache commands."""
+        from common.content_cache import DATASETS, bump_generation, get_generations
+
+        action = options.get("content_cache_action")
+        if action == "bump":
+            datasets = self._parse_comma_list(options.get("datasets")) or list(DATASETS)
+            bump_generation(*datasets)
+            self.stdout.write(self.style.SUCCESS(f"Bumped: {', '.join(datasets)}"))
+        elif action == "status":
+            for dataset, generation in get_generations(DATASETS).items():
+                self.stdout.write(f"  {dataset}: {generation}")
+        else:
+            self.stdout.write("Available content-cache actions: bump, status")
+
+    def handle_warm_start(self, options):
+        """Handle warm-start snapshot commands."""
+        from django.conf import settings
+
+        from common import warm_start
+
+        action = options.get("warm_start_action")
+        if action not in ("snapshot", "status"):
+            self.stdout.write("Available warm-start actions: snapshot, status")
+            return
+
+        path = options.get("output") or options.get("input") or settings.WARM_START_SNAPSHOT
+        if not path:
+            raise CommandError("No snapshot path: pass --output/--input or set WARM_START_SNAPSHOT")
+
+        if action == "snapshot":
+            start = time.time()
+            header = warm_start.write_snapshot(path)
+            self.stdout.write(self.style.SUCCESS(f"✓ Snapshot written to {path}"))
+            self.stdout.write(f"  Sections: {', '.join(header['sections'])}")
+            self.stdout.write(f"  Size: {header['bytes']:,} bytes | Build time: {time.time() - start:.2f}s")
+            return
+
+        start = time.time()
+        payload = warm_start.read_snapshot(path)
+        load_ms = (time.time() - start) * 1000
+        warm_start.load_providers()
+        stale = set(warm_start.stale_sections(payload))
+        self.stdout.write(f"Created: {payload['created_at']} | Load time: {load_ms:.1f} ms")
+        for name in sorted(payload["sections"]):
+            self.stdout.write(f"  {name}: {'stale' if name in stale else 'current'}")
+
     def handle_migrate(self, engine: BibleDataEngine, options):
         """Handle file migration."""
         source_dir = options.get("source_dir")
@@ -311,7 +462,7 @@ class Command(BaseCommand):
         start_time = time.time()
 
         if not dry_run:
-            result = engine.populate_all(languages)
+            result = engine.populate_all(languages, workers=options.get("workers") or 1)
 
             processing_time = time.time() - start_time
 
@@ -423,20 +574,73 @@ class Command(BaseCommand):
 
         self.stdout.write(f"Populating cross references from: {crossref_file}")
 
-        result = engine.populate_cross_references(crossref_file)
+        result = engine.populate_cross_references(
+            crossref_file, source=options.get("source", "openbible"), min_votes=options.get("min_votes", 0)
+        )
 
         if result.success:
+            from bible.crossrefs.graph import invalidate_crossref_graph
+
+            invalidate_crossref_graph()
             count = result.items_processed
+            details = result.details
             self.stdout.write(self.style.SUCCESS(f"✓ Successfully imported {count:,} cross references"))
+            self.stdout.write(
+                f"  Lines: {details['lines']:,} ({details['lines_per_second']:,.0f}/s) | "
+                f"Edges: {details['edges_staged']:,} ({details['edges_per_second']:,.0f}/s) | "
+                f"Unresolved: {details['unresolved']:,} | Truncated ranges: {details['ranges_truncated']:,}"
+            )
         else:
             self.stdout.write(self.style.ERROR(f"✗ Cross reference import failed: {result.error_message}"))
 
+    def handle_crossref_graph(self, options):
+        """Handle cross-reference graph commands."""
+        action = options.get("crossref_graph_action")
+
+        if not action:
+            self.stdout.write("Available crossref-graph actions: snapshot, status")
+            return
+
+        if action == "snapshot":
+            self._handle_crossref_graph_snapshot(options)
+        elif action == "status":
+            self._handle_crossref_graph_status()
+        else:
+            raise CommandError(f"Unknown crossref-graph action: {action}")
+
+    def _handle_crossref_graph_snapshot(self, options):
+        """Build the graph from the table and write it to a snapshot file."""
+        from django.conf import settings
+
+        from bible.crossrefs.graph import build_crossref_graph
+
+        output = options.get("output") or settings.CROSSREF_GRAPH_SNAPSHOT
+        if not output:
+            raise CommandError("No snapshot path: pass --output or set CROSSREF_GRAPH_SNAPSHOT")
+
+        graph = build_crossref_graph()
+        graph.save(output)
+        self.stdout.write(self.style.SUCCESS(f"✓ Snapshot written to {output}"))
+        self.stdout.write(f"  Verses with references: {len(graph.nodes):,}")
+        self.stdout.write(f"  Edges: {graph.edge_count:,}")
+
+    def _handle_crossref_graph_status(self):
+        """Build the graph and report its size."""
+        from bible.crossrefs.graph import build_crossref_graph
+
+        start = time.time()
+        graph = build_crossref_graph()
+        self.stdout.write(f"Verses with references: {len(graph.nodes):,}")
+        self.stdout.write(f"Edges: {graph.edge_count:,}")
+        self.stdout.write(f"Sources: {', '.join(s or 'unknown' for s in graph.sources) or '-'}")
+        self.stdout.write(f"Build time: {time.time() - start:.2f}s")
+
     def handle_commentaries(self, options):
         """Handle commentary management commands."""
         action = options.get("commentaries_action")
 
         if not action:
-            self.stdout.write("Available commentaries actions: import-authors, import-entries, status")
+            self.stdout.write("Available commentaries actions: import-authors, import-entries, status, benchmark-refs")
             return
 
         if action == "import-authors":
@@ -445,6 +649,8 @@ class Command(BaseCommand):
             self._handle_commentaries_import_entries(options)
         elif action == "status":
             self._handle_commentaries_status()
+        elif action == "benchmark-refs":
+            self._handle_commentaries_benchmark_refs(options)
         else:
             raise CommandError(f"Unknown commentaries action: {action}")
 
@@ -490,12 +696,19 @@ class Command(BaseCommand):
         if limit:
             self.stdout.write(f"  Limit: {limit:,}")
 
-        result = importer.import_entries(limit=limit)
+        workers = options.get("workers") or 1
+        if workers > 1:
+            self.stdout.write(f"  Workers: {workers}")
+
+        result = importer.import_entries(limit=limit, workers=workers)
 
         self.stdout.write(self.style.SUCCESS(f"\n✓ Entries imported in {result.duration_seconds:.1f}s"))
         self.stdout.write(f"  Created: {result.entries_created:,}")
         self.stdout.write(f"  Skipped: {result.entries_skipped:,}")
         self.stdout.write(f"  Books not found: {result.books_not_found:,}")
+        self.stdout.write(f"  Files: {result.files_processed:,} ({result.files_per_second:,.0f}/s)")
+        if result.rows_staged:
+            self.stdout.write(f"  Rows: {result.rows_staged:,} ({result.rows_per_second:,.0f}/s)")
 
         if result.errors:
             self.stdout.write(self.style.WARNING(f"\n⚠ {len(result.errors)} errors:"))
@@ -524,6 +737,41 @@ class Command(BaseCommand):
             count = CommentaryEntry.objects.filter(source=source).count()
             self.stdout.write(f"\n📖 {source.name} [{source.short_code}]: {count:,} entries")
 
+    def _handle_commentaries_benchmark_refs(self, options):
+        """Benchmark the free-text reference extractor on commentary bodies."""
+        from bible.utils.ref_extractor import get_extractor, measure_throughput
+
+        if options.get("file"):
+            path = Path(options["file"])
+            if not path.exists():
+                raise CommandError(f"File not found: {path}")
+            texts = path.read_text(encoding="utf-8").split("\n\n")
+            label = str(path)
+        else:
+            from bible.commentaries.models import CommentaryEntry
+
+            texts = list(
+                CommentaryEntry.objects.exclude(body_text="")
+                .order_by("id")
+                .values_list("body_text", flat=True)[: options["limit"]]
+            )
+            label = f"{len(texts):,} commentary entries"
+        if not texts:
+            raise CommandError("No text to scan")
+
+        started = time.perf_counter()
+        extractor = get_extractor()
+        build_ms = (time.perf_counter() - started) * 1000
+        self.stdout.write(f"Extractor built in {build_ms:.0f} ms ({len(extractor.aliases):,} aliases)")
+
+        result = measure_throughput(texts, extractor, repeat=options["repeat"])
+        self.stdout.write(f"Scanned {label}: {result['mb']:.2f} MB, {result['references']:,} references")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"  {result['mb_per_s']} MB/s, {result['refs_per_s']:,} refs/s (best of {options['repeat']})"
+            )
+        )
+
     def handle_cleanup(self, engine: BibleDataEngine, options):
         """Handle data cleanup."""
         languages = options["languages"]
@@ -574,7 +822,7 @@ class Command(BaseCommand):
         action = options.get("topics_action")
 
         if not action:
-            self.stdout.write("Available topics actions: import, update, status")
+            self.stdout.write("Available topics actions: import, update, status, prebuild-studies")
             return
 
         if action == "import":
@@ -583,6 +831,8 @@ class Command(BaseCommand):
             self._handle_topics_update(options)
         elif action == "status":
             self._handle_topics_status()
+        elif action == "prebuild-studies":
+            self._handle_topics_prebuild_studies(options)
         else:
             raise CommandError(f"Unknown topics action: {action}")
 
@@ -674,6 +924,21 @@ class Command(BaseCommand):
                 f"✗ Update failed: {result.error_message}"
             ))
 
+    def _handle_topics_prebuild_studies(self, options):
+        """Warm the topic study cache for every topic (or --slugs) in each language."""
+        from bible.topics.services import prebuild_studies
+
+        langs = self._parse_comma_list(options.get("langs")) or ["pt"]
+        slugs = self._parse_comma_list(options.get("slugs"))
+        self.stdout.write(f"Prebuilding topic studies ({', '.join(langs)})...")
+        stats = prebuild_studies(langs, slugs=slugs, force=options.get("force", False))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ {stats['topics']:,} topics: {stats['built']:,} built, {stats['cached']:,} already cached, "
+                f"{stats['failed']:,} failed in {stats['seconds']}s"
+            )
+        )
+
     def _handle_topics_status(self):
         """Show topics data status."""
         from pathlib import Path
@@ -934,11 +1199,13 @@ class Command(BaseCommand):
         action = options.get("themes_action")
 
         if not action:
-            self.stdout.write("Available themes actions: import, status")
+            self.stdout.write("Available themes actions: import, rebuild-matrix, status")
             return
 
         if action == "import":
             self._handle_themes_import(options)
+        elif action == "rebuild-matrix":
+            self._handle_themes_rebuild_matrix()
         elif action == "status":
             self._handle_themes_status()
         else:
@@ -979,6 +1246,21 @@ class Command(BaseCommand):
             if len(result.errors) > 10:
                 self.stdout.write(f"  ... and {len(result.errors) - 10} more errors")
 
+        # Every theme was committed by now; refresh the derived matrix in one pass
+        self._handle_themes_rebuild_matrix()
+
+    def _handle_themes_rebuild_matrix(self):
+        """Rebuild the precomputed theme co-occurrence matrix."""
+        from bible.themes.services import rebuild_theme_matrix
+
+        self.stdout.write("Rebuilding theme co-occurrence matrix...")
+        result = rebuild_theme_matrix()
+
+        self.stdout.write(self.style.SUCCESS(f"\n✓ Rebuild completed in {result.duration_seconds:.1f}s"))
+        self.stdout.write(f"  Themes: {result.themes:,}")
+        self.stdout.write(f"  Co-occurrence pairs: {result.cooccurrence_rows:,}")
+        self.stdout.write(f"  Chapter distribution rows: {result.distribution_rows:,}")
+
     def _handle_themes_status(self):
         """Show themes data status."""
         from bible.themes.models import Theme, ThemeVerseLink
@@ -1170,16 +1452,32 @@ class Command(BaseCommand):
     def handle_ai(self, options):
         action = options.get("ai_action")
         if not action:
-            self.stdout.write("Available ai actions: analyze, status")
+            self.stdout.write("Available ai actions: analyze, build-neighbors, status")
             return
 
         if action == "analyze":
             self._handle_ai_analyze(options)
+        elif action == "build-neighbors":
+            self._handle_ai_build_neighbors(options)
         elif action == "status":
             self._handle_ai_status()
         else:
             raise CommandError(f"Unknown ai action: {action}")
 
+    def _handle_ai_build_neighbors(self, options):
+        """Rebuild the precomputed semantic-neighbor table served by /ai/rag/similar/."""
+        from bible.ai.neighbors import build_neighbors
+
+        versions = [v.strip() for v in options["versions"].split(",") if v.strip()] if options.get("versions") else None
+        self.stdout.write("Building semantic neighbors from stored embeddings...")
+        stats = build_neighbors(versions, top_n=options["top_n"], block_size=options["block_size"])
+
+        for version_code, info in stats["versions"].items():
+            self.stdout.write(f"  {version_code}: {info['verses']:,} verses in {info['seconds']:.1f}s")
+        self.stdout.write(
+            self.style.SUCCESS(f"✓ {stats['verses']:,} neighbor rows built in {stats['seconds']:.1f}s")
+        )
+
     def _handle_ai_analyze(self, options):
         from bible.ai.services.chapter_analyzer import ChapterAnalyzer
         from bible.models import CanonicalBook
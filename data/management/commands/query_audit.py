@@ -0,0 +1,88 @@
+"""Query-count audit of every Bible read endpoint against a throwaway database.
+
+Usage examples:
+  python manage.py query_audit
+  python manage.py query_audit --output query_report.json
+  python manage.py query_audit --compare main_report.json --output query_report.json
+  python manage.py query_audit --small 2 --large 10
+
+Notes:
+- Creates a fresh test database (``test_<NAME>``), seeds the fixtures from
+  ``bible.query_audit`` at both sizes and drops the database afterwards.
+- Exits non-zero when an endpoint's query count grows with result size and it
+  is not listed in ``bible.query_audit.KNOWN_SCALING``.
+- The JSON report is ordered deterministically; ``--compare`` prints per-endpoint
+  query-count changes against a report from another commit.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from bible.query_audit import KNOWN_SCALING, SIZES, diff_reports, run_audit
+
+
+class Command(BaseCommand):
+    help = "Measure query counts and DB time of every Bible read endpoint at two fixture sizes"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--small", type=int, default=SIZES["small"], help="Rows per collection, small run")
+        parser.add_argument("--large", type=int, default=SIZES["large"], help="Rows per collection, large run")
+        parser.add_argument("--output", help="Write the report JSON to this path")
+        parser.add_argument("--compare", help="Report JSON from another commit to diff query counts against")
+        parser.add_argument("--keepdb", action="store_true", help="Reuse the audit database between runs")
+
+    def handle(self, *args, **opts):
+        if opts["large"] <= opts["small"]:
+            raise CommandError("--large must be greater than --small")
+
+        old_name = connection.settings_dict["NAME"]
+        setup_test_environment()
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False, keepdb=opts["keepdb"])
+        try:
+            report = run_audit({"small": opts["small"], "large": opts["large"]})
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=opts["keepdb"])
+            teardown_test_environment()
+
+        self._print_report(report)
+        if opts["output"]:
+            Path(opts["output"]).write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+            self.stdout.write(f"Report written to {opts['output']}")
+        if opts["compare"]:
+            self._print_diff(json.loads(Path(opts["compare"]).read_text(encoding="utf-8")), report)
+
+        unexpected = sorted(set(report["scaling"]) - set(KNOWN_SCALING))
+        if unexpected:
+            for name in unexpected:
+                counts = report["scaling"][name]
+                self.stdout.write(self.style.ERROR(f"✗ {name}: {counts['small']} → {counts['large']} queries"))
+            raise CommandError(f"{len(unexpected)} endpoint(s) issue a query per result row")
+        self.stdout.write(self.style.SUCCESS("✓ No endpoint's query count grows with result size"))
+
+    def _print_report(self, report):
+        sizes = report["sizes"]
+        self.stdout.write(f"\n{'endpoint':<48} {'status':>6} {'q(small)':>9} {'q(large)':>9} {'db ms':>8}")
+        for name, entry in report["endpoints"].items():
+            small, large = entry.get("small", {}), entry.get("large", {})
+            self.stdout.write(
+                f"{name:<48} {large.get('status', '-'):>6} {small.get('queries', '-'):>9} "
+                f"{large.get('queries', '-'):>9} {large.get('db_ms', 0):>8.2f}"
+            )
+        self.stdout.write(f"\n{len(report['endpoints'])} endpoints at sizes {sizes}")
+
+    def _print_diff(self, old, new):
+        changes = diff_reports(old, new)
+        if not changes:
+            self.stdout.write("No query-count changes against the compared report")
+            return
+        self.stdout.write(f"\n{'endpoint':<48} {'before':>7} {'after':>7}")
+        for change in changes:
+            before = "-" if change["before"] is None else change["before"]
+            after = "-" if change["after"] is None else change["after"]
+            self.stdout.write(f"{change['endpoint']:<48} {before:>7} {after:>7}")
@@ -0,0 +1,96 @@
+"""Offline hybrid search benchmark against a throwaway database.
+
+Usage examples:
+  python manage.py search_benchmark
+  python manage.py search_benchmark --verses 5000 --iterations 10 --output bench.json
+  python manage.py search_benchmark --baseline bible/ai/benchmark_baseline.json --tolerance 0.5
+  python manage.py search_benchmark --write-baseline bible/ai/benchmark_baseline.json
+
+Notes:
+- Creates a fresh test database (``test_<NAME>``), seeds the synthetic corpus from
+  ``bible.ai.benchmark`` and drops the database afterwards; real data is never touched.
+- Embeddings come from a deterministic local stub, so no API key is needed.
+- Exits non-zero when any stage regresses past the tolerance.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from bible.ai.benchmark import CorpusSpec, compare_to_baseline, run_benchmark, seed_corpus
+
+DEFAULT_BASELINE = Path(__file__).resolve().parents[3] / "bible" / "ai" / "benchmark_baseline.json"
+
+
+class Command(BaseCommand):
+    help = "Benchmark hybrid search stages in-process on a seeded synthetic corpus"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--verses", type=int, default=CorpusSpec.verses, help="Canonical verses to seed")
+        parser.add_argument("--dim", type=int, default=CorpusSpec.dim, help="Stub embedding dimension")
+        parser.add_argument("--seed", type=int, default=CorpusSpec.seed)
+        parser.add_argument("--iterations", type=int, default=5, help="Timed rounds over the query set")
+        parser.add_argument("--warmup", type=int, default=1, help="Untimed rounds before measuring")
+        parser.add_argument("--output", help="Write results JSON to this path")
+        parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline JSON to compare against")
+        parser.add_argument("--no-compare", action="store_true", help="Skip the baseline comparison")
+        parser.add_argument("--write-baseline", help="Write results as the new baseline to this path")
+        parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed slowdown ratio (0.5 = +50%%)")
+        parser.add_argument("--metric", default="p50_ms", choices=["mean_ms", "p50_ms", "p95_ms", "p99_ms"])
+        parser.add_argument("--keepdb", action="store_true", help="Reuse the benchmark database between runs")
+
+    def handle(self, *args, **opts):
+        spec = CorpusSpec(verses=opts["verses"], dim=opts["dim"], seed=opts["seed"])
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False, keepdb=opts["keepdb"])
+        try:
+            self.stdout.write(f"Seeding {spec.verses:,} verses × {len(spec.versions)} versions (dim={spec.dim})...")
+            seeded = seed_corpus(spec)
+            self.stdout.write(f"Seeded {seeded['verses']:,} verses; running {opts['iterations']} rounds...")
+            results = run_benchmark(spec, iterations=opts["iterations"], warmup=opts["warmup"])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=opts["keepdb"])
+
+        self._print_results(results)
+        payload = json.dumps(results, indent=2)
+        if opts["output"]:
+            Path(opts["output"]).write_text(payload + "\n", encoding="utf-8")
+            self.stdout.write(f"Results written to {opts['output']}")
+        if opts["write_baseline"]:
+            Path(opts["write_baseline"]).write_text(payload + "\n", encoding="utf-8")
+            self.stdout.write(self.style.SUCCESS(f"Baseline written to {opts['write_baseline']}"))
+            return
+        if opts["no_compare"]:
+            return
+
+        baseline_path = Path(opts["baseline"])
+        if not baseline_path.exists():
+            self.stdout.write(self.style.WARNING(f"No baseline at {baseline_path}; skipping comparison"))
+            return
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        try:
+            regressions = compare_to_baseline(results, baseline, tolerance=opts["tolerance"], metric=opts["metric"])
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+
+        if regressions:
+            for r in regressions:
+                self.stdout.write(
+                    self.style.ERROR(
+                        f"✗ {r['stage']}: {r['metric']} {r['current']:.2f}ms vs baseline {r['baseline']:.2f}ms "
+                        f"(×{r['ratio']})"
+                    )
+                )
+            raise CommandError(f"{len(regressions)} stage(s) regressed beyond {opts['tolerance']:.0%}")
+        self.stdout.write(self.style.SUCCESS(f"✓ No regressions vs {baseline_path.name} ({opts['metric']})"))
+
+    def _print_results(self, results):
+        self.stdout.write(f"\n{'stage':<12} {'p50':>9} {'p95':>9} {'p99':>9} {'ops/s':>9}")
+        for stage, s in results["stages"].items():
+            self.stdout.write(
+                f"{stage:<12} {s['p50_ms']:>8.2f}ms {s['p95_ms']:>7.2f}ms {s['p99_ms']:>7.2f}ms {s['ops_per_sec']:>9.1f}"
+            )
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Load test: throughput concorrente das rotas RAG sync vs async.
+
+Dispara o mesmo conjunto de queries contra a rota síncrona e a assíncrona
+(`/ai/rag/hybrid/` vs `/ai/rag/hybrid/async/`, ou `search`) com N requisições
+em voo, e reporta req/s, req/s por processo worker e latências p50/p95/p99.
+
+Rode o servidor ASGI com um número conhecido de workers, por exemplo:
+
+    uvicorn config.asgi:application --workers 1
+    API_KEY=... python scripts/run_async_loadtest.py --workers 1 --concurrency 32 --requests 320
+
+Com `--cache-bust` cada query recebe um sufixo único, forçando a chamada à
+OpenAI (o cenário I/O-bound em que a rota async deve se destacar).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+API_BASE = os.getenv("API_BASE", "http://127.0.0.1:8000/api/v1")
+API_KEY = os.getenv("API_KEY", "")
+ENDPOINTS = {
+    "hybrid": ("/ai/rag/hybrid/", "/ai/rag/hybrid/async/"),
+    "search": ("/ai/rag/search/", "/ai/rag/search/async/"),
+}
+DEFAULT_QUERIES = [
+    "amor de Deus",
+    "perdão dos pecados",
+    "salvação pela fé",
+    "confiança em tempos difíceis",
+    "reino de Deus",
+    "ressurreição de Cristo",
+    "oração e jejum",
+    "esperança",
+]
+
+
+def build_headers() -> dict[str, str]:
+    headers = {"Accept": "application/json"}
+    if API_KEY:
+        headers["Authorization"] = f"Api-Key {API_KEY}"
+    return headers
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_path(
+    client: httpx.AsyncClient,
+    path: str,
+    queries: list[str],
+    *,
+    total: int,
+    concurrency: int,
+    cache_bust: bool,
+    top_k: int,
+) -> dict[str, Any]:
+    latencies: list[float] = []
+    statuses: dict[str, int] = {}
+    counter = iter(range(total))
+
+    async def worker() -> None:
+        for i in counter:
+            query = queries[i % len(queries)]
+            if cache_bust:
+                query = f"{query} {uuid.uuid4().hex[:8]}"
+            started = time.perf_counter()
+            try:
+                response = await client.get(path, params={"q": query, "top_k": top_k})
+                key = str(response.status_code)
+            except httpx.HTTPError as e:
+                key = type(e).__name__
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[key] = statuses.get(key, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    ok = statuses.get("200", 0)
+    return {
+        "path": path,
+        "requests": total,
+        "ok": ok,
+        "statuses": statuses,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(ok / elapsed, 2) if elapsed else None,
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies), 1) if latencies else None,
+            "p50": round(percentile(latencies, 50), 1) if latencies else None,
+            "p95": round(percentile(latencies, 95), 1) if latencies else None,
+            "p99": round(percentile(latencies, 99), 1) if latencies else None,
+        },
+    }
+
+
+async def main_async(args: argparse.Namespace) -> dict[str, Any]:
+    queries = DEFAULT_QUERIES
+    if args.queries:
+        queries = [line.strip() for line in Path(args.queries).read_text(encoding="utf-8").splitlines() if line.strip()]
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.api_base, headers=build_headers(), timeout=args.timeout, limits=limits
+    ) as client:
+        results = {}
+        for mode, path in zip(("sync", "async"), ENDPOINTS[args.endpoint], strict=True):
+            if args.warmup:
+                await run_path(
+                    client, path, queries, total=args.warmup, concurrency=1, cache_bust=False, top_k=args.top_k
+                )
+            result = await run_path(
+                client,
+                path,
+                queries,
+                total=args.requests,
+                concurrency=args.concurrency,
+                cache_bust=args.cache_bust,
+                top_k=args.top_k,
+            )
+            rps = result["throughput_rps"]
+            result["throughput_rps_per_worker"] = round(rps / args.workers, 2) if rps is not None else None
+            results[mode] = result
+
+    sync_rps = results["sync"]["throughput_rps"]
+    async_rps = results["async"]["throughput_rps"]
+    return {
+        "endpoint": args.endpoint,
+        "api_base": args.api_base,
+        "workers": args.workers,
+        "concurrency": args.concurrency,
+        "cache_bust": args.cache_bust,
+        "results": results,
+        "async_vs_sync": round(async_rps / sync_rps, 2) if sync_rps else None,
+    }
+
+
+def print_report(report: dict[str, Any]) -> None:
+    print(
+        f"\n{report['endpoint']} — {report['concurrency']} em voo, {report['workers']} worker(s), "
+        f"cache_bust={report['cache_bust']}"
+    )
+    print(f"{'modo':<6} {'ok':>6} {'req/s':>8} {'req/s/worker':>13} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for mode, result in report["results"].items():
+        latency = result["latency_ms"]
+        print(
+            f"{mode:<6} {result['ok']:>6} {result['throughput_rps'] or 0:>8} "
+            f"{result['throughput_rps_per_worker'] or 0:>13} {latency['p50'] or 0:>8} "
+            f"{latency['p95'] or 0:>8} {latency['p99'] or 0:>8}"
+        )
+        errors = {k: v for k, v in result["statuses"].items() if k != "200"}
+        if errors:
+            print(f"       falhas: {errors}")
+    if report["async_vs_sync"] is not None:
+        print(f"async/sync throughput: {report['async_vs_sync']}x")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test sync vs async das rotas RAG")
+    parser.add_argument("--endpoint", choices=sorted(ENDPOINTS), default="hybrid")
+    parser.add_argument("--api-base", default=API_BASE)
+    parser.add_argument("--requests", type=int, default=200, help="Requisições por rota")
+    parser.add_argument("--concurrency", type=int, default=32, help="Requisições simultâneas em voo")
+    parser.add_argument("--workers", type=int, default=1, help="Processos worker do servidor (para req/s por worker)")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=5, help="Requisições sequenciais de aquecimento por rota")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--cache-bust", action="store_true", help="Sufixo único por query (força chamada à OpenAI)")
+    parser.add_argument("--queries", help="Arquivo com uma query por linha")
+    parser.add_argument("--output", help="Salvar o relatório em JSON")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    report = asyncio.run(main_async(args))
+    print_report(report)
+    if args.output:
+        path = Path(args.output)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"Relatório salvo em {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Tests for the async (ASGI) RAG endpoints.
+
+Covers:
+- AsyncAPIView runs authentication before the async handler
+- Async search/hybrid views share validation and response contract with the sync views
+- ahybrid_search runs the lexical stages and the async vector query
+- aio placeholder translation and the Django-connection fallback
+"""
+
+from unittest.mock import AsyncMock, patch
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from bible.ai import aio
+from bible.ai.hybrid import ahybrid_search
+from bible.ai.services import RagSearchResult
+from bible.models import APIKey
+
+
+def _result(query):
+    return RagSearchResult(
+        hits=[{"verse_id": 1, "reference": "João 3:16", "score": 0.9}],
+        total=1,
+        timing={"total_ms": 1.0, "hybrid": True},
+        query=query,
+        top_k=5,
+    )
+
+
+class AsyncRagViewsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(username="rag_async")
+        cls.api_key = APIKey.objects.create(name="Reader", user=user, scopes=["read"])
+
+    def _auth(self):
+        self.client.defaults["HTTP_AUTHORIZATION"] = f"Api-Key {self.api_key.key}"
+
+    def test_requires_auth(self):
+        response = self.client.get("/api/v1/ai/rag/search/async/", {"q": "amor de Deus"})
+        self.assertIn(response.status_code, (401, 403))
+
+    def test_validation_matches_sync(self):
+        self._auth()
+        for path in ("/api/v1/ai/rag/hybrid/", "/api/v1/ai/rag/hybrid/async/"):
+            response = self.client.get(path, {"q": "a"})
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json()["code"], "validation_error")
+
+    def test_hybrid_contract_matches_sync(self):
+        self._auth()
+        params = {"q": "perdão", "top_k": "5", "alpha": "2", "dedupe": "true", "embedding_source": "bogus"}
+        with (
+            patch("bible.ai.views.rag_service.search_hybrid", return_value=_result("perdão")) as sync_search,
+            patch(
+                "bible.ai.views.rag_service.asearch_hybrid", new=AsyncMock(return_value=_result("perdão"))
+            ) as async_search,
+        ):
+            sync_response = self.client.get("/api/v1/ai/rag/hybrid/", params)
+            async_response = self.client.get("/api/v1/ai/rag/hybrid/async/", params)
+
+        self.assertEqual(async_response.status_code, 200)
+        self.assertEqual(async_response.json(), sync_response.json())
+        self.assertEqual(async_search.await_args.kwargs, sync_search.call_args.kwargs)
+        kwargs = async_search.await_args.kwargs
+        self.assertEqual((kwargs["top_k"], kwargs["alpha"]), (5, 1.0))
+        self.assertTrue(kwargs["deduplicate_versions"])
+        self.assertEqual(kwargs["embedding_source"], "verse")
+
+    def test_search_async(self):
+        self._auth()
+        with patch("bible.ai.views.rag_service.asearch", new=AsyncMock(return_value=_result("amor de Deus"))):
+            response = self.client.get("/api/v1/ai/rag/search/async/", {"q": "amor de Deus", "version": "NAA"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["total"], 1)
+
+
+def _bm25(*args, **kwargs):
+    return [
+        {
+            "verse_id": 1,
+            "book_id": 1,
+            "book_osis": "John",
+            "chapter": 3,
+            "verse": 16,
+            "text": "For God so loved the world",
+            "version_code": "KJV",
+            "bm25_rank": 1,
+            "bm25_score": 0.9,
+        }
+    ]
+
+
+class AsyncHybridSearchTest(TestCase):
+    @patch("bible.ai.aio.fetchall", new_callable=AsyncMock)
+    @patch("bible.ai.embedding_cache.embedding_cache.aget_embedding", new_callable=AsyncMock)
+    @patch("bible.ai.hybrid.bm25_search", side_effect=_bm25)
+    def test_stages(self, _bm25_mock, embed_mock, fetch_mock):
+        embed_mock.return_value = ([0.1] * 8, {"source": "cache"})
+        fetch_mock.return_value = [(2, 1, "John", 3, 17, "For God sent not his Son", "KJV", 0.2)]
+
+        result = async_to_sync(ahybrid_search)("God so loved", top_k=5, embedding_model="small")
+
+        self.assertEqual(result["stats"]["bm25_candidates"], 1)
+        self.assertEqual(result["stats"]["vector_candidates"], 1)
+        self.assertEqual({hit["verse_id"] for hit in result["hits"]}, {1, 2})
+        sql = fetch_mock.await_args.args[0]
+        self.assertIn("ve.embedding_small", sql)
+
+
+class AioTest(TestCase):
+    def test_numbered_placeholders(self):
+        sql = "SELECT 1 WHERE a = %s AND b LIKE 'x%%' AND c = ANY(%s) LIMIT %s"
+        self.assertEqual(
+            aio.to_numbered_placeholders(sql), "SELECT 1 WHERE a = $1 AND b LIKE 'x%' AND c = ANY($2) LIMIT $3"
+        )
+
+    def test_fetchall_fallback(self):
+        with self.settings(RAG_ASYNC_DB=False):
+            rows = async_to_sync(aio.fetchall)("SELECT %s + 1", [1])
+        self.assertEqual([tuple(row) for row in rows], [(2,)])
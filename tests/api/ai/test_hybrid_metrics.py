@@ -0,0 +1,82 @@
+"""
+Tests for hybrid search pipeline metrics.
+
+Covers:
+- Query probe counting queries inside a block
+- Per-stage latency and DB-query histograms for stages that ran
+- Pool size, match_source and cache hit/miss counters
+"""
+
+from unittest.mock import patch
+
+from django.test import TestCase
+from prometheus_client import REGISTRY
+
+from bible.ai.hybrid import hybrid_search, record_cache_lookup
+from bible.models import Verse
+from common.observability.queries import probe_queries
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def _bm25(*args, **kwargs):
+    Verse.objects.count()
+    Verse.objects.exists()
+    return [
+        {
+            "verse_id": 1,
+            "book_id": 1,
+            "book_osis": "John",
+            "chapter": 3,
+            "verse": 16,
+            "text": "For God so loved the world",
+            "version_code": "KJV",
+            "bm25_rank": 1,
+            "bm25_score": 0.9,
+        }
+    ]
+
+
+class HybridSearchMetricsTest(TestCase):
+    def test_probe_counts_queries(self):
+        with probe_queries() as probe:
+            Verse.objects.count()
+            Verse.objects.exists()
+
+        self.assertEqual(probe.queries, 2)
+        self.assertGreater(probe.seconds, 0)
+
+    @patch("bible.ai.hybrid._vector_search", return_value=[])
+    @patch("bible.ai.hybrid.bm25_search", side_effect=_bm25)
+    def test_stage_metrics_recorded(self, _bm25_mock, _vector_mock):
+        bm25_count = _sample("hybrid_search_stage_latency_seconds_count", stage="bm25")
+        bm25_queries = _sample("hybrid_search_stage_db_queries_sum", stage="bm25")
+        vector_queries = _sample("hybrid_search_stage_db_queries_sum", stage="vector")
+        rerank_count = _sample("hybrid_search_stage_latency_seconds_count", stage="rerank")
+        total_count = _sample("hybrid_search_stage_latency_seconds_count", stage="total")
+        fused_sum = _sample("hybrid_search_pool_size_sum", pool="fused")
+        bm25_only = _sample("hybrid_search_match_source_total", match_source="bm25_only")
+
+        result = hybrid_search("God so loved", [0.0] * 8, top_k=5)
+
+        self.assertEqual(result["total"], 1)
+        self.assertEqual(_sample("hybrid_search_stage_latency_seconds_count", stage="bm25"), bm25_count + 1)
+        self.assertEqual(_sample("hybrid_search_stage_db_queries_sum", stage="bm25"), bm25_queries + 2)
+        self.assertEqual(_sample("hybrid_search_stage_db_queries_sum", stage="vector"), vector_queries)
+        self.assertEqual(_sample("hybrid_search_stage_latency_seconds_count", stage="rerank"), rerank_count)
+        self.assertEqual(_sample("hybrid_search_stage_latency_seconds_count", stage="total"), total_count + 1)
+        self.assertEqual(_sample("hybrid_search_pool_size_sum", pool="fused"), fused_sum + 1)
+        self.assertEqual(_sample("hybrid_search_match_source_total", match_source="bm25_only"), bm25_only + 1)
+
+    def test_cache_lookup_counter(self):
+        hits = _sample("hybrid_search_cache_total", cache="embedding", result="hit")
+        misses = _sample("hybrid_search_cache_total", cache="embedding", result="miss")
+
+        record_cache_lookup("embedding", True)
+        record_cache_lookup("embedding", False)
+        record_cache_lookup("embedding", True)
+
+        self.assertEqual(_sample("hybrid_search_cache_total", cache="embedding", result="hit"), hits + 2)
+        self.assertEqual(_sample("hybrid_search_cache_total", cache="embedding", result="miss"), misses + 1)
@@ -0,0 +1,127 @@
+"""
+Tests for the precomputed semantic-neighbor table.
+
+Covers:
+- Blocked top-N matches a brute-force ranking, with and without the verse's chapter
+- Rebuild replaces a version's rows
+- /ai/rag/similar/ served from the table in one query; live search as fallback
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from bible.ai.neighbors import build_neighbors, neighbor_rows, similar_verses
+from bible.models import (
+    APIKey,
+    BookName,
+    CanonicalBook,
+    Language,
+    Testament,
+    Verse,
+    VerseEmbedding,
+    VerseNeighbors,
+    Version,
+)
+from common.observability.queries import probe_queries
+
+
+class VerseNeighborsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        english = Language.objects.create(name="English", code="en")
+        testament = Testament.objects.create(name="Old Testament")
+        gen = CanonicalBook.objects.create(osis_code="Gen", canonical_order=1, testament=testament, chapter_count=50)
+        BookName.objects.create(canonical_book=gen, language=english, name="Genesis", abbreviation="Gen")
+        cls.kjv = Version.objects.create(name="King James Version", code="EN_KJV", language=english)
+
+        rng = np.random.default_rng(7)
+        cls.vectors = {}
+        cls.chapter = {}
+        for chapter in (1, 2, 3):
+            for number in range(1, 8):
+                verse = Verse.objects.create(
+                    book=gen, version=cls.kjv, chapter=chapter, number=number, text=f"Gen {chapter}:{number}"
+                )
+                vector = rng.normal(size=8).astype(np.float32)
+                VerseEmbedding.objects.create(
+                    verse=verse,
+                    version_code="EN_KJV",
+                    model_name_small="stub",
+                    dim_small=8,
+                    embedding_small=vector.tolist(),
+                )
+                cls.vectors[verse.id] = vector / np.linalg.norm(vector)
+                cls.chapter[verse.id] = chapter
+
+        user = User.objects.create_user(username="reader", password="x")
+        cls.api_key = APIKey.objects.create(name="Reader", user=user, scopes=["read"])
+
+    def _brute_force(self, verse_id, k, external):
+        scores = {
+            other: float(self.vectors[verse_id] @ vector)
+            for other, vector in self.vectors.items()
+            if other != verse_id and not (external and self.chapter[other] == self.chapter[verse_id])
+        }
+        return sorted(scores, key=scores.get, reverse=True)[:k]
+
+    def test_blocked_ranking_matches_brute_force(self):
+        rows = {row.verse_id: row for row in neighbor_rows("EN_KJV", top_n=5, block_size=4)}
+
+        self.assertEqual(set(rows), set(self.vectors))
+        for verse_id, row in rows.items():
+            self.assertEqual(row.neighbor_ids, self._brute_force(verse_id, 5, external=False))
+            self.assertEqual(row.external_ids, self._brute_force(verse_id, 5, external=True))
+            self.assertEqual(row.neighbor_scores, sorted(row.neighbor_scores, reverse=True))
+
+    def test_rebuild_replaces_version_rows(self):
+        build_neighbors(["EN_KJV"], top_n=3)
+        stats = build_neighbors(top_n=4)
+
+        self.assertEqual(stats["versions"]["EN_KJV"]["verses"], 21)
+        self.assertEqual(VerseNeighbors.objects.count(), 21)
+        self.assertEqual(set(VerseNeighbors.objects.values_list("top_n", flat=True)), {4})
+
+    def test_similar_verses_single_query(self):
+        build_neighbors(top_n=5)
+        verse_id = next(iter(self.vectors))
+
+        with probe_queries() as probe:
+            hits = similar_verses(verse_id, top_k=3)
+
+        self.assertEqual(probe.queries, 1)
+        self.assertEqual([h["verse_id"] for h in hits], self._brute_force(verse_id, 3, external=True))
+        self.assertTrue(all(h["chapter"] != self.chapter[verse_id] for h in hits))
+        self.assertEqual(hits[0]["book_name"], "Genesis")
+        self.assertEqual(hits[0]["version_code"], "EN_KJV")
+        self.assertEqual(hits[0]["reference"], f"Genesis {hits[0]['chapter']}:{hits[0]['verse']}")
+        self.assertIsNone(similar_verses(verse_id, top_k=6))
+
+        # A row short of top_k neighbors outside the chapter falls back instead of answering partially
+        row = VerseNeighbors.objects.get(verse_id=verse_id)
+        VerseNeighbors.objects.filter(pk=row.pk).update(
+            external_ids=row.external_ids[:2], external_scores=row.external_scores[:2]
+        )
+        self.assertIsNone(similar_verses(verse_id, top_k=3))
+        self.assertEqual(len(similar_verses(verse_id, top_k=2)), 2)
+
+    def test_view_serves_precomputed_and_falls_back(self):
+        build_neighbors(top_n=5)
+        verse_id = next(iter(self.vectors))
+        auth = {"HTTP_AUTHORIZATION": f"Api-Key {self.api_key.key}"}
+
+        resp = self.client.get(
+            f"/api/v1/ai/rag/similar/?verse_id={verse_id}&top_k=2&exclude_same_chapter=false", **auth
+        )
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["source"], "precomputed")
+        self.assertEqual([h["verse_id"] for h in resp.json()["hits"]], self._brute_force(verse_id, 2, external=False))
+
+        VerseNeighbors.objects.filter(verse_id=verse_id).delete()
+        live = type("Result", (), {"hits": [], "timing": {"total_ms": 1.0}})()
+        with patch("bible.ai.views.rag_service.get_similar_verses", create=True, return_value=live) as fallback:
+            resp = self.client.get(f"/api/v1/ai/rag/similar/?verse_id={verse_id}&top_k=2", **auth)
+        self.assertEqual(resp.json()["source"], "live")
+        fallback.assert_called_once_with(verse_id=verse_id, top_k=2, exclude_same_chapter=True)
@@ -0,0 +1,238 @@
+"""
+Tests for the in-memory cross-reference graph.
+
+Covers:
+- CSR build: degree, filtered edge lookup, summary stats
+- k-hop neighborhood and shortest path
+- Snapshot round-trip and staleness detection
+- Committed writes picked up with one throttled, background rebuild
+- Answers from an outdated graph are never stored in the content cache
+- /for/ answering counts and summary from the graph
+- /graph/ and /graph/path/ endpoints
+"""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from bible.crossrefs import graph as graph_module
+from bible.crossrefs.graph import (
+    CrossRefGraph,
+    build_crossref_graph,
+    get_crossref_graph,
+    pack_coordinate,
+    unpack_coordinate,
+)
+from bible.models import APIKey, BookName, CanonicalBook, CrossReference, Language, Testament
+
+
+class CrossRefGraphTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="graph_user")
+        self.api_key = APIKey.objects.create(name="Graph Key", user=self.user, scopes=["read"])
+        self.client.credentials(HTTP_AUTHORIZATION=f"Api-Key {self.api_key.key}")
+
+        english = Language.objects.create(name="English", code="en")
+        old = Testament.objects.create(name="Old Testament")
+        new = Testament.objects.create(name="New Testament")
+        self.gen = CanonicalBook.objects.create(osis_code="Gen", canonical_order=1, testament=old, chapter_count=50)
+        self.john = CanonicalBook.objects.create(osis_code="John", canonical_order=43, testament=new, chapter_count=21)
+        self.rom = CanonicalBook.objects.create(osis_code="Rom", canonical_order=45, testament=new, chapter_count=16)
+        for book, name in ((self.gen, "Genesis"), (self.john, "John"), (self.rom, "Romans")):
+            BookName.objects.create(canonical_book=book, language=english, name=name, abbreviation=book.osis_code)
+
+        self.gen_john = self._xref(self.gen, 1, 1, self.john, 1, 1, 2, "TSK", 0.9)
+        self.gen_rom = self._xref(self.gen, 1, 1, self.rom, 5, 8, 8, "openbible", 0.2)
+        self.john_gen = self._xref(self.john, 1, 1, self.gen, 1, 1, 1, "TSK", 0.8)
+        self.john_rom = self._xref(self.john, 1, 2, self.rom, 5, 8, 8, "openbible", 0.5)
+
+    def _xref(self, from_book, from_chapter, from_verse, to_book, to_chapter, start, end, source, confidence):
+        return CrossReference.objects.create(
+            from_book=from_book,
+            from_chapter=from_chapter,
+            from_verse=from_verse,
+            to_book=to_book,
+            to_chapter=to_chapter,
+            to_verse_start=start,
+            to_verse_end=end,
+            source=source,
+            confidence=confidence,
+        )
+
+    def _key(self, book, chapter, verse):
+        return pack_coordinate(book.id, chapter, verse)
+
+    def test_pack_roundtrip(self):
+        self.assertEqual(unpack_coordinate(pack_coordinate(66, 150, 176)), (66, 150, 176))
+
+    def test_build_csr_lookups(self):
+        graph = build_crossref_graph()
+
+        gen_1_1 = self._key(self.gen, 1, 1)
+        self.assertEqual(graph.edge_count, 4)
+        self.assertEqual(graph.degree(gen_1_1), 2)
+        self.assertEqual(graph.degree(self._key(self.rom, 5, 8)), 0)
+        self.assertEqual(
+            graph.edge_ids[graph.edges_from(gen_1_1, source="tsk")].tolist(),
+            [self.gen_john.id],
+        )
+        self.assertEqual(
+            graph.edge_ids[graph.edges_from(gen_1_1, min_confidence=0.2)].tolist(),
+            [self.gen_john.id, self.gen_rom.id],
+        )
+        summary = graph.summary(graph.edges_from(gen_1_1))
+        self.assertEqual(summary["sources"], {"TSK": 1, "openbible": 1})
+        self.assertEqual(summary["confidence"], {"min": 0.2, "max": 0.9, "avg": 0.55})
+
+    def test_neighborhood_expands_target_ranges(self):
+        graph = build_crossref_graph()
+
+        result = graph.neighborhood(self._key(self.gen, 1, 1), hops=2)
+
+        hops = {graph.format_key(key): hop for key, hop in result["nodes"].items()}
+        self.assertEqual(hops, {"Gen.1.1": 0, "John.1.1": 1, "John.1.2": 1, "Rom.5.8": 1})
+        self.assertEqual(len(result["edges"]), 4)
+        self.assertFalse(result["truncated"])
+
+    def test_neighborhood_truncates_at_max_nodes(self):
+        graph = build_crossref_graph()
+
+        result = graph.neighborhood(self._key(self.gen, 1, 1), hops=2, max_nodes=2)
+
+        self.assertEqual(len(result["nodes"]), 2)
+        self.assertTrue(result["truncated"])
+
+    def test_shortest_path(self):
+        graph = build_crossref_graph()
+
+        path = graph.shortest_path(self._key(self.john, 1, 1), self._key(self.rom, 5, 8))
+
+        self.assertEqual([graph.edge_payload(k, i)["id"] for k, i in path], [self.john_gen.id, self.gen_rom.id])
+        self.assertIsNone(graph.shortest_path(self._key(self.rom, 5, 8), self._key(self.gen, 1, 1)))
+        self.assertIsNone(
+            graph.shortest_path(self._key(self.john, 1, 1), self._key(self.rom, 5, 8), min_confidence=0.6)
+        )
+
+    def test_snapshot_roundtrip_and_staleness(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "xrefs.npz"
+            build_crossref_graph().save(path)
+
+            loaded = CrossRefGraph.load(path)
+            self.assertEqual(loaded.degree(self._key(self.gen, 1, 1)), 2)
+            self.assertEqual(loaded.format_key(self._key(self.rom, 5, 8)), "Rom.5.8")
+
+            with override_settings(CROSSREF_GRAPH_SNAPSHOT=str(path)):
+                self.assertEqual(graph_module._load_or_build().stamp, loaded.stamp)
+                self._xref(self.rom, 5, 8, self.john, 1, 1, 1, "TSK", 0.7)
+                self.assertEqual(graph_module._load_or_build().edge_count, 5)
+
+    def test_committed_write_refreshes_graph(self):
+        self.assertEqual(get_crossref_graph().edge_count, 4)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._xref(self.rom, 5, 8, self.john, 1, 1, 1, "TSK", 0.7)
+
+        self.assertEqual(get_crossref_graph().edge_count, 5)
+
+    @override_settings(CROSSREF_GRAPH_REFRESH_INTERVAL=60)
+    def test_write_burst_is_one_background_rebuild(self):
+        graph_module._graph = None  # cold process: the first lookup builds inline
+        graph = get_crossref_graph()
+        generation = graph.generation
+        with self.captureOnCommitCallbacks(execute=True):
+            self._xref(self.rom, 5, 8, self.john, 1, 1, 1, "TSK", 0.7)
+            self._xref(self.rom, 5, 8, self.gen, 1, 1, 1, "TSK", 0.7)
+        graph_module._stale_checked_at = 0.0
+
+        with patch.object(graph_module, "_refresh_in_background") as refresh, self.assertNumQueries(0):
+            # The old graph keeps answering; no lookup rebuilds inline
+            self.assertIs(get_crossref_graph(), graph)
+            self.assertIs(get_crossref_graph(), graph)
+
+        new_generations = {call.args[0] for call in refresh.call_args_list}
+        self.assertEqual(len(new_generations), 1)
+        self.assertNotIn(generation, new_generations)
+        self.assertIsNone(cache.get(graph_module.GRAPH_STALE_CACHE_KEY))
+
+    @override_settings(CROSSREF_GRAPH_REFRESH_INTERVAL=60)
+    def test_outdated_graph_answers_are_not_cached(self):
+        graph_module._graph = None
+        url = "/api/v1/bible/cross-references/for/?ref=Gen 1:1"
+        self.assertEqual(self.client.get(url)["X-Content-Cache"], "miss")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._xref(self.gen, 1, 1, self.john, 1, 3, 3, "TSK", 0.7)
+
+        # The write is pending in the graph but already bumped the crossrefs generation
+        resp = self.client.get(url)
+        self.assertEqual((resp["X-Content-Cache"], resp.json()["summary"]["available"]), ("bypass", 2))
+        self.assertNotIn("ETag", resp)
+
+        graph_module._stale_checked_at = 0.0
+        with patch.object(graph_module, "_refresh_in_background", side_effect=graph_module._install):
+            self.assertEqual(self.client.get(url)["X-Content-Cache"], "bypass")  # answered while rebuilding
+
+        resp = self.client.get(url)
+        self.assertEqual((resp["X-Content-Cache"], resp.json()["summary"]["available"]), ("miss", 3))
+        self.assertEqual(self.client.get(url)["X-Content-Cache"], "hit")
+
+    def test_for_endpoint_answers_from_graph(self):
+        url = "/api/v1/bible/cross-references/for/?ref=Gen 1:1&min_confidence=0.5"
+        get_crossref_graph()
+
+        with CaptureQueriesContext(connection) as queries:
+            resp = self.client.get(url)
+
+        # Only the page rows are read; counts, filters and summary come from the graph
+        self.assertEqual(len([q for q in queries if "cross_references" in q["sql"]]), 1)
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        data = resp.json()
+        self.assertEqual([r["id"] for r in data["results"]], [self.gen_john.id])
+        self.assertEqual(data["summary"]["available"], 2)
+        self.assertEqual(data["summary"]["total"], 1)
+        self.assertEqual(data["summary"]["sources"], {"TSK": 1})
+        self.assertEqual(data["pagination"]["count"], 1)
+
+    def test_graph_endpoint(self):
+        resp = self.client.get("/api/v1/bible/cross-references/graph/?ref=Gen 1:1&hops=2")
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        data = resp.json()
+        self.assertEqual(data["root"], "Gen.1.1")
+        self.assertIn({"ref": "Rom.5.8", "hop": 1}, data["nodes"])
+        edge = next(e for e in data["edges"] if e["id"] == self.gen_john.id)
+        self.assertEqual(edge["to"], "John.1.1-2")
+        self.assertEqual(edge["source"], "TSK")
+
+    def test_graph_endpoint_validation(self):
+        self.assertEqual(
+            self.client.get("/api/v1/bible/cross-references/graph/?ref=Gen 1:1&hops=9").status_code,
+            status.HTTP_400_BAD_REQUEST,
+        )
+        self.assertEqual(
+            self.client.get("/api/v1/bible/cross-references/graph/?ref=Rom 1:1").status_code,
+            status.HTTP_404_NOT_FOUND,
+        )
+
+    def test_path_endpoint(self):
+        resp = self.client.get("/api/v1/bible/cross-references/graph/path/?from=John 1:1&to=Rom 5:8")
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        data = resp.json()
+        self.assertEqual(data["hops"], 2)
+        self.assertEqual([step["from"] for step in data["path"]], ["John.1.1", "Gen.1.1"])
+
+        resp = self.client.get("/api/v1/bible/cross-references/graph/path/?from=Rom 5:8&to=Gen 1:1")
+        self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
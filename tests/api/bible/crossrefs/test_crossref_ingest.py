@@ -0,0 +1,115 @@
+"""
+Tests for streaming cross-reference ingestion.
+
+Covers:
+- Resolving OSIS, catalog-code and human-readable references without queries
+- COPY + staging merge filling the denormalized from_/to_ columns
+- Vote filtering, unresolved/truncated counters and idempotent re-runs
+- BibleDataEngine.populate_cross_references delegating to the ingester
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.test import TestCase
+
+from bible.crossrefs.graph import build_crossref_graph, pack_coordinate
+from bible.crossrefs.ingest import ReferenceResolver, ingest_cross_references
+from bible.models import CanonicalBook, CrossReference, Testament
+from common.data_core import BibleDataEngine
+
+OPENBIBLE = "\n".join(
+    [
+        "From Verse\tTo Verse\tVotes\t#www.openbible.info CC-BY 2024-01-01",
+        "Gen.1.1\tJohn.1.1-John.1.3\t120",
+        "Gen.1.1\tHeb.11.3\t45",
+        "Gen.1.1\tJohn.1.2-John.2.4\t10",
+        "Gen.1.2\tHeb.11.3\t-3",
+        "Gen.1.1\tTob.1.1\t9",
+        "Gen.1\tJohn.1.1\t7",
+        "",
+    ]
+)
+
+
+class CrossRefIngestTest(TestCase):
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        old = Testament.objects.create(name="Old Testament")
+        new = Testament.objects.create(name="New Testament")
+        self.gen = CanonicalBook.objects.create(osis_code="Gen", canonical_order=1, testament=old, chapter_count=50)
+        self.john = CanonicalBook.objects.create(osis_code="John", canonical_order=43, testament=new, chapter_count=21)
+        self.heb = CanonicalBook.objects.create(osis_code="Heb", canonical_order=58, testament=new, chapter_count=13)
+        self.path = self.tmpdir / "cross-references.txt"
+        self.path.write_text(OPENBIBLE, encoding="utf-8")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _edges(self):
+        return list(
+            CrossReference.objects.order_by("to_book__canonical_order", "to_verse_start").values_list(
+                "from_book__osis_code",
+                "from_chapter",
+                "from_verse",
+                "to_book__osis_code",
+                "to_chapter",
+                "to_verse_start",
+                "to_verse_end",
+                "votes",
+                "source",
+            )
+        )
+
+    def test_resolver_forms(self):
+        resolver = ReferenceResolver()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(resolver.resolve("Gen.1.1"), (self.gen.id, 1, 1, 1, False))
+            self.assertEqual(resolver.resolve("John.1.1-John.1.3"), (self.john.id, 1, 1, 3, False))
+            self.assertEqual(resolver.resolve("John.1.1-3"), (self.john.id, 1, 1, 3, False))
+            self.assertEqual(resolver.resolve("HEB.11.3"), (self.heb.id, 11, 3, 3, False))
+            self.assertEqual(resolver.resolve("John.1.2-John.2.4"), (self.john.id, 1, 2, 2, True))
+            self.assertEqual(resolver.resolve("Genesis 1:1-3"), (self.gen.id, 1, 1, 3, False))
+            self.assertIsNone(resolver.resolve("Tob.1.1"))
+            self.assertIsNone(resolver.resolve("Gen.x.1"))
+            self.assertIsNone(resolver.resolve("Genesis 1"))
+
+    def test_ingest_fills_denormalized_columns(self):
+        stats = ingest_cross_references(self.path)
+
+        self.assertEqual(
+            self._edges(),
+            [
+                ("Gen", 1, 1, "John", 1, 1, 3, 120, "openbible"),
+                ("Gen", 1, 1, "John", 1, 2, 2, 10, "openbible"),
+                ("Gen", 1, 1, "Heb", 11, 3, 3, 45, "openbible"),
+            ],
+        )
+        self.assertEqual((stats.lines, stats.edges_staged, stats.created), (6, 3, 3))
+        self.assertEqual((stats.unresolved, stats.below_min_votes, stats.ranges_truncated), (2, 1, 1))
+        self.assertGreater(stats.edges_per_second, 0)
+
+        graph = build_crossref_graph()
+        self.assertEqual(graph.degree(pack_coordinate(self.gen.id, 1, 1)), 3)
+
+    def test_min_votes_and_rerun_is_idempotent(self):
+        first = ingest_cross_references(self.path, min_votes=20)
+        again = ingest_cross_references(self.path, min_votes=20)
+
+        self.assertEqual(first.created, 2)
+        self.assertEqual(again.created, 0)
+        self.assertEqual(CrossReference.objects.count(), 2)
+
+    def test_engine_delegates_to_ingester(self):
+        engine = BibleDataEngine(str(self.tmpdir))
+
+        result = engine.populate_cross_references(str(self.path), source="TSK")
+        missing = engine.populate_cross_references(str(self.tmpdir / "missing.txt"))
+
+        self.assertTrue(result.success, result.error_message)
+        self.assertEqual(result.items_processed, 3)
+        self.assertEqual(result.details["unresolved"], 2)
+        self.assertEqual(set(CrossReference.objects.values_list("source", flat=True)), {"TSK"})
+        self.assertFalse(missing.success)
@@ -44,3 +44,17 @@ class ReferencesStubsTest(TestCase):
         self.assertEqual(resp.status_code, status.HTTP_200_OK)
         data = resp.json()
         self.assertIn("normalized", data)
+
+    def test_extract_ok(self):
+        text = "See Jo 3:16, 18 and Rom 8:28-30."
+        resp = self.client.post("/api/v1/bible/references/extract/", {"items": [text, ""]}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        data = resp.json()
+        self.assertEqual(data["count"], 3)
+        self.assertEqual(data["results"][1], {"index": 1, "references": []})
+        first = data["results"][0]["references"][0]
+        self.assertEqual((first["osis"], first["chapter"], first["verse_start"]), ("John", 3, 16))
+        self.assertEqual(text[first["start"] : first["end"]], first["text"])
+
+        resp = self.client.post("/api/v1/bible/references/extract/", {"items": ["x"] * 101}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
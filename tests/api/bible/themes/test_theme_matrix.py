@@ -0,0 +1,216 @@
+"""
+Tests for the precomputed theme co-occurrence matrix.
+
+Covers:
+- rebuild_theme_matrix: sparse symmetric pairs and chapter distribution
+- ConceptMapView / ThemeProgressionView answering from the matrix
+- Query count independent of theme size
+- Migration backfill of existing links; reads never write
+- Single VerseTheme writes and Verse.themes changes refresh their themes after commit
+"""
+
+from importlib import import_module
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from bible.models import (
+    APIKey,
+    BookName,
+    CanonicalBook,
+    Language,
+    Testament,
+    Theme,
+    ThemeChapterDistribution,
+    ThemeCooccurrence,
+    Verse,
+    VerseTheme,
+    Version,
+)
+from bible.themes.services import rebuild_theme_matrix
+
+
+class ThemeMatrixTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="matrix_user")
+        self.api_key = APIKey.objects.create(name="Matrix Key", user=self.user, scopes=["read"])
+        self.client.credentials(HTTP_AUTHORIZATION=f"Api-Key {self.api_key.key}")
+
+        self.lang = Language.objects.create(name="English", code="en")
+        old = Testament.objects.create(name="OLD")
+        new = Testament.objects.create(name="NEW")
+        self.gen = CanonicalBook.objects.create(osis_code="Gen", canonical_order=1, testament=old, chapter_count=50)
+        self.john = CanonicalBook.objects.create(osis_code="John", canonical_order=43, testament=new, chapter_count=21)
+        BookName.objects.create(canonical_book=self.gen, language=self.lang, name="Genesis")
+        BookName.objects.create(canonical_book=self.john, language=self.lang, name="John")
+        self.version = Version.objects.create(language=self.lang, code="EN_KJV", name="King James")
+
+        self.love = Theme.objects.create(name="Love")
+        self.faith = Theme.objects.create(name="Faith")
+        self.hope = Theme.objects.create(name="Hope")
+
+        self.verses = [
+            Verse.objects.create(book=self.gen, version=self.version, chapter=1, number=n, text=f"Gen 1:{n}")
+            for n in (3, 5)
+        ] + [
+            Verse.objects.create(book=self.john, version=self.version, chapter=3, number=n, text=f"John 3:{n}")
+            for n in (16, 17, 18)
+        ]
+        for verse in self.verses:
+            VerseTheme.objects.create(verse=verse, theme=self.love)
+        for verse in self.verses[2:4]:
+            VerseTheme.objects.create(verse=verse, theme=self.faith)
+        VerseTheme.objects.create(verse=self.verses[4], theme=self.hope)
+
+    def _add_love_verses(self, count):
+        for n in range(100, 100 + count):
+            verse = Verse.objects.create(book=self.john, version=self.version, chapter=4, number=n, text="x")
+            VerseTheme.objects.create(verse=verse, theme=self.love)
+            VerseTheme.objects.create(verse=verse, theme=self.faith)
+
+    def test_rebuild_creates_symmetric_sparse_pairs(self):
+        result = rebuild_theme_matrix()
+
+        self.assertEqual(result.cooccurrence_rows, 4)
+        pairs = {
+            (row.theme_id, row.related_theme_id): row.shared_verse_count for row in ThemeCooccurrence.objects.all()
+        }
+        self.assertEqual(pairs[(self.love.id, self.faith.id)], 2)
+        self.assertEqual(pairs[(self.faith.id, self.love.id)], 2)
+        self.assertEqual(pairs[(self.love.id, self.hope.id)], 1)
+        self.assertNotIn((self.faith.id, self.hope.id), pairs)
+
+    def test_rebuild_chapter_distribution(self):
+        rebuild_theme_matrix()
+
+        rows = ThemeChapterDistribution.objects.filter(theme=self.love).order_by("book__canonical_order")
+        self.assertEqual(
+            [(r.book_id, r.chapter, r.verse_count, r.first_verse) for r in rows],
+            [
+                (self.gen.id, 1, 2, 3),
+                (self.john.id, 3, 3, 16),
+            ],
+        )
+
+    def test_partial_rebuild_refreshes_mirror_pairs(self):
+        rebuild_theme_matrix()
+        VerseTheme.objects.create(verse=self.verses[0], theme=self.hope)
+
+        rebuild_theme_matrix([self.hope.id])
+
+        self.assertEqual(ThemeCooccurrence.objects.get(theme=self.love, related_theme=self.hope).shared_verse_count, 2)
+
+    def test_concept_map_from_matrix(self):
+        rebuild_theme_matrix()
+
+        response = self.client.get("/api/v1/bible/themes/concept-map/Love/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["concept"], "Love")
+        self.assertEqual(data["strength_metrics"]["main_theme_verse_count"], 5)
+        self.assertEqual([t["theme_name"] for t in data["related_themes"]], ["Faith", "Hope"])
+        self.assertEqual(data["related_themes"][0]["strength"], 0.4)
+        self.assertEqual(len(data["verse_examples"]), 2)
+        self.assertEqual(data["verse_examples"][0]["reference"], "John 3:16")
+        self.assertIn("Faith", data["verse_examples"][0]["related_themes"])
+
+    def test_migration_backfills_existing_links(self):
+        migration = import_module("bible.migrations.0023_theme_cooccurrence_matrix")
+        with connection.cursor() as cur:
+            for sql in migration.BACKFILL_SQL:
+                cur.execute(sql)
+
+        self.assertEqual(ThemeCooccurrence.objects.get(theme=self.love, related_theme=self.faith).shared_verse_count, 2)
+        response = self.client.get("/api/v1/bible/themes/concept-map/Love/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["strength_metrics"]["main_theme_verse_count"], 5)
+
+    def test_reads_never_write(self):
+        rebuild_theme_matrix()
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get("/api/v1/bible/themes/concept-map/Love/")
+            self.client.get(f"/api/v1/bible/themes/{self.love.id}/progression/")
+
+        writes = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith(("INSERT", "UPDATE", "DELETE"))]
+        self.assertFalse([sql for sql in writes if "theme_cooccurrence" in sql or "theme_chapter_distribution" in sql])
+
+    def test_new_link_refreshes_theme_after_commit(self):
+        rebuild_theme_matrix()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            VerseTheme.objects.create(verse=self.verses[0], theme=self.hope)
+
+        self.assertEqual(ThemeCooccurrence.objects.get(theme=self.love, related_theme=self.hope).shared_verse_count, 2)
+
+    def test_m2m_changes_refresh_themes_after_commit(self):
+        rebuild_theme_matrix()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.verses[0].themes.add(self.hope)
+        self.assertEqual(ThemeCooccurrence.objects.get(theme=self.love, related_theme=self.hope).shared_verse_count, 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.hope.verses.remove(self.verses[4])
+        self.assertEqual(ThemeCooccurrence.objects.get(theme=self.love, related_theme=self.hope).shared_verse_count, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.verses[0].themes.clear()
+        self.assertFalse(ThemeCooccurrence.objects.filter(theme=self.hope).exists())
+        self.assertEqual(
+            ThemeChapterDistribution.objects.get(theme=self.love, book=self.gen, chapter=1).verse_count,
+            1,
+        )
+
+    def test_concept_map_query_count_independent_of_theme_size(self):
+        rebuild_theme_matrix()
+        self.client.get("/api/v1/bible/themes/concept-map/Love/")  # warm auth/language lookups
+
+        with self.assertNumQueries(9):
+            self.client.get("/api/v1/bible/themes/concept-map/Love/")
+
+        self._add_love_verses(20)
+        rebuild_theme_matrix()
+        with self.assertNumQueries(9):
+            self.client.get("/api/v1/bible/themes/concept-map/Love/")
+
+    def test_progression_from_matrix(self):
+        rebuild_theme_matrix()
+
+        response = self.client.get(f"/api/v1/bible/themes/{self.love.id}/progression/?lang=en")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        books = data["progression_data"]
+        self.assertEqual([b["osis_code"] for b in books], ["Gen", "John"])
+        self.assertEqual(books[0]["name"], "Genesis")
+        self.assertEqual(books[1]["first_occurrence"], {"chapter": 3, "verse": 16})
+        self.assertEqual(data["testament_summary"]["OLD"]["verse_count"], 2)
+        self.assertEqual(data["testament_summary"]["NEW"]["book_count"], 1)
+        self.assertEqual(data["peak_books"][0]["osis_code"], "John")
+
+    def test_progression_query_count_independent_of_theme_size(self):
+        rebuild_theme_matrix()
+        url = f"/api/v1/bible/themes/{self.love.id}/progression/?lang=en"
+        self.client.get(url)
+
+        with self.assertNumQueries(6):
+            self.client.get(url)
+
+        self._add_love_verses(20)
+        rebuild_theme_matrix()
+        with self.assertNumQueries(6):
+            self.client.get(url)
+
+    def test_progression_404_for_theme_without_verses(self):
+        empty = Theme.objects.create(name="Empty")
+
+        response = self.client.get(f"/api/v1/bible/themes/{empty.id}/progression/")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
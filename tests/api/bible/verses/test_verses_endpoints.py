@@ -2,8 +2,15 @@
 API tests for verses endpoints.
 """
 
+import gzip
+import json
+from unittest.mock import patch
+
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import AsyncClient, TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APIClient
 
@@ -94,3 +101,401 @@ class VersesApiTest(TestCase):
         # Should return 404 for book not found, not 400 for bad URL
         self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
         self.assertIn("Book not found", resp.json().get("detail", ""))
+
+
+class VersesCompareApiTest(TestCase):
+    """Compare endpoint: single query across versions and aligned layout."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="compare_user")
+        self.api_key = APIKey.objects.create(name="Compare Key", user=self.user, scopes=["read"])
+        self.client.credentials(HTTP_AUTHORIZATION=f"Api-Key {self.api_key.key}")
+
+        testament = Testament.objects.create(name="New Testament")
+        english = Language.objects.create(name="English", code="en")
+        portuguese = Language.objects.create(name="Portuguese", code="pt-BR")
+        self.john = CanonicalBook.objects.create(
+            osis_code="John", canonical_order=43, testament=testament, chapter_count=21
+        )
+        BookName.objects.create(canonical_book=self.john, language=english, name="John", abbreviation="Jn")
+        BookName.objects.create(canonical_book=self.john, language=portuguese, name="João", abbreviation="Jo")
+        self.kjv = Version.objects.create(name="King James Version", code="EN_KJV", language=english)
+        self.ara = Version.objects.create(name="Almeida Revista", code="PT_ARA", language=portuguese)
+
+        for number in (16, 17, 18):
+            Verse.objects.create(book=self.john, version=self.kjv, chapter=3, number=number, text=f"KJV 3:{number}")
+            Verse.objects.create(book=self.john, version=self.ara, chapter=3, number=number, text=f"ARA 3:{number}")
+
+    def test_compare_returns_results_per_version_in_request_order(self):
+        resp = self.client.get("/api/v1/bible/verses/compare/?ref=John%203:16-17&versions=ARA,KJV,XYZ")
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        results = resp.json()["results"]
+        self.assertEqual([r["version"] for r in results], ["PT_ARA", "EN_KJV", "XYZ"])
+        self.assertEqual([v["text"] for v in results[0]["verses"]], ["ARA 3:16", "ARA 3:17"])
+        self.assertEqual(results[0]["verses"][0]["reference"], "João 3:16")
+        self.assertEqual(results[2]["error"], "version_not_found")
+
+    def test_compare_query_count_does_not_grow_with_versions(self):
+        url = "/api/v1/bible/verses/compare/?ref=John%203:16-18&versions="
+        self.client.get(url + "KJV")  # warm registries
+
+        with CaptureQueriesContext(connection) as single:
+            self.client.get(url + "KJV")
+        with CaptureQueriesContext(connection) as double:
+            self.client.get(url + "KJV,ARA")
+
+        self.assertEqual(len(single), len(double))
+
+    def test_compare_aligned_layout(self):
+        resp = self.client.get("/api/v1/bible/verses/compare/?ref=John%203:16-17&versions=KJV,ARA&layout=aligned")
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        data = resp.json()
+        self.assertEqual(data["book"]["osis_code"], "John")
+        self.assertEqual([v["version"] for v in data["versions"]], ["EN_KJV", "PT_ARA"])
+        self.assertEqual(
+            data["rows"][0],
+            {"chapter": 3, "verse": 16, "texts": {"EN_KJV": "KJV 3:16", "PT_ARA": "ARA 3:16"}},
+        )
+        self.assertEqual(len(data["rows"]), 2)
+
+    def test_version_registry_invalidated_on_save(self):
+        self.client.get("/api/v1/bible/verses/compare/?ref=John%203:16&versions=KJV")
+        Version.objects.create(name="Darby", code="EN_DBY", language=self.kjv.language)
+
+        resp = self.client.get("/api/v1/bible/verses/compare/?ref=John%203:16&versions=DBY")
+
+        self.assertEqual(resp.json()["results"][0]["version"], "EN_DBY")
+
+
+class VersesCompactLayoutTest(TestCase):
+    """?layout=compact: flat verse rows with book/version hoisted into 'included'."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="compact_user")
+        self.api_key = APIKey.objects.create(name="Compact Key", user=self.user, scopes=["read"])
+        self.client.credentials(HTTP_AUTHORIZATION=f"Api-Key {self.api_key.key}")
+
+        testament = Testament.objects.create(name="New Testament")
+        english = Language.objects.create(name="English", code="en")
+        self.john = CanonicalBook.objects.create(
+            osis_code="John", canonical_order=43, testament=testament, chapter_count=21
+        )
+        BookName.objects.create(canonical_book=self.john, language=english, name="John", abbreviation="Jn")
+        self.kjv = Version.objects.create(name="King James Version", code="EN_KJV", language=english)
+        self.web = Version.objects.create(name="World English Bible", code="EN_WEB", language=english)
+
+        for chapter in (1, 2):
+            for number in range(1, 4):
+                Verse.objects.create(
+                    book=self.john, version=self.kjv, chapter=chapter, number=number, text=f"KJV {chapter}:{number}"
+                )
+        Verse.objects.create(book=self.john, version=self.web, chapter=1, number=1, text="WEB 1:1")
+
+    def test_range_compact_rows_and_included(self):
+        resp = self.client.get("/api/v1/bible/verses/range/?ref=John%201:2-2:1&version=KJV&layout=compact")
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        data = resp.json()
+        self.assertEqual(data["fields"], ["id", "book", "version", "chapter", "verse", "text"])
+        self.assertEqual(
+            [row[1:] for row in data["verses"]],
+            [
+                ["John", "EN_KJV", 1, 2, "KJV 1:2"],
+                ["John", "EN_KJV", 1, 3, "KJV 1:3"],
+                ["John", "EN_KJV", 2, 1, "KJV 2:1"],
+            ],
+        )
+        self.assertEqual(data["included"]["books"], [{"osis_code": "John", "name": "John", "testament_code": "new"}])
+        self.assertEqual([v["code"] for v in data["included"]["versions"]], ["EN_KJV"])
+
+    def test_default_layout_unchanged(self):
+        resp = self.client.get("/api/v1/bible/verses/range/?ref=John%201:1-2&version=KJV")
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.json()[0]["book"]["osis_code"], "John")
+
+    def test_by_chapter_compact_is_paginated(self):
+        resp = self.client.get(f"/api/v1/bible/verses/by-chapter/John/2/?version={self.kjv.id}&layout=compact")
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        data = resp.json()
+        self.assertEqual(data["pagination"]["count"], 3)
+        self.assertEqual([row[4] for row in data["results"]["verses"]], [1, 2, 3])
+
+    def test_by_reference_compact(self):
+        resp = self.client.get("/api/v1/bible/verses/by-reference/?ref=John%201:1&version=KJV&layout=compact")
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.json()["verses"][0][5], "KJV 1:1")
+
+    def test_compare_compact_lists_each_version_once(self):
+        resp = self.client.get("/api/v1/bible/verses/compare/?ref=John%201:1&versions=KJV,WEB,XYZ&layout=compact")
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        data = resp.json()
+        self.assertEqual([row[2] for row in data["verses"]], ["EN_KJV", "EN_WEB"])
+        self.assertEqual(sorted(v["code"] for v in data["included"]["versions"]), ["EN_KJV", "EN_WEB"])
+        self.assertEqual(data["versions"][2], {"version": "XYZ", "error": "version_not_found"})
+
+    def test_compact_query_count_independent_of_verse_count(self):
+        url = "/api/v1/bible/verses/range/?version=KJV&layout=compact&ref="
+        self.client.get(url + "John%201:1")  # warm registries
+
+        with CaptureQueriesContext(connection) as one:
+            self.client.get(url + "John%201:1")
+        with CaptureQueriesContext(connection) as many:
+            self.client.get(url + "John%201:1-2:3")
+
+        self.assertEqual(len(one), len(many))
+
+
+class VersesRangeCapTest(TestCase):
+    """The 300-verse cap and 404 checks run without a separate COUNT/EXISTS round-trip."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="cap_user")
+        self.api_key = APIKey.objects.create(name="Cap Key", user=self.user, scopes=["read"])
+        self.client.credentials(HTTP_AUTHORIZATION=f"Api-Key {self.api_key.key}")
+
+        testament = Testament.objects.create(name="Old Testament")
+        english = Language.objects.create(name="English", code="en")
+        self.psalms = CanonicalBook.objects.create(
+            osis_code="Ps", canonical_order=19, testament=testament, chapter_count=150
+        )
+        BookName.objects.create(canonical_book=self.psalms, language=english, name="Psalms", abbreviation="Ps")
+        self.kjv = Version.objects.create(name="King James Version", code="EN_KJV", language=english)
+        Verse.objects.bulk_create(
+            Verse(book=self.psalms, version=self.kjv, chapter=chapter, number=number, text=f"{chapter}:{number}")
+            for chapter, count in ((1, 150), (2, 150), (3, 1))
+            for number in range(1, count + 1)
+        )
+
+    def _get_without_count(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            resp = self.client.get(url)
+        self.assertFalse([q["sql"] for q in queries if "COUNT(" in q["sql"].upper()])
+        return resp
+
+    def test_range_at_cap_is_served(self):
+        resp = self._get_without_count("/api/v1/bible/verses/range/?ref=Ps%201-2&version=KJV")
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(resp.json()), 300)
+
+    def test_range_over_cap_returns_413(self):
+        resp = self._get_without_count("/api/v1/bible/verses/range/?ref=Ps%201-3&version=KJV")
+
+        self.assertEqual(resp.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+    def test_compare_at_cap_is_served(self):
+        resp = self._get_without_count("/api/v1/bible/verses/compare/?ref=Ps%201&versions=KJV")
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(resp.json()["results"][0]["verses"]), 150)
+
+    def test_by_chapter_unknown_book_404(self):
+        resp = self.client.get("/api/v1/bible/verses/by-chapter/Nowhere/1/")
+
+        self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_by_chapter_empty_chapter_is_empty_page(self):
+        resp = self.client.get(f"/api/v1/bible/verses/by-chapter/Ps/99/?version={self.kjv.id}")
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.json()["pagination"]["count"], 0)
+
+
+class VersesExportTest(TestCase):
+    """Streaming NDJSON export with ETag revalidation."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="export_user")
+        self.api_key = APIKey.objects.create(name="Export Key", user=self.user, scopes=["read"])
+        self.client.credentials(HTTP_AUTHORIZATION=f"Api-Key {self.api_key.key}")
+
+        old = Testament.objects.create(name="Old Testament")
+        new = Testament.objects.create(name="New Testament")
+        english = Language.objects.create(name="English", code="en")
+        self.gen = CanonicalBook.objects.create(osis_code="Gen", canonical_order=1, testament=old, chapter_count=50)
+        self.john = CanonicalBook.objects.create(osis_code="John", canonical_order=43, testament=new, chapter_count=21)
+        BookName.objects.create(canonical_book=self.john, language=english, name="John", abbreviation="Jn")
+        self.kjv = Version.objects.create(name="King James Version", code="EN_KJV", language=english)
+
+        for chapter in (1, 2, 3):
+            Verse.objects.create(book=self.john, version=self.kjv, chapter=chapter, number=1, text=f"John {chapter}:1")
+        Verse.objects.create(book=self.gen, version=self.kjv, chapter=1, number=1, text="In the beginning")
+
+    def _lines(self, resp):
+        return [json.loads(line) for line in b"".join(resp.streaming_content).decode().splitlines()]
+
+    def test_export_whole_version_in_canonical_order(self):
+        resp = self.client.get("/api/v1/bible/verses/export/?version=KJV")
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertTrue(resp["Content-Type"].startswith("application/x-ndjson"))
+        lines = self._lines(resp)
+        self.assertEqual(
+            [(row["book"], row["chapter"]) for row in lines], [("Gen", 1), ("John", 1), ("John", 2), ("John", 3)]
+        )
+        self.assertEqual(lines[0]["version"], "EN_KJV")
+        self.assertEqual(lines[0]["text"], "In the beginning")
+
+    def test_export_chapter_span(self):
+        resp = self.client.get("/api/v1/bible/verses/export/?version=KJV&book=John&chapter_start=2&chapter_end=3")
+
+        self.assertEqual([row["chapter"] for row in self._lines(resp)], [2, 3])
+
+    def test_export_gzip(self):
+        resp = self.client.get("/api/v1/bible/verses/export/?version=KJV", HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(resp["Content-Encoding"], "gzip")
+        body = gzip.decompress(b"".join(resp.streaming_content)).decode()
+        self.assertEqual(len(body.splitlines()), 4)
+
+    def test_export_gzip_refused_with_zero_quality(self):
+        for accept_encoding in ("gzip;q=0, identity", "br, gzip; q=0.0", "*;q=0", "gzip-like"):
+            resp = self.client.get("/api/v1/bible/verses/export/?version=KJV", HTTP_ACCEPT_ENCODING=accept_encoding)
+
+            self.assertFalse(resp.has_header("Content-Encoding"), accept_encoding)
+            self.assertEqual(len(self._lines(resp)), 4)
+
+        resp = self.client.get("/api/v1/bible/verses/export/?version=KJV", HTTP_ACCEPT_ENCODING="br;q=1, *;q=0.5")
+        self.assertEqual(resp["Content-Encoding"], "gzip")
+
+    async def test_export_streams_asynchronously_under_asgi(self):
+        client = AsyncClient()
+        auth = {"Authorization": f"Api-Key {self.api_key.key}"}
+
+        resp = await client.get("/api/v1/bible/verses/export/?version=KJV", headers=auth)
+        self.assertTrue(resp.is_async)
+        body = b"".join([chunk async for chunk in resp.streaming_content])
+        self.assertEqual([json.loads(line)["chapter"] for line in body.decode().splitlines()], [1, 1, 2, 3])
+
+        resp = await client.get(
+            "/api/v1/bible/verses/export/?version=KJV&book=John", headers={**auth, "Accept-Encoding": "gzip"}
+        )
+        self.assertTrue(resp.is_async)
+        self.assertEqual(resp["Content-Encoding"], "gzip")
+        body = gzip.decompress(b"".join([chunk async for chunk in resp.streaming_content])).decode()
+        self.assertEqual(len(body.splitlines()), 3)
+
+    def test_export_etag_revalidation(self):
+        url = "/api/v1/bible/verses/export/?version=KJV"
+        etag = self.client.get(url)["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            resp = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertFalse([q for q in queries if 'FROM "verses"' in q["sql"]])
+
+        verse = Verse.objects.get(book=self.gen)
+        verse.text = "Changed"
+        verse.save()
+        resp = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(resp["ETag"], etag)
+
+    def test_export_etag_differs_per_slice(self):
+        whole = self.client.get("/api/v1/bible/verses/export/?version=KJV")["ETag"]
+        john = self.client.get("/api/v1/bible/verses/export/?version=KJV&book=John")["ETag"]
+
+        self.assertNotEqual(whole, john)
+
+    def test_export_validation(self):
+        self.assertEqual(
+            self.client.get("/api/v1/bible/verses/export/?version=NOPE").status_code, status.HTTP_404_NOT_FOUND
+        )
+        self.assertEqual(
+            self.client.get("/api/v1/bible/verses/export/?version=KJV&chapter_start=1").status_code,
+            status.HTTP_400_BAD_REQUEST,
+        )
+        self.assertEqual(
+            self.client.get("/api/v1/bible/verses/export/?version=KJV&book=John&chapter_end=x").status_code,
+            status.HTTP_400_BAD_REQUEST,
+        )
+
+
+class VersesBatchTest(TestCase):
+    """POST /verses/batch/ resolves many references and fetches them in one verse query."""
+
+    URL = "/api/v1/bible/verses/batch/"
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="batch_user")
+        self.api_key = APIKey.objects.create(name="Batch Key", user=self.user, scopes=["read"])
+        self.client.credentials(HTTP_AUTHORIZATION=f"Api-Key {self.api_key.key}")
+
+        testament = Testament.objects.create(name="Old Testament")
+        english = Language.objects.create(name="English", code="en")
+        self.gen = CanonicalBook.objects.create(
+            osis_code="Gen", canonical_order=1, testament=testament, chapter_count=50
+        )
+        self.ps = CanonicalBook.objects.create(
+            osis_code="Ps", canonical_order=19, testament=testament, chapter_count=150
+        )
+        BookName.objects.create(canonical_book=self.gen, language=english, name="Genesis", abbreviation="Gen")
+        BookName.objects.create(canonical_book=self.ps, language=english, name="Psalms", abbreviation="Ps")
+        self.kjv = Version.objects.create(name="King James Version", code="EN_KJV", language=english)
+        self.other = Version.objects.create(name="American Standard", code="EN_ASV", language=english)
+        for version in (self.kjv, self.other):
+            Verse.objects.bulk_create(
+                Verse(book=book, version=version, chapter=chapter, number=number, text=f"{book.osis_code} {chapter}")
+                for book in (self.gen, self.ps)
+                for chapter in (1, 2, 3)
+                for number in range(1, 11)
+            )
+
+    def _post(self, refs, version="KJV"):
+        return self.client.post(self.URL, {"refs": refs, "version": version}, format="json")
+
+    def _coords(self, data, ids):
+        rows = {row[0]: row for row in data["verses"]}
+        return [f"{rows[i][1]} {rows[i][3]}:{rows[i][4]}" for i in ids]
+
+    def test_groups_ranges_and_deduplicates(self):
+        resp = self._post(["Ps 2:9-3:2", "Gen 1:2-3; Genesis 1:3-4", "Ps 1", "Nowhere 1:1", "Gen"])
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        data = resp.json()
+        results = data["results"]
+        self.assertEqual(self._coords(data, results[0]["verse_ids"]), ["Ps 2:9", "Ps 2:10", "Ps 3:1", "Ps 3:2"])
+        self.assertEqual(self._coords(data, results[1]["verse_ids"]), ["Gen 1:2", "Gen 1:3"])
+        self.assertEqual(self._coords(data, results[2]["verse_ids"]), ["Gen 1:3", "Gen 1:4"])
+        self.assertEqual(len(results[3]["verse_ids"]), 10)
+        self.assertEqual(results[4]["error"], "book_not_found")
+        self.assertEqual(results[5]["error"], "unparsed")
+
+        # Gen 1:3 is shared by two references but returned once, in canonical order, from one version
+        self.assertEqual(len(data["verses"]), 3 + 4 + 10)
+        self.assertEqual(data["verses"][0][1:5], ["Gen", "EN_KJV", 1, 2])
+        self.assertEqual({v["code"] for v in data["included"]["versions"]}, {"EN_KJV"})
+
+    def test_single_verse_query_regardless_of_reference_count(self):
+        def verse_queries(refs):
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(self._post(refs).status_code, status.HTTP_200_OK)
+            return [q["sql"] for q in queries if "unnest" in q["sql"]]
+
+        self.assertEqual(len(verse_queries(["Gen 1:1"])), 1)
+        self.assertEqual(len(verse_queries([f"Gen {c}:{v}" for c in (1, 2, 3) for v in range(1, 11)])), 1)
+
+    def test_limits(self):
+        self.assertEqual(self._post(["Gen 1:1"] * 101).status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertEqual(self._post(["Gen 1:1"], version="NOPE").status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.post(self.URL, {"refs": []}, format="json").status_code, 400)
+
+        with patch("bible.verses.views.MAX_BATCH_VERSES", 15):
+            self.assertEqual(self._post(["Gen 1:1-10", "Ps 1:1-5"]).status_code, status.HTTP_200_OK)
+            self.assertEqual(self._post(["Gen 1", "Ps 1"]).status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
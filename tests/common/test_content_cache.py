@@ -0,0 +1,123 @@
+"""
+Tests for the content-versioned response cache.
+
+Covers:
+- Strong ETag with long Cache-Control; If-None-Match answered 304 with no queries but the API-key lookup
+- Stored responses replayed without running the view
+- Model writes and explicit bumps invalidate only the affected datasets
+- With replicas, misses over a just-written dataset read from the primary
+"""
+
+import json
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from bible.models import APIKey, BookName, CanonicalBook, Language, Testament, Verse, Version
+from common.content_cache import WRITTEN_KEY, ContentCacheMixin, bump_generation, get_generations
+from common.db import replicas
+
+
+class ContentCacheTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        english = Language.objects.create(name="English", code="en")
+        testament = Testament.objects.create(name="Old Testament")
+        cls.gen = CanonicalBook.objects.create(
+            osis_code="Gen", canonical_order=1, testament=testament, chapter_count=50
+        )
+        BookName.objects.create(canonical_book=cls.gen, language=english, name="Genesis", abbreviation="Gen")
+        kjv = Version.objects.create(name="King James Version", code="EN_KJV", language=english)
+        cls.verse = Verse.objects.create(book=cls.gen, version=kjv, chapter=1, number=1, text="In the beginning")
+        user = User.objects.create_user(username="reader", password="x")
+        cls.api_key = APIKey.objects.create(name="Reader", user=user, scopes=["read"])
+
+    def setUp(self):
+        bump_generation()
+        self.client.defaults["HTTP_AUTHORIZATION"] = f"Api-Key {self.api_key.key}"
+
+    def test_etag_and_not_modified(self):
+        url = f"/api/v1/bible/verses/by-chapter/Genesis/1/?version={self.verse.version_id}"
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first["X-Content-Cache"], "miss")
+        self.assertRegex(first["ETag"], r'^"[0-9a-f]{32}"$')
+        self.assertIn("max-age=86400", first["Cache-Control"])
+
+        with CaptureQueriesContext(connection) as queries:
+            revalidated = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated["ETag"], first["ETag"])
+        # Only authentication (API-key lookup and its last-used stamp) touches the database
+        self.assertTrue(
+            all(
+                "verses" not in sql and "canonical_books" not in sql
+                for sql in (q["sql"] for q in queries.captured_queries)
+            )
+        )
+
+    def test_stored_response_replayed(self):
+        url = "/api/v1/bible/books/Genesis/info/"
+        first = self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(url)
+
+        self.assertEqual(second["X-Content-Cache"], "hit")
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["ETag"], first["ETag"])
+        self.assertTrue(all("canonical_books" not in sql for sql in (q["sql"] for q in queries.captured_queries)))
+
+    def test_writes_invalidate_their_datasets(self):
+        url = "/api/v1/bible/books/Genesis/info/"
+        etag = self.client.get(url)["ETag"]
+        before = get_generations(["books", "verses"])
+
+        Verse.objects.filter(pk=self.verse.pk).first().save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.gen.chapter_count = 51
+        self.gen.save()
+        after = get_generations(["books", "verses"])
+        self.assertGreater(after["books"], before["books"])
+        fresh = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(fresh.status_code, 200)
+        self.assertEqual(fresh["X-Content-Cache"], "miss")
+        self.assertNotEqual(fresh["ETag"], etag)
+
+        with self.assertRaises(ValueError):
+            bump_generation("nope")
+
+
+class _ReplicaProbeView(ContentCacheMixin, APIView):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    throttle_classes = []
+    content_datasets = ("books",)
+
+    def get(self, request):
+        return Response({"replica": replicas.pick_replica()})
+
+
+@override_settings(DB_REPLICA_ALIASES=["replica"], DB_REPLICA_MAX_LAG_SECONDS=5.0, DB_REPLICA_LAG_CHECK_INTERVAL=5.0)
+class ContentCacheReplicaTest(SimpleTestCase):
+    def _get(self, path):
+        with patch.object(replicas, "replica_lag", return_value=0.0), replicas.use_replicas():
+            response = _ReplicaProbeView.as_view()(APIRequestFactory().get(path))
+        self.assertEqual(response["X-Content-Cache"], "miss")
+        return json.loads(response.content)["replica"]
+
+    def test_recently_written_dataset_reads_from_primary(self):
+        bump_generation("books")
+        self.assertEqual(cache.ttl(WRITTEN_KEY.format("books")), 10)
+        self.assertIsNone(self._get("/probe/"))
+
+        cache.delete(WRITTEN_KEY.format("books"))
+        self.assertEqual(self._get("/probe/?page=2"), "replica")
@@ -0,0 +1,124 @@
+"""
+Tests for the COPY-based version loader in common.data_core.
+
+Covers:
+- Streaming both JSON layouts into verses through COPY + staging
+- Re-population as an in-place diff that keeps verse ids
+- Parallel populate_all with deferred secondary indexes
+"""
+
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+
+from bible.models import Theme, Verse, VerseTheme, Version
+from common.data_core import BibleDataEngine
+
+
+def _write(path: Path, data) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+class VersionLoaderTest(TestCase):
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.engine = BibleDataEngine(str(self.tmpdir))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _texts(self, code):
+        return {
+            (v.book.osis_code, v.chapter, v.number): v.text
+            for v in Verse.objects.filter(version__code=code).select_related("book")
+        }
+
+    def test_populate_list_layout(self):
+        path = _write(
+            self.tmpdir / "acf.json",
+            [{"abbrev": "Gn", "chapters": [["No princípio", "A terra", "  "], ["Assim"]]}],
+        )
+
+        result = self.engine.populate_version(path, "pt-BR", "acf")
+
+        self.assertTrue(result.success, result.error_message)
+        self.assertEqual(result.items_processed, 3)
+        self.assertEqual(
+            self._texts("ACF"),
+            {("Gen", 1, 1): "No princípio", ("Gen", 1, 2): "A terra", ("Gen", 2, 1): "Assim"},
+        )
+
+    def test_populate_books_layout(self):
+        path = _write(
+            self.tmpdir / "kjv.json",
+            {
+                "name": "King James Version",
+                "books": [{"name": "John", "chapters": [{"verses": [{"verse": 1, "text": "In the beginning"}]}]}],
+            },
+        )
+
+        result = self.engine.populate_version(path, "en-US", "kjv")
+
+        self.assertTrue(result.success, result.error_message)
+        self.assertEqual(Version.objects.get(code="KJV").name, "King James Version")
+        self.assertEqual(self._texts("KJV"), {("John", 1, 1): "In the beginning"})
+
+    def test_repopulate_keeps_ids_and_links(self):
+        path = _write(self.tmpdir / "acf.json", [{"abbrev": "Gn", "chapters": [["One", "Two"]]}])
+        self.engine.populate_version(path, "pt-BR", "acf")
+        first = Verse.objects.get(version__code="ACF", chapter=1, number=1)
+        VerseTheme.objects.create(verse=first, theme=Theme.objects.create(name="Creation"))
+
+        _write(path, [{"abbrev": "Gn", "chapters": [["One (revised)"], ["Three"]]}])
+        result = self.engine.populate_version(path, "pt-BR", "acf")
+
+        self.assertTrue(result.success, result.error_message)
+        self.assertEqual((result.details["inserted"], result.details["updated"], result.details["deleted"]), (1, 1, 1))
+        first.refresh_from_db()
+        self.assertEqual(first.text, "One (revised)")
+        self.assertTrue(VerseTheme.objects.filter(verse=first).exists())
+        self.assertEqual(self._texts("ACF"), {("Gen", 1, 1): "One (revised)", ("Gen", 2, 1): "Three"})
+
+    def test_invalid_file_rolls_back(self):
+        # Passes validation (first book only); the second book breaks mid-stream
+        path = _write(self.tmpdir / "bad.json", [{"abbrev": "Gn", "chapters": [["Um"]]}, {"abbrev": "Êx"}])
+
+        result = self.engine.populate_version(path, "pt-BR", "bad")
+
+        self.assertFalse(result.success)
+        self.assertFalse(Version.objects.filter(code="BAD").exists())
+
+
+class ParallelVersionLoaderTest(TransactionTestCase):
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        canonical = self.tmpdir / "processed" / "bibles" / "canonical"
+        _write(canonical / "pt" / "acf" / "acf.json", [{"abbrev": "Gn", "chapters": [["Um", "Dois"]]}])
+        _write(canonical / "pt" / "nvi" / "nvi.json", [{"abbrev": "Gn", "chapters": [["Um"]]}])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _verse_indexes(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT indexname FROM pg_indexes WHERE tablename = %s", [Verse._meta.db_table])
+            return {row[0] for row in cursor.fetchall()}
+
+    def test_parallel_populate_all_restores_indexes(self):
+        expected = {index.name for index in Verse._meta.indexes}
+        self.assertTrue(expected <= self._verse_indexes())
+
+        result = BibleDataEngine(str(self.tmpdir)).populate_all(["pt-BR"], workers=2)
+
+        self.assertEqual(result.details["total_versions"], 2)
+        self.assertEqual(result.details["total_verses"], 3)
+        self.assertEqual(result.details["failed_versions"], [])
+        self.assertEqual(Verse.objects.filter(version__code="ACF").count(), 2)
+        self.assertEqual(Verse.objects.filter(version__code="NVI").count(), 1)
+        self.assertTrue(expected <= self._verse_indexes())
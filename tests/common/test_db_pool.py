@@ -0,0 +1,120 @@
+"""
+Tests for pooled connections, query routes and statement timeouts.
+
+Covers:
+- Pool reuses released connections, waits then times out at max_size, drops broken ones
+- Pooled backend hands the same raw connection back after close()
+- Request and search-route statement timeouts; cancelled queries answered 503
+- Hot SQL prepared once per connection
+"""
+
+from django.db import OperationalError, connection, connections, transaction
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+from common.db import PoolTimeout, execute_prepared, is_statement_timeout, route_cursor, statement_timeout
+from common.db.pool import ConnectionPool
+from common.exceptions import custom_exception_handler
+from common.middleware import StatementTimeoutMiddleware
+
+
+class _Info:
+    transaction_status = 0  # TRANSACTION_STATUS_IDLE
+
+
+class _Conn:
+    def __init__(self):
+        self.closed = 0
+        self.info = _Info()
+        self.rollbacks = 0
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.info.transaction_status = 0
+
+    def close(self):
+        self.closed = 1
+
+
+class ConnectionPoolTest(SimpleTestCase):
+    def test_reuses_released_connection(self):
+        pool = ConnectionPool("test", max_size=2, timeout=0.01)
+        conn = pool.getconn(_Conn)
+        conn.info.transaction_status = 2  # left in a transaction by the borrower
+        pool.putconn(conn)
+
+        self.assertEqual(conn.rollbacks, 1)
+        self.assertIs(pool.getconn(_Conn), conn)
+        self.assertEqual(pool.stats()["in_use"], 1)
+
+    def test_times_out_when_exhausted(self):
+        pool = ConnectionPool("test", max_size=1, timeout=0.01)
+        held = pool.getconn(_Conn)
+        with self.assertRaises(PoolTimeout):
+            pool.getconn(_Conn)
+
+        pool.putconn(held)
+        self.assertIs(pool.getconn(_Conn), held)
+
+    def test_drops_broken_connections(self):
+        pool = ConnectionPool("test", max_size=1, timeout=0.01)
+        conn = pool.getconn(_Conn)
+        conn.closed = 1
+        pool.putconn(conn)
+
+        self.assertEqual(pool.stats()["size"], 0)
+        self.assertIsNot(pool.getconn(_Conn), conn)
+
+
+class PooledBackendTest(TestCase):
+    def test_close_returns_connection_to_pool(self):
+        wrapper = connections.create_connection("default")
+        try:
+            wrapper.ensure_connection()
+            raw = wrapper.connection
+            wrapper.close()
+            wrapper.ensure_connection()
+            self.assertIs(wrapper.connection, raw)
+        finally:
+            wrapper.close()
+
+    def test_prepares_hot_sql_once(self):
+        sql = "SELECT %s::int + %s"
+        with connection.cursor() as cursor:
+            execute_prepared(cursor, sql, [1, 2])
+            self.assertEqual(cursor.fetchone(), (3,))
+            execute_prepared(cursor, sql, [5, 2])
+            self.assertEqual(cursor.fetchone(), (7,))
+            cursor.execute("SELECT statement FROM pg_prepared_statements WHERE statement LIKE %s", ["%$1::int + $2%"])
+            self.assertEqual(len(cursor.fetchall()), 1)
+
+
+class StatementTimeoutTest(TestCase):
+    def _timeout(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SHOW statement_timeout")
+            return cursor.fetchone()[0]
+
+    def test_request_and_search_route_timeouts(self):
+        seen = {}
+
+        def view(request):
+            seen["oltp"] = self._timeout()
+            with route_cursor() as cursor:
+                cursor.execute("SHOW statement_timeout")
+                seen["search"] = cursor.fetchone()[0]
+            return None
+
+        with self.settings(DB_OLTP_STATEMENT_TIMEOUT_MS=1500, DB_SEARCH_STATEMENT_TIMEOUT_MS=9000):
+            StatementTimeoutMiddleware(view)(RequestFactory().get("/"))
+        self.assertEqual(seen, {"oltp": "1500ms", "search": "9s"})
+
+    def test_cancelled_query_is_503(self):
+        with self.assertRaises(OperationalError) as ctx:
+            with transaction.atomic(), statement_timeout(20):
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT pg_sleep(1)")
+
+        self.assertTrue(is_statement_timeout(ctx.exception))
+        response = custom_exception_handler(ctx.exception, {})
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.data["code"], "query_timeout")
@@ -0,0 +1,65 @@
+"""
+Tests for read-replica routing.
+
+Covers:
+- Safe-request reads (ORM and search route) go to a healthy replica, writes to the primary
+- Lagging or unreachable replicas, transactions and non-request code fall back to the primary
+- A successful write pins the client to the primary for its next reads
+- Lag probe SQL on a primary reports no lag
+"""
+
+from unittest.mock import patch
+
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from bible.models import Version
+from common.db import ROUTE_SEARCH, replicas, route_alias
+from common.db.routers import ReplicaRouter
+from common.middleware import ReadReplicaMiddleware
+
+router = ReplicaRouter()
+
+
+@override_settings(DB_REPLICA_ALIASES=["replica"], DB_REPLICA_MAX_LAG_SECONDS=5.0)
+class ReplicaRouterTest(SimpleTestCase):
+    def test_safe_reads_use_healthy_replica(self):
+        with patch.object(replicas, "replica_lag", return_value=0.0), replicas.use_replicas():
+            self.assertEqual(router.db_for_read(Version), "replica")
+            self.assertEqual(route_alias(ROUTE_SEARCH), "replica")
+            self.assertEqual(router.db_for_write(Version), "default")
+        self.assertEqual(router.db_for_read(Version), "default")
+
+    def test_lagging_or_unreachable_replica_falls_back(self):
+        for lag in (30.0, None):
+            with patch.object(replicas, "replica_lag", return_value=lag), replicas.use_replicas():
+                self.assertEqual(router.db_for_read(Version), "default")
+
+    def test_write_pins_client_to_primary(self):
+        seen = []
+
+        def view(request):
+            seen.append(replicas.pick_replica())
+            return HttpResponse(status=201 if request.method == "POST" else 200)
+
+        middleware = ReadReplicaMiddleware(view)
+        factory = RequestFactory()
+        with patch.object(replicas, "replica_lag", return_value=0.0):
+            middleware(factory.get("/", HTTP_AUTHORIZATION="Api-Key writer"))
+            middleware(factory.post("/", HTTP_AUTHORIZATION="Api-Key writer"))
+            middleware(factory.get("/", HTTP_AUTHORIZATION="Api-Key writer"))
+            middleware(factory.get("/", HTTP_AUTHORIZATION="Api-Key reader"))
+        replicas.cache.delete(replicas.client_key(factory.get("/", HTTP_AUTHORIZATION="Api-Key writer")))
+
+        self.assertEqual(seen, ["replica", None, None, "replica"])
+
+
+class ReplicaLagTest(TestCase):
+    def test_primary_reports_no_lag(self):
+        replicas._lag.pop("default", None)
+        self.assertEqual(replicas.replica_lag("default"), 0.0)
+
+    @override_settings(DB_REPLICA_ALIASES=["replica"])
+    def test_reads_in_transaction_stay_on_primary(self):
+        with patch.object(replicas, "replica_lag", return_value=0.0), replicas.use_replicas():
+            self.assertEqual(router.db_for_read(Version), "default")
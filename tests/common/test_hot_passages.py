@@ -0,0 +1,104 @@
+"""
+Tests for the bounded top-K passage popularity sketch.
+
+Covers:
+- Space-Saving counts, eviction and error bounds
+- Sampled recording and scaled read-out
+- /metrics/hot-passages/ fed by the verses views, including content-cache hits
+"""
+
+from django.test import TestCase, override_settings
+
+from bible.models import BookName, CanonicalBook, Language, Testament, Verse, Version
+from common.observability.topk import HOT_PASSAGES, SpaceSaving, hot_passages, record_passage
+
+
+class SpaceSavingTest(TestCase):
+    def test_exact_below_capacity(self):
+        sketch = SpaceSaving(capacity=3)
+        for key in ["a", "b", "a", "c", "a", "b"]:
+            sketch.add(key)
+
+        self.assertEqual(sketch.top(2), [("a", 3, 0), ("b", 2, 0)])
+        self.assertEqual(sketch.total, 6)
+
+    def test_memory_is_bounded_and_heavy_hitters_survive(self):
+        sketch = SpaceSaving(capacity=10)
+        for i in range(5000):
+            sketch.add("John.3.16")
+            sketch.add(f"noise-{i}")
+            if i % 2 == 0:
+                sketch.add("Ps.23")
+
+        self.assertEqual(len(sketch), 10)
+        self.assertLessEqual(len(sketch._heap), 40)
+        top = sketch.top(2)
+        self.assertEqual([key for key, _, _ in top], ["John.3.16", "Ps.23"])
+        for key, count, error in top:
+            true_count = 5000 if key == "John.3.16" else 2500
+            self.assertGreaterEqual(count, true_count)
+            self.assertLessEqual(count - error, true_count)
+
+
+class HotPassagesTest(TestCase):
+    def setUp(self):
+        HOT_PASSAGES.clear()
+        self.addCleanup(HOT_PASSAGES.clear)
+
+    @override_settings(HOT_PASSAGES_SAMPLE_RATE=1.0)
+    def test_record_keys(self):
+        record_passage("John", 3, 16, 18)
+        record_passage("John", 3, 16, 16)
+        record_passage("John", 3)
+
+        self.assertEqual(
+            {item["passage"] for item in hot_passages()["items"]},
+            {"John.3.16-18", "John.3.16", "John.3"},
+        )
+
+    @override_settings(HOT_PASSAGES_SAMPLE_RATE=0.5)
+    def test_sampled_counts_are_scaled(self):
+        for _ in range(4000):
+            record_passage("Gen", 1, 1)
+
+        result = hot_passages()
+
+        self.assertLess(HOT_PASSAGES.total, 4000)
+        self.assertAlmostEqual(result["observed"], 4000, delta=400)
+        self.assertEqual(result["items"][0]["count"], result["observed"])
+
+    @override_settings(HOT_PASSAGES_SAMPLE_RATE=1.0)
+    def test_endpoint_reports_served_passages(self):
+        english = Language.objects.create(name="English", code="en")
+        testament = Testament.objects.create(name="New Testament")
+        john = CanonicalBook.objects.create(osis_code="John", canonical_order=43, testament=testament, chapter_count=21)
+        BookName.objects.create(canonical_book=john, language=english, name="John", abbreviation="Jn")
+        kjv = Version.objects.create(name="King James Version", code="EN_KJV", language=english)
+        Verse.objects.create(book=john, version=kjv, chapter=3, number=16, text="For God so loved the world")
+
+        self.client.get("/api/v1/bible/verses/by-reference/?ref=John%203:16&version=KJV")
+        self.client.get("/api/v1/bible/verses/by-reference/?ref=John%203:16&version=KJV")
+        self.client.get("/api/v1/bible/verses/by-chapter/John/3/")
+
+        resp = self.client.get("/metrics/hot-passages/?n=5")
+
+        self.assertEqual(resp.status_code, 200)
+        items = {item["passage"]: item["count"] for item in resp.json()["items"]}
+        self.assertEqual(items, {"John.3.16": 2, "John.3": 1})
+
+    @override_settings(HOT_PASSAGES_SAMPLE_RATE=1.0)
+    def test_content_cache_hits_are_counted(self):
+        english = Language.objects.create(name="English", code="en")
+        testament = Testament.objects.create(name="Old Testament")
+        gen = CanonicalBook.objects.create(osis_code="Gen", canonical_order=1, testament=testament, chapter_count=50)
+        BookName.objects.create(canonical_book=gen, language=english, name="Genesis", abbreviation="Gen")
+        kjv = Version.objects.create(name="King James Version", code="EN_KJV", language=english)
+        Verse.objects.create(book=gen, version=kjv, chapter=1, number=1, text="In the beginning")
+        url = f"/api/v1/bible/verses/by-chapter/Genesis/1/?version={kjv.id}"
+
+        first = self.client.get(url)
+        hit = self.client.get(url)
+        revalidated = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual([hit["X-Content-Cache"], revalidated.status_code], ["hit", 304])
+        self.assertEqual(hot_passages()["items"][0], {"passage": "Gen.1", "count": 3, "error": 0})
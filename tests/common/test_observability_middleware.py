@@ -7,6 +7,8 @@ from unittest.mock import Mock, patch
 from django.http import HttpResponse
 from django.test import RequestFactory, TestCase
 
+from bible.models import Language, Version
+from common.observability.labels import reset_label_registry
 from common.observability.middleware import ObservabilityMiddleware
 
 
@@ -17,6 +19,9 @@ class ObservabilityMiddlewareTest(TestCase):
         """Set up test data."""
         self.factory = RequestFactory()
         self.get_response = Mock(return_value=HttpResponse())
+        self.pt_br = Language.objects.create(name="Português", code="pt-BR")
+        Version.objects.create(name="Nova Versão Internacional", code="PT_NVI", language=self.pt_br)
+        reset_label_registry()
 
     def test_middleware_initialization(self):
         """Test middleware initializes correctly."""
@@ -83,7 +88,7 @@ class ObservabilityMiddlewareTest(TestCase):
         """Test middleware with lang and version parameters."""
         middleware = ObservabilityMiddleware(self.get_response)
 
-        request = self.factory.get("/test/?lang=pt&version=v2")
+        request = self.factory.get("/test/?lang=pt&version=nvi")
         request.resolver_match = Mock()
         request.resolver_match.view_name = "test_view"
 
@@ -93,13 +98,46 @@ class ObservabilityMiddlewareTest(TestCase):
 
         middleware(request)
 
-        # Should use provided lang and version
-        mock_latency.labels.assert_called_once_with(view="test_view", lang="pt", version="v2")
+        # Known lang and version are mapped onto their registered codes
+        mock_latency.labels.assert_called_once_with(view="test_view", lang="pt", version="PT_NVI")
 
         mock_requests.labels.assert_called_once_with(
-            method="GET", status="201", view="test_view", lang="pt", version="v2"
+            method="GET", status="201", view="test_view", lang="pt", version="PT_NVI"
         )
 
+    @patch("common.observability.middleware.LATENCY")
+    @patch("common.observability.middleware.REQUESTS")
+    @patch("common.observability.middleware.BUILD_INFO")
+    def test_unknown_lang_and_version_collapse_to_other(self, mock_build_info, mock_requests, mock_latency):
+        """Arbitrary client input must not mint new label values."""
+        middleware = ObservabilityMiddleware(self.get_response)
+
+        for i in range(3):
+            request = self.factory.get(f"/test/?lang=xx-{i}&version=random-{i}")
+            request.resolver_match = Mock()
+            request.resolver_match.view_name = "test_view"
+            middleware(request)
+
+        labels = {(c.kwargs["lang"], c.kwargs["version"]) for c in mock_latency.labels.call_args_list}
+        self.assertEqual(labels, {("other", "other")})
+
+    @patch("common.observability.middleware.LATENCY")
+    @patch("common.observability.middleware.REQUESTS")
+    @patch("common.observability.middleware.BUILD_INFO")
+    def test_label_registry_follows_new_versions(self, mock_build_info, mock_requests, mock_latency):
+        """Saving a Version refreshes the known labels without waiting for the TTL."""
+        middleware = ObservabilityMiddleware(self.get_response)
+        request = self.factory.get("/test/?version=ARA")
+        request.resolver_match = Mock()
+        request.resolver_match.view_name = "test_view"
+
+        middleware(request)
+        Version.objects.create(name="Almeida Revista e Atualizada", code="PT_ARA", language=self.pt_br)
+        middleware(request)
+
+        versions = [c.kwargs["version"] for c in mock_latency.labels.call_args_list]
+        self.assertEqual(versions, ["other", "PT_ARA"])
+
     @patch("common.observability.middleware.LATENCY")
     @patch("common.observability.middleware.REQUESTS")
     @patch("common.observability.middleware.BUILD_INFO")
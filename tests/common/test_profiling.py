@@ -0,0 +1,161 @@
+"""
+Tests for opt-in request profiling.
+
+Covers:
+- SQL fingerprinting and the bounded profile ring buffer
+- Stack sampling of a busy thread
+- Header trigger restricted to admin API keys; sampling-rate trigger
+- SQL timeline covering every database alias
+- /metrics/profiles/ as speedscope, collapsed stacks and JSON
+"""
+
+import threading
+import time
+
+from django.contrib.auth.models import User
+from django.db import connections
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from bible.models import APIKey, BookName, CanonicalBook, Language, Testament, Verse, Version
+from common.observability.profiling import (
+    PROFILES,
+    Frame,
+    Profile,
+    ProfileStore,
+    ProfilingMiddleware,
+    StackSampler,
+    fingerprint_sql,
+)
+
+
+def _busy_wait(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class ProfilingPrimitivesTest(TestCase):
+    def test_fingerprint_collapses_literals(self):
+        a = fingerprint_sql("SELECT *  FROM verses WHERE id IN (%s, %s, %s) AND chapter = 3 AND text = 'it''s'")
+        b = fingerprint_sql("SELECT * FROM verses WHERE id IN (%s) AND chapter = 12 AND text = 'x'")
+
+        self.assertEqual(a, b)
+        self.assertEqual(a, "SELECT * FROM verses WHERE id IN (...) AND chapter = ? AND text = ?")
+
+    def test_store_is_bounded_newest_first(self):
+        store = ProfileStore(capacity=3)
+        for i in range(5):
+            store.add(Profile(id=str(i), method="GET", path="/", trigger="sample", started_at="", interval_ms=1))
+
+        self.assertEqual([p.id for p in store.recent()], ["4", "3", "2"])
+        self.assertIsNone(store.get("0"))
+        self.assertEqual(store.get("3").id, "3")
+
+    def test_sampler_records_the_target_thread_stack(self):
+        with StackSampler(threading.get_ident(), interval=0.001) as sampler:
+            _busy_wait(0.05)
+
+        self.assertGreater(sum(sampler.samples.values()), 0)
+        leaf_names = {stack[-1].name for stack in sampler.samples}
+        self.assertTrue(any(name.startswith("_busy_wait ") for name in leaf_names), leaf_names)
+
+
+class ProfilingMiddlewareTest(TestCase):
+    URL = "/api/v1/bible/verses/by-reference/?ref=John%203:16&version=KJV"
+
+    def setUp(self):
+        PROFILES.clear()
+        self.addCleanup(PROFILES.clear)
+        english = Language.objects.create(name="English", code="en")
+        testament = Testament.objects.create(name="New Testament")
+        john = CanonicalBook.objects.create(osis_code="John", canonical_order=43, testament=testament, chapter_count=21)
+        BookName.objects.create(canonical_book=john, language=english, name="John", abbreviation="Jn")
+        kjv = Version.objects.create(name="King James Version", code="EN_KJV", language=english)
+        Verse.objects.create(book=john, version=kjv, chapter=3, number=16, text="For God so loved the world")
+
+        user = User.objects.create_user(username="ops", password="x")
+        self.admin_key = APIKey.objects.create(name="Admin", user=user, scopes=["read", "admin"])
+        self.read_key = APIKey.objects.create(name="Reader", user=user, scopes=["read"])
+
+    def _auth(self, key):
+        return {"HTTP_AUTHORIZATION": f"Api-Key {key.key}"}
+
+    def test_unprofiled_by_default(self):
+        resp = self.client.get(self.URL, **self._auth(self.admin_key))
+
+        self.assertNotIn("X-Profile-Id", resp)
+        self.assertEqual(len(PROFILES), 0)
+
+    def test_header_requires_admin_key(self):
+        resp = self.client.get(self.URL, HTTP_X_PROFILE="1", **self._auth(self.read_key))
+
+        self.assertNotIn("X-Profile-Id", resp)
+        self.assertEqual(len(PROFILES), 0)
+
+    def test_header_with_admin_key_records_profile(self):
+        resp = self.client.get(self.URL, HTTP_X_PROFILE="1", **self._auth(self.admin_key))
+
+        self.assertEqual(resp.status_code, 200)
+        profile = PROFILES.get(resp["X-Profile-Id"])
+        self.assertEqual(profile.trigger, "header")
+        self.assertEqual(profile.status, 200)
+        self.assertEqual(profile.view, "bible:verses:verses_by_reference")
+        self.assertTrue(profile.queries)
+        starts = [q.start_ms for q in profile.queries]
+        self.assertEqual(starts, sorted(starts))
+
+    @override_settings(PROFILING_SAMPLE_RATE=1.0)
+    def test_sampling_rate_profiles_without_header(self):
+        resp = self.client.get(self.URL)
+
+        self.assertNotIn("X-Profile-Id", resp)
+        self.assertEqual([p.trigger for p in PROFILES.recent()], ["sample"])
+
+    def test_profile_endpoints(self):
+        profile_id = self.client.get(self.URL, HTTP_X_PROFILE="1", **self._auth(self.admin_key))["X-Profile-Id"]
+        PROFILES.get(profile_id).samples[(Frame("view (a.py:1)", "a.py", 1), Frame("fetch (b.py:2)", "b.py", 2))] += 3
+
+        self.assertEqual(self.client.get("/metrics/profiles/", **self._auth(self.read_key)).status_code, 403)
+        listing = self.client.get("/metrics/profiles/", **self._auth(self.admin_key)).json()
+        self.assertEqual([p["id"] for p in listing["results"]], [profile_id])
+
+        detail = self.client.get(f"/metrics/profiles/{profile_id}/", **self._auth(self.admin_key)).json()
+        sampled, evented = detail["profiles"]
+        self.assertEqual((sampled["type"], evented["type"]), ("sampled", "evented"))
+        self.assertEqual(len(sampled["samples"]), len(sampled["weights"]))
+        frame_names = [f["name"] for f in detail["shared"]["frames"]]
+        self.assertIn("view (a.py:1)", frame_names)
+        self.assertTrue(any(name.startswith("SQL SELECT") for name in frame_names))
+
+        collapsed = self.client.get(f"/metrics/profiles/{profile_id}/?output=collapsed", **self._auth(self.admin_key))
+        self.assertEqual(collapsed["Content-Type"], "text/plain; charset=utf-8")
+        self.assertIn("view (a.py:1);fetch (b.py:2) 3\n", collapsed.content.decode())
+
+        self.assertEqual(
+            self.client.get(f"/metrics/profiles/{profile_id}/?output=bogus", **self._auth(self.admin_key)).status_code,
+            400,
+        )
+        self.assertEqual(self.client.get("/metrics/profiles/missing/", **self._auth(self.admin_key)).status_code, 404)
+
+
+class ProfilingAliasesTest(TestCase):
+    databases = {"default", "search"}
+
+    def setUp(self):
+        PROFILES.clear()
+        self.addCleanup(PROFILES.clear)
+
+    @override_settings(PROFILING_SAMPLE_RATE=1.0)
+    def test_timeline_covers_every_alias(self):
+        def view(request):
+            for alias in ("default", "search"):
+                with connections[alias].cursor() as cursor:
+                    cursor.execute("SELECT 1")
+            return HttpResponse()
+
+        ProfilingMiddleware(view)(RequestFactory().get("/profiled/"))
+
+        profile = PROFILES.recent()[0]
+        self.assertEqual([q.alias for q in profile.queries], ["default", "search"])
+        self.assertEqual(profile.to_dict()["sql"][1]["alias"], "search")
@@ -0,0 +1,74 @@
+"""
+Tests for the warm-start snapshot of in-process registries.
+
+Covers:
+- Snapshot round trip: installed sections are served without rebuilding
+- Sections recorded at older dataset generations are reported stale
+- Foreign or corrupt files are rejected
+- Boot without a usable snapshot warms up in the background
+"""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from common import warm_start
+from common.content_cache import bump_generation
+
+
+class WarmStartTestMixin:
+    def setUp(self):
+        warm_start.load_providers()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "warm.snapshot"
+        self.values = dict(warm_start._values)
+        self.status = warm_start.status()
+
+    def tearDown(self):
+        warm_start._values.clear()
+        warm_start._values.update(self.values)
+        warm_start._set_status(**self.status)
+        self.tmp.cleanup()
+
+
+class SnapshotTest(WarmStartTestMixin, TestCase):
+    def test_round_trip_installs_current_sections(self):
+        header = warm_start.write_snapshot(self.path)
+        self.assertIn("rag_book_data", header["sections"])
+
+        warm_start._values.clear()
+        payload = warm_start.read_snapshot(self.path)
+        self.assertEqual(warm_start.install_snapshot(payload), [])
+        with self.assertNumQueries(0):
+            books = warm_start.process_value("rag_book_data")
+            warm_start.process_value("ref_aliases")
+        self.assertIs(books, payload["sections"]["rag_book_data"]["value"])
+
+    def test_sections_of_changed_datasets_are_stale(self):
+        warm_start.write_snapshot(self.path)
+        bump_generation("books")
+
+        stale = warm_start.stale_sections(warm_start.read_snapshot(self.path))
+        self.assertEqual(sorted(stale), ["rag_book_data", "ref_aliases"])
+
+
+class SnapshotFormatTest(WarmStartTestMixin, SimpleTestCase):
+    def test_rejects_foreign_files(self):
+        for data in (b"", b"not a snapshot at all", warm_start._HEADER.pack(warm_start.MAGIC, 1) + b"garbage"):
+            self.path.write_bytes(data)
+            with self.assertRaises(ValueError):
+                warm_start.read_snapshot(self.path)
+
+    def test_boot_without_snapshot_warms_in_background(self):
+        with (
+            override_settings(WARM_START_SNAPSHOT=str(self.path)),
+            patch.object(warm_start, "warm", return_value=[]) as warm,
+            patch("threading.Thread.start", lambda thread: thread.run()),
+        ):
+            warm_start.boot()
+
+        self.assertCountEqual(warm.call_args[0][0], warm_start._registries)
+        self.assertEqual(warm_start.status()["state"], warm_start.WARM)
+        self.assertEqual(warm_start.status()["source"], "live")
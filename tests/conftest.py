@@ -24,6 +24,27 @@ def setup_test_database(django_db_setup, django_db_blocker):
             cursor.execute("CREATE EXTENSION IF NOT EXISTS vector;")
 
 
+@pytest.fixture(scope="session", autouse=True)
+def single_connection_routes():
+    """Keep reads on "default", where TestCase data is visible; no cached rows or background writers."""
+    with override_settings(
+        DB_SEARCH_ALIAS="default",
+        DB_REPLICA_ALIASES=[],
+        AI_LOOKUP_CACHE_TIMEOUT=0,
+        USAGE_FLUSH_INTERVAL=0,
+        CROSSREF_GRAPH_REFRESH_INTERVAL=0,
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def fresh_content_generations():
+    """Start every test on new content-cache generations so cached API responses never leak between tests."""
+    from common.content_cache import bump_generation
+
+    bump_generation()
+
+
 # ========================================
 # Basic Fixtures
 # ========================================
@@ -4,13 +4,16 @@ Tests query efficiency, response times, and scalability.
 """
 
 import time
+from unittest.mock import patch
 
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test import TestCase
 from django.test.utils import override_settings
 from rest_framework.test import APIClient
 
 from bible.models import APIKey, BookName, CanonicalBook, Language, Testament, Theme, Verse, VerseTheme, Version
+from bible.verses.serializers import BookNestedSerializer
 
 
 class APIPerformanceTest(TestCase):
@@ -225,6 +228,27 @@ class APIScalabilityTest(TestCase):
             # Should complete within reasonable time even with 30 verses
             self.assertLess(elapsed, 1.5, f"Large chapter took {elapsed:.2f}s")
 
+    def test_compact_layout_serialization_cost(self):
+        """The compact fast path serializes each book once instead of once per verse (300 verses)."""
+        cache.clear()  # reference alias maps from earlier tests
+        url = "/api/v1/bible/verses/range/?ref=LRG%201-10&version=SCALE"
+
+        def book_name_lookups(layout_suffix):
+            with patch.object(
+                BookNestedSerializer, "get_name", autospec=True, side_effect=BookNestedSerializer.get_name
+            ) as get_name:
+                response = self.client.get(url + layout_suffix)
+            self.assertEqual(response.status_code, 200)
+            return get_name.call_count, response.json()
+
+        full_lookups, _ = book_name_lookups("")
+        compact_lookups, compact = book_name_lookups("&layout=compact")
+
+        self.assertEqual(full_lookups, 300)
+        self.assertEqual(compact_lookups, 1)
+        self.assertEqual(len(compact["verses"]), 300)
+        self.assertEqual({len(row) for row in compact["verses"]}, {len(compact["fields"])})
+
     def test_memory_usage_with_large_responses(self):
         """Test that large responses don't consume excessive memory."""
         import os
@@ -0,0 +1,64 @@
+"""
+Query-count regression guard for the Bible read API.
+
+Covers:
+- Every GET route under bible/urls.py is discovered and audited
+- No endpoint's query count grows with the size of its result set
+- KNOWN_SCALING only lists endpoints that still scale
+- Report diffing between two runs
+"""
+
+from django.test import TestCase
+
+from bible.query_audit import KNOWN_SCALING, SKIP, diff_reports, iter_endpoints, run_audit
+
+# Endpoints that regressed to one query per row before; their fixtures must actually grow
+GUARDED = [
+    "bible:verses:verses_by_chapter",
+    "bible:verses:verses_by_reference",
+    "bible:topics:search",
+    "bible:entities:entity-by-chapter",
+    "bible:themes:theme_progression",
+]
+
+
+class QueryCountGuardTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.report = run_audit()
+
+    def test_every_read_route_is_audited(self):
+        names = {endpoint.name for endpoint in iter_endpoints()}
+
+        self.assertGreater(len(names), 80)
+        self.assertEqual(set(self.report["endpoints"]), names - set(SKIP))
+        self.assertNotIn("bible:studies:create", names)  # POST only
+
+    def test_guarded_endpoints_are_exercised(self):
+        for name in GUARDED:
+            small = self.report["endpoints"][name]["small"]
+            large = self.report["endpoints"][name]["large"]
+            self.assertEqual((small["status"], large["status"]), (200, 200), name)
+            if small["items"] is not None:
+                self.assertGreater(large["items"], small["items"], name)
+
+    def test_query_count_does_not_grow_with_result_size(self):
+        scaling = self.report["scaling"]
+
+        unexpected = {name: counts for name, counts in scaling.items() if name not in KNOWN_SCALING}
+        self.assertEqual(unexpected, {}, "Endpoints issuing a query per result row")
+        stale = sorted(set(KNOWN_SCALING) - set(scaling))
+        self.assertEqual(stale, [], "KNOWN_SCALING entries that no longer scale; remove them")
+
+    def test_diff_reports(self):
+        previous = {"endpoints": {name: dict(entry) for name, entry in self.report["endpoints"].items()}}
+        previous["endpoints"]["bible:topics:search"] = {
+            **previous["endpoints"]["bible:topics:search"],
+            "large": {**self.report["endpoints"]["bible:topics:search"]["large"], "queries": 1},
+        }
+
+        self.assertEqual(diff_reports(self.report, self.report), [])
+        changes = diff_reports(previous, self.report)
+        self.assertEqual([c["endpoint"] for c in changes], ["bible:topics:search"])
+        self.assertEqual(changes[0]["before"], 1)
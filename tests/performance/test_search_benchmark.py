@@ -0,0 +1,57 @@
+"""
+Tests for the offline hybrid search benchmark harness.
+
+Covers:
+- Deterministic stub embeddings and corpus seeding
+- Every pipeline stage timed against a small seeded corpus
+- Baseline comparison flagging regressions
+"""
+
+import copy
+
+from django.test import TestCase
+
+from bible.ai.benchmark import STAGES, CorpusSpec, compare_to_baseline, run_benchmark, seed_corpus, stub_embedding
+from bible.models import Verse, VerseEmbedding
+
+
+class SearchBenchmarkTest(TestCase):
+    spec = CorpusSpec(verses=60, versions=("PT_BENCH_A", "PT_BENCH_B"), dim=16)
+
+    def test_stub_embedding_is_deterministic_and_normalized(self):
+        first = stub_embedding("O amor de Deus", 16)
+
+        self.assertEqual(first, stub_embedding("o AMOR de deus!", 16))
+        self.assertAlmostEqual(sum(x * x for x in first), 1.0, places=4)
+        self.assertNotEqual(first, stub_embedding("luz nas trevas", 16))
+
+    def test_run_covers_every_stage(self):
+        seeded = seed_corpus(self.spec)
+        self.assertEqual(seeded["verses"], 120)
+        self.assertEqual(VerseEmbedding.objects.count(), Verse.objects.count())
+
+        results = run_benchmark(self.spec, iterations=1, warmup=0, queries=("amor de deus", "pão da vida"))
+
+        self.assertEqual(set(results["stages"]), set(STAGES))
+        for stage in STAGES:
+            self.assertEqual(results["stages"][stage]["n"], 2)
+            self.assertGreater(results["stages"][stage]["ops_per_sec"], 0)
+        self.assertGreater(results["meta"]["avg_hits"], 0)
+        self.assertEqual(results["meta"]["corpus"]["versions"], ["PT_BENCH_A", "PT_BENCH_B"])
+
+    def test_compare_to_baseline(self):
+        baseline = {
+            "meta": {"corpus": {"verses": 60}},
+            "stages": {"bm25": {"p50_ms": 10.0}, "fusion": {"p50_ms": 0.2}, "vector": {"p50_ms": 5.0}},
+        }
+        results = copy.deepcopy(baseline)
+        results["stages"]["bm25"]["p50_ms"] = 20.0  # 2x slower
+        results["stages"]["fusion"]["p50_ms"] = 0.9  # 4.5x, but under the absolute noise floor
+        results["stages"]["vector"]["p50_ms"] = 6.0
+
+        regressions = compare_to_baseline(results, baseline, tolerance=0.5)
+
+        self.assertEqual([(r["stage"], r["ratio"]) for r in regressions], [("bm25", 2.0)])
+        results["meta"]["corpus"]["verses"] = 61
+        with self.assertRaises(ValueError):
+            compare_to_baseline(results, baseline)
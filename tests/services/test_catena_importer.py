@@ -0,0 +1,130 @@
+"""
+Tests for the Catena commentary importer.
+
+Covers:
+- DB-free file parsing used by pool workers
+- Parallel COPY + staging merge import matching the serial importer
+- Incremental entry_count and idempotent re-import
+"""
+
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.test import TestCase, TransactionTestCase
+
+from bible.commentaries.models import Author, CommentaryEntry, CommentarySource
+from bible.commentaries.services.catena_importer import CatenaImporter, parse_catena_file
+from bible.models import CanonicalBook, Testament
+
+LONG_TEXT = "Being justified by faith, we have peace with God through our Lord."
+
+
+class CatenaFixtureMixin:
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        nt = Testament.objects.create(name="New Testament")
+        ot = Testament.objects.create(name="Old Testament")
+        self.rom = CanonicalBook.objects.create(osis_code="Rom", canonical_order=45, testament=nt, chapter_count=16)
+        self.gen = CanonicalBook.objects.create(osis_code="Gen", canonical_order=1, testament=ot, chapter_count=50)
+        self.augustine = Author.objects.create(name="Augustine of Hippo", short_name="Augustine")
+
+        romans = self.tmpdir / "new_testament" / "pauline_epistles" / "romans" / "verses"
+        genesis = self.tmpdir / "old_testament" / "pentateuch" / "gn" / "verses"
+        self._write(
+            romans / "rom_05_01.json",
+            "Romans 5:1",
+            [("Augustine", LONG_TEXT), ("Unknown Monk", LONG_TEXT), ("Augustine", "too short")],
+        )
+        self._write(romans / "rom_05_02.json", "Romans 5:2", [("Augustine", LONG_TEXT)])
+        self._write(genesis / "gn_01_01.json", "Genesis 1:1", [("Augustine", LONG_TEXT)])
+        (genesis / "gn_01_02.json").write_text("{broken", encoding="utf-8")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _write(self, path: Path, reference: str, commentaries):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "verse_reference": reference,
+            "commentaries": [{"author": author, "content": content} for author, content in commentaries],
+        }
+        path.write_text(json.dumps(payload), encoding="utf-8")
+
+    def _entries(self):
+        return list(
+            CommentaryEntry.objects.order_by("book__osis_code", "chapter", "verse_start", "display_order").values_list(
+                "book__osis_code",
+                "chapter",
+                "verse_start",
+                "author__name",
+                "display_order",
+                "extraction_method",
+                "original_language",
+                "confidence_score",
+                "title",
+            )
+        )
+
+
+class CatenaImporterTest(CatenaFixtureMixin, TestCase):
+    def test_parse_catena_file_is_db_free(self):
+        path = self.tmpdir / "new_testament" / "pauline_epistles" / "romans" / "verses" / "rom_05_01.json"
+
+        with self.assertNumQueries(0):
+            parsed = parse_catena_file(str(path))
+
+        self.assertEqual(parsed.book_candidates[0], "Rom")
+        self.assertEqual((parsed.chapter, parsed.verse, parsed.reference), (5, 1, "Romans 5:1"))
+        self.assertEqual([row[:2] for row in parsed.commentaries], [(0, "Augustine"), (1, "Unknown Monk")])
+        self.assertEqual(parsed.skipped, 1)
+
+    def test_parallel_import_matches_serial(self):
+        serial = CatenaImporter(catena_base=str(self.tmpdir)).import_entries()
+        expected = self._entries()
+        CommentaryEntry.objects.all().delete()
+        CommentarySource.objects.filter(short_code="CATENA").update(entry_count=0)
+
+        result = CatenaImporter(catena_base=str(self.tmpdir)).import_entries(workers=2)
+
+        self.assertEqual(self._entries(), expected)
+        self.assertEqual(result.entries_created, 4)
+        self.assertEqual(result.entries_created, serial.entries_created)
+        self.assertEqual(result.files_processed, 3)
+        self.assertEqual(result.rows_staged, 4)
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn("gn_01_02.json", result.errors[0])
+        self.assertGreater(result.rows_per_second, 0)
+
+    def test_parallel_import_respects_limit(self):
+        result = CatenaImporter(catena_base=str(self.tmpdir)).import_entries(limit=2, workers=2)
+
+        self.assertEqual(result.rows_staged, 2)
+        self.assertEqual(CommentaryEntry.objects.count(), 2)
+
+
+class CatenaReimportTest(CatenaFixtureMixin, TransactionTestCase):
+    """Each import commits, as in a real run, so the ON COMMIT DROP staging table is gone between runs."""
+
+    def test_parallel_reimport_is_idempotent_and_counts_incrementally(self):
+        importer = CatenaImporter(catena_base=str(self.tmpdir))
+        importer.import_entries(workers=2)
+
+        again = importer.import_entries(workers=2)
+
+        self.assertEqual(again.entries_created, 0)
+        self.assertEqual(CommentaryEntry.objects.count(), 4)
+        self.assertEqual(CommentarySource.objects.get(short_code="CATENA").entry_count, 4)
+
+    def test_serial_reimport_counts_incrementally(self):
+        importer = CatenaImporter(catena_base=str(self.tmpdir))
+        first = importer.import_entries()
+
+        again = importer.import_entries()
+
+        self.assertEqual(first.entries_created, 4)
+        # Only rows the database inserted are counted; the unique constraint lets the NULL-author row in again
+        self.assertEqual(again.entries_created, 1)
+        self.assertEqual(CommentaryEntry.objects.count(), 5)
+        self.assertEqual(CommentarySource.objects.get(short_code="CATENA").entry_count, 5)
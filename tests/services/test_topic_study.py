@@ -0,0 +1,113 @@
+"""
+Tests for memoized topic study payloads.
+
+Covers:
+- Composed payload served by TopicStudyView, 404 for unknown topics
+- Repeat requests answered from the cache without touching the database
+- Topic writes and dataset bumps retire cached studies
+- Prebuild warms every topic/language and skips documents already cached
+- run_concurrently keeps task order and carries the caller's context variables into pool threads
+"""
+
+import contextvars
+import threading
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from bible.models import CanonicalBook, Language, Testament, Topic, TopicName
+from bible.topics.services.study_cache import get_study, prebuild_studies
+from bible.topics.services.study_composer import run_concurrently
+from common.content_cache import bump_generation
+
+
+class TopicStudyCacheTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.english = Language.objects.create(name="English", code="en")
+        testament = Testament.objects.create(name="Old Testament")
+        CanonicalBook.objects.create(osis_code="Gen", canonical_order=1, testament=testament, chapter_count=50)
+        cls.topic = Topic.objects.create(
+            slug="abraham",
+            canonical_id="UNIFIED:abraham",
+            canonical_name="ABRAHAM",
+            name_normalized="abraham",
+            primary_source="NAV",
+        )
+        TopicName.objects.create(topic=cls.topic, language=cls.english, name="Abraham")
+        Topic.objects.create(
+            slug="moses",
+            canonical_id="UNIFIED:moses",
+            canonical_name="MOSES",
+            name_normalized="moses",
+            primary_source="NAV",
+        )
+
+    def setUp(self):
+        bump_generation()
+
+    def test_view_serves_composed_study(self):
+        response = self.client.get("/api/v1/bible/topics/abraham/study/", HTTP_ACCEPT_LANGUAGE="en")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), get_study("abraham", "en"))
+
+        missing = self.client.get("/api/v1/bible/topics/nobody/study/")
+        self.assertEqual(missing.status_code, 404)
+
+    def test_second_request_is_served_from_cache(self):
+        first = get_study("abraham", "en")
+        with CaptureQueriesContext(connection) as queries:
+            second = get_study("abraham", "en")
+        self.assertEqual(second, first)
+        self.assertEqual(len(queries), 0)
+
+    def test_writes_and_bumps_retire_cached_studies(self):
+        get_study("abraham", "en")
+
+        self.topic.canonical_name = "ABRAHAM (PATRIARCH)"
+        self.topic.save()
+        with CaptureQueriesContext(connection) as queries:
+            get_study("abraham", "en")
+        self.assertGreater(len(queries), 0)
+
+        bump_generation("crossrefs")
+        with CaptureQueriesContext(connection) as queries:
+            get_study("abraham", "en")
+        self.assertGreater(len(queries), 0)
+
+        bump_generation("verses")  # not an input of studies
+        with CaptureQueriesContext(connection) as queries:
+            get_study("abraham", "en")
+        self.assertEqual(len(queries), 0)
+
+    def test_prebuild_warms_and_skips_cached(self):
+        stats = prebuild_studies(["en", "pt"])
+        self.assertEqual((stats["topics"], stats["built"], stats["cached"], stats["failed"]), (2, 4, 0, 0))
+
+        with CaptureQueriesContext(connection) as queries:
+            get_study("moses", "pt")
+        self.assertEqual(len(queries), 0)
+
+        stats = prebuild_studies(["en", "pt"], slugs=["moses"])
+        self.assertEqual((stats["topics"], stats["built"], stats["cached"]), (1, 0, 2))
+
+    def test_run_concurrently_keeps_order(self):
+        results = run_concurrently({name: (lambda n=n: n * n) for name, n in [("a", 2), ("b", 3), ("c", 4)]})
+        self.assertEqual(results, {"a": 4, "b": 9, "c": 16})
+
+
+class RunConcurrentlyTest(SimpleTestCase):
+    probe = contextvars.ContextVar("probe", default=None)
+
+    def test_pool_tasks_see_the_callers_context(self):
+        token = self.probe.set("req-42")
+        self.addCleanup(self.probe.reset, token)
+
+        def task():
+            return threading.current_thread().name, self.probe.get()
+
+        results = run_concurrently({"a": task, "b": task})
+
+        self.assertTrue(all(name.startswith("study-composer") for name, _ in results.values()))
+        self.assertEqual({value for _, value in results.values()}, {"req-42"})
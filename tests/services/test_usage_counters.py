@@ -0,0 +1,66 @@
+"""
+Tests for batched usage counters and cached lookups of the query-expansion / NLP caches.
+
+Covers:
+- Cache hits are counted in memory and written by one UPDATE per table on flush
+- A failed flush keeps its counts for the next one
+- Rows are served from the Django cache after the first read; saves and deletes keep it coherent
+"""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+
+from bible.ai import usage_counters
+from bible.models import QueryExpansionCache, QueryNLPCache
+
+
+class UsageCountersTest(TestCase):
+    def setUp(self):
+        usage_counters._pending = {}
+        self.expansion = QueryExpansionCache.objects.create(query_normalized="graca", query_original="graça")
+        self.nlp = QueryNLPCache.objects.create(query_normalized="fe e obras", query_original="fé e obras")
+
+    def tearDown(self):
+        usage_counters._pending = {}
+        for row in (self.expansion, self.nlp):
+            cache.delete(usage_counters._row_key(type(row), row.query_normalized))
+
+    def test_hits_are_written_in_one_batch(self):
+        with self.assertNumQueries(0):
+            for _ in range(3):
+                self.expansion.increment_usage()
+            self.nlp.increment_usage()
+
+        self.assertEqual(usage_counters.pending_hits()[QueryExpansionCache._meta.db_table], {"graca": 3})
+        with self.assertNumQueries(2):
+            self.assertEqual(usage_counters.flush(), 2)
+
+        self.expansion.refresh_from_db()
+        self.nlp.refresh_from_db()
+        self.assertEqual((self.expansion.usage_count, self.nlp.usage_count), (3, 1))
+        self.assertIsNotNone(self.expansion.last_used_at)
+        self.assertEqual(usage_counters.pending_hits(), {})
+
+    def test_failed_flush_keeps_counts(self):
+        self.expansion.increment_usage()
+        with patch.object(usage_counters, "_apply", side_effect=DatabaseError("down")):
+            self.assertEqual(usage_counters.flush(), 0)
+        self.expansion.increment_usage()
+
+        usage_counters.flush()
+        self.expansion.refresh_from_db()
+        self.assertEqual(self.expansion.usage_count, 2)
+
+    @override_settings(AI_LOOKUP_CACHE_TIMEOUT=60)
+    def test_rows_served_from_cache(self):
+        self.nlp.save()  # write-through
+
+        with self.assertNumQueries(0):
+            row = usage_counters.cached_row(QueryNLPCache, "fe e obras")
+        self.assertEqual(row.pk, self.nlp.pk)
+
+        self.nlp.delete()
+        self.assertIsNone(usage_counters.cached_row(QueryNLPCache, "fe e obras"))
@@ -0,0 +1,75 @@
+"""
+Tests for the free-text scripture reference extractor.
+
+Covers:
+- Single, ranged, cross-chapter and whole-chapter references with offsets
+- Verse and chapter lists continuing the same book
+- Prose words and lowercase book names not mistaken for references
+- Generic BookName aliases merged into the process-wide extractor
+"""
+
+from django.test import SimpleTestCase, TestCase
+
+from bible.models import BookName, CanonicalBook, Language, Testament
+from bible.utils.ref_extractor import ReferenceExtractor, default_extractor, get_extractor, measure_throughput
+
+
+def _refs(text, extractor=None):
+    found = (extractor or default_extractor()).extract(text)
+    return [(r.osis, r.chapter, r.verse_start, r.chapter_end, r.verse_end, text[r.start : r.end]) for r in found]
+
+
+class ReferenceExtractorTest(SimpleTestCase):
+    def test_references_with_offsets(self):
+        text = "Compare Gen 1:31-2:3 with 1 Sam. 16:6-10 and Salmo 23, then Êxodo 3:2."
+        self.assertEqual(
+            _refs(text),
+            [
+                ("Gen", 1, 31, 2, 3, "Gen 1:31-2:3"),
+                ("1Sam", 16, 6, 16, 10, "1 Sam. 16:6-10"),
+                ("Ps", 23, None, 23, None, "Salmo 23"),
+                ("Exod", 3, 2, 3, 2, "Êxodo 3:2"),
+            ],
+        )
+
+    def test_lists_continue_the_book(self):
+        self.assertEqual(
+            _refs("Mt 5:3-12; 6:9-13, 15 and 2 Kings 3:4, 2 Cor 5:17"),
+            [
+                ("Matt", 5, 3, 5, 12, "Mt 5:3-12"),
+                ("Matt", 6, 9, 6, 13, "6:9-13"),
+                ("Matt", 6, 15, 6, 15, "15"),
+                ("2Kgs", 3, 4, 3, 4, "2 Kings 3:4"),
+                ("2Cor", 5, 17, 5, 17, "2 Cor 5:17"),
+            ],
+        )
+
+    def test_prose_is_not_a_reference(self):
+        self.assertEqual(_refs("there is 1 way, ex 3 am 5; Is 3 enough? genesis 1:1"), [])
+        self.assertEqual(_refs("Is 53:5 and Song of Solomon 2:1")[0][:5], ("Isa", 53, 5, 53, 5))
+        self.assertEqual(
+            _refs("genesis 1:1", ReferenceExtractor({"genesis": "Gen"}, require_capital=False))[0][0], "Gen"
+        )
+
+    def test_batch_and_throughput(self):
+        texts = ["Jo 3:16", "", "nothing here", "Rom 8:28"]
+        self.assertEqual([len(refs) for refs in default_extractor().extract_many(texts)], [1, 0, 0, 1])
+        result = measure_throughput(texts, repeat=1)
+        self.assertEqual(result["references"], 2)
+        self.assertGreater(result["mb_per_s"], 0)
+
+
+class DatabaseAliasesTest(TestCase):
+    def setUp(self):
+        lang = Language.objects.create(name="Deutsch", code="de")
+        testament = Testament.objects.create(name="Neues Testament")
+        rev = CanonicalBook.objects.create(osis_code="Rev", canonical_order=66, testament=testament, chapter_count=22)
+        BookName.objects.create(canonical_book=rev, language=lang, name="Offenbarung", abbreviation="Offb")
+        get_extractor.cache_clear()
+        self.addCleanup(get_extractor.cache_clear)
+
+    def test_book_names_are_aliases(self):
+        self.assertEqual(
+            _refs("Offb 21:4 und Offenbarung 22", get_extractor()),
+            [("Rev", 21, 4, 21, 4, "Offb 21:4"), ("Rev", 22, None, 22, None, "Offenbarung 22")],
+        )
@@ -0,0 +1,121 @@
+"""
+Tests for the shared verse-coordinate index.
+
+Covers:
+- Vectorized verse resolution, per version and across versions
+- Cross-reference pair lookup
+- Importers resolving references through the index in constant queries
+"""
+
+from django.test import TestCase
+
+from bible.models import CanonicalBook, CrossReference, Language, Testament, Topic, Verse, Version
+from bible.topics.services.importer import TopicImporter
+from bible.utils.verse_index import VerseIndex
+
+
+class VerseIndexTest(TestCase):
+    def setUp(self):
+        lang = Language.objects.create(name="English", code="en")
+        old = Testament.objects.create(name="Old Testament")
+        new = Testament.objects.create(name="New Testament")
+        self.gen = CanonicalBook.objects.create(osis_code="Gen", canonical_order=1, testament=old, chapter_count=50)
+        self.heb = CanonicalBook.objects.create(osis_code="Heb", canonical_order=58, testament=new, chapter_count=13)
+        self.kjv = Version.objects.create(language=lang, code="EN_KJV", name="King James")
+        self.asv = Version.objects.create(language=lang, code="EN_ASV", name="American Standard")
+
+        self.kjv_verses = {
+            (book.osis_code, ch, n): Verse.objects.create(book=book, version=self.kjv, chapter=ch, number=n, text="k")
+            for book, ch, n in ((self.gen, 12, 1), (self.gen, 12, 2), (self.heb, 11, 8))
+        }
+        self.asv_gen = Verse.objects.create(book=self.gen, version=self.asv, chapter=12, number=1, text="a")
+        self.asv_only = Verse.objects.create(book=self.gen, version=self.asv, chapter=12, number=3, text="a")
+
+        self.xref = CrossReference.objects.create(
+            from_book=self.gen,
+            from_chapter=12,
+            from_verse=1,
+            to_book=self.heb,
+            to_chapter=11,
+            to_verse_start=8,
+            to_verse_end=10,
+            source="TSK",
+        )
+
+    def test_resolve_many_for_version(self):
+        index = VerseIndex(version=self.kjv)
+
+        ids = index.resolve_many([("Heb", 11, 8), ("Gen", 12, 3), ("Gen", 12, 1), ("Exod", 1, 1), ("Gen", 2000, 1)])
+
+        self.assertEqual(
+            ids.tolist(),
+            [self.kjv_verses[("Heb", 11, 8)].id, 0, self.kjv_verses[("Gen", 12, 1)].id, 0, 0],
+        )
+        self.assertIsNone(index.resolve("Gen", 12, 3))
+
+    def test_resolve_any_version_prefers_lowest_id(self):
+        index = VerseIndex()
+
+        self.assertEqual(index.resolve("Gen", 12, 1), self.kjv_verses[("Gen", 12, 1)].id)
+        self.assertEqual(index.resolve("Gen", 12, 3), self.asv_only.id)
+
+    def test_lookups_load_once(self):
+        index = VerseIndex(version=self.kjv)
+
+        with self.assertNumQueries(2):
+            index.resolve("Gen", 12, 1)
+            index.resolve_many([("Gen", 12, 2), ("Heb", 11, 8)])
+            index.crossref_id(("Gen", 12, 1), ("Heb", 11, 8))
+            index.crossref_id(("Gen", 12, 2), ("Heb", 11, 8))
+
+    def test_crossref_lookup(self):
+        index = VerseIndex()
+
+        self.assertEqual(index.crossref_id(("Gen", 12, 1), ("Heb", 11, 8)), self.xref.id)
+        self.assertIsNone(index.crossref_id(("Gen", 12, 2), ("Heb", 11, 8)))
+        self.assertEqual(
+            index.crossref_ids([(("Gen", 12, 1), ("Heb", 11, 9)), (("Gen", 12, 1), ("Heb", 11, 8))]).tolist(),
+            [0, self.xref.id],
+        )
+
+    def test_empty_tables(self):
+        Verse.objects.all().delete()
+        CrossReference.objects.all().delete()
+        index = VerseIndex()
+
+        self.assertEqual(index.resolve_many([("Gen", 12, 1)]).tolist(), [0])
+        self.assertIsNone(index.crossref_id(("Gen", 12, 1), ("Heb", 11, 8)))
+
+    def test_topic_importer_links_through_index(self):
+        topic = Topic.objects.create(
+            slug="abraham",
+            canonical_id="UNIFIED:abraham",
+            canonical_name="ABRAHAM",
+            name_normalized="abraham",
+            primary_source="NAV",
+        )
+        importer = TopicImporter()
+
+        refs = [
+            {"book_abbrev": "gen", "chapter": 12, "verses": [1, 2, 9]},
+            {"book_abbrev": "gen", "chapter": 12, "verses": [1]},
+        ]
+        linked = importer._import_verses(topic, {"biblical_references": refs})
+        crossrefs = importer._import_crossrefs(
+            topic,
+            {
+                "cross_reference_network": {
+                    "Genesis 12:1": [{"to_verse": "HEB.11.8", "score": 8}, {"to_verse": "HEB.11.8", "score": 6}]
+                }
+            },
+        )
+
+        self.assertEqual(linked, 2)
+        self.assertEqual(
+            sorted(topic.verse_links.values_list("verse_id", flat=True)),
+            sorted([self.kjv_verses[("Gen", 12, 1)].id, self.kjv_verses[("Gen", 12, 2)].id]),
+        )
+        self.assertEqual(crossrefs, 1)
+        self.assertEqual(
+            list(topic.cross_references.values_list("cross_reference_id", "relevance_score")), [(self.xref.id, 0.8)]
+        )
@@ -8,11 +8,14 @@ from unittest.mock import patch
 import pytest
 from django.contrib.auth.models import User
 from django.core.cache import cache
+from django.db import connection
 from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
 
+from bible.crossrefs.graph import get_crossref_graph
 from bible.crossrefs.serializers import CrossReferenceSerializer
 from bible.crossrefs.views import (
     CrossReferenceFiltersMixin,
@@ -115,22 +118,6 @@ class CrossRefsViewsTest(TestCase):
         view = CrossReferencesByVerseView()
         self.assertEqual(view.serializer_class, CrossReferenceSerializer)
 
-    def test_crossrefs_by_verse_view_queryset(self):
-        """Test CrossReferencesByVerseView queryset logic."""
-        view = CrossReferencesByVerseView()
-        django_request = self.api_factory.get("/api/v1/bible/cross-references/for/?ref=Gen 1:1")
-        request = Request(django_request)
-        view.request = request
-
-        queryset = view.get_queryset()
-
-        # Should have select_related for efficiency
-        query_str = str(queryset.query)
-        self.assertIn("JOIN", query_str)  # Should have joins for select_related
-
-        # Should have proper ordering
-        self.assertIn("ORDER BY", query_str)
-
     def test_crossrefs_by_verse_view_get(self):
         """Test CrossReferencesByVerseView GET method exists and is callable."""
         view = CrossReferencesByVerseView()
@@ -196,20 +183,22 @@ class CrossRefsViewsTest(TestCase):
         self.assertTrue(issubclass(CrossReferencesByThemeView, generics.ListAPIView))
 
     def test_crossrefs_by_verse_view_query_efficiency(self):
-        """Test that CrossReferencesByVerseView uses select_related for efficiency."""
+        """Test CrossReferencesByVerseView counts from the graph and loads only the page rows."""
+        cache.clear()  # alias maps and the graph generation from earlier tests
+        get_crossref_graph()
         view = CrossReferencesByVerseView()
         django_request = self.api_factory.get("/api/v1/bible/cross-references/for/?ref=Gen 1:1")
         request = Request(django_request)
         view.request = request
+        view.format_kwarg = None
 
-        queryset = view.get_queryset()
+        with CaptureQueriesContext(connection) as queries:
+            view.list(request)
 
-        # Check that select_related is applied with correct fields
-        query_str = str(queryset.query)
-        self.assertIn("JOIN", query_str)  # Should have joins for select_related
-        # The queryset should include both from_book and to_book relationships
-        self.assertIn("from_book", str(queryset.query))
-        self.assertIn("to_book", str(queryset.query))
+        sql = [q["sql"] for q in queries.captured_queries if "cross_references" in q["sql"]]
+        self.assertTrue(sql)
+        self.assertTrue(all("COUNT(" not in q for q in sql))
+        self.assertTrue(any("JOIN" in q for q in sql))  # select_related from_book / to_book
 
     def test_crossrefs_by_theme_view_query_efficiency(self):
         """Test that CrossReferencesByThemeView uses select_related for efficiency."""
@@ -228,19 +217,6 @@ class CrossRefsViewsTest(TestCase):
         self.assertIn("from_book", str(queryset.query))
         self.assertIn("to_book", str(queryset.query))
 
-    def test_crossrefs_by_verse_view_ordering(self):
-        """Test CrossReferencesByVerseView ordering."""
-        view = CrossReferencesByVerseView()
-        django_request = self.api_factory.get("/api/v1/bible/cross-references/for/?ref=Gen 1:1")
-        request = Request(django_request)
-        view.request = request
-
-        queryset = view.get_queryset()
-
-        # Should be ordered by from_book, from_chapter, from_verse
-        query_str = str(queryset.query)
-        self.assertIn("ORDER BY", query_str)
-
     def test_crossrefs_by_theme_view_ordering(self):
         """Test CrossReferencesByThemeView ordering."""
         view = CrossReferencesByThemeView()
@@ -410,23 +386,23 @@ class CrossRefsViewsTest(TestCase):
         with self.assertRaises(NotFound):
             view.list(request)
 
-    def test_crossrefs_by_verse_view_build_summary(self):
-        """Test CrossReferencesByVerseView _build_summary method."""
+    def test_crossrefs_by_verse_view_summary(self):
+        """Test CrossReferencesByVerseView summary computed from the graph."""
+        cache.clear()  # alias maps and the graph generation from earlier tests
         view = CrossReferencesByVerseView()
         django_request = self.api_factory.get("/api/v1/bible/cross-references/for/?ref=Gen 1:1&limit=10")
         request = Request(django_request)
         view.request = request
-        view._input_ref = "Gen 1:1"
+        view.format_kwarg = None
 
-        queryset = CrossReference.objects.filter(from_book=self.genesis)
-        summary = view._build_summary(queryset, 1, 1)
+        summary = view.list(request).data["summary"]
 
         self.assertEqual(summary["input"], "Gen 1:1")
         self.assertEqual(summary["available"], 1)
         self.assertEqual(summary["total"], 1)
-        self.assertIn("filters", summary)
-        self.assertIn("sources", summary)
-        self.assertIn("confidence", summary)
+        self.assertEqual(summary["sources"], {"TSK": 1})
+        self.assertEqual(summary["filters"], {"limit": 10})
+        self.assertIsNotNone(summary["confidence"])
 
     def test_parallels_view_not_found(self):
         """Test CrossReferencesParallelsView when no parallels found."""
@@ -67,6 +67,18 @@ class ReadinessCheckViewTest(TestCase):
         self.assertEqual(data["status"], "not_ready")
         self.assertFalse(data["checks"]["cache"])
 
+    def test_readiness_waits_for_warm_worker(self):
+        """Test readiness holds traffic from a cold worker when warm start is required."""
+        with self.settings(WARM_START_REQUIRED=True), patch("common.warm_start._status", {"state": "warming"}):
+            response = self.client.get("/health/readiness/")
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertFalse(response.json()["checks"]["warm"])
+        self.assertEqual(response.json()["warm_start"]["state"], "warming")
+
+        with self.settings(WARM_START_REQUIRED=True), patch("common.warm_start._status", {"state": "warm"}):
+            response = self.client.get("/health/readiness/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
 
 class PrometheusMetricsViewTest(TestCase):
     """Tests for PrometheusMetricsView."""